@@ -26,12 +26,36 @@ from src.repositorios.repositorio_requisitos_vaga import RepositorioRequisitoVag
 from src.repositorios.repositorio_curso_competencia import RepositorioCursoCompetenciaJSON
 from src.repositorios.repositorio_area_ensino import RepositorioAreaEnsinoJSON
 from src.repositorios.repositorio_instituicao_area_ensino import RepositorioInstituicaoAreaEnsinoJSON
+from src.repositorios.repositorio_recomendacao_salva import RepositorioRecomendacaoSalvaJSON
+from src.repositorios.repositorio_candidato_sqlite import RepositorioCandidatoSQLite
+from src.repositorios.repositorio_empresa_sqlite import RepositorioEmpresaSQLite
+from src.repositorios.repositorio_instituicao_ensino_sqlite import RepositorioInstituicaoEnsinoSQLite
+from src.repositorios.repositorio_vaga_clt_sqlite import RepositorioVagaCLTSQLite
+from src.repositorios.repositorio_vaga_estagio_sqlite import RepositorioVagaEstagioSQLite
+from src.repositorios.repositorio_candidatura_sqlite import RepositorioCandidaturaSQLite
+from src.repositorios.repositorio_inscricao_curso_sqlite import RepositorioInscricaoCursoSQLite
+from src.repositorios.repositorio_curso_ead_sqlite import RepositorioCursoEADSQLite
+from src.repositorios.repositorio_curso_presencial_sqlite import RepositorioCursoPresencialSQLite
+from src.repositorios.repositorio_competencia_sqlite import RepositorioCompetenciaSQLite
+from src.repositorios.repositorio_competencia_candidato_sqlite import RepositorioCompetenciaCandidatoSQLite
+from src.repositorios.repositorio_requisitos_vaga_sqlite import RepositorioRequisitoVagaSQLite
+from src.repositorios.repositorio_curso_competencia_sqlite import RepositorioCursoCompetenciaSQLite
+from src.repositorios.repositorio_area_ensino_sqlite import RepositorioAreaEnsinoSQLite
+from src.repositorios.repositorio_instituicao_area_ensino_sqlite import RepositorioInstituicaoAreaEnsinoSQLite
+from src.repositorios.repositorio_recomendacao_salva_sqlite import RepositorioRecomendacaoSalvaSQLite
+from src.repositorios.sequencia_ids import SequenciaIdsJSON
+from src.repositorios.sequencia_ids_sqlite import SequenciaIdsSQLite
+from src.repositorios.unidade_trabalho import UnidadeDeTrabalho
+
+# Domínio
+from src.dominio.candidatura import TipoVagaCandidatura
 
 # Services
 from src.services.service_candidato import CandidatoService
 from src.services.service_instituicao_ensino import ServiceInstituicaoEnsino
 from src.services.services_empresa import EmpresaService
 from src.services.service_busca_vaga import MotorBuscaVaga
+from src.services.service_busca_federada import MotorBuscaFederada
 from src.services.service_candidatura import CandidaturaService
 from src.services.service_inscricao_curso import InscricaoCursoService
 from src.services.service_curso_ead import CursoEADService
@@ -39,24 +63,45 @@ from src.services.service_curso_presencial import CursoPresencialService
 from src.services.service_competencia import CompetenciaService
 from src.services.service_competencia_candidato import CompetenciaCandidatoService
 from src.services.service_recomendacao import RecomendacaoService
+from src.services.service_recomendacao_lote import RecomendacaoLoteService, TAMANHO_PARTICAO, TOP_N_RECOMENDACOES
+from src.services.service_visao_recomendacoes import VisaoRecomendacoes
+from src.services.service_tabela_vagas import TabelaVagas
+from src.services.service_compatibilidade import MotorCompatibilidade
 from src.services.service_vaga_clt import VagaCLTService
 from src.services.service_vaga_estagio import VagaEstagioService
 from src.services.service_requisito_vaga import RequisitoVagaService
 from src.services.service_curso_competencia import CursoCompetenciaService
 from src.services.service_area_ensino import AreaEnsinoService
 from src.services.service_instituicao_area_ensino import InstituicaoAreaEnsinoService
+from src.services.service_importacao import ImportadorService, TAMANHO_LOTE_IMPORTACAO, TIPOS_IMPORTACAO
 
 # Fluxos
 from src.aplicacao.fluxo_candidato import FluxoCandidato
 from src.aplicacao.fluxo_empresa import FluxoEmpresa
 from src.aplicacao.fluxo_instituicao import FluxoInstituicao
+from src.aplicacao.comando_importacao import executar_importacao
+from src.aplicacao.comando_recomendacao import executar_recomendacao_lote
+
+
+BACKEND_JSON = "json"
+BACKEND_SQLITE = "sqlite"
+BACKENDS_VALIDOS = (BACKEND_JSON, BACKEND_SQLITE)
 
 
 class AplicacaoSkillUp:
     """Orquestradora principal da aplicação SkillUp"""
 
-    def __init__(self):
-        """Inicializa a aplicação e suas dependências"""
+    def __init__(self, backend: Optional[str] = None):
+        """Inicializa a aplicação e suas dependências.
+
+        `backend` escolhe onde os dados ficam ("json" ou "sqlite"); se omitido,
+        usa a variável de ambiente SKILLUP_BACKEND (padrão: json).
+        """
+        self.backend = (backend or os.environ.get("SKILLUP_BACKEND", BACKEND_JSON)).lower()
+        if self.backend not in BACKENDS_VALIDOS:
+            raise ValueError(
+                f"Backend inválido: {self.backend}. Use: {', '.join(BACKENDS_VALIDOS)}"
+            )
         self._inicializar_servicos()
         self.acoes = self._construir_acoes()
 
@@ -65,30 +110,19 @@ class AplicacaoSkillUp:
         # ==========================================
         # Repositórios
         # ==========================================
-        self.repo_candidato = RepositorioCandidatoJSON()
-        self.repo_empresa = RepositorioEmpresaJSON()
-        self.repo_instituicao = RepositorioInstituicaoEnsinoJSON()
-        self.repo_vaga_clt = RepositorioVagaCLTJSON()
-        self.repo_vaga_estagio = RepositorioVagaEstagioJSON()
-        self.repo_candidatura = RepositorioCandidaturaJSON()
-        self.repo_inscricao_curso = RepositorioInscricaoCursoJSON()
-        self.repo_curso_ead = RepositorioCursoEADJSON()
-        self.repo_curso_presencial = RepositorioCursoPresencialJSON()
-        self.repo_competencia = RepositorioCompetenciaJSON()
-        self.repo_competencia_candidato = RepositorioCompetenciaCandidatoJSON()
-        self.repo_requisito_vaga = RepositorioRequisitoVagaJSON()
-        self.repo_curso_competencia = RepositorioCursoCompetenciaJSON()
-        self.repo_area_ensino = RepositorioAreaEnsinoJSON()
-        self.repo_instituicao_area = RepositorioInstituicaoAreaEnsinoJSON()
+        if self.backend == BACKEND_SQLITE:
+            self._inicializar_repositorios_sqlite()
+        else:
+            self._inicializar_repositorios_json()
 
         # ==========================================
         # Serviços
         # ==========================================
         # Candidato
-        self.service_candidato = CandidatoService(self.repo_candidato)
+        self.service_candidato = CandidatoService(self.repo_candidato, sequencia=self.sequencia_ids)
         
         # Empresa
-        self.service_empresa = EmpresaService(self.repo_empresa)
+        self.service_empresa = EmpresaService(self.repo_empresa, sequencia=self.sequencia_ids)
         
         # Instituição
         self.service_instituicao = ServiceInstituicaoEnsino(
@@ -96,16 +130,33 @@ class AplicacaoSkillUp:
         )
         
         # Vagas
-        self.service_vaga_clt = VagaCLTService(self.repo_vaga_clt, self.repo_empresa)
-        self.service_vaga_estagio = VagaEstagioService(self.repo_vaga_estagio, self.repo_empresa)
-        self.motor_busca_vagas = MotorBuscaVaga(self.repo_vaga_clt)  # Busca em vagas CLT
+        self.service_vaga_clt = VagaCLTService(
+            self.repo_vaga_clt, self.repo_empresa, sequencia=self.sequencia_ids
+        )
+        self.service_vaga_estagio = VagaEstagioService(
+            self.repo_vaga_estagio, self.repo_empresa, sequencia=self.sequencia_ids
+        )
+        self.motor_busca_vagas_clt = MotorBuscaVaga(self.repo_vaga_clt)
+        self.motor_busca_vagas_estagio = MotorBuscaVaga(self.repo_vaga_estagio)
+        self.service_vaga_clt.adicionar_observador(self.motor_busca_vagas_clt)
+        self.service_vaga_estagio.adicionar_observador(self.motor_busca_vagas_estagio)
+        # Colunas das vagas CLT para os filtros da recomendação
+        self.tabela_vagas_clt = TabelaVagas(self.repo_vaga_clt)
+        self.service_vaga_clt.adicionar_observador(self.tabela_vagas_clt)
+        # Busca em vagas CLT e de estágio ao mesmo tempo
+        self.motor_busca_vagas = MotorBuscaFederada({
+            TipoVagaCandidatura.CLT: self.motor_busca_vagas_clt,
+            TipoVagaCandidatura.ESTAGIO: self.motor_busca_vagas_estagio,
+        })
         
         # Candidatura
         self.service_candidatura = CandidaturaService(
             self.repo_candidatura,
             self.repo_vaga_clt,
             self.repo_vaga_estagio,
-            self.repo_candidato
+            self.repo_candidato,
+            sequencia=self.sequencia_ids,
+            unidade_trabalho=UnidadeDeTrabalho,
         )
         
         # Cursos
@@ -120,23 +171,132 @@ class AplicacaoSkillUp:
             self.repo_curso_presencial,
             self.repo_candidato,
             self.repo_curso_competencia,
-            self.repo_competencia_candidato
+            self.repo_competencia_candidato,
+            sequencia=self.sequencia_ids,
+            unidade_trabalho=UnidadeDeTrabalho,
         )
         
         # Competências
         self.service_competencia = CompetenciaService(self.repo_competencia)
-        self.service_competencia_candidato = CompetenciaCandidatoService(self.repo_competencia_candidato)
+        self.service_competencia_candidato = CompetenciaCandidatoService(
+            self.repo_competencia_candidato, sequencia=self.sequencia_ids
+        )
         
         # Requisitos de vaga
-        self.service_requisito_vaga = RequisitoVagaService(self.repo_requisito_vaga)
+        self.service_requisito_vaga = RequisitoVagaService(
+            self.repo_requisito_vaga, sequencia=self.sequencia_ids
+        )
         
         # Recomendação
-        self.service_recomendacao = RecomendacaoService(self.repo_vaga_clt, self.repo_curso_ead)
+        self.motor_compatibilidade = MotorCompatibilidade(
+            self.repo_requisito_vaga, self.repo_competencia_candidato
+        )
+        self.service_recomendacao = RecomendacaoService(
+            self.repo_vaga_clt,
+            self.repo_curso_ead,
+            self.motor_compatibilidade,
+            repo_candidato=self.repo_candidato,
+            tabela_vagas=self.tabela_vagas_clt,
+        )
+        # Recomendações pré-calculadas (ver `python main.py recomendar`), mantidas
+        # em dia pelos avisos de vagas, candidatos e competências
+        self.visao_recomendacoes = VisaoRecomendacoes(
+            self.repo_vaga_clt,
+            self.repo_curso_ead,
+            self.repo_candidato,
+            self.repo_recomendacao_salva,
+            self.motor_compatibilidade,
+        )
+        self.service_vaga_clt.adicionar_observador(self.visao_recomendacoes)
+        self.service_candidato.adicionar_observador(self.visao_recomendacoes)
+        self.service_competencia_candidato.adicionar_observador(self.visao_recomendacoes)
+        self.service_inscricao_curso.adicionar_observador(self.visao_recomendacoes)
         
         # Áreas de ensino
         self.service_area_ensino = AreaEnsinoService(self.repo_area_ensino)
         self.service_instituicao_area = InstituicaoAreaEnsinoService(self.repo_instituicao_area)
 
+    def _inicializar_repositorios_json(self) -> None:
+        """Repositórios gravados nos arquivos JSON de src/data"""
+        self.repo_candidato = RepositorioCandidatoJSON()
+        self.repo_empresa = RepositorioEmpresaJSON()
+        self.repo_instituicao = RepositorioInstituicaoEnsinoJSON()
+        self.repo_vaga_clt = RepositorioVagaCLTJSON()
+        self.repo_vaga_estagio = RepositorioVagaEstagioJSON()
+        self.repo_candidatura = RepositorioCandidaturaJSON()
+        self.repo_inscricao_curso = RepositorioInscricaoCursoJSON()
+        self.repo_curso_ead = RepositorioCursoEADJSON()
+        self.repo_curso_presencial = RepositorioCursoPresencialJSON()
+        self.repo_competencia = RepositorioCompetenciaJSON()
+        self.repo_competencia_candidato = RepositorioCompetenciaCandidatoJSON()
+        self.repo_requisito_vaga = RepositorioRequisitoVagaJSON()
+        self.repo_curso_competencia = RepositorioCursoCompetenciaJSON()
+        self.repo_area_ensino = RepositorioAreaEnsinoJSON()
+        self.repo_instituicao_area = RepositorioInstituicaoAreaEnsinoJSON()
+        self.repo_recomendacao_salva = RepositorioRecomendacaoSalvaJSON()
+        self.sequencia_ids = SequenciaIdsJSON()
+
+    def _inicializar_repositorios_sqlite(self) -> None:
+        """Repositórios no banco SQLite (importa os JSON na primeira execução)"""
+        self.repo_candidato = RepositorioCandidatoSQLite()
+        self.repo_empresa = RepositorioEmpresaSQLite()
+        self.repo_instituicao = RepositorioInstituicaoEnsinoSQLite()
+        self.repo_vaga_clt = RepositorioVagaCLTSQLite()
+        self.repo_vaga_estagio = RepositorioVagaEstagioSQLite()
+        self.repo_candidatura = RepositorioCandidaturaSQLite()
+        self.repo_inscricao_curso = RepositorioInscricaoCursoSQLite()
+        self.repo_curso_ead = RepositorioCursoEADSQLite()
+        self.repo_curso_presencial = RepositorioCursoPresencialSQLite()
+        self.repo_competencia = RepositorioCompetenciaSQLite()
+        self.repo_competencia_candidato = RepositorioCompetenciaCandidatoSQLite()
+        self.repo_requisito_vaga = RepositorioRequisitoVagaSQLite()
+        self.repo_curso_competencia = RepositorioCursoCompetenciaSQLite()
+        self.repo_area_ensino = RepositorioAreaEnsinoSQLite()
+        self.repo_instituicao_area = RepositorioInstituicaoAreaEnsinoSQLite()
+        self.repo_recomendacao_salva = RepositorioRecomendacaoSalvaSQLite()
+        self.sequencia_ids = SequenciaIdsSQLite()
+
+    def criar_importador(self, tipo: str, tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO) -> ImportadorService:
+        """Importador em massa de um dos TIPOS_IMPORTACAO, ligado aos repositórios do backend"""
+        repositorios = {
+            "candidatos": self.repo_candidato,
+            "empresas": self.repo_empresa,
+            "vagas_clt": self.repo_vaga_clt,
+            "vagas_estagio": self.repo_vaga_estagio,
+        }
+        # Os mesmos observadores dos services: índices e visões acompanham a importação
+        observadores = {
+            "candidatos": self.service_candidato.observadores,
+            "vagas_clt": self.service_vaga_clt.observadores,
+            "vagas_estagio": self.service_vaga_estagio.observadores,
+        }
+        return ImportadorService(
+            TIPOS_IMPORTACAO[tipo],
+            repositorios[tipo],
+            sequencia=self.sequencia_ids,
+            referencias={"empresa": self.repo_empresa, "instituicao": self.repo_instituicao},
+            tamanho_lote=tamanho_lote,
+            observadores=observadores.get(tipo, ()),
+        )
+
+    def criar_recomendador_lote(
+        self,
+        processos: Optional[int] = None,
+        top_n: int = TOP_N_RECOMENDACOES,
+        tamanho_particao: int = TAMANHO_PARTICAO,
+    ) -> RecomendacaoLoteService:
+        """Lote de recomendações sobre as mesmas vagas e cursos do RecomendacaoService"""
+        return RecomendacaoLoteService(
+            self.repo_vaga_clt,
+            self.repo_curso_ead,
+            self.repo_candidato,
+            self.repo_recomendacao_salva,
+            self.motor_compatibilidade,
+            top_n=top_n,
+            tamanho_particao=tamanho_particao,
+            processos=processos,
+        )
+
     def _limpar_tela(self) -> None:
         """Limpa a tela do console"""
         os.system("clear" if os.name == "posix" else "cls")
@@ -171,6 +331,7 @@ class AplicacaoSkillUp:
                 service_competencia_candidato=self.service_competencia_candidato,
                 service_competencia=self.service_competencia,
                 service_recomendacao=self.service_recomendacao,
+                visao_recomendacoes=self.visao_recomendacoes,
             )
             fluxo.executar()
         except Exception as e:
@@ -188,6 +349,7 @@ class AplicacaoSkillUp:
                 service_requisito_vaga=self.service_requisito_vaga,
                 service_candidatura=self.service_candidatura,
                 service_competencia=self.service_competencia,
+                service_recomendacao=self.service_recomendacao,
             )
             fluxo.executar()
         except Exception as e:
@@ -269,9 +431,18 @@ class AplicacaoSkillUp:
 
 
 def main():
-    """Função de entrada da aplicação"""
+    """Função de entrada da aplicação.
+
+    `python main.py importar <tipo> <arquivo>` importa cadastros em massa em vez de abrir o menu.
+    `python main.py recomendar` pré-calcula as recomendações de todos os candidatos.
+    Os dados ficam em src/data; SKILLUP_DADOS aponta outro diretório (ex.: um temporário).
+    """
     try:
         app = AplicacaoSkillUp()
+        if len(sys.argv) > 1 and sys.argv[1] == "importar":
+            sys.exit(executar_importacao(app, sys.argv[2:]))
+        if len(sys.argv) > 1 and sys.argv[1] == "recomendar":
+            sys.exit(executar_recomendacao_lote(app, sys.argv[2:]))
         app.executar()
     except KeyboardInterrupt:
         print("\n\nAplicação interrompida pelo usuário.")
@@ -0,0 +1,46 @@
+"""
+Comando de linha de comando para importar cadastros em massa.
+Uso: python main.py importar <tipo> <arquivo.csv|arquivo.jsonl> [--rejeitados CAMINHO] [--lote N]
+"""
+
+import argparse
+from typing import List
+
+from src.services.service_importacao import TAMANHO_LOTE_IMPORTACAO, TIPOS_IMPORTACAO
+
+
+def _argumentos() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="main.py importar",
+        description="Importa cadastros em massa de um arquivo CSV (com cabeçalho) ou JSONL.",
+    )
+    parser.add_argument("tipo", choices=sorted(TIPOS_IMPORTACAO), help="O que importar")
+    parser.add_argument("arquivo", help="Arquivo .csv ou .jsonl")
+    parser.add_argument(
+        "--rejeitados", default=None,
+        help="Arquivo JSONL com as linhas recusadas (padrão: <arquivo>.rejeitados.jsonl)",
+    )
+    parser.add_argument(
+        "--lote", type=int, default=TAMANHO_LOTE_IMPORTACAO,
+        help=f"Linhas gravadas por vez (padrão: {TAMANHO_LOTE_IMPORTACAO})",
+    )
+    return parser
+
+
+def executar_importacao(app, argumentos: List[str]) -> int:
+    """Importa o arquivo pedido com os repositórios de `app` e exibe o resumo.
+
+    Retorna o código de saída: 0 se todas as linhas foram importadas, 1 se houve rejeitadas.
+    """
+    opcoes = _argumentos().parse_args(argumentos)
+    importador = app.criar_importador(opcoes.tipo, tamanho_lote=opcoes.lote)
+    estatisticas = importador.importar(opcoes.arquivo, opcoes.rejeitados)
+
+    print(f"Linhas lidas:      {estatisticas.lidas}")
+    print(f"Importadas:        {estatisticas.importadas} (em {estatisticas.lotes} lote(s))")
+    print(f"Rejeitadas:        {estatisticas.rejeitadas}")
+    print(f"Tempo:             {estatisticas.segundos:.2f}s ({estatisticas.linhas_por_segundo:.0f} linhas/s)")
+    if estatisticas.rejeitadas:
+        print(f"Linhas rejeitadas em: {estatisticas.arquivo_rejeitados}")
+        return 1
+    return 0
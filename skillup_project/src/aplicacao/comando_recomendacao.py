@@ -0,0 +1,46 @@
+"""
+Comando de linha de comando para pré-calcular as recomendações de todos os candidatos.
+Uso: python main.py recomendar [--processos N] [--top N] [--particao N]
+"""
+
+import argparse
+from typing import List
+
+from src.services.service_recomendacao_lote import TAMANHO_PARTICAO, TOP_N_RECOMENDACOES
+
+
+def _argumentos() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="main.py recomendar",
+        description="Calcula as melhores vagas e cursos de cada candidato e grava o resultado.",
+    )
+    parser.add_argument(
+        "--processos", type=int, default=None,
+        help="Processos usados no cálculo (padrão: um por CPU)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=TOP_N_RECOMENDACOES,
+        help=f"Vagas e cursos guardados por candidato (padrão: {TOP_N_RECOMENDACOES})",
+    )
+    parser.add_argument(
+        "--particao", type=int, default=TAMANHO_PARTICAO,
+        help=f"Candidatos enviados de cada vez a um processo (padrão: {TAMANHO_PARTICAO})",
+    )
+    return parser
+
+
+def executar_recomendacao_lote(app, argumentos: List[str]) -> int:
+    """Recalcula as recomendações com os repositórios de `app` e exibe o resumo.
+
+    Retorna o código de saída (0).
+    """
+    opcoes = _argumentos().parse_args(argumentos)
+    lote = app.criar_recomendador_lote(
+        processos=opcoes.processos, top_n=opcoes.top, tamanho_particao=opcoes.particao
+    )
+    estatisticas = lote.executar()
+
+    print(f"Candidatos:        {estatisticas.candidatos} (em {estatisticas.particoes} partição(ões))")
+    print(f"Processos:         {estatisticas.processos}")
+    print(f"Tempo:             {estatisticas.segundos:.2f}s ({estatisticas.candidatos_por_segundo:.0f} candidatos/s)")
+    return 0
@@ -7,7 +7,9 @@ from typing import Optional, List
 from src.dominio.candidato import Candidato
 from src.dominio.vaga import Modalidade
 from src.services.service_candidato import CandidatoService
-from src.services.service_busca_vaga import MotorBuscaVaga
+from src.dominio.candidatura import TipoVagaCandidatura
+from src.services.service_busca_vaga import salario_da_vaga
+from src.services.service_busca_federada import MotorBuscaFederada
 from src.services.service_candidatura import CandidaturaService
 from src.services.service_inscricao_curso import InscricaoCursoService
 from src.services.service_curso_ead import CursoEADService
@@ -15,15 +17,18 @@ from src.services.service_curso_presencial import CursoPresencialService
 from src.services.service_competencia_candidato import CompetenciaCandidatoService
 from src.services.service_competencia import CompetenciaService
 from src.services.service_recomendacao import RecomendacaoService
+from src.services.service_visao_recomendacoes import VisaoRecomendacoes
 
 
 class FluxoCandidato:
     """Orquestra o fluxo completo de candidatos na plataforma"""
 
+    VAGAS_POR_PAGINA = 10
+
     def __init__(
         self,
         service_candidato: CandidatoService,
-        motor_busca_vagas: MotorBuscaVaga,
+        motor_busca_vagas: MotorBuscaFederada,
         service_candidatura: CandidaturaService,
         service_inscricao_curso: InscricaoCursoService,
         service_curso_ead: CursoEADService,
@@ -31,6 +36,7 @@ class FluxoCandidato:
         service_competencia_candidato: Optional[CompetenciaCandidatoService] = None,
         service_competencia: Optional[CompetenciaService] = None,
         service_recomendacao: Optional[RecomendacaoService] = None,
+        visao_recomendacoes: Optional[VisaoRecomendacoes] = None,
     ):
         """
         Inicializa o fluxo de candidato com todos os serviços necessários
@@ -44,6 +50,7 @@ class FluxoCandidato:
         self.service_competencia_candidato = service_competencia_candidato
         self.service_competencia = service_competencia
         self.service_recomendacao = service_recomendacao
+        self.visao_recomendacoes = visao_recomendacoes
 
         self.candidato_logado: Optional[Candidato] = None
         self.acoes_autenticacao = self._construir_acoes_autenticacao()
@@ -209,40 +216,68 @@ class FluxoCandidato:
 
     def _explorar_vagas(self) -> None:
         self._limpar_tela()
-        print("\n=== VAGAS RECOMENDADAS ===\n")
-        
-        # Busca vagas compatíveis
-        vagas = self.motor_busca_vagas.buscar_por_candidato(
-            areas_interesse=self.candidato_logado._areas_interesse,
-            localidade_candidato=self.candidato_logado.localidade
-        )
-
-        if not vagas:
-            print("Nenhuma vaga encontrada para o seu perfil no momento.")
-        else:
-            print(f"Encontramos {len(vagas)} vagas para você:\n")
-            for v in vagas:
+        consulta = input("\nBuscar por palavras-chave (ENTER para vagas do seu perfil): ").strip()
+        pagina = 1
+
+        while True:
+            if consulta:
+                print(f"\n=== RESULTADOS PARA \"{consulta}\" ===\n")
+                resultado = self.motor_busca_vagas.buscar_texto(
+                    consulta, pagina=pagina, por_pagina=self.VAGAS_POR_PAGINA
+                )
+            else:
+                print("\n=== VAGAS RECOMENDADAS ===\n")
+                # Busca vagas compatíveis (CLT e estágio)
+                resultado = self.motor_busca_vagas.buscar_por_candidato(
+                    areas_interesse=self.candidato_logado._areas_interesse,
+                    localidade_candidato=self.candidato_logado.localidade,
+                    pagina=pagina,
+                    por_pagina=self.VAGAS_POR_PAGINA,
+                )
+
+            if not resultado:
+                print("Nenhuma vaga encontrada para o seu perfil no momento.")
+                input("\nPressione ENTER para voltar...")
+                return
+
+            print(
+                f"Encontramos {resultado.total} vagas para você "
+                f"(página {resultado.pagina} de {resultado.total_paginas}):\n"
+            )
+            for numero, encontrada in enumerate(resultado, start=1):
+                v = encontrada.vaga
                 empresa_nome = v.empresa_nome if hasattr(v, 'empresa_nome') else 'Empresa Parceira'
-                print(f"ID: {v.id} | {v.titulo} ({v.modalidade.value}) - {empresa_nome}")
-                # Verifica se 'salario' existe antes de acessar
-                salario = f"R$ {v.salario:.2f}" if hasattr(v, 'salario') else "A combinar"
+                tipo = "Estágio" if encontrada.tipo == TipoVagaCandidatura.ESTAGIO else "CLT"
+                print(f"{numero}. [{tipo}] {v.titulo} ({v.modalidade.value}) - {empresa_nome}")
+                salario = salario_da_vaga(v)
+                salario = f"R$ {salario:.2f}" if salario else "A combinar"
                 print(f"   Salário: {salario} | Área: {v.area}")
                 print("-" * 40)
-            
-            escolha = input("\nDigite o ID da vaga para se candidatar (ou ENTER para voltar): ").strip()
+
+            mensagem = "\nDigite o número da vaga para se candidatar"
+            if resultado.tem_proxima:
+                mensagem += ", P para a próxima página"
+            escolha = input(mensagem + " (ou ENTER para voltar): ").strip()
+
+            if escolha.lower() == "p" and resultado.tem_proxima:
+                pagina += 1
+                self._limpar_tela()
+                continue
+
             if escolha:
                 try:
-                    from src.dominio.candidatura import TipoVagaCandidatura
-                    id_vaga = int(escolha)
-                    # Por padrão, vagas listadas são CLT
-                    self.service_candidatura.cadastrar(id_vaga, TipoVagaCandidatura.CLT, self.candidato_logado.id)
+                    numero = int(escolha)
+                    if not 1 <= numero <= len(resultado):
+                        raise ValueError("Número de vaga inválido.")
+                    encontrada = resultado.itens[numero - 1]
+                    self.service_candidatura.cadastrar(
+                        encontrada.vaga.id, encontrada.tipo, self.candidato_logado.id
+                    )
                     print("✅ Candidatura enviada com sucesso!")
                 except Exception as e:
                     print(f"❌ Erro ao candidatar: {e}")
                 input("Pressione ENTER para continuar...")
-        
-        if not vagas:
-            input("\nPressione ENTER para voltar...")
+            return
 
     def _explorar_cursos(self) -> None:
         self._limpar_tela()
@@ -477,7 +512,7 @@ class FluxoCandidato:
 
     def _ver_recomendacoes(self) -> None:
         """Exibe recomendações de vagas e cursos para o candidato"""
-        if not self.service_recomendacao:
+        if not self.service_recomendacao and not self.visao_recomendacoes:
             self._limpar_tela()
             print("\n=== RECOMENDAÇÕES ===")
             print("\n❌ Serviço de recomendações não disponível")
@@ -488,30 +523,65 @@ class FluxoCandidato:
         print("\n=== RECOMENDAÇÕES PARA VOCÊ ===")
         
         try:
-            recomendacao = self.service_recomendacao.recomendar(self.candidato_logado)
-            
-            print("\n--- VAGAS RECOMENDADAS ---")
-            if not recomendacao.vagas:
-                print("  Nenhuma vaga recomendada no momento.")
-            else:
-                for item in recomendacao.vagas[:10]:  # Top 10
-                    vaga = item.item
-                    print(f"\n  [⭐ {item.pontuacao}pts] {vaga.titulo}")
-                    print(f"     Área: {vaga.area} | Modalidade: {vaga.modalidade.value}")
-            
-            print("\n--- CURSOS RECOMENDADOS ---")
-            if not recomendacao.cursos:
-                print("  Nenhum curso recomendado no momento.")
+            # Linha da visão de recomendações (mantida em dia pelos avisos); sem ela, calcula agora
+            salva = None
+            if self.visao_recomendacoes:
+                salva = self.visao_recomendacoes.buscar(self.candidato_logado.id)
+            if salva is not None:
+                self._exibir_recomendacao_salva(salva)
+            elif self.service_recomendacao:
+                self._exibir_recomendacao(self.service_recomendacao.recomendar(self.candidato_logado))
             else:
-                for item in recomendacao.cursos[:10]:  # Top 10
-                    curso = item.item
-                    print(f"\n  [⭐ {item.pontuacao}pts] {curso.nome}")
-                    print(f"     Área: {curso.area} | Carga: {curso.carga_horaria}h")
+                print("\n  Suas recomendações ainda não foram calculadas.")
         except Exception as e:
             print(f"\n❌ Erro ao obter recomendações: {e}")
         
         input("\nPressione ENTER para voltar...")
 
+    @staticmethod
+    def _exibir_recomendacao(recomendacao) -> None:
+        print("\n--- VAGAS RECOMENDADAS ---")
+        if not recomendacao.vagas:
+            print("  Nenhuma vaga recomendada no momento.")
+        else:
+            for item in recomendacao.vagas[:10]:  # Top 10
+                vaga = item.item
+                print(f"\n  [⭐ {item.pontuacao}pts] {vaga.titulo}")
+                print(f"     Área: {vaga.area} | Modalidade: {vaga.modalidade.value}")
+                if item.compatibilidade:
+                    print(f"     Compatibilidade de competências: {item.compatibilidade.percentual}%")
+        
+        print("\n--- CURSOS RECOMENDADOS ---")
+        if not recomendacao.cursos:
+            print("  Nenhum curso recomendado no momento.")
+        else:
+            for item in recomendacao.cursos[:10]:  # Top 10
+                curso = item.item
+                print(f"\n  [⭐ {item.pontuacao}pts] {curso.nome}")
+                print(f"     Área: {curso.area} | Carga: {curso.carga_horaria}h")
+
+    @staticmethod
+    def _exibir_recomendacao_salva(salva) -> None:
+        print("\n--- VAGAS RECOMENDADAS ---")
+        if not salva.vagas:
+            print("  Nenhuma vaga recomendada no momento.")
+        else:
+            for vaga in salva.vagas[:10]:  # Top 10
+                print(f"\n  [⭐ {vaga.pontuacao}pts] {vaga.titulo}")
+                print(f"     Área: {vaga.area} | Modalidade: {vaga.modalidade}")
+                if vaga.percentual is not None:
+                    print(f"     Compatibilidade de competências: {vaga.percentual}%")
+        
+        print("\n--- CURSOS RECOMENDADOS ---")
+        if not salva.cursos:
+            print("  Nenhum curso recomendado no momento.")
+        else:
+            for curso in salva.cursos[:10]:  # Top 10
+                print(f"\n  [⭐ {curso.pontuacao}pts] {curso.nome}")
+                print(f"     Área: {curso.area} | Carga: {curso.carga_horaria}h")
+        if salva.gerada_em:
+            print(f"\n  (calculadas em {salva.gerada_em})")
+
     def _ver_perfil(self) -> None:
         """Menu de gerenciamento do perfil do candidato"""
         while True:
@@ -14,11 +14,14 @@ from src.services.service_curso_ead import CursoEADService
 from src.services.service_curso_presencial import CursoPresencialService
 from src.services.service_competencia_candidato import CompetenciaCandidatoService
 from src.services.service_competencia import CompetenciaService
+from src.aplicacao.listagem_paginada import exibir_paginado
 
 
 class FluxoCandidatoAdmin:
     """Back Office para administração de candidatos"""
 
+    ITENS_POR_PAGINA = 20
+
     def __init__(
         self,
         service_candidato: CandidatoService,
@@ -101,13 +104,11 @@ class FluxoCandidatoAdmin:
         print("\n=== TODOS OS CANDIDATOS ===\n")
 
         try:
-            candidatos = self.service.listar()
-            if not candidatos:
-                print("Nenhum candidato cadastrado.")
-            else:
-                print(f"Total: {len(candidatos)} candidatos\n")
-                for c in candidatos:
-                    self._exibir_candidato_resumo(c)
+            exibir_paginado(
+                lambda cursor: self.service.paginar(self.ITENS_POR_PAGINA, cursor),
+                self._exibir_candidato_resumo,
+                "Nenhum candidato cadastrado.",
+            )
 
         except Exception as e:
             print(f"Erro ao listar candidatos: {e}")
@@ -14,6 +14,7 @@ from src.services.service_vaga_estagio import VagaEstagioService
 from src.services.service_requisito_vaga import RequisitoVagaService
 from src.services.service_candidatura import CandidaturaService
 from src.services.service_competencia import CompetenciaService
+from src.services.service_recomendacao import RecomendacaoService
 
 
 class FluxoEmpresa:
@@ -27,6 +28,7 @@ class FluxoEmpresa:
         service_requisito_vaga: Optional[RequisitoVagaService] = None,
         service_candidatura: Optional[CandidaturaService] = None,
         service_competencia: Optional[CompetenciaService] = None,
+        service_recomendacao: Optional[RecomendacaoService] = None,
     ):
         """
         Inicializa o fluxo de empresa
@@ -38,6 +40,7 @@ class FluxoEmpresa:
             service_requisito_vaga: Serviço de requisitos de vagas
             service_candidatura: Serviço de candidaturas
             service_competencia: Serviço de competências
+            service_recomendacao: Serviço de recomendação (ranking de candidatos)
         """
         self.service = service_empresa
         self.service_vaga_clt = service_vaga_clt
@@ -45,6 +48,7 @@ class FluxoEmpresa:
         self.service_requisito_vaga = service_requisito_vaga
         self.service_candidatura = service_candidatura
         self.service_competencia = service_competencia
+        self.service_recomendacao = service_recomendacao
         self.empresa_logada: Optional[Empresa] = None
         self.acoes_autenticacao = self._construir_acoes_autenticacao()
         self.acoes_menu_principal = self._construir_acoes_menu_principal()
@@ -331,9 +335,10 @@ class FluxoEmpresa:
             print("2. Ver detalhes de uma vaga")
             print("3. Pausar/Ativar vaga")
             print("4. Adicionar requisito")
-            print("5. Voltar")
+            print("5. Ranquear candidatos para uma vaga")
+            print("6. Voltar")
             
-            opcao = input("\nEscolha uma opção (1-5): ").strip()
+            opcao = input("\nEscolha uma opção (1-6): ").strip()
             
             if opcao == "1":
                 self._listar_vagas_empresa()
@@ -344,6 +349,8 @@ class FluxoEmpresa:
             elif opcao == "4":
                 self._adicionar_requisito_existente()
             elif opcao == "5":
+                self._ranquear_candidatos()
+            elif opcao == "6":
                 break
             else:
                 print("❌ Opção inválida!")
@@ -392,6 +399,35 @@ class FluxoEmpresa:
             print(f"❌ Erro: {e}")
         input("\nPressione ENTER para continuar...")
 
+    def _ranquear_candidatos(self) -> None:
+        """Exibe os candidatos mais compatíveis com uma vaga da empresa"""
+        if not self.service_recomendacao:
+            print("\n❌ Serviço de recomendação não disponível")
+            input("Pressione ENTER para voltar...")
+            return
+
+        try:
+            id_vaga = int(input("\nID da vaga: ").strip())
+            vaga = self.service_vaga_clt.buscar_por_id(id_vaga)
+
+            if vaga.id_empresa != self.empresa_logada.id:
+                print("❌ Esta vaga não pertence à sua empresa.")
+            else:
+                ranking = self.service_recomendacao.ranquear_candidatos_para_vaga(id_vaga)
+                if not ranking:
+                    print("\n📋 Nenhum candidato compatível com esta vaga.")
+                else:
+                    print(f"\n🏆 Candidatos mais compatíveis ({len(ranking)}):\n")
+                    for posicao, r in enumerate(ranking, start=1):
+                        c = r.item
+                        linha = f"  {posicao}. [{c.id}] {c.nome} - {c.email} | {r.pontuacao} pts"
+                        if r.compatibilidade is not None:
+                            linha += f" | Competências: {r.compatibilidade.percentual}%"
+                        print(linha)
+        except ValueError as e:
+            print(f"❌ Erro: {e}")
+        input("\nPressione ENTER para continuar...")
+
     def _pausar_ativar_vaga(self) -> None:
         """Pausa ou ativa uma vaga"""
         try:
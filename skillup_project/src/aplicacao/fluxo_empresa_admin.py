@@ -13,11 +13,14 @@ from src.services.service_vaga_estagio import VagaEstagioService
 from src.services.service_requisito_vaga import RequisitoVagaService
 from src.services.service_candidatura import CandidaturaService
 from src.services.service_competencia import CompetenciaService
+from src.aplicacao.listagem_paginada import exibir_paginado
 
 
 class FluxoEmpresaAdmin:
     """Back Office para administração de empresas"""
 
+    ITENS_POR_PAGINA = 20
+
     def __init__(
         self,
         service_empresa: EmpresaService,
@@ -100,13 +103,11 @@ class FluxoEmpresaAdmin:
         print("\n=== TODAS AS EMPRESAS ===\n")
 
         try:
-            empresas = self.service_empresa.listar()
-            if not empresas:
-                print("Nenhuma empresa cadastrada.")
-            else:
-                print(f"Total: {len(empresas)} empresas\n")
-                for e in empresas:
-                    self._exibir_empresa_resumo(e)
+            exibir_paginado(
+                lambda cursor: self.service_empresa.paginar(self.ITENS_POR_PAGINA, cursor),
+                self._exibir_empresa_resumo,
+                "Nenhuma empresa cadastrada.",
+            )
 
         except Exception as e:
             print(f"Erro ao listar empresas: {e}")
@@ -357,20 +358,20 @@ class FluxoEmpresaAdmin:
         self._limpar_tela()
         print(f"\n=== VAGAS CLT ===\n")
 
-        try:
-            vagas = self.service_vaga_clt.listar_todas()
+        def exibir(v) -> None:
+            status = "Ativa" if getattr(v, 'ativa', True) else "Inativa"
+            print(f"ID: {v.id} | {v.titulo}")
+            print(f"   Área: {v.area} | Modalidade: {v.modalidade.value}")
+            print(f"   Salário: R$ {v.salario_base:.2f} | Status: {status}")
+            print(f"   Localidade: {v.localidade}")
+            print("-" * 40)
 
-            if not vagas:
-                print("Nenhuma vaga CLT cadastrada.")
-            else:
-                print(f"Total: {len(vagas)} vagas\n")
-                for v in vagas:
-                    status = "Ativa" if getattr(v, 'ativa', True) else "Inativa"
-                    print(f"ID: {v.id} | {v.titulo}")
-                    print(f"   Área: {v.area} | Modalidade: {v.modalidade.value}")
-                    print(f"   Salário: R$ {v.salario_base:.2f} | Status: {status}")
-                    print(f"   Localidade: {v.localidade}")
-                    print("-" * 40)
+        try:
+            exibir_paginado(
+                lambda cursor: self.service_vaga_clt.paginar(self.ITENS_POR_PAGINA, cursor),
+                exibir,
+                "Nenhuma vaga CLT cadastrada.",
+            )
 
         except Exception as e:
             print(f"Erro ao listar: {e}")
@@ -510,20 +511,20 @@ class FluxoEmpresaAdmin:
         self._limpar_tela()
         print(f"\n=== VAGAS DE ESTÁGIO ===\n")
 
-        try:
-            vagas = self.service_vaga_estagio.listar_todas()
+        def exibir(v) -> None:
+            print(f"ID: {v.id} | {v.titulo}")
+            print(f"   Área: {v.area} | Modalidade: {v.modalidade.value}")
+            print(f"   Bolsa: R$ {v.bolsa_auxilio:.2f}")
+            print(f"   Instituição Conveniada: {v.instituicao_conveniada}")
+            print(f"   Localidade: {v.localidade}")
+            print("-" * 40)
 
-            if not vagas:
-                print("Nenhuma vaga de estágio cadastrada.")
-            else:
-                print(f"Total: {len(vagas)} vagas\n")
-                for v in vagas:
-                    print(f"ID: {v.id} | {v.titulo}")
-                    print(f"   Área: {v.area} | Modalidade: {v.modalidade.value}")
-                    print(f"   Bolsa: R$ {v.bolsa_auxilio:.2f}")
-                    print(f"   Instituição Conveniada: {v.instituicao_conveniada}")
-                    print(f"   Localidade: {v.localidade}")
-                    print("-" * 40)
+        try:
+            exibir_paginado(
+                lambda cursor: self.service_vaga_estagio.paginar(self.ITENS_POR_PAGINA, cursor),
+                exibir,
+                "Nenhuma vaga de estágio cadastrada.",
+            )
 
         except Exception as e:
             print(f"Erro ao listar: {e}")
@@ -857,18 +858,18 @@ class FluxoEmpresaAdmin:
         self._limpar_tela()
         print("\n=== TODAS AS CANDIDATURAS ===\n")
 
-        try:
-            candidaturas = self.service_candidatura.listar_todas()
+        def exibir(c) -> None:
+            status = c.status.value if hasattr(c.status, 'value') else c.status
+            print(f"ID: {c.id} | Vaga: {c.id_vaga} | Candidato: {c.id_candidato}")
+            print(f"   Status: {status}")
+            print("-" * 40)
 
-            if not candidaturas:
-                print("Nenhuma candidatura encontrada.")
-            else:
-                print(f"Total: {len(candidaturas)}\n")
-                for c in candidaturas:
-                    status = c.status.value if hasattr(c.status, 'value') else c.status
-                    print(f"ID: {c.id} | Vaga: {c.id_vaga} | Candidato: {c.id_candidato}")
-                    print(f"   Status: {status}")
-                    print("-" * 40)
+        try:
+            exibir_paginado(
+                lambda cursor: self.service_candidatura.paginar(self.ITENS_POR_PAGINA, cursor),
+                exibir,
+                "Nenhuma candidatura encontrada.",
+            )
 
         except Exception as e:
             print(f"Erro: {e}")
@@ -882,15 +883,19 @@ class FluxoEmpresaAdmin:
 
         try:
             id_vaga = int(input("ID da vaga: ").strip())
-            candidaturas = self.service_candidatura.listar_por_vaga(id_vaga)
-
-            if not candidaturas:
-                print("\nNenhuma candidatura para esta vaga.")
-            else:
-                print(f"\nCandidaturas para vaga {id_vaga}:\n")
-                for c in candidaturas:
-                    status = c.status.value if hasattr(c.status, 'value') else c.status
-                    print(f"ID: {c.id} | Candidato: {c.id_candidato} | Status: {status}")
+            print(f"\nCandidaturas para vaga {id_vaga}:\n")
+
+            def exibir(c) -> None:
+                status = c.status.value if hasattr(c.status, 'value') else c.status
+                print(f"ID: {c.id} | Candidato: {c.id_candidato} | Status: {status}")
+
+            exibir_paginado(
+                lambda cursor: self.service_candidatura.paginar(
+                    self.ITENS_POR_PAGINA, cursor, id_vaga=id_vaga
+                ),
+                exibir,
+                "Nenhuma candidatura para esta vaga.",
+            )
 
         except ValueError as e:
             print(f"\n❌ Erro: {e}")
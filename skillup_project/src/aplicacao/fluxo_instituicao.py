@@ -15,11 +15,14 @@ from src.services.service_inscricao_curso import InscricaoCursoService
 from src.services.service_competencia import CompetenciaService
 from src.services.service_area_ensino import AreaEnsinoService
 from src.services.service_instituicao_area_ensino import InstituicaoAreaEnsinoService
+from src.aplicacao.listagem_paginada import exibir_paginado
 
 
 class FluxoInstituicao:
     """Orquestra o fluxo completo de instituições de ensino na plataforma"""
 
+    ITENS_POR_PAGINA = 20
+
     def __init__(
         self,
         service_instituicao: ServiceInstituicaoEnsino,
@@ -718,12 +721,7 @@ class FluxoInstituicao:
             self._limpar_tela()
             print(f"\n=== INSCRITOS NO CURSO EAD ID {id_curso} ===\n")
             
-            inscritos = self.service_inscricao_curso.listar_por_curso(id_curso)
-            if not inscritos:
-                print("Nenhum inscrito neste curso.")
-            else:
-                for i in inscritos:
-                    print(f"  ID Inscrição: {i.id} | Aluno ID: {i.id_aluno} | Data: {i.data_inscricao} | Status: {i.status.value}")
+            self._exibir_inscritos(id_curso)
         except ValueError:
             print("\n❌ ID inválido")
         except Exception as e:
@@ -754,18 +752,23 @@ class FluxoInstituicao:
             self._limpar_tela()
             print(f"\n=== INSCRITOS NO CURSO PRESENCIAL ID {id_curso} ===\n")
             
-            inscritos = self.service_inscricao_curso.listar_por_curso(id_curso)
-            if not inscritos:
-                print("Nenhum inscrito neste curso.")
-            else:
-                for i in inscritos:
-                    print(f"  ID Inscrição: {i.id} | Aluno ID: {i.id_aluno} | Data: {i.data_inscricao} | Status: {i.status.value}")
+            self._exibir_inscritos(id_curso)
         except ValueError:
             print("\n❌ ID inválido")
         except Exception as e:
             print(f"\n❌ Erro: {e}")
         input("\nPressione ENTER para voltar...")
 
+    def _exibir_inscritos(self, id_curso: int) -> None:
+        """Exibe os inscritos de um curso, uma página por vez"""
+        exibir_paginado(
+            lambda cursor: self.service_inscricao_curso.paginar(
+                self.ITENS_POR_PAGINA, cursor, id_curso=id_curso
+            ),
+            lambda i: print(f"  ID Inscrição: {i.id} | Aluno ID: {i.id_aluno} | Data: {i.data_inscricao} | Status: {i.status.value}"),
+            "Nenhum inscrito neste curso.",
+        )
+
     def _ver_detalhes_inscricao(self) -> None:
         """Mostra detalhes de uma inscrição"""
         if not self.service_inscricao_curso:
@@ -13,11 +13,14 @@ from src.services.service_curso_presencial import CursoPresencialService
 from src.services.service_curso_competencia import CursoCompetenciaService
 from src.services.service_inscricao_curso import InscricaoCursoService
 from src.services.service_competencia import CompetenciaService
+from src.aplicacao.listagem_paginada import exibir_paginado
 
 
 class FluxoInstituicaoAdmin:
     """Back Office para administração de Instituições de Ensino"""
 
+    ITENS_POR_PAGINA = 20
+
     def __init__(
         self,
         service_area_ensino: AreaEnsinoService,
@@ -1066,15 +1069,19 @@ class FluxoInstituicaoAdmin:
 
         try:
             id_curso = int(input("ID do curso: ").strip())
-            inscricoes = self.service_inscricao_curso.listar_por_curso(id_curso)
-
-            if not inscricoes:
-                print("\nNenhuma inscrição neste curso.")
-            else:
-                print(f"\nInscrições do curso {id_curso}:\n")
-                for i in inscricoes:
-                    status = i.status.name if hasattr(i.status, 'name') else i.status
-                    print(f"ID: {i.id} | Candidato: {i.id_aluno} | Status: {status}")
+            print(f"\nInscrições do curso {id_curso}:\n")
+
+            def exibir(i) -> None:
+                status = i.status.name if hasattr(i.status, 'name') else i.status
+                print(f"ID: {i.id} | Candidato: {i.id_aluno} | Status: {status}")
+
+            exibir_paginado(
+                lambda cursor: self.service_inscricao_curso.paginar(
+                    self.ITENS_POR_PAGINA, cursor, id_curso=id_curso
+                ),
+                exibir,
+                "Nenhuma inscrição neste curso.",
+            )
 
         except ValueError as e:
             print(f"\n❌ Erro: {e}")
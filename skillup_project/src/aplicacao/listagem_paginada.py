@@ -0,0 +1,35 @@
+"""
+Listagens paginadas das telas de terminal.
+Cada página é lida do repositório só quando o usuário pede mais.
+"""
+
+from typing import Any, Callable, Optional
+
+from src.interfaces.paginacao import Pagina
+
+
+def exibir_paginado(
+    buscar_pagina: Callable[[Optional[Any]], Pagina],
+    exibir: Callable[[Any], None],
+    mensagem_vazia: str,
+) -> int:
+    """Exibe os itens página a página e retorna quantos foram exibidos.
+
+    `buscar_pagina` recebe o cursor (None na primeira página) e devolve a
+    Pagina seguinte. Entre as páginas, ENTER continua e V interrompe.
+    """
+    pagina = buscar_pagina(None)
+    if not pagina.itens:
+        print(mensagem_vazia)
+        return 0
+    exibidos = 0
+    while True:
+        for item in pagina:
+            exibir(item)
+        exibidos += len(pagina)
+        if not pagina.tem_proxima:
+            return exibidos
+        resposta = input(f"\n{exibidos} exibidos. ENTER para ver mais ou V para parar: ")
+        if resposta.strip().upper() == "V":
+            return exibidos
+        pagina = buscar_pagina(pagina.proximo_cursor)
@@ -1,6 +1,9 @@
+import copy
 import re
 from dataclasses import dataclass, field
-from typing import List, Protocol, Tuple, Dict, Any, Optional
+from typing import List, Protocol, Tuple, Dict, Any, Optional, ClassVar
+
+from .hidratacao import construtor
 
 
 # ==============================
@@ -134,7 +137,7 @@ class CampoObrigatorioValidador:
 # ==============================
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidato:
     id: int
     nome: str
@@ -146,19 +149,19 @@ class Candidato:
     localidade: str = ""
 
     # Dependências injetadas
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    nome_validador: Validador = field(default_factory=NomeValidador, repr=False)
-    cpf_validador: Validador = field(default_factory=CpfValidador, repr=False)
-    email_validador: Validador = field(default_factory=EmailValidador, repr=False)
-    areas_validador: Validador = field(default_factory=AreasValidador, repr=False)
-    nivel_validador: Validador = field(default_factory=NivelFormacaoValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    nome_validador: ClassVar[Validador] = NomeValidador()
+    cpf_validador: ClassVar[Validador] = CpfValidador()
+    email_validador: ClassVar[Validador] = EmailValidador()
+    areas_validador: ClassVar[Validador] = AreasValidador()
+    nivel_validador: ClassVar[Validador] = NivelFormacaoValidador()
     
     # Validadores de currículo
-    objetivo_validador: Validador = field(default_factory=ObjetivoCurriculoValidador, repr=False)
-    resumo_validador: Validador = field(default_factory=ResumoCurriculoValidador, repr=False)
-    data_validador: DataCurriculoValidador = field(default_factory=DataCurriculoValidador, repr=False)
-    nivel_curriculo_validador: Validador = field(default_factory=NivelFormacaoCurriculoValidador, repr=False)
-    campo_obrigatorio_validador: CampoObrigatorioValidador = field(default_factory=CampoObrigatorioValidador, repr=False)
+    objetivo_validador: ClassVar[Validador] = ObjetivoCurriculoValidador()
+    resumo_validador: ClassVar[Validador] = ResumoCurriculoValidador()
+    data_validador: ClassVar[DataCurriculoValidador] = DataCurriculoValidador()
+    nivel_curriculo_validador: ClassVar[Validador] = NivelFormacaoCurriculoValidador()
+    campo_obrigatorio_validador: ClassVar[CampoObrigatorioValidador] = CampoObrigatorioValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -339,19 +342,19 @@ class CandidatoMapper:
             "email": candidato.email,
             "areas_interesse": list(candidato.areas_interesse),
             "nivel_formacao": candidato.nivel_formacao,
-            "curriculo": candidato.curriculo,
+            "curriculo": copy.deepcopy(candidato.curriculo),
             "localidade": candidato.localidade
         }
 
     @staticmethod
-    def from_dict(dados: dict) -> Candidato:
-        return Candidato(
+    def from_dict(dados: dict, validar: bool = True) -> Candidato:
+        return construtor(Candidato, validar)(
             id=dados["id"],
             nome=dados["nome"],
             _cpf=dados["cpf"],
             email=dados["email"],
-            _areas_interesse=dados["areas_interesse"],
+            _areas_interesse=list(dados["areas_interesse"]),
             nivel_formacao=dados["nivel_formacao"],
-            curriculo=dados.get("curriculo"),
+            curriculo=copy.deepcopy(dados.get("curriculo")),
             localidade=dados.get("localidade", "")
         )
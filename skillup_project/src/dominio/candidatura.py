@@ -1,9 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Protocol
+from typing import Protocol, ClassVar
 
 from .validators import IdValidador, StatusCandidaturaValidador, DataValidador, StrValidador, Validador
+from .hidratacao import construtor
 
 
 # ==============================
@@ -28,7 +29,7 @@ class TipoVagaCandidatura(Enum):
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class Candidatura:
     id: int
     id_vaga: int
@@ -37,10 +38,10 @@ class Candidatura:
     status: StatusCandidatura = StatusCandidatura.ENVIADO
     data_candidatura: str | None = None
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    status_validador: Validador = field(default_factory=StatusCandidaturaValidador, repr=False)
-    data_validador: Validador = field(default_factory=DataValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    status_validador: ClassVar[Validador] = StatusCandidaturaValidador()
+    data_validador: ClassVar[Validador] = DataValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -105,8 +106,10 @@ class CandidaturaMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> Candidatura:
-        return Candidatura(
+    def from_dict(d: dict, validar: bool = True) -> Candidatura:
+        # Registro sem data passa pelo construtor, que preenche a data de hoje
+        validar = validar or not d.get("data_candidatura")
+        return construtor(Candidatura, validar)(
             id=d["id_candidatura"],
             id_vaga=d["id_vaga"],
             tipo_vaga=TipoVagaCandidatura(d["tipo_vaga"]),
@@ -1,8 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Protocol
+from typing import Optional, Protocol, ClassVar
 
 from .validators import IdValidador, StrValidador, NivelValidador, Validador
+from .hidratacao import construtor
 
 
 # ==============================
@@ -19,14 +20,14 @@ class Nivel(Enum):
 # ENTIDADES DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class Competencia:
     id: int
     nome: str
     descricao: Optional[str] = None
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -35,14 +36,14 @@ class Competencia:
             raise TypeError("Descrição deve ser texto.")
 
 
-@dataclass
+@dataclass(slots=True)
 class CompetenciaNivelada(Competencia):
     nivel: Nivel = Nivel.INICIANTE
 
-    nivel_validador: Validador = field(default_factory=NivelValidador, repr=False)
+    nivel_validador: ClassVar[Validador] = NivelValidador()
 
     def __post_init__(self):
-        super().__post_init__()
+        super(CompetenciaNivelada, self).__post_init__()
         self.nivel_validador.validar(self.nivel)
         if not isinstance(self.nivel, Nivel):
             try:
@@ -71,8 +72,8 @@ class CompetenciaMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> Competencia:
-        return Competencia(
+    def from_dict(d: dict, validar: bool = True) -> Competencia:
+        return construtor(Competencia, validar)(
             id=d["id"],
             nome=d["nome"],
             descricao=d.get("descricao")
@@ -88,8 +89,8 @@ class CompetenciaNiveladaMapper:
         return data
 
     @staticmethod
-    def from_dict(d: dict) -> CompetenciaNivelada:
-        return CompetenciaNivelada(
+    def from_dict(d: dict, validar: bool = True) -> CompetenciaNivelada:
+        return construtor(CompetenciaNivelada, validar)(
             id=d["id"],
             nome=d["nome"],
             descricao=d.get("descricao"),
@@ -1,29 +1,30 @@
-from dataclasses import dataclass, field
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, ClassVar
 
 from .validators import IdValidador, StrValidador, NivelAtualizavelValidador, Validador
+from .hidratacao import construtor
 
 
 # ==============================
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class CompetenciaCandidato:
     id: int
     id_candidato: int
     id_competencia: int
     nivel_atual: str
 
-    _valid_levels: Dict[str, int] = field(init=False, repr=False, default_factory=lambda: {
+    _valid_levels: ClassVar[Dict[str, int]] = {
         "iniciante": 0,
         "intermediario": 1,
         "avancado": 2,
-    })
+    }
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    nivel_validador: Validador = field(default_factory=NivelAtualizavelValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
+    nivel_validador: ClassVar[Validador] = NivelAtualizavelValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -62,9 +63,9 @@ class CompetenciaCandidatoMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> CompetenciaCandidato:
+    def from_dict(d: dict, validar: bool = True) -> CompetenciaCandidato:
         mapa_inverso = {0: "iniciante", 1: "intermediario", 2: "avancado"}
-        return CompetenciaCandidato(
+        return construtor(CompetenciaCandidato, validar)(
             id=d["id"],
             id_candidato=d["candidato_id"],
             id_competencia=d["competencia_id"],
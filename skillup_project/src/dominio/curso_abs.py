@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, ClassVar
 
 from .vaga import Modalidade
 from .validators import IdValidador, StrValidador, CargaHorariaValidador, CapacidadeValidador, ModalidadeCursoValidador, PrazoValidador, AtivoValidador, Validador
@@ -13,7 +13,7 @@ from .validators import IdValidador, StrValidador, CargaHorariaValidador, Capaci
 # ENTIDADE DE DOMÍNIO ABSTRATA
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class Curso(ABC):
     id: int
     id_instituicao: int  # FK para InstituicaoEnsino - materializa vínculo Instituicao -> Curso
@@ -26,13 +26,13 @@ class Curso(ABC):
     ativo: bool = True
     competencias_ofertadas: List = field(default_factory=list, repr=False)
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    carga_validador: Validador = field(default_factory=CargaHorariaValidador, repr=False)
-    capacidade_validador: Validador = field(default_factory=CapacidadeValidador, repr=False)
-    modalidade_validador: Validador = field(default_factory=ModalidadeCursoValidador, repr=False)
-    prazo_validador: Validador = field(default_factory=PrazoValidador, repr=False)
-    ativo_validador: Validador = field(default_factory=AtivoValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
+    carga_validador: ClassVar[Validador] = CargaHorariaValidador()
+    capacidade_validador: ClassVar[Validador] = CapacidadeValidador()
+    modalidade_validador: ClassVar[Validador] = ModalidadeCursoValidador()
+    prazo_validador: ClassVar[Validador] = PrazoValidador()
+    ativo_validador: ClassVar[Validador] = AtivoValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
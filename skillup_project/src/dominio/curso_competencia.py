@@ -1,8 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import ClassVar
 from enum import Enum
 
 from .validators import IdValidador, StrValidador, CursoNivelValidador, Validador
 from .competencia import Nivel
+from .hidratacao import construtor
 
 
 # ==============================
@@ -19,7 +21,7 @@ class TipoCursoCompetencia(Enum):
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class CursoCompetencia:
     id: int
     id_curso: int
@@ -27,10 +29,10 @@ class CursoCompetencia:
     id_competencia: int
     nivel_conferido: str
 
-    _valid_levels: dict = field(init=False, repr=False, default_factory=lambda: {nivel.name: nivel.value for nivel in Nivel})
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    nivel_validador: Validador = field(default_factory=CursoNivelValidador, repr=False)
+    _valid_levels: ClassVar[dict] = {nivel.name: nivel.value for nivel in Nivel}
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
+    nivel_validador: ClassVar[Validador] = CursoNivelValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -80,9 +82,9 @@ class CursoCompetenciaMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> CursoCompetencia:
+    def from_dict(d: dict, validar: bool = True) -> CursoCompetencia:
         mapa_inverso = {0: "iniciante", 1: "intermediario", 2: "avancado"}
-        return CursoCompetencia(
+        return construtor(CursoCompetencia, validar)(
             id=d["id"],
             id_curso=d["curso_id"],
             tipo_curso=TipoCursoCompetencia(d["tipo_curso"]),
@@ -1,25 +1,27 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import ClassVar
 from datetime import date
 from .curso_abs import Curso
 from .validators import StrValidador, UrlValidador, Validador
+from .hidratacao import construtor
 
 
 # ==============================
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class CursoEAD(Curso):
     plataforma_url: str = ""
 
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    url_validador: Validador = field(default_factory=UrlValidador, repr=False)
+    texto_validador: ClassVar[Validador] = StrValidador()
+    url_validador: ClassVar[Validador] = UrlValidador()
 
     def __post_init__(self):
         from .vaga import Modalidade
         self.modalidade = Modalidade.REMOTO
         self.url_validador.validar(self.plataforma_url)
-        super().__post_init__()
+        super(CursoEAD, self).__post_init__()
 
     def exibir_detalhes(self) -> str:
         status = "Ativo" if self.ativo else "Inativo"
@@ -32,7 +34,7 @@ class CursoEAD(Curso):
         )
 
     def to_dict(self) -> dict:
-        data = super().to_dict()
+        data = super(CursoEAD, self).to_dict()
         data.update({"plataforma_url": self.plataforma_url, "tipo": "EAD"})
         return data
 
@@ -48,9 +50,9 @@ class CursoEADMapper:
         return curso.to_dict()
 
     @staticmethod
-    def from_dict(d: dict) -> CursoEAD:
+    def from_dict(d: dict, validar: bool = True) -> CursoEAD:
         from .vaga import Modalidade
-        return CursoEAD(
+        return construtor(CursoEAD, validar)(
             id=d["id"],
             id_instituicao=d["id_instituicao"],
             nome=d["nome"],
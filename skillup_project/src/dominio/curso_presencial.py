@@ -1,25 +1,27 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import ClassVar
 from datetime import date
 from .curso_abs import Curso
 from .validators import StrValidador, LocalidadeValidador, Validador
+from .hidratacao import construtor
 
 
 # ==============================
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class CursoPresencial(Curso):
     localidade: str = ""
 
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    localidade_validador: Validador = field(default_factory=LocalidadeValidador, repr=False)
+    texto_validador: ClassVar[Validador] = StrValidador()
+    localidade_validador: ClassVar[Validador] = LocalidadeValidador()
 
     def __post_init__(self):
         from .vaga import Modalidade
         self.modalidade = Modalidade.PRESENCIAL
         self.localidade_validador.validar(self.localidade)
-        super().__post_init__()
+        super(CursoPresencial, self).__post_init__()
 
     def exibir_detalhes(self) -> str:
         status = "Ativo" if self.ativo else "Inativo"
@@ -31,7 +33,7 @@ class CursoPresencial(Curso):
         )
 
     def to_dict(self) -> dict:
-        data = super().to_dict()
+        data = super(CursoPresencial, self).to_dict()
         data.update({"localidade": self.localidade, "tipo": "PRESENCIAL"})
         return data
 
@@ -47,9 +49,9 @@ class CursoPresencialMapper:
         return curso.to_dict()
 
     @staticmethod
-    def from_dict(d: dict) -> CursoPresencial:
+    def from_dict(d: dict, validar: bool = True) -> CursoPresencial:
         from .vaga import Modalidade
-        return CursoPresencial(
+        return construtor(CursoPresencial, validar)(
             id=d["id"],
             id_instituicao=d["id_instituicao"],
             nome=d["nome"],
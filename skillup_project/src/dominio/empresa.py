@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Protocol, ClassVar
 
 from .validators import (
     IdValidador,
@@ -8,6 +8,7 @@ from .validators import (
     PorteValidador,
     Validador,
 )
+from .hidratacao import construtor
 
 
 # ==============================
@@ -21,17 +22,17 @@ from .validators import (
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class Empresa:
     id: int
     nome: str
     _cnpj: str = field(repr=False)
     porte: str
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    nome_validador: Validador = field(default_factory=StrValidador, repr=False)
-    cnpj_validador: Validador = field(default_factory=CnpjValidador, repr=False)
-    porte_validador: Validador = field(default_factory=PorteValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    nome_validador: ClassVar[Validador] = StrValidador()
+    cnpj_validador: ClassVar[Validador] = CnpjValidador()
+    porte_validador: ClassVar[Validador] = PorteValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -84,8 +85,8 @@ class EmpresaMapper:
         }
 
     @staticmethod
-    def from_dict(dados: dict) -> Empresa:
-        return Empresa(
+    def from_dict(dados: dict, validar: bool = True) -> Empresa:
+        return construtor(Empresa, validar)(
             id=dados["id"],
             nome=dados["nome"],
             _cnpj=dados["cnpj"],
@@ -2,19 +2,20 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from .validators import IdValidador, StrValidador, CnpjValidador, Validador
 
 
-@dataclass
+@dataclass(slots=True)
 class EntidadePublicadora(ABC):
     id: int
     nome: str
     _cnpj: str = field(repr=False)
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    nome_validador: Validador = field(default_factory=StrValidador, repr=False)
-    cnpj_validador: Validador = field(default_factory=CnpjValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    nome_validador: ClassVar[Validador] = StrValidador()
+    cnpj_validador: ClassVar[Validador] = CnpjValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
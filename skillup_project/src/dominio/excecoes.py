@@ -0,0 +1,18 @@
+from typing import Any
+
+
+class ChaveDuplicadaError(ValueError):
+    """Violação de um campo único (CPF, e-mail, CNPJ) ao gravar um registro."""
+
+    def __init__(self, campo: str, valor: Any, mensagem: str = None):
+        self.campo = campo
+        self.valor = valor
+        super().__init__(mensagem or f"Já existe registro com {campo} = {valor}")
+
+
+class ConflitoEscritaError(RuntimeError):
+    """Um arquivo foi alterado por outra escrita enquanto uma unidade de trabalho o alterava."""
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        super().__init__(f"{caminho} foi alterado por outra escrita durante a unidade de trabalho")
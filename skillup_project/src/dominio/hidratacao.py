@@ -0,0 +1,62 @@
+from dataclasses import MISSING, fields
+from typing import Callable, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+
+# ==============================
+# HIDRATAÇÃO CONFIÁVEL
+# ==============================
+
+# Uma função gerada por classe, equivalente ao __init__ sem o __post_init__
+_HIDRATADORES: Dict[type, Callable[..., object]] = {}
+
+
+def _gerar_hidratador(cls: type) -> Callable[..., object]:
+    """Gera `def hidratar(**valores)` que atribui cada campo direto, sem validar.
+
+    Mesma ideia do __init__ que o dataclass gera: código específico da classe,
+    sem laço sobre os campos a cada instância.
+    """
+    ambiente = {"_novo": object.__new__, "_cls": cls}
+    linhas = ["def hidratar(**valores):", "    obj = _novo(_cls)", "    try:"]
+    for f in fields(cls):
+        nome = f.name
+        if f.default is not MISSING:
+            ambiente[f"_padrao_{nome}"] = f.default
+            valor = f"valores.get({nome!r}, _padrao_{nome})"
+        elif f.default_factory is not MISSING:
+            ambiente[f"_fabrica_{nome}"] = f.default_factory
+            valor = f"valores[{nome!r}] if {nome!r} in valores else _fabrica_{nome}()"
+        else:
+            valor = f"valores[{nome!r}]"
+        linhas.append(f"        obj.{nome} = {valor}")
+    linhas += [
+        "    except KeyError as erro:",
+        f"        raise TypeError('{cls.__name__}: campo obrigatório ausente: ' + erro.args[0]) from None",
+        "    return obj",
+    ]
+    exec("\n".join(linhas), ambiente)
+    return ambiente["hidratar"]
+
+
+def _hidratador(cls: type) -> Callable[..., object]:
+    funcao = _HIDRATADORES.get(cls)
+    if funcao is None:
+        funcao = _HIDRATADORES[cls] = _gerar_hidratador(cls)
+    return funcao
+
+
+def hidratar(cls: Type[T], **valores) -> T:
+    """Cria a entidade sem passar por __init__/__post_init__.
+
+    Só para registros lidos do armazenamento, que já foram validados quando
+    gravados. Campos omitidos recebem o padrão declarado na dataclass; campo
+    obrigatório ausente levanta TypeError, como no construtor.
+    """
+    return construtor(cls, validar=False)(**valores)
+
+
+def construtor(cls: Type[T], validar: bool = True) -> Callable[..., T]:
+    """Retorna o construtor normal (com validação) ou o de hidratação confiável."""
+    return cls if validar else _hidratador(cls)
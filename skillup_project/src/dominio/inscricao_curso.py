@@ -1,9 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from datetime import date
-from typing import Protocol
+from typing import Protocol, ClassVar
 
 from .validators import IdValidador, DataInscricaoValidador, StatusInscricaoValidador, Validador
+from .hidratacao import construtor
 
 
 # ==============================
@@ -26,7 +27,7 @@ class TipoCursoInscricao(Enum):
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class InscricaoCurso:
     id: int
     id_curso: int
@@ -35,9 +36,9 @@ class InscricaoCurso:
     data_inscricao: date
     status: StatusInscricao = StatusInscricao.DEFERIDO
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    data_validador: Validador = field(default_factory=DataInscricaoValidador, repr=False)
-    status_validador: Validador = field(default_factory=StatusInscricaoValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    data_validador: ClassVar[Validador] = DataInscricaoValidador()
+    status_validador: ClassVar[Validador] = StatusInscricaoValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -91,8 +92,8 @@ class InscricaoCursoMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> InscricaoCurso:
-        return InscricaoCurso(
+    def from_dict(d: dict, validar: bool = True) -> InscricaoCurso:
+        return construtor(InscricaoCurso, validar)(
             id=d["id"],
             id_curso=d["curso_id"],
             tipo_curso=TipoCursoInscricao(d["tipo_curso"]),
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, ClassVar
 
 from .entidade_publicadora import EntidadePublicadora
 from .validators import (
@@ -10,13 +10,14 @@ from .validators import (
     ModalidadesValidador,
     Validador,
 )
+from .hidratacao import construtor
 
 
 # ==============================
 # ENTIDADES DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class InstituicaoEnsino(EntidadePublicadora):
     razao_social: str = ""
     nome_fantasia: str = ""
@@ -29,11 +30,11 @@ class InstituicaoEnsino(EntidadePublicadora):
     endereco: str = ""
     website: str = ""
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    cnpj_validador: Validador = field(default_factory=CnpjValidador, repr=False)
-    credenciado_validador: Validador = field(default_factory=CredenciadoValidador, repr=False)
-    modalidades_validador: Validador = field(default_factory=ModalidadesValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
+    cnpj_validador: ClassVar[Validador] = CnpjValidador()
+    credenciado_validador: ClassVar[Validador] = CredenciadoValidador()
+    modalidades_validador: ClassVar[Validador] = ModalidadesValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -76,7 +77,7 @@ class InstituicaoEnsinoMapper:
             "cnpj": instituicao.cnpj,
             "registro_educacional": instituicao.registro_educacional,
             "tipo": instituicao.tipo,
-            "modalidades": instituicao.modalidades,
+            "modalidades": list(instituicao.modalidades),
             "credenciada": instituicao.credenciada,
             "email": instituicao.email,
             "telefone": instituicao.telefone,
@@ -85,8 +86,8 @@ class InstituicaoEnsinoMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> InstituicaoEnsino:
-        return InstituicaoEnsino(
+    def from_dict(d: dict, validar: bool = True) -> InstituicaoEnsino:
+        return construtor(InstituicaoEnsino, validar)(
             id=d["id"],
             nome=d.get("nome", d.get("nome_fantasia", "")),
             razao_social=d.get("razao_social", d.get("nome", "")),
@@ -94,7 +95,7 @@ class InstituicaoEnsinoMapper:
             _cnpj=d["cnpj"],
             registro_educacional=d["registro_educacional"],
             tipo=d["tipo"],
-            modalidades=d.get("modalidades", []),
+            modalidades=list(d.get("modalidades", [])),
             credenciada=d.get("credenciada", True),
             email=d.get("email", ""),
             telefone=d.get("telefone", ""),
@@ -107,13 +108,13 @@ class InstituicaoEnsinoMapper:
 # ENTIDADES COMPLEMENTARES
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class AreaEnsino:
     id_area: int
     nome_area: str
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id_area)
@@ -130,20 +131,20 @@ class AreaEnsinoMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> AreaEnsino:
-        return AreaEnsino(
+    def from_dict(d: dict, validar: bool = True) -> AreaEnsino:
+        return construtor(AreaEnsino, validar)(
             id_area=d["id_area"],
             nome_area=d["nome_area"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InstituicaoAreaEnsino:
     id_instituicao_area: int
     id_instituicao: int
     id_area: int
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id_instituicao_area)
@@ -162,8 +163,8 @@ class InstituicaoAreaEnsinoMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> InstituicaoAreaEnsino:
-        return InstituicaoAreaEnsino(
+    def from_dict(d: dict, validar: bool = True) -> InstituicaoAreaEnsino:
+        return construtor(InstituicaoAreaEnsino, validar)(
             id_instituicao_area=d["id_instituicao_area"],
             id_instituicao=d["id_instituicao"],
             id_area=d["id_area"],
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+# ==============================
+# ITENS RECOMENDADOS
+# ==============================
+
+# Guardam o que a tela de recomendações exibe, para que ler a recomendação
+# de um candidato não exija buscar cada vaga ou curso no repositório.
+
+@dataclass(frozen=True, slots=True)
+class VagaRecomendada:
+    id: int
+    titulo: str
+    area: str
+    modalidade: str
+    pontuacao: int
+    percentual: Optional[int] = None   # compatibilidade de competências, se calculada
+
+
+@dataclass(frozen=True, slots=True)
+class CursoRecomendado:
+    id: int
+    nome: str
+    area: str
+    carga_horaria: int
+    pontuacao: int
+
+
+# ==============================
+# RECOMENDAÇÃO PRÉ-CALCULADA
+# ==============================
+
+@dataclass(slots=True)
+class RecomendacaoSalva:
+    """Melhores vagas e cursos de um candidato, ordenados por pontuação (maior primeiro)."""
+    id_candidato: int
+    vagas: Tuple[VagaRecomendada, ...] = ()
+    cursos: Tuple[CursoRecomendado, ...] = ()
+    gerada_em: str = ""
+
+
+class RecomendacaoSalvaMapper:
+
+    @staticmethod
+    def to_dict(recomendacao: RecomendacaoSalva) -> dict:
+        return {
+            "id_candidato": recomendacao.id_candidato,
+            "gerada_em": recomendacao.gerada_em,
+            "vagas": [
+                [v.id, v.titulo, v.area, v.modalidade, v.pontuacao, v.percentual]
+                for v in recomendacao.vagas
+            ],
+            "cursos": [
+                [c.id, c.nome, c.area, c.carga_horaria, c.pontuacao]
+                for c in recomendacao.cursos
+            ],
+        }
+
+    @staticmethod
+    def from_dict(d: dict) -> RecomendacaoSalva:
+        return RecomendacaoSalva(
+            id_candidato=d["id_candidato"],
+            vagas=tuple(VagaRecomendada(*v) for v in d.get("vagas", ())),
+            cursos=tuple(CursoRecomendado(*c) for c in d.get("cursos", ())),
+            gerada_em=d.get("gerada_em", ""),
+        )
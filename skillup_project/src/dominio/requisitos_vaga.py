@@ -1,9 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple
+from typing import Tuple, ClassVar
 
 from .validators import IdValidador, StrValidador, NivelMinimoValidador, BooleanValidador, Validador
 from .competencia import Nivel
+from .hidratacao import construtor
 
 
 # ==============================
@@ -20,7 +21,7 @@ class TipoVagaRequisito(Enum):
 # ENTIDADE DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class RequisitoVaga:
     id: int
     id_vaga: int
@@ -29,10 +30,10 @@ class RequisitoVaga:
     nivel_minimo: str
     obrigatorio: bool = True
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    nivel_validador: Validador = field(default_factory=NivelMinimoValidador, repr=False)
-    bool_validador: Validador = field(default_factory=BooleanValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
+    nivel_validador: ClassVar[Validador] = NivelMinimoValidador()
+    bool_validador: ClassVar[Validador] = BooleanValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -89,9 +90,9 @@ class RequisitoVagaMapper:
         }
 
     @staticmethod
-    def from_dict(d: dict) -> RequisitoVaga:
+    def from_dict(d: dict, validar: bool = True) -> RequisitoVaga:
         mapa_inverso = {0: "INICIANTE", 1: "INTERMEDIARIO", 2: "AVANCADO"}
-        return RequisitoVaga(
+        return construtor(RequisitoVaga, validar)(
             id=d["id"],
             id_vaga=d["vaga_id"],
             tipo_vaga=TipoVagaRequisito(d["tipo_vaga"]),
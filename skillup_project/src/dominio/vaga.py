@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, ClassVar
 
 from .validators import (
     IdValidador,
@@ -15,6 +15,7 @@ from .validators import (
     AtivoValidador,
     Validador,
 )
+from .hidratacao import construtor
 
 
 # ==============================
@@ -37,7 +38,7 @@ class TipoVaga(Enum):
 # ENTIDADES DE DOMÍNIO
 # ==============================
 
-@dataclass
+@dataclass(slots=True)
 class Vaga(ABC):
     id: int
     id_empresa: int  # FK para Empresa - materializa vínculo Empresa -> Vaga
@@ -51,13 +52,13 @@ class Vaga(ABC):
     requisitos: List[str] = field(default_factory=list, repr=False)
     ativa: bool = True
 
-    id_validador: Validador = field(default_factory=IdValidador, repr=False)
-    texto_validador: Validador = field(default_factory=StrValidador, repr=False)
-    modalidade_validador: Validador = field(default_factory=ModalidadeValidador, repr=False)
-    tipo_validador: Validador = field(default_factory=TipoVagaValidador, repr=False)
-    requisitos_validador: Validador = field(default_factory=RequisitosValidador, repr=False)
-    prazo_validador: Validador = field(default_factory=PrazoValidador, repr=False)
-    ativo_validador: Validador = field(default_factory=AtivoValidador, repr=False)
+    id_validador: ClassVar[Validador] = IdValidador()
+    texto_validador: ClassVar[Validador] = StrValidador()
+    modalidade_validador: ClassVar[Validador] = ModalidadeValidador()
+    tipo_validador: ClassVar[Validador] = TipoVagaValidador()
+    requisitos_validador: ClassVar[Validador] = RequisitosValidador()
+    prazo_validador: ClassVar[Validador] = PrazoValidador()
+    ativo_validador: ClassVar[Validador] = AtivoValidador()
 
     def __post_init__(self):
         self.id_validador.validar(self.id)
@@ -118,15 +119,15 @@ class Vaga(ABC):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VagaCLT(Vaga):
     salario_base: float = 0.0
     localidade: str = ""
 
-    salario_validador: Validador = field(default_factory=SalarioValidador, repr=False)
+    salario_validador: ClassVar[Validador] = SalarioValidador()
 
     def __post_init__(self):
-        super().__post_init__()
+        super(VagaCLT, self).__post_init__()
         if self.salario_base > 0:
             self.salario_validador.validar(self.salario_base)
         if not isinstance(self.localidade, str):
@@ -137,23 +138,23 @@ class VagaCLT(Vaga):
         return self.salario_base * 1.8
 
     def to_dict(self) -> dict:
-        data = super().to_dict()
+        data = super(VagaCLT, self).to_dict()
         data["salario_base"] = self.salario_base
         data["localidade"] = self.localidade
         data["tipo_vaga"] = "CLT"
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class VagaEstagio(Vaga):
     bolsa_auxilio: float = 0.0
     id_instituicao_conveniada: int | None = None  # FK opcional para InstituicaoEnsino
     localidade: str = ""
 
-    bolsa_validador: Validador = field(default_factory=SalarioValidador, repr=False)
+    bolsa_validador: ClassVar[Validador] = SalarioValidador()
 
     def __post_init__(self):
-        super().__post_init__()
+        super(VagaEstagio, self).__post_init__()
         if self.bolsa_auxilio > 0:
             self.bolsa_validador.validar(self.bolsa_auxilio)
         if self.id_instituicao_conveniada is not None:
@@ -166,7 +167,7 @@ class VagaEstagio(Vaga):
         return self.bolsa_auxilio * 1.1
 
     def to_dict(self) -> dict:
-        data = super().to_dict()
+        data = super(VagaEstagio, self).to_dict()
         data["bolsa_auxilio"] = self.bolsa_auxilio
         data["id_instituicao_conveniada"] = self.id_instituicao_conveniada
         data["localidade"] = self.localidade
@@ -185,10 +186,10 @@ class VagaCLTMapper:
         return vaga.to_dict()
 
     @staticmethod
-    def from_dict(d: dict) -> VagaCLT:
+    def from_dict(d: dict, validar: bool = True) -> VagaCLT:
         prazo_str = d.get("prazo_inscricao")
         prazo = date.fromisoformat(prazo_str) if prazo_str else None
-        return VagaCLT(
+        return construtor(VagaCLT, validar)(
             id=d["id"],
             id_empresa=d["id_empresa"],
             titulo=d["titulo"],
@@ -197,7 +198,7 @@ class VagaCLTMapper:
             modalidade=Modalidade(d["modalidade"]),
             tipo=TipoVaga(d["tipo"]),
             prazo_inscricao=prazo,
-            requisitos=d.get("requisitos", []),
+            requisitos=list(d.get("requisitos", [])),
             ativa=d.get("ativa", True),
             salario_base=d.get("salario_base", 0.0),
             localidade=d.get("localidade", "")
@@ -211,10 +212,10 @@ class VagaEstagioMapper:
         return vaga.to_dict()
 
     @staticmethod
-    def from_dict(d: dict) -> VagaEstagio:
+    def from_dict(d: dict, validar: bool = True) -> VagaEstagio:
         prazo_str = d.get("prazo_inscricao")
         prazo = date.fromisoformat(prazo_str) if prazo_str else None
-        return VagaEstagio(
+        return construtor(VagaEstagio, validar)(
             id=d["id"],
             id_empresa=d["id_empresa"],
             titulo=d["titulo"],
@@ -223,7 +224,7 @@ class VagaEstagioMapper:
             modalidade=Modalidade(d["modalidade"]),
             tipo=TipoVaga(d["tipo"]),
             prazo_inscricao=prazo,
-            requisitos=d.get("requisitos", []),
+            requisitos=list(d.get("requisitos", [])),
             ativa=d.get("ativa", True),
             bolsa_auxilio=d.get("bolsa_auxilio", 0.0),
             id_instituicao_conveniada=d.get("id_instituicao_conveniada"),
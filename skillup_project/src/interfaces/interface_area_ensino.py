@@ -1,15 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.instituicao_ensino import AreaEnsino
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
 
 '''Interface para repositório de AreaEnsino. Define os métodos que qualquer implementação deve seguir.'''
-class IAreaEnsinoRepositorio(ABC):
+class IAreaEnsinoRepositorio(Paginavel[AreaEnsino], GravacaoEmLote[AreaEnsino], ABC):
     """
     Interface que define o contrato para repositórios de AreaEnsino.
     Classes concretas devem implementar a persistência de áreas de ensino.
     """
 
+    _LISTAGENS = {None: "listar_todas"}
+
     @abstractmethod
     def salvar(self, area: AreaEnsino) -> None:
         """
@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.candidato import Candidato
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
+from src.interfaces.versao import Versionado
 
 '''Interface para repositório de candidatos. Define os métodos que qualquer implementação deve seguir.'''
-class ICandidatoRepositorio(ABC):
+class ICandidatoRepositorio(Paginavel[Candidato], GravacaoEmLote[Candidato], Versionado, ABC):
+
+    _LISTAGENS = {None: "listar"}
 
     @abstractmethod
     def salvar(self, candidato: Candidato):
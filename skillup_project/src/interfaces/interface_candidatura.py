@@ -1,14 +1,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.candidatura import Candidatura
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
-class ICandidaturaRepositorio(ABC):
+class ICandidaturaRepositorio(Paginavel[Candidatura], GravacaoEmLote[Candidatura], ABC):
     """
     Interface que define o contrato para repositórios de Candidatura.
     Classes concretas devem implementar todos os métodos.
     
     """
 
+    _LISTAGENS = {
+        None: "listar_todas",
+        "id_candidato": "listar_por_candidato",
+        "id_vaga": "listar_por_vaga",
+        "status": "listar_por_status",
+    }
+
     @abstractmethod
     def salvar(self, candidatura: Candidatura) -> None:
         """
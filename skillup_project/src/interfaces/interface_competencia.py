@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.competencia import Competencia
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
-class ICompetenciaRepositorio(ABC):
+class ICompetenciaRepositorio(Paginavel[Competencia], GravacaoEmLote[Competencia], ABC):
     """
     Interface que define o contrato para repositórios de Competencia.
     Classes concretas devem implementar a persistência de competencias.
     """
+
+    _LISTAGENS = {None: "listar_todos"}
     @abstractmethod
     def salvar(self, competencia: Competencia) -> None:
         """
@@ -1,14 +1,24 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.competencia_candidato import CompetenciaCandidato
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
+from src.interfaces.versao import Versionado
 
 '''Interface para repositório de CompetenciaCandidato. Define os métodos que qualquer implementação deve seguir.'''
-class ICompetenciaCandidatoRepositorio(ABC):
+class ICompetenciaCandidatoRepositorio(Paginavel[CompetenciaCandidato], GravacaoEmLote[CompetenciaCandidato], Versionado, ABC):
     """
     Interface que define o contrato para repositórios de CompetenciaCandidato.
     Classes concretas devem implementar a persistência de competências de candidatos.
     """
 
+    _LISTAGENS = {
+        None: "listar_todas",
+        "id_candidato": "listar_por_candidato",
+        "id_competencia": "listar_por_competencia",
+        "nivel": "listar_por_nivel",
+    }
+
     @abstractmethod
     def salvar(self, competencia_candidato: CompetenciaCandidato) -> None:
         """
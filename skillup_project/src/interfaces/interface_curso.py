@@ -1,14 +1,24 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.curso_abs import Curso
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
+from src.interfaces.versao import Versionado
 
 '''Interface para repositório de Curso. Define os métodos que qualquer implementação deve seguir.'''
-class ICursoRepositorio(ABC):
+class ICursoRepositorio(Paginavel[Curso], GravacaoEmLote[Curso], Versionado, ABC):
     """
     Interface que define o contrato para repositórios de Curso.
     Classes concretas devem implementar a persistência de cursos (EAD e Presencial).
     """
 
+    _LISTAGENS = {
+        None: "listar_todos",
+        "nome": "listar_por_nome",
+        "tipo": "listar_por_tipo",
+        "carga_horaria_minima": "listar_por_carga_horaria_minima",
+    }
+
     @abstractmethod
     def salvar(self, curso: Curso) -> None:
         """
@@ -1,14 +1,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.curso_competencia import CursoCompetencia
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
 '''Interface para repositório de CursoCompetencia. Define os métodos que qualquer implementação deve seguir.'''
-class ICursoCompetenciaRepositorio(ABC):
+class ICursoCompetenciaRepositorio(Paginavel[CursoCompetencia], GravacaoEmLote[CursoCompetencia], ABC):
     """
     Interface que define o contrato para repositórios de CursoCompetencia.
     Classes concretas devem implementar a persistência de competências oferecidas por cursos.
     """
 
+    _LISTAGENS = {
+        None: "listar_todas",
+        "id_curso": "listar_por_curso",
+        "id_competencia": "listar_por_competencia",
+        "nivel": "listar_por_nivel",
+    }
+
     @abstractmethod
     def salvar(self, curso_competencia: CursoCompetencia) -> None:
         """
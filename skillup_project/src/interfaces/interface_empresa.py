@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.empresa import Empresa
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
 '''Interface para repositório de Empresa. Define os métodos que qualquer implementação deve seguir.'''
-class IEmpresa(ABC):
+class IEmpresa(Paginavel[Empresa], GravacaoEmLote[Empresa], ABC):
+
+    _LISTAGENS = {None: "listar"}
 
     @abstractmethod
     def salvar(self, empresa: Empresa):
@@ -2,14 +2,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.inscricao_curso import InscricaoCurso
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
 
-class IInscricaoCursoRepositorio(ABC):
+class IInscricaoCursoRepositorio(Paginavel[InscricaoCurso], GravacaoEmLote[InscricaoCurso], ABC):
     """
     Interface que define o contrato para repositórios de InscricaoCurso.
     Classes concretas devem implementar todos os métodos.
     """
 
+    _LISTAGENS = {
+        None: "listar_todas",
+        "id_aluno": "listar_por_aluno",
+        "id_curso": "listar_por_curso",
+        "status": "listar_por_status",
+    }
+
     @abstractmethod
     def salvar(self, inscricao: InscricaoCurso) -> None:
         """
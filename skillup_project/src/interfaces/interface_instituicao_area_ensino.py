@@ -1,15 +1,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.instituicao_ensino import InstituicaoAreaEnsino
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
 
 '''Interface para repositório de InstituicaoAreaEnsino. Define os métodos que qualquer implementação deve seguir.'''
-class IInstituicaoAreaEnsinoRepositorio(ABC):
+class IInstituicaoAreaEnsinoRepositorio(Paginavel[InstituicaoAreaEnsino], GravacaoEmLote[InstituicaoAreaEnsino], ABC):
     """
     Interface que define o contrato para repositórios de InstituicaoAreaEnsino.
     Classes concretas devem implementar a persistência das relações instituição-área.
     """
 
+    _LISTAGENS = {
+        None: "listar_todas",
+        "id_instituicao": "listar_por_instituicao",
+        "id_area": "listar_por_area",
+    }
+
     @abstractmethod
     def salvar(self, inst_area: InstituicaoAreaEnsino) -> None:
         """
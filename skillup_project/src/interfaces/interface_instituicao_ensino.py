@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.instituicao_ensino import InstituicaoEnsino
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
 
 '''Interface para repositório de Instituição de Ensino. Define os métodos que qualquer implementação deve seguir.'''
-class IInstituicaoEnsino(ABC):
+class IInstituicaoEnsino(Paginavel[InstituicaoEnsino], GravacaoEmLote[InstituicaoEnsino], ABC):
+
+    _LISTAGENS = {None: "listar"}
 
     @abstractmethod
     def salvar(self, instituicao: InstituicaoEnsino):
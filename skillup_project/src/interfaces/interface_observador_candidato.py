@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Collection, Sequence
+
+from src.dominio.candidato import Candidato
+
+
+'''Interface para quem precisa acompanhar mudanças no perfil dos candidatos (ex.: recomendações pré-calculadas).'''
+class IObservadorCandidato(ABC):
+    """
+    Interface que define o contrato para observadores de candidatos.
+    Os serviços de candidato, de competências e de inscrição avisam os observadores
+    depois de cada escrita no repositório. Escritas em lote geram um único aviso.
+    """
+
+    @abstractmethod
+    def candidatos_salvos(self, candidatos: Sequence[Candidato]) -> None:
+        """
+        Chamado após candidatos serem cadastrados ou alterados.
+        param candidatos: Candidatos no estado que foi gravado.
+        """
+        pass
+
+    @abstractmethod
+    def candidato_removido(self, id_candidato: int) -> None:
+        """
+        Chamado após um candidato ser excluído.
+        param id_candidato: ID do candidato excluído.
+        """
+        pass
+
+    @abstractmethod
+    def competencias_alteradas(self, ids_candidatos: Collection[int]) -> None:
+        """
+        Chamado após competências de candidatos serem cadastradas, alteradas ou removidas.
+        param ids_candidatos: IDs dos candidatos cujas competências mudaram.
+        """
+        pass
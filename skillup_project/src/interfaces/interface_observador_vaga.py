@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from src.dominio.vaga import Vaga
+
+
+'''Interface para quem precisa acompanhar mudanças nas vagas (ex.: índices de busca).'''
+class IObservadorVaga(ABC):
+    """
+    Interface que define o contrato para observadores de vagas.
+    Os serviços de vaga avisam os observadores depois de cada escrita no repositório.
+    """
+
+    @abstractmethod
+    def vaga_salva(self, vaga: Vaga) -> None:
+        """
+        Chamado após uma vaga ser cadastrada ou alterada.
+        param vaga: Vaga no estado que foi gravado.
+        """
+        pass
+
+    def vagas_salvas(self, vagas: Sequence[Vaga]) -> None:
+        """
+        Chamado após uma escrita em lote de vagas (ex.: importação em massa).
+        Por padrão equivale a um `vaga_salva` por vaga.
+        param vagas: Vagas no estado que foi gravado.
+        """
+        for vaga in vagas:
+            self.vaga_salva(vaga)
+
+    @abstractmethod
+    def vaga_removida(self, id_vaga: int) -> None:
+        """
+        Chamado após uma vaga ser excluída.
+        param id_vaga: ID da vaga excluída.
+        """
+        pass
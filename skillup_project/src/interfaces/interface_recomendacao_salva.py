@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional
+from src.dominio.recomendacao_salva import RecomendacaoSalva
+from src.interfaces.versao import Versionado
+
+'''Interface para o repositório de recomendações pré-calculadas. Define os métodos que qualquer implementação deve seguir.'''
+class IRecomendacaoSalvaRepositorio(Versionado, ABC):
+    """
+    Interface que define o contrato para repositórios de recomendações pré-calculadas.
+    Cada candidato tem no máximo uma recomendação, identificada pelo ID do candidato.
+    """
+
+    @abstractmethod
+    def buscar_por_candidato(self, id_candidato: int) -> Optional[RecomendacaoSalva]:
+        """
+        Busca a recomendação de um candidato pela chave, sem percorrer as demais.
+        param id_candidato: ID do candidato.
+        return: RecomendacaoSalva encontrada ou None se ainda não foi calculada.
+        """
+        pass
+
+    @abstractmethod
+    def iterar(self) -> Iterator[RecomendacaoSalva]:
+        """
+        Percorre todas as recomendações salvas, sem montar uma lista.
+        return: Iterador de RecomendacaoSalva.
+        """
+        pass
+
+    @abstractmethod
+    def salvar_muitos(self, recomendacoes: Iterable[RecomendacaoSalva]) -> None:
+        """
+        Salva as recomendações numa única gravação, substituindo as dos mesmos candidatos.
+        param recomendacoes: Recomendações a persistir.
+        """
+        pass
+
+    @abstractmethod
+    def substituir_todas(self, recomendacoes: Iterable[RecomendacaoSalva]) -> None:
+        """
+        Troca todo o conteúdo do armazenamento pelas recomendações informadas.
+        param recomendacoes: Recomendações de todos os candidatos.
+        """
+        pass
+
+    @abstractmethod
+    def remover_por_candidato(self, id_candidato: int) -> bool:
+        """
+        Remove a recomendação de um candidato.
+        param id_candidato: ID do candidato.
+        return: True se havia recomendação, False caso contrário.
+        """
+        pass
@@ -1,14 +1,25 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.requisitos_vaga import RequisitoVaga
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
+from src.interfaces.versao import Versionado
 
 '''Interface para repositório de RequisitoVaga. Define os métodos que qualquer implementação deve seguir.'''
-class IRequisitoVagaRepositorio(ABC):
+class IRequisitoVagaRepositorio(Paginavel[RequisitoVaga], GravacaoEmLote[RequisitoVaga], Versionado, ABC):
     """
     Interface que define o contrato para repositórios de RequisitoVaga.
     Classes concretas devem implementar a persistência de requisitos de vagas.
     """
 
+    _LISTAGENS = {
+        None: "listar_todos",
+        "id_vaga": "listar_por_vaga",
+        "id_competencia": "listar_por_competencia",
+        "obrigatorios_da_vaga": "listar_obrigatorios_por_vaga",
+        "nivel_minimo": "listar_por_nivel_minimo",
+    }
+
     @abstractmethod
     def salvar(self, requisito: RequisitoVaga) -> None:
         """
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+'''Interface para geradores de IDs. Define os métodos que qualquer implementação deve seguir.'''
+class ISequenciaIds(ABC):
+    """
+    Interface que define o contrato para sequências de IDs por entidade.
+    Cada entidade (candidato, vaga_clt, candidatura...) tem seu próprio contador,
+    que só cresce: um ID entregue nunca é entregue de novo.
+    """
+
+    @abstractmethod
+    def proximo(self, entidade: str, maior_existente: Callable[[], int] = lambda: 0) -> int:
+        """
+        Retorna o próximo ID da entidade e avança o contador.
+        param entidade: Nome da sequência (ex.: "candidatura").
+        param maior_existente: Chamada apenas quando a sequência ainda não existe,
+            para iniciá-la a partir do maior ID já gravado.
+        return: ID reservado.
+        """
+        pass
+
+    @abstractmethod
+    def reservar(
+        self, entidade: str, quantidade: int, maior_existente: Callable[[], int] = lambda: 0
+    ) -> range:
+        """
+        Reserva um bloco de IDs consecutivos (usado em inserções em lote).
+        param entidade: Nome da sequência.
+        param quantidade: Quantos IDs reservar.
+        param maior_existente: Ver `proximo`.
+        return: range com os IDs reservados.
+        """
+        pass
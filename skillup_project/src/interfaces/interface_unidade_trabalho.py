@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+
+
+'''Interface para unidades de trabalho. Define os métodos que qualquer implementação deve seguir.'''
+class IUnidadeDeTrabalho(ABC):
+    """
+    Interface que define o contrato de uma unidade de trabalho: as escritas feitas
+    nos repositórios enquanto ela está aberta são gravadas juntas em `confirmar`
+    ou descartadas em `desfazer`.
+    Usada com `with`: sair do bloco normalmente confirma, sair com exceção desfaz.
+    """
+
+    def __enter__(self) -> "IUnidadeDeTrabalho":
+        self.abrir()
+        return self
+
+    def __exit__(self, tipo, erro, rastreamento) -> bool:
+        if tipo is None:
+            self.confirmar()
+        else:
+            self.desfazer()
+        return False
+
+    @abstractmethod
+    def abrir(self) -> None:
+        """
+        Passa a acumular as escritas dos repositórios feitas na thread atual.
+        """
+        pass
+
+    @abstractmethod
+    def confirmar(self) -> None:
+        """
+        Grava de uma vez tudo o que foi escrito desde `abrir`.
+        """
+        pass
+
+    @abstractmethod
+    def desfazer(self) -> None:
+        """
+        Descarta tudo o que foi escrito desde `abrir`.
+        """
+        pass
@@ -1,13 +1,24 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.dominio.vaga import Vaga
+from src.interfaces.lote import GravacaoEmLote
+from src.interfaces.paginacao import Paginavel
+from src.interfaces.versao import Versionado
 
-class IVagaRepositorio(ABC):
+class IVagaRepositorio(Paginavel[Vaga], GravacaoEmLote[Vaga], Versionado, ABC):
     """
     Interface que define o contrato para repositórios de Vaga.
     Classes concretas devem implementar a persistência de vaga (ex: JSON, Banco).
     """
 
+    _LISTAGENS = {
+        None: "listar_todas",
+        "area": "listar_por_area",
+        "modalidade": "listar_por_modalidade",
+        "tipo": "listar_por_tipo",
+        "titulo": "listar_por_titulo",
+    }
+
     @abstractmethod
     def salvar(self, vaga: Vaga) -> None:
         """
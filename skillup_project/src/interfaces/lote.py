@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Generic, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class ErroLote:
+    """Item de um lote que não foi cadastrado."""
+    posicao: int    # índice do item nos dados de entrada
+    mensagem: str
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoLote(Generic[T]):
+    """Resultado de um cadastro em lote: os itens gravados e o erro de cada item recusado.
+
+    Iterar percorre os itens cadastrados.
+    """
+    cadastrados: List[T] = field(default_factory=list)
+    erros: List[ErroLote] = field(default_factory=list)
+
+    @property
+    def sucesso(self) -> bool:
+        return not self.erros
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.cadastrados)
+
+    def __len__(self) -> int:
+        return len(self.cadastrados)
+
+
+'''Gravação em lote para as interfaces de repositório.'''
+class GravacaoEmLote(Generic[T]):
+    """
+    Mixin das interfaces de repositório que oferece `salvar_muitos` e `atualizar_muitos`.
+    A implementação padrão chama `salvar`/`atualizar` item a item; os repositórios
+    sobrescrevem para gravar o lote com uma leitura e uma escrita do armazenamento.
+    """
+
+    def salvar_muitos(self, itens: Iterable[T]) -> None:
+        """
+        Salva todos os itens (inserindo ou substituindo pelo ID).
+        param itens: Entidades já com ID.
+        """
+        for item in itens:
+            self.salvar(item)
+
+    def atualizar_muitos(self, itens: Iterable[T]) -> None:
+        """
+        Atualiza todos os itens.
+        param itens: Entidades já cadastradas.
+        Levanta ValueError se algum item não existir.
+        """
+        for item in itens:
+            self.atualizar(item)
@@ -0,0 +1,97 @@
+import heapq
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Tamanho padrão das páginas pedidas pelas telas
+TAMANHO_PAGINA = 20
+
+
+@dataclass(frozen=True, slots=True)
+class Pagina(Generic[T]):
+    """Uma página de uma listagem, em ordem de ID.
+
+    `proximo_cursor` é passado de volta em `paginar` para obter a página
+    seguinte; é None na última página.
+    """
+    itens: List[T]
+    proximo_cursor: Optional[Any] = None
+
+    @property
+    def tem_proxima(self) -> bool:
+        return self.proximo_cursor is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.itens)
+
+    def __len__(self) -> int:
+        return len(self.itens)
+
+
+def validar_limite(limite: int) -> None:
+    if limite < 1:
+        raise ValueError("O tamanho da página deve ser maior ou igual a 1")
+
+
+def paginar_lista(
+    itens: Iterable[T],
+    limite: int,
+    cursor: Optional[Any] = None,
+    chave: Callable[[T], Any] = lambda item: item.id,
+) -> Pagina[T]:
+    """Recorta de uma listagem já materializada a página seguinte ao cursor.
+
+    Não depende da ordem de `itens`: pega os `limite` menores IDs acima do cursor.
+    """
+    validar_limite(limite)
+    candidatos = itens if cursor is None else (i for i in itens if chave(i) > cursor)
+    # Um item a mais indica se existe próxima página
+    selecionados = heapq.nsmallest(limite + 1, candidatos, key=chave)
+    if len(selecionados) <= limite:
+        return Pagina(selecionados)
+    pagina = selecionados[:limite]
+    return Pagina(pagina, chave(pagina[-1]))
+
+
+'''Paginação por cursor para as interfaces de repositório.'''
+class Paginavel(Generic[T]):
+    """
+    Mixin das interfaces de repositório que oferece `paginar` sobre os métodos listar_*.
+    `_LISTAGENS` liga cada filtro aceito ao método listar_* correspondente (None é a
+    listagem completa). A implementação padrão lista tudo e recorta a página; os
+    repositórios sobrescrevem `_pagina` para ler só a página do armazenamento.
+    `iterar` percorre todos os registros para rotinas em lote (relatórios,
+    exportações); os repositórios o sobrescrevem para ler o armazenamento aos poucos.
+    """
+
+    _LISTAGENS: ClassVar[Dict[Optional[str], str]] = {}
+
+    def paginar(self, limite: int = TAMANHO_PAGINA, cursor: Optional[Any] = None, **filtro: Any) -> Pagina[T]:
+        """
+        Retorna uma página de registros, em ordem de ID.
+        param limite: Quantidade máxima de itens na página.
+        param cursor: `proximo_cursor` da página anterior (None para a primeira).
+        param filtro: No máximo um filtro de `_LISTAGENS`, ex.: id_vaga=3.
+        return: Pagina com os itens e o cursor da próxima.
+        """
+        validar_limite(limite)
+        if len(filtro) > 1:
+            raise ValueError("Informe no máximo um filtro por consulta paginada")
+        campo, valor = next(iter(filtro.items()), (None, None))
+        if campo not in self._LISTAGENS:
+            opcoes = ", ".join(f for f in self._LISTAGENS if f)
+            raise ValueError(f"Filtro inválido: {campo!r} (use {opcoes})")
+        return self._pagina(campo, valor, limite, cursor)
+
+    def _pagina(self, campo: Optional[str], valor: Any, limite: int, cursor: Optional[Any]) -> Pagina[T]:
+        listar = getattr(self, self._LISTAGENS[campo])
+        itens = listar() if campo is None else listar(valor)
+        return paginar_lista(itens, limite, cursor)
+
+    def iterar(self) -> Iterator[T]:
+        """
+        Percorre todos os registros sem exigir a listagem inteira em memória.
+        return: Iterador com os registros, na ordem do armazenamento.
+        """
+        yield from getattr(self, self._LISTAGENS[None])()
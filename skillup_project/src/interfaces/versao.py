@@ -0,0 +1,20 @@
+from typing import Hashable, Optional
+
+
+'''Versão do armazenamento para quem guarda cópias derivadas dos registros.'''
+class Versionado:
+    """
+    Mixin das interfaces de repositório que oferece `versao`: um valor que muda
+    sempre que os registros guardados mudam, seja por este processo ou por outro.
+    Serviços que mantêm índices ou vetores montados a partir do repositório
+    comparam a versão antes de usá-los e os remontam quando ela muda.
+    A implementação padrão retorna None (versão desconhecida): quem guarda
+    cópias deve então remontá-las a cada uso ou depender de avisos.
+    """
+
+    def versao(self) -> Optional[Hashable]:
+        """
+        Retorna a versão atual dos registros, sem lê-los.
+        return: Valor comparável com ==, ou None se o armazenamento não informa versão.
+        """
+        return None
@@ -0,0 +1,47 @@
+import os
+from typing import Sequence
+
+from src.repositorios.journal import JournalJsonRepository
+from src.repositorios.loader import JsonRepository
+
+
+# ==============================
+# MODOS DE ARMAZENAMENTO
+# ==============================
+
+MODO_ARQUIVO = "arquivo"    # reescreve o arquivo inteiro a cada escrita
+MODO_JOURNAL = "journal"    # anexa operações e compacta periodicamente
+
+MODOS_VALIDOS = (MODO_ARQUIVO, MODO_JOURNAL)
+
+_modo_atual = os.environ.get("SKILLUP_ARMAZENAMENTO", MODO_ARQUIVO)
+
+# Snapshot binário (marshal) ao lado de cada JSON, para leituras a frio rápidas
+_snapshot_binario = os.environ.get("SKILLUP_SNAPSHOT_BINARIO", "") == "1"
+
+
+def configurar_modo(modo: str) -> None:
+    """Define o modo usado pelos repositórios criados a partir de agora."""
+    global _modo_atual
+    if modo not in MODOS_VALIDOS:
+        raise ValueError(f"Modo de armazenamento inválido: {modo}. Use: {', '.join(MODOS_VALIDOS)}")
+    _modo_atual = modo
+
+
+def modo_atual() -> str:
+    return _modo_atual
+
+
+def configurar_snapshot_binario(ativo: bool) -> None:
+    """Liga ou desliga o snapshot binário nos repositórios criados a partir de agora."""
+    global _snapshot_binario
+    _snapshot_binario = ativo
+
+
+def abrir_armazenamento(
+    caminho_arquivo: str, chave: str = "id", unicos: Sequence[str] = ()
+) -> JsonRepository:
+    """Cria o armazenamento JSON de uma tabela conforme o modo configurado."""
+    if _modo_atual == MODO_JOURNAL:
+        return JournalJsonRepository(caminho_arquivo, chave, unicos, snapshot_binario=_snapshot_binario)
+    return JsonRepository(caminho_arquivo, chave, unicos, snapshot_binario=_snapshot_binario)
@@ -0,0 +1,225 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import IO, Callable, Dict, Iterator, Optional, TextIO
+
+try:
+    import fcntl
+except ImportError:  # Windows: só a trava entre threads
+    fcntl = None
+
+
+# ==============================
+# DIRETÓRIO DE DADOS
+# ==============================
+
+# src/data, ou o diretório em SKILLUP_DADOS (ex.: um temporário nos testes)
+DIRETORIO_DADOS_PADRAO = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+)
+
+
+def caminho_dados(nome_arquivo: str) -> str:
+    """Caminho padrão de um arquivo de dados, dentro de SKILLUP_DADOS se definido."""
+    return os.path.join(os.environ.get("SKILLUP_DADOS") or DIRETORIO_DADOS_PADRAO, nome_arquivo)
+
+
+# ==============================
+# ESCRITA ATÔMICA
+# ==============================
+
+# Arquivo ao lado do original onde se grava antes de publicar com os.replace
+SUFIXO_TEMPORARIO = ".tmp"
+
+
+def _sincronizar_diretorio(diretorio: str) -> None:
+    """Leva ao disco a entrada do diretório (o rename); só existe em POSIX."""
+    if os.name != "posix":
+        return
+    fd = os.open(diretorio or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def gravar_temporario(
+    caminho: str,
+    escrever: Callable[[IO], None],
+    anexar_a: Optional[str] = None,
+    binario: bool = False,
+    unico: bool = False,
+) -> str:
+    """Grava `<caminho>.tmp` com `escrever` e faz fsync; devolve o caminho do temporário.
+
+    Com `anexar_a`, o temporário começa como cópia desse arquivo (se existir)
+    e `escrever` acrescenta ao fim. O arquivo original não é tocado.
+    Com `unico`, o nome leva o PID: serve a quem grava sem a trava exclusiva.
+    """
+    temporario = caminho + (f".{os.getpid()}" if unico else "") + SUFIXO_TEMPORARIO
+    os.makedirs(os.path.dirname(temporario), exist_ok=True)
+    try:
+        with open(temporario, "wb") if binario else open(temporario, "w", encoding="utf-8") as f:
+            if anexar_a is not None and os.path.exists(anexar_a):
+                with open(anexar_a, "r", encoding="utf-8") as origem:
+                    for bloco in iter(lambda: origem.read(64 * 1024), ""):
+                        f.write(bloco)
+            escrever(f)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    return temporario
+
+
+def publicar(temporario: str, caminho: str) -> None:
+    """Põe o temporário no lugar do arquivo (os.replace) e sincroniza o diretório.
+
+    Quem lê vê o arquivo antigo inteiro ou o novo inteiro, nunca um pedaço.
+    """
+    os.replace(temporario, caminho)
+    _sincronizar_diretorio(os.path.dirname(caminho))
+
+
+def escrever_atomico(
+    caminho: str, escrever: Callable[[IO], None], binario: bool = False, unico: bool = False
+) -> None:
+    """Substitui o conteúdo de `caminho` de forma atômica: temporário, fsync e rename."""
+    publicar(gravar_temporario(caminho, escrever, binario=binario, unico=unico), caminho)
+
+
+def anexar_sincronizado(caminho: str, texto: str) -> None:
+    """Anexa linhas (`texto` terminado em "\n") ao fim do arquivo e faz fsync antes de retornar.
+
+    Se o arquivo não termina em "\n", um append anterior foi interrompido:
+    a linha incompleta é cortada antes, para não colar nela a primeira linha nova.
+    """
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, "a+b") as f:
+        _cortar_linha_incompleta(f)
+        f.write(texto.encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def cortar_linha_incompleta(caminho: str) -> bool:
+    """Corta o arquivo logo depois do seu último "\n". Retorna True se havia o que cortar."""
+    try:
+        with open(caminho, "r+b") as f:
+            if not _cortar_linha_incompleta(f):
+                return False
+            f.flush()
+            os.fsync(f.fileno())
+            return True
+    except FileNotFoundError:
+        return False
+
+
+def _cortar_linha_incompleta(f: IO[bytes]) -> bool:
+    fim = f.seek(0, os.SEEK_END)
+    if fim == 0:
+        return False
+    f.seek(fim - 1)
+    if f.read(1) == b"\n":
+        return False
+    # Procura o último "\n" de trás para frente, um bloco por vez
+    corte = 0
+    posicao = fim
+    while posicao > 0:
+        inicio = max(0, posicao - 64 * 1024)
+        f.seek(inicio)
+        indice = f.read(posicao - inicio).rfind(b"\n")
+        if indice >= 0:
+            corte = inicio + indice + 1
+            break
+        posicao = inicio
+    f.truncate(corte)
+    return True
+
+
+# ==============================
+# TRAVAS ENTRE PROCESSOS
+# ==============================
+
+SUFIXO_TRAVA = ".lock"
+
+# Modos da trava; sem fcntl só servem para distinguir um do outro
+_COMPARTILHADA = fcntl.LOCK_SH if fcntl else 1
+_EXCLUSIVA = fcntl.LOCK_EX if fcntl else 2
+
+
+class TravaArquivo:
+    """Trava consultiva (fcntl.flock) entre processos sobre um arquivo de dados.
+
+    A trava fica em `<arquivo>.lock`, que não é substituído pelo os.replace
+    das escritas. `compartilhada` admite vários leitores ao mesmo tempo, em
+    processos diferentes; `exclusiva` admite um só escritor e nenhum leitor.
+
+    Dentro do processo, só uma thread segura a trava por vez, e quem já a
+    segura pode pedi-la de novo: a exclusiva cobre a compartilhada, e a
+    compartilhada é promovida a exclusiva (e volta ao fim do bloco).
+    Onde não há fcntl (Windows), só a trava entre threads vale.
+    """
+
+    def __init__(self, caminho_arquivo: str):
+        self._caminho = caminho_arquivo + SUFIXO_TRAVA
+        self._lock = threading.RLock()
+        self._arquivo: Optional[TextIO] = None
+        self._modo: Optional[int] = None
+
+    @contextmanager
+    def compartilhada(self) -> Iterator[None]:
+        with self._travar(_COMPARTILHADA):
+            yield
+
+    @contextmanager
+    def exclusiva(self) -> Iterator[None]:
+        with self._travar(_EXCLUSIVA):
+            yield
+
+    @contextmanager
+    def _travar(self, modo: int) -> Iterator[None]:
+        with self._lock:
+            anterior = self._modo
+            if anterior is None or (anterior != modo and modo == _EXCLUSIVA):
+                self._flock(modo)
+            try:
+                yield
+            finally:
+                if anterior is None:
+                    self._liberar()
+                elif anterior != self._modo:
+                    self._flock(anterior)
+
+    def _flock(self, modo: int) -> None:
+        if fcntl is not None:
+            if self._arquivo is None:
+                os.makedirs(os.path.dirname(self._caminho), exist_ok=True)
+                self._arquivo = open(self._caminho, "a")
+            fcntl.flock(self._arquivo, modo)
+        self._modo = modo
+
+    def _liberar(self) -> None:
+        self._modo = None
+        if self._arquivo is not None:
+            try:
+                fcntl.flock(self._arquivo, fcntl.LOCK_UN)
+            finally:
+                self._arquivo.close()
+                self._arquivo = None
+
+
+_TRAVAS: Dict[str, TravaArquivo] = {}
+_TRAVAS_LOCK = threading.Lock()
+
+
+def trava_do_arquivo(caminho_arquivo: str) -> TravaArquivo:
+    """A trava do arquivo neste processo (a mesma para todos que usam o caminho)."""
+    chave = os.path.normcase(os.path.abspath(caminho_arquivo))
+    with _TRAVAS_LOCK:
+        trava = _TRAVAS.get(chave)
+        if trava is None:
+            trava = _TRAVAS[chave] = TravaArquivo(chave)
+        return trava
@@ -0,0 +1,59 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class IndiceOrdenado:
+    """Índice de um campo numérico para consultas por faixa.
+
+    Os valores ficam ordenados num `array("d")` (8 bytes por valor) e a
+    chave de cada registro numa lista paralela, na mesma posição. Uma
+    faixa é respondida com duas bisseções: O(log N + k).
+    Valores iguais ficam na ordem em que foram inseridos.
+    """
+
+    __slots__ = ("_valores", "_chaves")
+
+    def __init__(self, pares: Iterable[Tuple[float, Any]] = ()):
+        ordenados = sorted(pares, key=lambda par: par[0])
+        self._valores = array("d", (valor for valor, _ in ordenados))
+        self._chaves: List[Any] = [chave for _, chave in ordenados]
+
+    def __len__(self) -> int:
+        return len(self._valores)
+
+    def adicionar(self, valor: float, chave: Any) -> None:
+        posicao = bisect_right(self._valores, valor)
+        self._valores.insert(posicao, valor)
+        self._chaves.insert(posicao, chave)
+
+    def remover(self, valor: float, chave: Any) -> bool:
+        """Remove o par (valor, chave). Retorna False se ele não estiver no índice."""
+        inicio = bisect_left(self._valores, valor)
+        fim = bisect_right(self._valores, valor, inicio)
+        for posicao in range(inicio, fim):
+            if self._chaves[posicao] == chave:
+                del self._valores[posicao]
+                del self._chaves[posicao]
+                return True
+        return False
+
+    def limites(self, minimo: Optional[float] = None, maximo: Optional[float] = None) -> Tuple[int, int]:
+        """Posições [início, fim) dos valores entre `minimo` e `maximo` (inclusive)."""
+        inicio = 0 if minimo is None else bisect_left(self._valores, minimo)
+        fim = len(self._valores) if maximo is None else bisect_right(self._valores, maximo)
+        return inicio, max(inicio, fim)
+
+    def faixa(self, minimo: Optional[float] = None, maximo: Optional[float] = None) -> List[Any]:
+        """Chaves com valor entre `minimo` e `maximo` (inclusive), do menor valor ao maior."""
+        inicio, fim = self.limites(minimo, maximo)
+        return self._chaves[inicio:fim]
+
+    def seguintes(self, apos: Optional[float], limite: int) -> List[Any]:
+        """Até `limite` chaves com valor estritamente maior que `apos` (None: desde o início)."""
+        inicio = 0 if apos is None else bisect_right(self._valores, apos)
+        return self._chaves[inicio:inicio + limite]
+
+    def decrescente(self) -> Iterator[Any]:
+        """Chaves do maior valor ao menor."""
+        return reversed(self._chaves)
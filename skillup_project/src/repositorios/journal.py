@@ -0,0 +1,235 @@
+import json
+import os
+from typing import Callable, Iterator, List, Sequence
+
+from src.repositorios.arquivos import (
+    SUFIXO_TEMPORARIO,
+    anexar_sincronizado,
+    cortar_linha_incompleta,
+    gravar_temporario,
+    publicar,
+)
+from src.repositorios.loader import (
+    OP_GRAVAR,
+    OP_REMOVER,
+    JsonRepository,
+    _CACHE,
+    _CACHE_LOCK,
+    _EntradaCache,
+    iterar_array_json,
+)
+from src.repositorios.unidade_trabalho import unidade_ativa
+
+
+# ==============================
+# JOURNAL
+# ==============================
+
+# Compacta quando o journal passa deste tamanho e de metade do snapshot
+LIMITE_MINIMO_JOURNAL = 64 * 1024
+
+
+class JournalJsonRepository(JsonRepository):
+    """Armazenamento JSON com journal append-only.
+
+    O arquivo `.json` continua sendo o snapshot (mesmo formato do
+    JsonRepository). Cada gravação ou remoção é anexada como uma linha
+    JSON em `<arquivo>.journal`; a leitura aplica o journal sobre o
+    snapshot. Quando o journal cresce demais, ele é compactado no snapshot
+    (e no snapshot binário, se ativado).
+
+    As operações do journal são idempotentes (upsert/remoção por chave),
+    então uma queda entre a escrita do snapshot e o truncamento do
+    journal não corrompe os dados: o replay apenas as reaplica.
+
+    Snapshot e journal são lidos juntos sob a trava compartilhada, para que
+    uma compactação de outro processo não apareça pela metade; cada append
+    faz fsync antes de retornar.
+    """
+
+    def __init__(
+        self,
+        caminho_arquivo: str,
+        chave: str = "id",
+        unicos: Sequence[str] = (),
+        limite_journal: int = LIMITE_MINIMO_JOURNAL,
+        snapshot_binario: bool = False,
+    ):
+        super().__init__(caminho_arquivo, chave, unicos, snapshot_binario)
+        self._caminho_journal = caminho_arquivo + ".journal"
+        self._limite_journal = limite_journal
+        if os.path.exists(self._caminho_journal):
+            # Uma queda no meio de um append deixa a última linha pela metade
+            with self._trava.exclusiva():
+                cortar_linha_incompleta(self._caminho_journal)
+
+    # ------------------------------------------------------------------
+    # Leitura: snapshot + replay
+    # ------------------------------------------------------------------
+
+    def _assinatura(self):
+        snapshot = self._assinatura_arquivo()
+        try:
+            st = os.stat(self._caminho_journal)
+            journal = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except FileNotFoundError:
+            journal = None
+        if snapshot is None and journal is None:
+            return None
+        return (snapshot, journal)
+
+    def _ler_arquivo(self) -> list:
+        dados = super()._ler_arquivo() if os.path.exists(self._caminho_arquivo) else []
+        operacoes = self._ler_journal()
+        if not operacoes:
+            return dados
+
+        por_chave = {r.get(self._chave): r for r in dados}
+        for op in operacoes:
+            if op["op"] == OP_GRAVAR:
+                registro = op["registro"]
+                por_chave[registro[self._chave]] = registro
+            elif op["op"] == OP_REMOVER:
+                por_chave.pop(op["chave"], None)
+        return list(por_chave.values())
+
+    def _iterar_arquivo(self) -> Iterator[dict]:
+        """Snapshot lido em blocos com o journal aplicado, na mesma ordem de `_ler_arquivo`.
+
+        Só as operações do journal ficam em memória; a compactação as limita.
+        """
+        # O snapshot é aberto junto com a leitura do journal: se outro processo
+        # compactar depois, o arquivo aberto continua sendo o antigo
+        with self._trava.compartilhada():
+            operacoes = self._ler_journal()
+            try:
+                snapshot = open(self._caminho_arquivo, "r", encoding="utf-8-sig")
+            except FileNotFoundError:
+                snapshot = None
+
+        # Chave -> registro final (None se removido). Como no dict do replay,
+        # uma chave removida e gravada de novo vai para o fim.
+        pendentes = {}
+        movidos = set()
+        for op in operacoes:
+            if op["op"] == OP_GRAVAR:
+                chave = op["registro"][self._chave]
+                if chave in pendentes and pendentes[chave] is None:
+                    del pendentes[chave]
+                pendentes[chave] = op["registro"]
+            elif op["op"] == OP_REMOVER:
+                pendentes.pop(op["chave"], None)
+                pendentes[op["chave"]] = None
+                movidos.add(op["chave"])
+
+        if snapshot is not None:
+            with snapshot:
+                for registro in iterar_array_json(snapshot):
+                    chave = registro.get(self._chave)
+                    if chave not in pendentes:
+                        yield registro
+                    elif chave not in movidos:
+                        # Só alterado: continua na posição do snapshot
+                        yield pendentes.pop(chave)
+        yield from (registro for registro in pendentes.values() if registro is not None)
+
+    def _ler_journal(self) -> List[dict]:
+        try:
+            with open(self._caminho_journal, "rb") as f:
+                linhas = f.read().split(b"\n")
+        except FileNotFoundError:
+            return []
+        operacoes = []
+        for numero, linha in enumerate(linhas, start=1):
+            if not linha.strip():
+                continue
+            try:
+                operacoes.append(json.loads(linha))
+            except ValueError:
+                if numero == len(linhas):
+                    # Sem "\n" no fim: append interrompido por uma queda, nunca confirmado
+                    break
+                raise ValueError(f"Journal corrompido em {self._caminho_journal}, linha {numero}") from None
+        return operacoes
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def salvar(self, lista) -> None:
+        """Grava a lista inteira como novo snapshot e descarta o journal."""
+        if unidade_ativa() is not None:
+            super().salvar(lista)
+            return
+        with _CACHE_LOCK, self._trava.exclusiva():
+            super().salvar(lista)
+            if os.path.exists(self._caminho_journal):
+                os.remove(self._caminho_journal)
+            _CACHE[self._chave_cache].assinatura = self._assinatura()
+
+    def compactar(self) -> None:
+        """Reescreve o snapshot com o estado atual e zera o journal."""
+        with _CACHE_LOCK, self._trava.exclusiva():
+            entrada = self._entrada()
+            self._compactar(entrada.dados)
+            entrada.assinatura = self._assinatura()
+
+    def _compactar(self, dados: list) -> None:
+        # Snapshot primeiro: se cair antes do remove, o replay é idempotente
+        self._escrever(dados)
+        if os.path.exists(self._caminho_journal):
+            os.remove(self._caminho_journal)
+
+    def _persistir(self, entrada: _EntradaCache, operacoes: List[dict]) -> None:
+        """Anexa as operações ao journal em vez de reescrever o snapshot."""
+        anexar_sincronizado(self._caminho_journal, self._linhas(operacoes))
+        if self._precisa_compactar():
+            self._compactar(entrada.dados)
+
+    @staticmethod
+    def _linhas(operacoes: List[dict]) -> str:
+        return "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in operacoes)
+
+    def _precisa_compactar(self) -> bool:
+        try:
+            tamanho_journal = os.path.getsize(self._caminho_journal)
+        except FileNotFoundError:
+            return False
+        try:
+            tamanho_snapshot = os.path.getsize(self._caminho_arquivo)
+        except FileNotFoundError:
+            tamanho_snapshot = 0
+        return tamanho_journal > max(self._limite_journal, tamanho_snapshot // 2)
+
+    # ------------------------------------------------------------------
+    # Unidade de trabalho
+    # ------------------------------------------------------------------
+
+    def _temporarios(self) -> List[str]:
+        return super()._temporarios() + [self._caminho_journal + SUFIXO_TEMPORARIO]
+
+    def _preparar_escrita(
+        self, entrada: _EntradaCache, operacoes: List[dict], reescrever: bool
+    ) -> Callable[[], None]:
+        """Prepara um journal temporário com as operações anexadas (ou um snapshot novo,
+        se a unidade substituiu a lista inteira); a função devolvida o publica."""
+        if reescrever:
+            publicar_snapshot = super()._preparar_escrita(entrada, operacoes, reescrever)
+
+            def publicar_e_descartar_journal():
+                publicar_snapshot()
+                if os.path.exists(self._caminho_journal):
+                    os.remove(self._caminho_journal)
+            return publicar_e_descartar_journal
+
+        linhas = self._linhas(operacoes)
+        cortar_linha_incompleta(self._caminho_journal)
+        temporario = gravar_temporario(
+            self._caminho_journal, lambda f: f.write(linhas), anexar_a=self._caminho_journal
+        )
+
+        def publicar_journal():
+            publicar(temporario, self._caminho_journal)
+            if self._precisa_compactar():
+                self._compactar(entrada.dados)
+        return publicar_journal
@@ -1,22 +1,674 @@
+import gc
+import heapq
 import json
+import marshal
 import os
+import sys
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from src.dominio.excecoes import ChaveDuplicadaError, ConflitoEscritaError
+from src.repositorios.arquivos import (
+    SUFIXO_TEMPORARIO,
+    escrever_atomico,
+    gravar_temporario,
+    publicar,
+    trava_do_arquivo,
+)
+from src.repositorios.indice_ordenado import IndiceOrdenado
+from src.repositorios.unidade_trabalho import UnidadeDeTrabalho, unidade_ativa
+
+
+# ==============================
+# CACHE COMPARTILHADO
+# ==============================
+
+Assinatura = Tuple[int, int, int]
+
+# Operações pontuais aplicadas ao cache (e anexadas ao journal, no modo journal)
+OP_GRAVAR = "gravar"
+OP_REMOVER = "remover"
+
+# Snapshot binário opcional, ao lado do JSON (ver JsonRepository)
+SUFIXO_BINARIO = ".marshal"
+FORMATO_BINARIO = 1
+
+
+class _EntradaCache:
+    """Lista de registros em memória, seus índices e a assinatura do arquivo lido.
+
+    `primario` mapeia chave -> registro. `indices` mapeia campo -> valor ->
+    {chave: registro}. `ordenados` mapeia campo numérico -> IndiceOrdenado
+    de chaves. Todos são construídos sob demanda e mantidos pelas
+    operações pontuais; `salvar` com uma lista inteira os descarta.
+    """
+
+    __slots__ = ("assinatura", "dados", "primario", "indices", "ordenados")
+
+    def __init__(self, assinatura: Assinatura, dados: list):
+        self.assinatura = assinatura
+        self.dados = dados
+        self.primario: Optional[Dict[Any, dict]] = None
+        self.indices: Dict[str, Dict[Any, Dict[Any, dict]]] = {}
+        self.ordenados: Dict[str, IndiceOrdenado] = {}
+
+    def invalidar_indices(self) -> None:
+        self.primario = None
+        self.indices.clear()
+        self.ordenados.clear()
+
+
+def _numero(valor: Any) -> bool:
+    """Só valores numéricos (não booleanos) entram nos índices ordenados."""
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+@contextmanager
+def _coleta_pausada() -> Iterator[None]:
+    """Pausa o coletor de ciclos: criar milhares de dicts o dispara sem nada a coletar."""
+    ativa = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if ativa:
+            gc.enable()
+
+
+# ==============================
+# LEITURA EM BLOCOS
+# ==============================
+
+TAMANHO_BLOCO = 64 * 1024
+_ESPACOS = " \t\r\n"
+
+
+def iterar_array_json(arquivo: TextIO, tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[Any]:
+    """Decodifica um a um os elementos do array JSON que forma o arquivo.
+
+    Só um bloco (mais o elemento em andamento) fica em memória. Um arquivo
+    vazio produz nada; conteúdo inválido encerra a iteração, assim como
+    `carregar` trata o arquivo corrompido como vazio.
+    """
+    decodificador = json.JSONDecoder()
+    buffer, pos, aberto = "", 0, False
+    while True:
+        # Pula espaços (e, dentro do array, as vírgulas entre elementos)
+        while pos < len(buffer) and (buffer[pos] in _ESPACOS or (aberto and buffer[pos] == ",")):
+            pos += 1
+        if pos < len(buffer):
+            if not aberto:
+                if buffer[pos] != "[":
+                    return
+                aberto, pos = True, pos + 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                valor, fim = decodificador.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                fim = None
+            # Um elemento que chega ao fim do buffer pode continuar no próximo bloco
+            if fim is not None and fim < len(buffer):
+                yield valor
+                pos = fim
+                continue
+        bloco = arquivo.read(tamanho_bloco)
+        if not bloco:
+            return
+        buffer, pos = buffer[pos:] + bloco, 0
+
+
+# Compartilhado por todas as instâncias que apontam para o mesmo arquivo
+_CACHE: Dict[str, _EntradaCache] = {}
+_CACHE_LOCK = threading.RLock()
+
+
+def limpar_cache() -> None:
+    """Descarta todas as cópias em memória (a próxima leitura volta ao disco)."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
 
 
 class JsonRepository:
-    def __init__(self, caminho_arquivo: str):
+    """Acesso a um arquivo JSON contendo uma lista de registros.
+
+    A lista lida é mantida em cache e só é relida quando o mtime, o tamanho
+    ou o inode do arquivo mudam. Escritas atualizam o cache no lugar.
+
+    O arquivo nunca é reescrito no lugar: cada escrita vai para um
+    temporário com fsync e o substitui com os.replace, então uma queda no
+    meio deixa o arquivo antigo inteiro. Vários processos podem usar o mesmo
+    diretório de dados: as leituras do disco seguram a trava compartilhada
+    de `<arquivo>.lock` e as escritas a exclusiva, relendo o arquivo se outro
+    processo o alterou, então nenhuma escrita apaga a de outro processo.
+
+    `chave` é o campo que identifica cada registro; é usado pelas operações
+    pontuais (gravar, substituir, remover) e pelo índice primário.
+    Índices secundários por qualquer campo são criados na primeira consulta
+    (`buscar_por_indice`, ou `buscar_por_faixa` para campos numéricos) e
+    mantidos pelas operações pontuais.
+
+    Campos listados em `unicos` não podem se repetir entre registros com
+    chaves diferentes: gravar um valor já usado levanta ChaveDuplicadaError.
+
+    Com `snapshot_binario`, cada gravação do arquivo também grava
+    `<arquivo>.marshal`: a mesma lista em `marshal`, com a assinatura do JSON
+    de que foi tirada. Enquanto essa assinatura bate com a do JSON, a leitura
+    usa o binário, várias vezes mais rápido de decodificar; senão lê o JSON e
+    regrava o binário. O JSON continua sendo o dado de verdade.
+    """
+
+    def __init__(
+        self,
+        caminho_arquivo: str,
+        chave: str = "id",
+        unicos: Sequence[str] = (),
+        snapshot_binario: bool = False,
+    ):
         self._caminho_arquivo = caminho_arquivo
+        self._caminho_binario = caminho_arquivo + SUFIXO_BINARIO if snapshot_binario else None
+        self._chave = chave
+        self._unicos = tuple(unicos)
+        self._chave_cache = os.path.normcase(os.path.abspath(caminho_arquivo))
+        self._trava = trava_do_arquivo(caminho_arquivo)
 
-    def carregar(self):
-        if not os.path.exists(self._caminho_arquivo):
-            return []
+    @property
+    def chave(self) -> str:
+        return self._chave
+
+    def versao(self) -> Optional[Hashable]:
+        """Assinatura do arquivo em disco; muda a cada gravação, deste ou de outro processo."""
+        # () enquanto o arquivo não existe: None indicaria versão desconhecida
+        return self._assinatura() or ()
 
+    # ------------------------------------------------------------------
+    # Helpers privados
+    # ------------------------------------------------------------------
+
+    def _assinatura(self) -> Optional[Assinatura]:
+        return self._assinatura_arquivo()
+
+    def _assinatura_arquivo(self) -> Optional[Assinatura]:
+        try:
+            st = os.stat(self._caminho_arquivo)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _ler_arquivo(self) -> list:
+        with _coleta_pausada():
+            if self._caminho_binario is None:
+                return self._ler_json()
+            cabecalho = self._cabecalho_binario()
+            dados = self._ler_binario(cabecalho)
+            if dados is None:
+                dados = self._ler_json()
+                self._escrever_binario(dados, cabecalho, unico=True)
+            return dados
+
+    def _ler_json(self) -> list:
         try:
             with open(self._caminho_arquivo, "r", encoding="utf-8-sig") as f:
                 return json.load(f)
         except json.JSONDecodeError:
             return []
 
-    def salvar(self, lista):
-        os.makedirs(os.path.dirname(self._caminho_arquivo), exist_ok=True)
-        with open(self._caminho_arquivo, "w", encoding="utf-8") as f:
-            json.dump(lista, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+    def _entrada(self) -> _EntradaCache:
+        """Entrada vista por esta thread: a da unidade de trabalho aberta, ou a do cache."""
+        unidade = unidade_ativa()
+        if unidade is not None:
+            return self._na_unidade(unidade).entrada
+        return self._entrada_compartilhada()
+
+    def _entrada_compartilhada(self) -> _EntradaCache:
+        """Retorna a entrada em cache, relendo o arquivo se ele mudou em disco."""
+        with _CACHE_LOCK:
+            assinatura = self._assinatura()
+            if assinatura is None:
+                _CACHE.pop(self._chave_cache, None)
+                return _EntradaCache(None, [])
+
+            entrada = _CACHE.get(self._chave_cache)
+            if entrada is None or entrada.assinatura != assinatura:
+                with self._trava.compartilhada():
+                    # Assinatura e conteúdo lidos sem escritor no meio
+                    assinatura = self._assinatura()
+                    dados = self._ler_arquivo() if assinatura is not None else []
+                entrada = _EntradaCache(assinatura, dados)
+                _CACHE[self._chave_cache] = entrada
+            return entrada
+
+    def _registros(self) -> list:
+        return self._entrada().dados
+
+    def _escrever(self, lista) -> None:
+        """Substitui o arquivo pela lista: temporário com fsync e os.replace."""
+        self._publicar(self._escrever_temporario(lista), lista)
+
+    def _escrever_temporario(self, lista) -> str:
+        return gravar_temporario(
+            self._caminho_arquivo, lambda f: json.dump(lista, f, indent=4, ensure_ascii=False)
+        )
+
+    def _publicar(self, temporario: str, lista) -> None:
+        publicar(temporario, self._caminho_arquivo)
+        if self._caminho_binario is not None:
+            self._escrever_binario(lista, self._cabecalho_binario())
+
+    # ------------------------------------------------------------------
+    # Snapshot binário
+    # ------------------------------------------------------------------
+
+    def _cabecalho_binario(self) -> tuple:
+        # marshal muda entre versões do Python; a assinatura diz de qual JSON veio
+        return (FORMATO_BINARIO, tuple(sys.version_info[:2]), self._assinatura_arquivo())
+
+    def _ler_binario(self, cabecalho: tuple) -> Optional[list]:
+        """Lista do snapshot binário, ou None se ele não existe ou não é do JSON atual."""
+        try:
+            with open(self._caminho_binario, "rb") as f:
+                if marshal.load(f) != cabecalho:
+                    return None
+                # marshal.load num arquivo lê aos pedaços; o corpo vai de uma vez
+                return marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def _escrever_binario(self, lista, cabecalho: tuple, unico: bool = False) -> None:
+        def escrever(f):
+            marshal.dump(cabecalho, f)
+            marshal.dump(lista, f)
+
+        try:
+            escrever_atomico(self._caminho_binario, escrever, binario=True, unico=unico)
+        except ValueError:
+            # Algum valor que o marshal não grava: fica só o JSON
+            if os.path.exists(self._caminho_binario):
+                os.remove(self._caminho_binario)
+
+    # ------------------------------------------------------------------
+    # Índices
+    # ------------------------------------------------------------------
+
+    def _primario(self, entrada: _EntradaCache) -> Dict[Any, dict]:
+        if entrada.primario is None:
+            entrada.primario = {r.get(self._chave): r for r in entrada.dados}
+        return entrada.primario
+
+    def _indice(self, entrada: _EntradaCache, campo: str) -> Dict[Any, Dict[Any, dict]]:
+        indice = entrada.indices.get(campo)
+        if indice is None:
+            indice = {}
+            for r in entrada.dados:
+                indice.setdefault(r.get(campo), {})[r.get(self._chave)] = r
+            entrada.indices[campo] = indice
+        return indice
+
+    def _ordenado(self, entrada: _EntradaCache, campo: str) -> IndiceOrdenado:
+        indice = entrada.ordenados.get(campo)
+        if indice is None:
+            indice = IndiceOrdenado(
+                (r[campo], r.get(self._chave)) for r in entrada.dados if _numero(r.get(campo))
+            )
+            entrada.ordenados[campo] = indice
+        return indice
+
+    def _indexar(self, entrada: _EntradaCache, registro: dict) -> None:
+        chave = registro.get(self._chave)
+        if entrada.primario is not None:
+            entrada.primario[chave] = registro
+        for campo, indice in entrada.indices.items():
+            indice.setdefault(registro.get(campo), {})[chave] = registro
+        for campo, ordenado in entrada.ordenados.items():
+            if _numero(registro.get(campo)):
+                ordenado.adicionar(registro[campo], chave)
+
+    def _desindexar(self, entrada: _EntradaCache, registro: dict) -> None:
+        chave = registro.get(self._chave)
+        if entrada.primario is not None:
+            entrada.primario.pop(chave, None)
+        for campo, indice in entrada.indices.items():
+            grupo = indice.get(registro.get(campo))
+            if grupo is not None:
+                grupo.pop(chave, None)
+                if not grupo:
+                    del indice[registro.get(campo)]
+        for campo, ordenado in entrada.ordenados.items():
+            if _numero(registro.get(campo)):
+                ordenado.remover(registro[campo], chave)
+
+    def _verificar_unicos(self, entrada: _EntradaCache, registro: dict) -> None:
+        chave = registro.get(self._chave)
+        for campo in self._unicos:
+            valor = registro.get(campo)
+            if valor in (None, ""):
+                continue
+            grupo = self._indice(entrada, campo).get(valor, {})
+            if any(outra != chave for outra in grupo):
+                raise ChaveDuplicadaError(campo, valor)
+
+    # ------------------------------------------------------------------
+    # Aplicação de operações pontuais
+    # ------------------------------------------------------------------
+
+    def _aplicar(self, entrada: _EntradaCache, operacoes: List[dict]) -> None:
+        """Aplica as operações na lista em cache mantendo os índices."""
+        primario = self._primario(entrada)
+        removidos = set()
+        posicoes: Optional[Dict[int, int]] = None
+        for op in operacoes:
+            if op["op"] == OP_GRAVAR:
+                registro = op["registro"]
+                self._verificar_unicos(entrada, registro)
+                antigo = primario.get(registro[self._chave])
+                if antigo is None:
+                    entrada.dados.append(registro)
+                    if posicoes is not None:
+                        posicoes[id(registro)] = len(entrada.dados) - 1
+                else:
+                    if len(operacoes) == 1:
+                        pos = next(i for i, r in enumerate(entrada.dados) if r is antigo)
+                    else:
+                        # Em lote, uma passada pela lista serve para todas as substituições
+                        if posicoes is None:
+                            posicoes = {id(r): i for i, r in enumerate(entrada.dados)}
+                        pos = posicoes.pop(id(antigo))
+                        posicoes[id(registro)] = pos
+                    entrada.dados[pos] = registro
+                    self._desindexar(entrada, antigo)
+                self._indexar(entrada, registro)
+            elif op["op"] == OP_REMOVER:
+                antigo = primario.get(op["chave"])
+                if antigo is not None:
+                    removidos.add(id(antigo))
+                    self._desindexar(entrada, antigo)
+        if removidos:
+            entrada.dados[:] = [r for r in entrada.dados if id(r) not in removidos]
+
+    def _persistir(self, entrada: _EntradaCache, operacoes: List[dict]) -> None:
+        """Leva ao disco o estado do cache depois das operações."""
+        self._escrever(entrada.dados)
+
+    def _executar(self, operacoes: List[dict]) -> None:
+        unidade = unidade_ativa()
+        if unidade is not None:
+            self._na_unidade(unidade).aplicar(operacoes)
+            return
+        with _CACHE_LOCK, self._trava.exclusiva():
+            # Sob a trava exclusiva, a entrada reflete o que outro processo gravou
+            entrada = self._entrada()
+            _CACHE[self._chave_cache] = entrada
+            try:
+                self._aplicar(entrada, operacoes)
+                self._persistir(entrada, operacoes)
+            except Exception:
+                # Estado em disco desconhecido: força releitura na próxima chamada
+                _CACHE.pop(self._chave_cache, None)
+                raise
+            entrada.assinatura = self._assinatura()
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def carregar(self) -> List[dict]:
+        """Retorna uma cópia rasa da lista (os dicts são compartilhados com o cache)."""
+        return list(self._registros())
+
+    def iterar(self) -> Iterator[dict]:
+        """Percorre os registros um a um, sem montar a lista inteira.
+
+        Se o arquivo já está no cache, percorre o cache. Senão, lê o arquivo
+        em blocos e não o coloca no cache, então a memória não cresce com ele.
+        Os registros vistos são os do momento em que a iteração começou.
+        Numa unidade de trabalho, percorre a cópia da unidade.
+        """
+        if unidade_ativa() is not None:
+            yield from list(self._entrada().dados)
+            return
+        with _CACHE_LOCK:
+            assinatura = self._assinatura()
+            if assinatura is None:
+                return
+            entrada = _CACHE.get(self._chave_cache)
+            em_cache = entrada is not None and entrada.assinatura == assinatura
+            registros = list(entrada.dados) if em_cache else None
+        if registros is not None:
+            yield from registros
+        else:
+            yield from self._iterar_arquivo()
+
+    def _iterar_arquivo(self) -> Iterator[dict]:
+        try:
+            with open(self._caminho_arquivo, "r", encoding="utf-8-sig") as f:
+                yield from iterar_array_json(f)
+        except FileNotFoundError:
+            return
+
+    def salvar(self, lista) -> None:
+        """Substitui o conteúdo inteiro do arquivo pela lista informada."""
+        unidade = unidade_ativa()
+        if unidade is not None:
+            self._na_unidade(unidade).substituir_tudo(lista)
+            return
+        with _CACHE_LOCK, self._trava.exclusiva():
+            try:
+                self._escrever(lista)
+            except Exception:
+                _CACHE.pop(self._chave_cache, None)
+                raise
+
+            entrada = _CACHE.get(self._chave_cache)
+            if entrada is None:
+                entrada = _EntradaCache(None, [])
+                _CACHE[self._chave_cache] = entrada
+            entrada.dados[:] = lista
+            entrada.invalidar_indices()
+            entrada.assinatura = self._assinatura()
+
+    # ------------------------------------------------------------------
+    # Consultas por índice
+    # ------------------------------------------------------------------
+
+    def buscar(self, valor_chave: Any) -> Optional[dict]:
+        """Retorna o registro cuja chave vale `valor_chave`, ou None."""
+        with _CACHE_LOCK:
+            return self._primario(self._entrada()).get(valor_chave)
+
+    def buscar_por_indice(self, campo: str, valor: Any) -> List[dict]:
+        """Retorna os registros com `campo == valor` usando um índice hash."""
+        with _CACHE_LOCK:
+            return list(self._indice(self._entrada(), campo).get(valor, {}).values())
+
+    def buscar_unico(self, campo: str, valor: Any) -> Optional[dict]:
+        """Retorna o registro com `campo == valor` (campo único), ou None."""
+        registros = self.buscar_por_indice(campo, valor)
+        return registros[0] if registros else None
+
+    def buscar_por_faixa(
+        self, campo: str, minimo: Optional[float] = None, maximo: Optional[float] = None
+    ) -> List[dict]:
+        """Retorna os registros com `minimo <= campo <= maximo`, do menor valor ao maior.
+
+        Usa um índice ordenado do campo; limites None deixam a faixa aberta.
+        """
+        with _CACHE_LOCK:
+            entrada = self._entrada()
+            primario = self._primario(entrada)
+            return [primario[c] for c in self._ordenado(entrada, campo).faixa(minimo, maximo)]
+
+    def pagina(
+        self,
+        limite: int,
+        cursor: Any = None,
+        campo: Optional[str] = None,
+        valor: Any = None,
+    ) -> Tuple[List[dict], Any]:
+        """Retorna até `limite` registros com chave maior que `cursor`, em ordem de chave.
+
+        Com `campo`, só os registros com `campo == valor` (índice hash). Devolve
+        (registros, cursor da próxima página ou None). Exige chaves numéricas.
+        """
+        with _CACHE_LOCK:
+            entrada = self._entrada()
+            if campo is None:
+                primario = self._primario(entrada)
+                chaves = self._ordenado(entrada, self._chave).seguintes(cursor, limite + 1)
+                registros = [primario[c] for c in chaves]
+            else:
+                grupo = self._indice(entrada, campo).get(valor, {})
+                seguintes = grupo if cursor is None else (c for c in grupo if c > cursor)
+                registros = [grupo[c] for c in heapq.nsmallest(limite + 1, seguintes)]
+        if len(registros) <= limite:
+            return registros, None
+        del registros[limite:]
+        return registros, registros[-1][self._chave]
+
+    def contar_por_indice(self, campo: str, valor: Any) -> int:
+        with _CACHE_LOCK:
+            return len(self._indice(self._entrada(), campo).get(valor, ()))
+
+    # ------------------------------------------------------------------
+    # Operações pontuais (por chave)
+    # ------------------------------------------------------------------
+
+    def gravar(self, registro: dict) -> None:
+        """Insere o registro ou substitui o existente com a mesma chave."""
+        self._executar([{"op": OP_GRAVAR, "registro": registro}])
+
+    def substituir(self, registro: dict) -> bool:
+        """Substitui o registro com a mesma chave. Retorna False se não existir."""
+        return self.substituir_muitos([registro])
+
+    def remover(self, valor_chave: Any) -> bool:
+        """Remove o registro com a chave informada. Retorna False se não existir."""
+        with _CACHE_LOCK:
+            if self.buscar(valor_chave) is None:
+                return False
+            self._executar([{"op": OP_REMOVER, "chave": valor_chave}])
+            return True
+
+    def remover_onde(self, predicado: Callable[[dict], bool]) -> int:
+        """Remove todos os registros que satisfazem o predicado. Retorna quantos saíram."""
+        with _CACHE_LOCK:
+            chaves = [r.get(self._chave) for r in self._registros() if predicado(r)]
+            if chaves:
+                self._executar([{"op": OP_REMOVER, "chave": c} for c in chaves])
+            return len(chaves)
+
+    # ------------------------------------------------------------------
+    # Operações em lote (uma leitura e uma escrita para o lote inteiro)
+    # ------------------------------------------------------------------
+
+    def gravar_muitos(self, registros: Sequence[dict]) -> None:
+        """Insere ou substitui todos os registros de uma vez.
+
+        Se algum violar um campo único, levanta ChaveDuplicadaError e nenhum é gravado.
+        """
+        if registros:
+            self._executar([{"op": OP_GRAVAR, "registro": r} for r in registros])
+
+    def substituir_muitos(self, registros: Sequence[dict]) -> bool:
+        """Substitui todos os registros de uma vez. Se algum não existir, não grava nenhum e retorna False."""
+        with _CACHE_LOCK:
+            primario = self._primario(self._entrada())
+            if any(r[self._chave] not in primario for r in registros):
+                return False
+            self.gravar_muitos(registros)
+            return True
+
+    # ------------------------------------------------------------------
+    # Unidade de trabalho
+    # ------------------------------------------------------------------
+
+    def _na_unidade(self, unidade: UnidadeDeTrabalho) -> "_ArquivoNaUnidade":
+        return unidade.participante(
+            self._chave_cache, lambda: _ArquivoNaUnidade(self, self._entrada_compartilhada())
+        )
+
+    def _temporarios(self) -> List[str]:
+        return [self._caminho_arquivo + SUFIXO_TEMPORARIO]
+
+    def _preparar_escrita(
+        self, entrada: _EntradaCache, operacoes: List[dict], reescrever: bool
+    ) -> Callable[[], None]:
+        """Grava o estado da unidade num temporário; a função devolvida o põe no lugar do arquivo."""
+        temporario = self._escrever_temporario(entrada.dados)
+        return lambda: self._publicar(temporario, entrada.dados)
+
+    def _encerrar_escrita(self, entrada: _EntradaCache, confirmada: bool) -> None:
+        with _CACHE_LOCK:
+            if confirmada:
+                entrada.assinatura = self._assinatura()
+                _CACHE[self._chave_cache] = entrada
+                return
+            for temporario in self._temporarios():
+                if os.path.exists(temporario):
+                    os.remove(temporario)
+
+
+class _ArquivoNaUnidade:
+    """Um arquivo JSON dentro de uma unidade de trabalho (ver unidade_trabalho.py).
+
+    Começa com a entrada do cache, então só ler não copia nada. A primeira
+    escrita troca por uma cópia, onde as operações se acumulam até a
+    confirmação; o cache compartilhado só a recebe depois de gravada.
+    """
+
+    __slots__ = ("repo", "entrada", "assinatura_base", "operacoes", "alterado", "reescrever", "_travas")
+
+    def __init__(self, repo: JsonRepository, entrada: _EntradaCache):
+        self.repo = repo
+        self.entrada = entrada
+        self.assinatura_base = entrada.assinatura
+        self.operacoes: List[dict] = []
+        self.alterado = False
+        self.reescrever = False
+        self._travas = ExitStack()
+
+    def _copia(self) -> _EntradaCache:
+        if not self.alterado:
+            with _CACHE_LOCK:
+                self.assinatura_base = self.entrada.assinatura
+                self.entrada = _EntradaCache(self.entrada.assinatura, list(self.entrada.dados))
+            self.alterado = True
+        return self.entrada
+
+    def aplicar(self, operacoes: List[dict]) -> None:
+        entrada = self._copia()
+        anteriores = list(entrada.dados) if len(operacoes) > 1 else None
+        try:
+            self.repo._aplicar(entrada, operacoes)
+        except Exception:
+            # Descarta só este lote; o que a unidade já tinha continua valendo
+            if anteriores is not None:
+                entrada.dados[:] = anteriores
+            entrada.invalidar_indices()
+            raise
+        self.operacoes.extend(operacoes)
+
+    def substituir_tudo(self, lista) -> None:
+        entrada = self._copia()
+        entrada.dados[:] = lista
+        entrada.invalidar_indices()
+        self.operacoes.clear()
+        self.reescrever = True
+
+    def preparar(self) -> Optional[Callable[[], None]]:
+        if not self.alterado:
+            return None
+        # Até o fim da unidade nenhuma outra escrita, deste ou de outro processo, mexe no arquivo
+        self._travas.enter_context(_CACHE_LOCK)
+        self._travas.enter_context(self.repo._trava.exclusiva())
+        if self.repo._assinatura() != self.assinatura_base:
+            raise ConflitoEscritaError(self.repo._caminho_arquivo)
+        return self.repo._preparar_escrita(self.entrada, self.operacoes, self.reescrever)
+
+    def encerrar(self, confirmada: bool) -> None:
+        try:
+            if self.alterado:
+                self.repo._encerrar_escrita(self.entrada, confirmada)
+        finally:
+            self._travas.close()
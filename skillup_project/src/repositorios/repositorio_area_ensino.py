@@ -1,30 +1,25 @@
-import os
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from src.dominio.instituicao_ensino import AreaEnsino, AreaEnsinoMapper
 from src.interfaces.interface_area_ensino import IAreaEnsinoRepositorio
-from src.repositorios.loader import JsonRepository
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "area_ensino.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("area_ensino.json")
 
 
 class RepositorioAreaEnsinoJSON(IAreaEnsinoRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO, chave="id_area")
 
     def salvar(self, area: AreaEnsino) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(AreaEnsinoMapper.to_dict(area))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(AreaEnsinoMapper.to_dict(area))
+
+    def salvar_muitos(self, areas: Iterable[AreaEnsino]) -> None:
+        self._json_repo.gravar_muitos([AreaEnsinoMapper.to_dict(a) for a in areas])
 
     def buscar_por_id(self, id_area: int) -> Optional[AreaEnsino]:
-        dados = self._json_repo.carregar()
-        for a in dados:
-            if a["id_area"] == id_area:
-                return AreaEnsinoMapper.from_dict(a)
-        return None
+        a = self._json_repo.buscar(id_area)
+        return AreaEnsinoMapper.from_dict(a, validar=False) if a else None
 
     def buscar_por_nome(self, nome: str) -> Optional[AreaEnsino]:
         for a in self.listar_todas():
@@ -37,25 +32,18 @@ class RepositorioAreaEnsinoJSON(IAreaEnsinoRepositorio):
 
     def listar_todas(self) -> List[AreaEnsino]:
         dados = self._json_repo.carregar()
-        return [AreaEnsinoMapper.from_dict(d) for d in dados]
+        return [AreaEnsinoMapper.from_dict(d, validar=False) for d in dados]
 
     def atualizar(self, area: AreaEnsino) -> None:
-        dados = self._json_repo.carregar()
-        for i, a in enumerate(dados):
-            if a["id_area"] == area.id_area:
-                dados[i] = AreaEnsinoMapper.to_dict(area)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("Área de ensino não encontrada")
+        if not self._json_repo.substituir(AreaEnsinoMapper.to_dict(area)):
+            raise ValueError("Área de ensino não encontrada")
+
+    def atualizar_muitos(self, areas: Iterable[AreaEnsino]) -> None:
+        if not self._json_repo.substituir_muitos([AreaEnsinoMapper.to_dict(a) for a in areas]):
+            raise ValueError("Área de ensino não encontrada")
 
     def remover_por_id(self, id_area: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [a for a in dados if a["id_area"] != id_area]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover(id_area)
 
     def contar_total(self) -> int:
         return len(self.listar_todas())
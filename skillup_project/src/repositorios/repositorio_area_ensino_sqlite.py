@@ -0,0 +1,51 @@
+from typing import Iterable, List, Optional
+from src.dominio.instituicao_ensino import AreaEnsino, AreaEnsinoMapper
+from src.interfaces.interface_area_ensino import IAreaEnsinoRepositorio
+from src.repositorios.repositorio_area_ensino import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioAreaEnsinoSQLite(IAreaEnsinoRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "area_ensino",
+            chave="id_area",
+            colunas={"nome_area": lambda d: d["nome_area"]},
+            indices=["nome_area"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def salvar(self, area: AreaEnsino) -> None:
+        self._tabela.gravar(AreaEnsinoMapper.to_dict(area))
+
+    def salvar_muitos(self, areas: Iterable[AreaEnsino]) -> None:
+        self._tabela.gravar_muitos([AreaEnsinoMapper.to_dict(a) for a in areas])
+
+    def buscar_por_id(self, id_area: int) -> Optional[AreaEnsino]:
+        d = self._tabela.buscar(id_area)
+        return AreaEnsinoMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_nome(self, nome: str) -> Optional[AreaEnsino]:
+        d = self._tabela.primeiro("nome_area = ?", (nome,))
+        return AreaEnsinoMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_nome_parcial(self, nome: str) -> List[AreaEnsino]:
+        return [a for a in self.listar_todas() if nome.lower() in a.nome_area.lower()]
+
+    def listar_todas(self) -> List[AreaEnsino]:
+        return [AreaEnsinoMapper.from_dict(d, validar=False) for d in self._tabela.carregar()]
+
+    def atualizar(self, area: AreaEnsino) -> None:
+        if not self._tabela.substituir(AreaEnsinoMapper.to_dict(area)):
+            raise ValueError("Área de ensino não encontrada")
+
+    def atualizar_muitos(self, areas: Iterable[AreaEnsino]) -> None:
+        if not self._tabela.substituir_muitos([AreaEnsinoMapper.to_dict(a) for a in areas]):
+            raise ValueError("Área de ensino não encontrada")
+
+    def remover_por_id(self, id_area: int) -> bool:
+        return self._tabela.remover(id_area)
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
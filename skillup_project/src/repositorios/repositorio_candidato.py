@@ -1,37 +1,42 @@
-import os
+from typing import Hashable, Iterable, Iterator, Optional
 from src.dominio.candidato import Candidato, CandidatoMapper
 from src.interfaces.interface_candidato import ICandidatoRepositorio
-from src.repositorios.loader import JsonRepository
+from src.interfaces.paginacao import Pagina
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "candidato.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("candidato.json")
 
 
 class RepositorioCandidatoJSON(ICandidatoRepositorio):
 
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO, unicos=("cpf", "email"))
 
     def salvar(self, candidato: Candidato):
-        dados = self._json_repo.carregar()
-        dados.append(CandidatoMapper.to_dict(candidato))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(CandidatoMapper.to_dict(candidato))
+
+    def salvar_muitos(self, candidatos: Iterable[Candidato]) -> None:
+        self._json_repo.gravar_muitos([CandidatoMapper.to_dict(c) for c in candidatos])
 
     def listar(self):
         dados = self._json_repo.carregar()
-        return [CandidatoMapper.from_dict(d) for d in dados]
+        return [CandidatoMapper.from_dict(d, validar=False) for d in dados]
 
-    def buscar_por_id(self, id_candidato: int):
-        dados = self._json_repo.carregar()
+    def iterar(self) -> Iterator[Candidato]:
+        return (CandidatoMapper.from_dict(d, validar=False) for d in self._json_repo.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._json_repo.versao()
 
-        for c in dados:
-            if c["id"] == id_candidato:
-                return CandidatoMapper.from_dict(c)
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[Candidato]:
+        dados, proximo = self._json_repo.pagina(limite, cursor)
+        return Pagina([CandidatoMapper.from_dict(d, validar=False) for d in dados], proximo)
 
-        return None
+    def buscar_por_id(self, id_candidato: int):
+        c = self._json_repo.buscar(id_candidato)
+        return CandidatoMapper.from_dict(c, validar=False) if c else None
 
     def buscar_por_filtros(self, **filtros):
         candidatos = self.listar()
@@ -61,42 +66,24 @@ class RepositorioCandidatoJSON(ICandidatoRepositorio):
         return resultado
 
     def atualizar(self, candidato: Candidato):
-        dados = self._json_repo.carregar()
-
-        for i, c in enumerate(dados):
-            if c["id"] == candidato.id:
-                dados[i] = CandidatoMapper.to_dict(candidato)
-                self._json_repo.salvar(dados)
-                return
+        if not self._json_repo.substituir(CandidatoMapper.to_dict(candidato)):
+            raise ValueError("Candidato não encontrado")
 
-        raise ValueError("Candidato não encontrado")
+    def atualizar_muitos(self, candidatos: Iterable[Candidato]) -> None:
+        if not self._json_repo.substituir_muitos([CandidatoMapper.to_dict(c) for c in candidatos]):
+            raise ValueError("Candidato não encontrado")
 
     def deletar(self, id_candidato: int):
-        dados = self._json_repo.carregar()
-
-        if not any(c["id"] == id_candidato for c in dados):
+        if not self._json_repo.remover(id_candidato):
             raise ValueError("Candidato não encontrado")
 
-        dados = [c for c in dados if c["id"] != id_candidato]
-        self._json_repo.salvar(dados)
-
     def buscar_por_cpf(self, cpf: str):
-        dados = self._json_repo.carregar()
-
-        for c in dados:
-            if c["cpf"] == cpf:
-                return CandidatoMapper.from_dict(c)
-
-        return None
+        c = self._json_repo.buscar_unico("cpf", cpf)
+        return CandidatoMapper.from_dict(c, validar=False) if c else None
 
     def buscar_por_email(self, email: str):
-        dados = self._json_repo.carregar()
-
-        for c in dados:
-            if c["email"] == email:
-                return CandidatoMapper.from_dict(c)
-
-        return None
+        c = self._json_repo.buscar_unico("email", email)
+        return CandidatoMapper.from_dict(c, validar=False) if c else None
 
     def buscar_por_area_interesse(self, area: str):
         candidatos = self.listar()
@@ -0,0 +1,94 @@
+from typing import Hashable, Iterable, Iterator, List, Optional
+from src.dominio.candidato import Candidato, CandidatoMapper
+from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.paginacao import Pagina
+from src.repositorios.repositorio_candidato import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioCandidatoSQLite(ICandidatoRepositorio):
+
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "candidato",
+            colunas={
+                "cpf": lambda d: d["cpf"],
+                "email": lambda d: d["email"],
+                "nivel_formacao": lambda d: d["nivel_formacao"],
+            },
+            indices=["nivel_formacao"],
+            unicos=["cpf", "email"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def salvar(self, candidato: Candidato):
+        self._tabela.gravar(CandidatoMapper.to_dict(candidato))
+
+    def salvar_muitos(self, candidatos: Iterable[Candidato]) -> None:
+        self._tabela.gravar_muitos([CandidatoMapper.to_dict(c) for c in candidatos])
+
+    def listar(self) -> List[Candidato]:
+        return [CandidatoMapper.from_dict(d, validar=False) for d in self._tabela.carregar()]
+
+    def iterar(self) -> Iterator[Candidato]:
+        return (CandidatoMapper.from_dict(d, validar=False) for d in self._tabela.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._tabela.versao()
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[Candidato]:
+        dados, proximo = self._tabela.pagina(limite, cursor)
+        return Pagina([CandidatoMapper.from_dict(d, validar=False) for d in dados], proximo)
+
+    def buscar_por_id(self, id_candidato: int) -> Optional[Candidato]:
+        d = self._tabela.buscar(id_candidato)
+        return CandidatoMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_filtros(self, **filtros) -> List[Candidato]:
+        resultado = []
+        for candidato in self.listar():
+            corresponde = True
+            for campo, valor in filtros.items():
+                if not hasattr(candidato, campo):
+                    raise AttributeError(f"O campo '{campo}' não existe no candidato")
+                atributo = getattr(candidato, campo)
+                if isinstance(atributo, (list, tuple)):
+                    if valor not in atributo:
+                        corresponde = False
+                        break
+                elif atributo != valor:
+                    corresponde = False
+                    break
+            if corresponde:
+                resultado.append(candidato)
+        return resultado
+
+    def atualizar(self, candidato: Candidato):
+        if not self._tabela.substituir(CandidatoMapper.to_dict(candidato)):
+            raise ValueError("Candidato não encontrado")
+
+    def atualizar_muitos(self, candidatos: Iterable[Candidato]) -> None:
+        if not self._tabela.substituir_muitos([CandidatoMapper.to_dict(c) for c in candidatos]):
+            raise ValueError("Candidato não encontrado")
+
+    def deletar(self, id_candidato: int):
+        if not self._tabela.remover(id_candidato):
+            raise ValueError("Candidato não encontrado")
+
+    def buscar_por_cpf(self, cpf: str) -> Optional[Candidato]:
+        d = self._tabela.primeiro("cpf = ?", (cpf,))
+        return CandidatoMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_email(self, email: str) -> Optional[Candidato]:
+        d = self._tabela.primeiro("email = ?", (email,))
+        return CandidatoMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_area_interesse(self, area: str) -> List[Candidato]:
+        return [c for c in self.listar() if area in c.areas_interesse]
+
+    def buscar_por_nivel_formacao(self, nivel: str) -> List[Candidato]:
+        return [CandidatoMapper.from_dict(d, validar=False) for d in self._tabela.onde("nivel_formacao = ?", (nivel,))]
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
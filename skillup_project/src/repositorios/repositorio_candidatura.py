@@ -1,63 +1,70 @@
-import os
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from src.dominio.candidatura import Candidatura, CandidaturaMapper
 from src.interfaces.interface_candidatura import ICandidaturaRepositorio
-from src.repositorios.loader import JsonRepository
+from src.interfaces.paginacao import Pagina
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "candidatura.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("candidatura.json")
 
 
 class RepositorioCandidaturaJSON(ICandidaturaRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO, chave="id_candidatura")
 
     def salvar(self, candidatura: Candidatura) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(CandidaturaMapper.to_dict(candidatura))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(CandidaturaMapper.to_dict(candidatura))
+
+    def salvar_muitos(self, candidaturas: Iterable[Candidatura]) -> None:
+        self._json_repo.gravar_muitos([CandidaturaMapper.to_dict(c) for c in candidaturas])
+
+    def atualizar_muitos(self, candidaturas: Iterable[Candidatura]) -> None:
+        if not self._json_repo.substituir_muitos([CandidaturaMapper.to_dict(c) for c in candidaturas]):
+            raise ValueError("Candidatura não encontrada")
+
+    def _listar_por_indice(self, campo: str, valor) -> List[Candidatura]:
+        return [CandidaturaMapper.from_dict(d, validar=False) for d in self._json_repo.buscar_por_indice(campo, valor)]
 
     def buscar_por_id(self, id_candidatura: int) -> Optional[Candidatura]:
-        dados = self._json_repo.carregar()
-        for c in dados:
-            if c["id_candidatura"] == id_candidatura:
-                return CandidaturaMapper.from_dict(c)
-        return None
+        c = self._json_repo.buscar(id_candidatura)
+        return CandidaturaMapper.from_dict(c, validar=False) if c else None
 
     def listar_todas(self) -> List[Candidatura]:
         dados = self._json_repo.carregar()
-        return [CandidaturaMapper.from_dict(d) for d in dados]
+        return [CandidaturaMapper.from_dict(d, validar=False) for d in dados]
+
+    def iterar(self) -> Iterator[Candidatura]:
+        return (CandidaturaMapper.from_dict(d, validar=False) for d in self._json_repo.iterar())
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[Candidatura]:
+        # Os filtros de paginação têm o mesmo nome dos campos gravados
+        dados, proximo = self._json_repo.pagina(limite, cursor, campo, valor)
+        return Pagina([CandidaturaMapper.from_dict(d, validar=False) for d in dados], proximo)
 
     def listar_por_candidato(self, id_candidato: int) -> List[Candidatura]:
-        return [c for c in self.listar_todas() if c.id_candidato == id_candidato]
+        return self._listar_por_indice("id_candidato", id_candidato)
 
     def listar_por_vaga(self, id_vaga: int) -> List[Candidatura]:
-        return [c for c in self.listar_todas() if c.id_vaga == id_vaga]
+        return self._listar_por_indice("id_vaga", id_vaga)
 
     def listar_por_status(self, status: str) -> List[Candidatura]:
-        return [c for c in self.listar_todas() if c.status.value == status]
+        return self._listar_por_indice("status", status)
 
     def contar_por_candidato(self, id_candidato: int) -> int:
-        return len(self.listar_por_candidato(id_candidato))
+        return self._json_repo.contar_por_indice("id_candidato", id_candidato)
 
     def contar_por_vaga(self, id_vaga: int) -> int:
-        return len(self.listar_por_vaga(id_vaga))
+        return self._json_repo.contar_por_indice("id_vaga", id_vaga)
 
     def contar_por_status(self, status: str) -> int:
-        return len(self.listar_por_status(status))
+        return self._json_repo.contar_por_indice("status", status)
 
     def atualizar_status(self, id_candidatura: int, novo_status: str) -> bool:
-        dados = self._json_repo.carregar()
-        for i, c in enumerate(dados):
-            if c["id_candidatura"] == id_candidatura:
-                dados[i]["status"] = novo_status
-                self._json_repo.salvar(dados)
-                return True
-        return False
+        c = self._json_repo.buscar(id_candidatura)
+        if c is None:
+            return False
+        self._json_repo.substituir({**c, "status": novo_status})
+        return True
 
     def excluir(self, id_candidatura: int) -> None:
-        dados = self._json_repo.carregar()
-        dados = [c for c in dados if c["id_candidatura"] != id_candidatura]
-        self._json_repo.salvar(dados)
+        self._json_repo.remover(id_candidatura)
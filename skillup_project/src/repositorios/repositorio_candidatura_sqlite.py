@@ -0,0 +1,77 @@
+from typing import Iterable, Iterator, List, Optional
+from src.dominio.candidatura import Candidatura, CandidaturaMapper
+from src.interfaces.interface_candidatura import ICandidaturaRepositorio
+from src.interfaces.paginacao import Pagina
+from src.repositorios.repositorio_candidatura import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioCandidaturaSQLite(ICandidaturaRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "candidatura",
+            chave="id_candidatura",
+            colunas={
+                "id_candidato": lambda d: d["id_candidato"],
+                "id_vaga": lambda d: d["id_vaga"],
+                "status": lambda d: d["status"],
+            },
+            indices=["id_candidato", "id_vaga", "status"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=()) -> List[Candidatura]:
+        return [CandidaturaMapper.from_dict(d, validar=False) for d in self._tabela.onde(condicao, parametros)]
+
+    def salvar(self, candidatura: Candidatura) -> None:
+        self._tabela.gravar(CandidaturaMapper.to_dict(candidatura))
+
+    def salvar_muitos(self, candidaturas: Iterable[Candidatura]) -> None:
+        self._tabela.gravar_muitos([CandidaturaMapper.to_dict(c) for c in candidaturas])
+
+    def atualizar_muitos(self, candidaturas: Iterable[Candidatura]) -> None:
+        if not self._tabela.substituir_muitos([CandidaturaMapper.to_dict(c) for c in candidaturas]):
+            raise ValueError("Candidatura não encontrada")
+
+    def buscar_por_id(self, id_candidatura: int) -> Optional[Candidatura]:
+        d = self._tabela.buscar(id_candidatura)
+        return CandidaturaMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todas(self) -> List[Candidatura]:
+        return self._listar_onde("")
+
+    def iterar(self) -> Iterator[Candidatura]:
+        return (CandidaturaMapper.from_dict(d, validar=False) for d in self._tabela.iterar())
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[Candidatura]:
+        condicao, parametros = (f"{campo} = ?", (valor,)) if campo else ("", ())
+        dados, proximo = self._tabela.pagina(limite, cursor, condicao, parametros)
+        return Pagina([CandidaturaMapper.from_dict(d, validar=False) for d in dados], proximo)
+
+    def listar_por_candidato(self, id_candidato: int) -> List[Candidatura]:
+        return self._listar_onde("id_candidato = ?", (id_candidato,))
+
+    def listar_por_vaga(self, id_vaga: int) -> List[Candidatura]:
+        return self._listar_onde("id_vaga = ?", (id_vaga,))
+
+    def listar_por_status(self, status: str) -> List[Candidatura]:
+        return self._listar_onde("status = ?", (status,))
+
+    def contar_por_candidato(self, id_candidato: int) -> int:
+        return self._tabela.contar("id_candidato = ?", (id_candidato,))
+
+    def contar_por_vaga(self, id_vaga: int) -> int:
+        return self._tabela.contar("id_vaga = ?", (id_vaga,))
+
+    def contar_por_status(self, status: str) -> int:
+        return self._tabela.contar("status = ?", (status,))
+
+    def atualizar_status(self, id_candidatura: int, novo_status: str) -> bool:
+        c = self._tabela.buscar(id_candidatura)
+        if c is None:
+            return False
+        return self._tabela.substituir({**c, "status": novo_status})
+
+    def excluir(self, id_candidatura: int) -> None:
+        self._tabela.remover(id_candidatura)
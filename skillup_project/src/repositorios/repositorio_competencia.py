@@ -1,30 +1,25 @@
-import os
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from src.dominio.competencia import Competencia, CompetenciaMapper
 from src.interfaces.interface_competencia import ICompetenciaRepositorio
-from src.repositorios.loader import JsonRepository
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "competencia.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("competencia.json")
 
 
 class RepositorioCompetenciaJSON(ICompetenciaRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO)
 
     def salvar(self, competencia: Competencia) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(CompetenciaMapper.to_dict(competencia))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(CompetenciaMapper.to_dict(competencia))
+
+    def salvar_muitos(self, competencias: Iterable[Competencia]) -> None:
+        self._json_repo.gravar_muitos([CompetenciaMapper.to_dict(c) for c in competencias])
 
     def buscar_por_id(self, id_competencia: int) -> Optional[Competencia]:
-        dados = self._json_repo.carregar()
-        for c in dados:
-            if c["id"] == id_competencia:
-                return CompetenciaMapper.from_dict(c)
-        return None
+        c = self._json_repo.buscar(id_competencia)
+        return CompetenciaMapper.from_dict(c, validar=False) if c else None
 
     def buscar_por_nome(self, nome: str) -> Optional[Competencia]:
         for c in self.listar_todos():
@@ -37,7 +32,7 @@ class RepositorioCompetenciaJSON(ICompetenciaRepositorio):
 
     def listar_todos(self) -> List[Competencia]:
         dados = self._json_repo.carregar()
-        return [CompetenciaMapper.from_dict(d) for d in dados]
+        return [CompetenciaMapper.from_dict(d, validar=False) for d in dados]
 
     def buscar_por_filtros(self, **filtros) -> List[Competencia]:
         competencias = self.listar_todos()
@@ -61,22 +56,15 @@ class RepositorioCompetenciaJSON(ICompetenciaRepositorio):
         return resultado
 
     def atualizar(self, competencia: Competencia) -> None:
-        dados = self._json_repo.carregar()
-        for i, c in enumerate(dados):
-            if c["id"] == competencia.id:
-                dados[i] = CompetenciaMapper.to_dict(competencia)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("Competência não encontrada")
+        if not self._json_repo.substituir(CompetenciaMapper.to_dict(competencia)):
+            raise ValueError("Competência não encontrada")
+
+    def atualizar_muitos(self, competencias: Iterable[Competencia]) -> None:
+        if not self._json_repo.substituir_muitos([CompetenciaMapper.to_dict(c) for c in competencias]):
+            raise ValueError("Competência não encontrada")
 
     def remover_por_id(self, id_competencia: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [c for c in dados if c["id"] != id_competencia]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover(id_competencia)
 
     def contar_total(self) -> int:
         return len(self.listar_todos())
@@ -3,11 +3,13 @@ Repositório JSON para CompetenciaCandidato
 """
 import json
 import os
-from pathlib import Path
-from typing import List, Optional
+from typing import Hashable, Iterable, Iterator, List, Optional
 
 from src.dominio.competencia_candidato import CompetenciaCandidato
+from src.dominio.hidratacao import hidratar
 from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
 
 class RepositorioCompetenciaCandidatoJSON(ICompetenciaCandidatoRepositorio):
@@ -15,27 +17,24 @@ class RepositorioCompetenciaCandidatoJSON(ICompetenciaCandidatoRepositorio):
 
     def __init__(self, caminho_arquivo: str = None):
         if caminho_arquivo is None:
-            base_dir = Path(__file__).parent.parent / "data"
-            caminho_arquivo = str(base_dir / "competencia_candidato.json")
+            caminho_arquivo = caminho_dados("competencia_candidato.json")
         self._caminho = caminho_arquivo
+        self._json_repo = abrir_armazenamento(caminho_arquivo)
         self._garantir_arquivo()
 
     def _garantir_arquivo(self) -> None:
         """Garante que o arquivo JSON existe."""
         os.makedirs(os.path.dirname(self._caminho), exist_ok=True)
-        if not os.path.exists(self._caminho):
-            with open(self._caminho, "w", encoding="utf-8") as f:
+        # "x" só cria se não existir: não apaga o que outro processo acabou de gravar
+        try:
+            with open(self._caminho, "x", encoding="utf-8") as f:
                 json.dump([], f)
+        except FileExistsError:
+            pass
 
     def _carregar(self) -> List[dict]:
-        """Carrega dados do arquivo JSON."""
-        with open(self._caminho, "r", encoding="utf-8") as f:
-            return json.load(f)
-
-    def _salvar_todos(self, dados: List[dict]) -> None:
-        """Salva todos os dados no arquivo JSON."""
-        with open(self._caminho, "w", encoding="utf-8") as f:
-            json.dump(dados, f, indent=2, ensure_ascii=False)
+        """Carrega dados do arquivo JSON (via cache compartilhado)."""
+        return self._json_repo.carregar()
 
     def _para_dict(self, comp: CompetenciaCandidato) -> dict:
         """Converte CompetenciaCandidato para dicionário."""
@@ -47,8 +46,9 @@ class RepositorioCompetenciaCandidatoJSON(ICompetenciaCandidatoRepositorio):
         }
 
     def _para_objeto(self, dados: dict) -> CompetenciaCandidato:
-        """Converte dicionário para CompetenciaCandidato."""
-        return CompetenciaCandidato(
+        """Converte dicionário para CompetenciaCandidato (sem revalidar o que já foi gravado)."""
+        return hidratar(
+            CompetenciaCandidato,
             id=dados["id"],
             id_candidato=dados["id_candidato"],
             id_competencia=dados["id_competencia"],
@@ -57,39 +57,38 @@ class RepositorioCompetenciaCandidatoJSON(ICompetenciaCandidatoRepositorio):
 
     def salvar(self, competencia_candidato: CompetenciaCandidato) -> None:
         """Salva ou atualiza uma competência do candidato."""
-        dados = self._carregar()
-        existente = next(
-            (i for i, c in enumerate(dados) if c["id"] == competencia_candidato.id),
-            None,
-        )
-        if existente is not None:
-            dados[existente] = self._para_dict(competencia_candidato)
-        else:
-            dados.append(self._para_dict(competencia_candidato))
-        self._salvar_todos(dados)
+        self._json_repo.gravar(self._para_dict(competencia_candidato))
+
+    def salvar_muitos(self, competencias_candidato: Iterable[CompetenciaCandidato]) -> None:
+        """Salva ou atualiza várias competências de candidatos numa única gravação."""
+        self._json_repo.gravar_muitos([self._para_dict(c) for c in competencias_candidato])
 
     def buscar_por_id(self, id_competencia_candidato: int) -> Optional[CompetenciaCandidato]:
         """Busca uma competência do candidato pelo ID."""
-        dados = self._carregar()
-        for c in dados:
-            if c["id"] == id_competencia_candidato:
-                return self._para_objeto(c)
-        return None
+        c = self._json_repo.buscar(id_competencia_candidato)
+        return self._para_objeto(c) if c else None
 
     def listar_todas(self) -> List[CompetenciaCandidato]:
         """Retorna todas as competências de candidatos."""
         dados = self._carregar()
         return [self._para_objeto(c) for c in dados]
 
+    def iterar(self) -> Iterator[CompetenciaCandidato]:
+        """Percorre as competências de candidatos sem carregar todas de uma vez."""
+        return (self._para_objeto(d) for d in self._json_repo.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._json_repo.versao()
+
     def listar_por_candidato(self, id_candidato: int) -> List[CompetenciaCandidato]:
         """Retorna todas as competências de um candidato específico."""
-        dados = self._carregar()
-        return [self._para_objeto(c) for c in dados if c["id_candidato"] == id_candidato]
+        dados = self._json_repo.buscar_por_indice("id_candidato", id_candidato)
+        return [self._para_objeto(c) for c in dados]
 
     def listar_por_competencia(self, id_competencia: int) -> List[CompetenciaCandidato]:
         """Retorna todos os candidatos que possuem uma competência específica."""
-        dados = self._carregar()
-        return [self._para_objeto(c) for c in dados if c["id_competencia"] == id_competencia]
+        dados = self._json_repo.buscar_por_indice("id_competencia", id_competencia)
+        return [self._para_objeto(c) for c in dados]
 
     def listar_por_nivel(self, nivel: str) -> List[CompetenciaCandidato]:
         """Retorna todas as competências de candidatos com um nível específico."""
@@ -110,22 +109,14 @@ class RepositorioCompetenciaCandidatoJSON(ICompetenciaCandidatoRepositorio):
         """Atualiza uma competência do candidato."""
         self.salvar(competencia_candidato)
 
+    def atualizar_muitos(self, competencias_candidato: Iterable[CompetenciaCandidato]) -> None:
+        """Atualiza várias competências de candidatos numa única gravação."""
+        self.salvar_muitos(competencias_candidato)
+
     def remover_por_id(self, id_competencia_candidato: int) -> bool:
         """Remove uma competência do candidato pelo ID."""
-        dados = self._carregar()
-        tamanho_original = len(dados)
-        dados = [c for c in dados if c["id"] != id_competencia_candidato]
-        if len(dados) < tamanho_original:
-            self._salvar_todos(dados)
-            return True
-        return False
+        return self._json_repo.remover(id_competencia_candidato)
 
     def remover_por_candidato(self, id_candidato: int) -> bool:
         """Remove todas as competências de um candidato."""
-        dados = self._carregar()
-        tamanho_original = len(dados)
-        dados = [c for c in dados if c["id_candidato"] != id_candidato]
-        if len(dados) < tamanho_original:
-            self._salvar_todos(dados)
-            return True
-        return False
+        return self._json_repo.remover_onde(lambda c: c["id_candidato"] == id_candidato) > 0
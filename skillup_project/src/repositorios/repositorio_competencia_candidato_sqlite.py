@@ -0,0 +1,112 @@
+"""
+Repositório SQLite para CompetenciaCandidato
+"""
+from typing import Hashable, Iterable, Iterator, List, Optional
+
+from src.dominio.competencia_candidato import CompetenciaCandidato
+from src.dominio.hidratacao import hidratar
+from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.repositorios.arquivos import caminho_dados
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+CAMINHO_ARQUIVO = caminho_dados("competencia_candidato.json")
+
+
+class RepositorioCompetenciaCandidatoSQLite(ICompetenciaCandidatoRepositorio):
+    """Implementação do repositório de CompetenciaCandidato usando SQLite."""
+
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "competencia_candidato",
+            colunas={
+                "id_candidato": lambda d: d["id_candidato"],
+                "id_competencia": lambda d: d["id_competencia"],
+                "nivel_atual": lambda d: d["nivel_atual"],
+            },
+            indices=[("id_candidato", "id_competencia"), "id_competencia", "nivel_atual"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _para_dict(self, comp: CompetenciaCandidato) -> dict:
+        """Converte CompetenciaCandidato para dicionário (mesmo formato do JSON)."""
+        return {
+            "id": comp.id,
+            "id_candidato": comp.id_candidato,
+            "id_competencia": comp.id_competencia,
+            "nivel_atual": comp.nivel_atual,
+        }
+
+    def _para_objeto(self, dados: dict) -> CompetenciaCandidato:
+        """Converte dicionário para CompetenciaCandidato (sem revalidar o que já foi gravado)."""
+        return hidratar(
+            CompetenciaCandidato,
+            id=dados["id"],
+            id_candidato=dados["id_candidato"],
+            id_competencia=dados["id_competencia"],
+            nivel_atual=dados["nivel_atual"],
+        )
+
+    def _listar_onde(self, condicao: str, parametros=()) -> List[CompetenciaCandidato]:
+        return [self._para_objeto(d) for d in self._tabela.onde(condicao, parametros)]
+
+    def salvar(self, competencia_candidato: CompetenciaCandidato) -> None:
+        """Salva ou atualiza uma competência do candidato."""
+        self._tabela.gravar(self._para_dict(competencia_candidato))
+
+    def salvar_muitos(self, competencias_candidato: Iterable[CompetenciaCandidato]) -> None:
+        """Salva ou atualiza várias competências de candidatos numa única gravação."""
+        self._tabela.gravar_muitos([self._para_dict(c) for c in competencias_candidato])
+
+    def buscar_por_id(self, id_competencia_candidato: int) -> Optional[CompetenciaCandidato]:
+        """Busca uma competência do candidato pelo ID."""
+        d = self._tabela.buscar(id_competencia_candidato)
+        return self._para_objeto(d) if d else None
+
+    def listar_todas(self) -> List[CompetenciaCandidato]:
+        """Retorna todas as competências de candidatos."""
+        return self._listar_onde("")
+
+    def iterar(self) -> Iterator[CompetenciaCandidato]:
+        """Percorre as competências de candidatos sem carregar todas de uma vez."""
+        return (self._para_objeto(d) for d in self._tabela.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._tabela.versao()
+
+    def listar_por_candidato(self, id_candidato: int) -> List[CompetenciaCandidato]:
+        """Retorna todas as competências de um candidato específico."""
+        return self._listar_onde("id_candidato = ?", (id_candidato,))
+
+    def listar_por_competencia(self, id_competencia: int) -> List[CompetenciaCandidato]:
+        """Retorna todos os candidatos que possuem uma competência específica."""
+        return self._listar_onde("id_competencia = ?", (id_competencia,))
+
+    def listar_por_nivel(self, nivel: str) -> List[CompetenciaCandidato]:
+        """Retorna todas as competências de candidatos com um nível específico."""
+        return self._listar_onde("nivel_atual = ?", (nivel,))
+
+    def buscar_por_candidato_e_competencia(
+        self, id_candidato: int, id_competencia: int
+    ) -> Optional[CompetenciaCandidato]:
+        """Busca a competência de um candidato específico."""
+        d = self._tabela.primeiro(
+            "id_candidato = ? AND id_competencia = ?", (id_candidato, id_competencia)
+        )
+        return self._para_objeto(d) if d else None
+
+    def atualizar(self, competencia_candidato: CompetenciaCandidato) -> None:
+        """Atualiza uma competência do candidato."""
+        self.salvar(competencia_candidato)
+
+    def atualizar_muitos(self, competencias_candidato: Iterable[CompetenciaCandidato]) -> None:
+        """Atualiza várias competências de candidatos numa única gravação."""
+        self.salvar_muitos(competencias_candidato)
+
+    def remover_por_id(self, id_competencia_candidato: int) -> bool:
+        """Remove uma competência do candidato pelo ID."""
+        return self._tabela.remover(id_competencia_candidato)
+
+    def remover_por_candidato(self, id_candidato: int) -> bool:
+        """Remove todas as competências de um candidato."""
+        return self._tabela.remover_onde("id_candidato = ?", (id_candidato,)) > 0
@@ -0,0 +1,69 @@
+from typing import Iterable, List, Optional
+from src.dominio.competencia import Competencia, CompetenciaMapper
+from src.interfaces.interface_competencia import ICompetenciaRepositorio
+from src.repositorios.repositorio_competencia import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioCompetenciaSQLite(ICompetenciaRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "competencia",
+            colunas={"nome": lambda d: d["nome"]},
+            indices=["nome"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def salvar(self, competencia: Competencia) -> None:
+        self._tabela.gravar(CompetenciaMapper.to_dict(competencia))
+
+    def salvar_muitos(self, competencias: Iterable[Competencia]) -> None:
+        self._tabela.gravar_muitos([CompetenciaMapper.to_dict(c) for c in competencias])
+
+    def buscar_por_id(self, id_competencia: int) -> Optional[Competencia]:
+        d = self._tabela.buscar(id_competencia)
+        return CompetenciaMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_nome(self, nome: str) -> Optional[Competencia]:
+        d = self._tabela.primeiro("nome = ?", (nome,))
+        return CompetenciaMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_nome_parcial(self, nome: str) -> List[Competencia]:
+        return [c for c in self.listar_todos() if nome.lower() in c.nome.lower()]
+
+    def listar_todos(self) -> List[Competencia]:
+        return [CompetenciaMapper.from_dict(d, validar=False) for d in self._tabela.carregar()]
+
+    def buscar_por_filtros(self, **filtros) -> List[Competencia]:
+        resultado = []
+        for comp in self.listar_todos():
+            corresponde = True
+            for campo, valor in filtros.items():
+                if not hasattr(comp, campo):
+                    raise AttributeError(f"O campo '{campo}' não existe em Competencia")
+                atributo = getattr(comp, campo)
+                if isinstance(atributo, list):
+                    if valor not in atributo:
+                        corresponde = False
+                        break
+                elif atributo != valor:
+                    corresponde = False
+                    break
+            if corresponde:
+                resultado.append(comp)
+        return resultado
+
+    def atualizar(self, competencia: Competencia) -> None:
+        if not self._tabela.substituir(CompetenciaMapper.to_dict(competencia)):
+            raise ValueError("Competência não encontrada")
+
+    def atualizar_muitos(self, competencias: Iterable[Competencia]) -> None:
+        if not self._tabela.substituir_muitos([CompetenciaMapper.to_dict(c) for c in competencias]):
+            raise ValueError("Competência não encontrada")
+
+    def remover_por_id(self, id_competencia: int) -> bool:
+        return self._tabela.remover(id_competencia)
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
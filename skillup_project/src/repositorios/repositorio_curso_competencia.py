@@ -1,34 +1,29 @@
-import os
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from src.dominio.curso_competencia import CursoCompetencia, CursoCompetenciaMapper
 from src.interfaces.interface_curso_competencia import ICursoCompetenciaRepositorio
-from src.repositorios.loader import JsonRepository
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "curso_competencia.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("curso_competencia.json")
 
 
 class RepositorioCursoCompetenciaJSON(ICursoCompetenciaRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO)
 
     def salvar(self, curso_competencia: CursoCompetencia) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(CursoCompetenciaMapper.to_dict(curso_competencia))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(CursoCompetenciaMapper.to_dict(curso_competencia))
+
+    def salvar_muitos(self, cursos_competencia: Iterable[CursoCompetencia]) -> None:
+        self._json_repo.gravar_muitos([CursoCompetenciaMapper.to_dict(c) for c in cursos_competencia])
 
     def buscar_por_id(self, id_curso_competencia: int) -> Optional[CursoCompetencia]:
-        dados = self._json_repo.carregar()
-        for c in dados:
-            if c["id"] == id_curso_competencia:
-                return CursoCompetenciaMapper.from_dict(c)
-        return None
+        c = self._json_repo.buscar(id_curso_competencia)
+        return CursoCompetenciaMapper.from_dict(c, validar=False) if c else None
 
     def listar_todas(self) -> List[CursoCompetencia]:
         dados = self._json_repo.carregar()
-        return [CursoCompetenciaMapper.from_dict(d) for d in dados]
+        return [CursoCompetenciaMapper.from_dict(d, validar=False) for d in dados]
 
     def listar_por_curso(self, id_curso: int) -> List[CursoCompetencia]:
         return [cc for cc in self.listar_todas() if cc.id_curso == id_curso]
@@ -46,31 +41,18 @@ class RepositorioCursoCompetenciaJSON(ICursoCompetenciaRepositorio):
         return None
 
     def atualizar(self, curso_competencia: CursoCompetencia) -> None:
-        dados = self._json_repo.carregar()
-        for i, c in enumerate(dados):
-            if c["id"] == curso_competencia.id:
-                dados[i] = CursoCompetenciaMapper.to_dict(curso_competencia)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("CursoCompetencia não encontrado")
+        if not self._json_repo.substituir(CursoCompetenciaMapper.to_dict(curso_competencia)):
+            raise ValueError("CursoCompetencia não encontrado")
+
+    def atualizar_muitos(self, cursos_competencia: Iterable[CursoCompetencia]) -> None:
+        if not self._json_repo.substituir_muitos([CursoCompetenciaMapper.to_dict(c) for c in cursos_competencia]):
+            raise ValueError("CursoCompetencia não encontrado")
 
     def remover_por_id(self, id_curso_competencia: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [c for c in dados if c["id"] != id_curso_competencia]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover(id_curso_competencia)
 
     def remover_por_curso(self, id_curso: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [c for c in dados if c["curso_id"] != id_curso]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover_onde(lambda c: c["curso_id"] == id_curso) > 0
 
     def contar_competencias_curso(self, id_curso: int) -> int:
         return len(self.listar_por_curso(id_curso))
@@ -0,0 +1,65 @@
+from typing import Iterable, List, Optional
+from src.dominio.curso_competencia import CursoCompetencia, CursoCompetenciaMapper
+from src.interfaces.interface_curso_competencia import ICursoCompetenciaRepositorio
+from src.repositorios.repositorio_curso_competencia import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioCursoCompetenciaSQLite(ICursoCompetenciaRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "curso_competencia",
+            colunas={
+                "id_curso": lambda d: d["curso_id"],
+                "id_competencia": lambda d: d["competencia_id"],
+            },
+            indices=[("id_curso", "id_competencia"), "id_competencia"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=()) -> List[CursoCompetencia]:
+        return [CursoCompetenciaMapper.from_dict(d, validar=False) for d in self._tabela.onde(condicao, parametros)]
+
+    def salvar(self, curso_competencia: CursoCompetencia) -> None:
+        self._tabela.gravar(CursoCompetenciaMapper.to_dict(curso_competencia))
+
+    def salvar_muitos(self, cursos_competencia: Iterable[CursoCompetencia]) -> None:
+        self._tabela.gravar_muitos([CursoCompetenciaMapper.to_dict(c) for c in cursos_competencia])
+
+    def buscar_por_id(self, id_curso_competencia: int) -> Optional[CursoCompetencia]:
+        d = self._tabela.buscar(id_curso_competencia)
+        return CursoCompetenciaMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todas(self) -> List[CursoCompetencia]:
+        return self._listar_onde("")
+
+    def listar_por_curso(self, id_curso: int) -> List[CursoCompetencia]:
+        return self._listar_onde("id_curso = ?", (id_curso,))
+
+    def listar_por_competencia(self, id_competencia: int) -> List[CursoCompetencia]:
+        return self._listar_onde("id_competencia = ?", (id_competencia,))
+
+    def listar_por_nivel(self, nivel: str) -> List[CursoCompetencia]:
+        return [cc for cc in self.listar_todas() if cc.nivel_conferido == nivel.lower()]
+
+    def buscar_por_curso_e_competencia(self, id_curso: int, id_competencia: int) -> Optional[CursoCompetencia]:
+        d = self._tabela.primeiro("id_curso = ? AND id_competencia = ?", (id_curso, id_competencia))
+        return CursoCompetenciaMapper.from_dict(d, validar=False) if d else None
+
+    def atualizar(self, curso_competencia: CursoCompetencia) -> None:
+        if not self._tabela.substituir(CursoCompetenciaMapper.to_dict(curso_competencia)):
+            raise ValueError("CursoCompetencia não encontrado")
+
+    def atualizar_muitos(self, cursos_competencia: Iterable[CursoCompetencia]) -> None:
+        if not self._tabela.substituir_muitos([CursoCompetenciaMapper.to_dict(c) for c in cursos_competencia]):
+            raise ValueError("CursoCompetencia não encontrado")
+
+    def remover_por_id(self, id_curso_competencia: int) -> bool:
+        return self._tabela.remover(id_curso_competencia)
+
+    def remover_por_curso(self, id_curso: int) -> bool:
+        return self._tabela.remover_onde("id_curso = ?", (id_curso,)) > 0
+
+    def contar_competencias_curso(self, id_curso: int) -> int:
+        return self._tabela.contar("id_curso = ?", (id_curso,))
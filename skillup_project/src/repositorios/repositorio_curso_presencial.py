@@ -1,34 +1,32 @@
-import os
-from typing import List, Optional
+from typing import Hashable, Iterable, List, Optional
 from src.dominio.curso_presencial import CursoPresencial, CursoPresencialMapper
 from src.interfaces.interface_curso import ICursoRepositorio
-from src.repositorios.loader import JsonRepository
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "curso_presencial.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("curso_presencial.json")
 
 
 class RepositorioCursoPresencialJSON(ICursoRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO)
 
     def salvar(self, curso: CursoPresencial) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(CursoPresencialMapper.to_dict(curso))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(CursoPresencialMapper.to_dict(curso))
+
+    def salvar_muitos(self, cursos: Iterable[CursoPresencial]) -> None:
+        self._json_repo.gravar_muitos([CursoPresencialMapper.to_dict(c) for c in cursos])
 
     def buscar_por_id(self, id_curso: int) -> Optional[CursoPresencial]:
-        dados = self._json_repo.carregar()
-        for c in dados:
-            if c["id"] == id_curso:
-                return CursoPresencialMapper.from_dict(c)
-        return None
+        c = self._json_repo.buscar(id_curso)
+        return CursoPresencialMapper.from_dict(c, validar=False) if c else None
 
     def listar_todos(self) -> List[CursoPresencial]:
         dados = self._json_repo.carregar()
-        return [CursoPresencialMapper.from_dict(d) for d in dados]
+        return [CursoPresencialMapper.from_dict(d, validar=False) for d in dados]
+
+    def versao(self) -> Optional[Hashable]:
+        return self._json_repo.versao()
 
     def listar_por_nome(self, nome: str) -> List[CursoPresencial]:
         return [c for c in self.listar_todos() if nome.lower() in c.nome.lower()]
@@ -67,22 +65,15 @@ class RepositorioCursoPresencialJSON(ICursoRepositorio):
         return resultado
 
     def atualizar(self, curso: CursoPresencial) -> None:
-        dados = self._json_repo.carregar()
-        for i, c in enumerate(dados):
-            if c["id"] == curso.id:
-                dados[i] = CursoPresencialMapper.to_dict(curso)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("Curso Presencial não encontrado")
+        if not self._json_repo.substituir(CursoPresencialMapper.to_dict(curso)):
+            raise ValueError("Curso Presencial não encontrado")
+
+    def atualizar_muitos(self, cursos: Iterable[CursoPresencial]) -> None:
+        if not self._json_repo.substituir_muitos([CursoPresencialMapper.to_dict(c) for c in cursos]):
+            raise ValueError("Curso Presencial não encontrado")
 
     def remover_por_id(self, id_curso: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [c for c in dados if c["id"] != id_curso]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover(id_curso)
 
     def contar_total(self) -> int:
         return len(self.listar_todos())
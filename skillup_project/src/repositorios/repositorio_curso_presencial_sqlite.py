@@ -0,0 +1,116 @@
+from typing import Hashable, Iterable, List, Optional
+from src.dominio.curso_presencial import CursoPresencial, CursoPresencialMapper
+from src.interfaces.interface_curso import ICursoRepositorio
+from src.repositorios.repositorio_curso_presencial import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioCursoPresencialSQLite(ICursoRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "curso_presencial",
+            colunas={
+                "id_instituicao": lambda d: d["id_instituicao"],
+                "area": lambda d: d["area"].lower(),
+                "carga_horaria": lambda d: d["carga_horaria"],
+                "ativo": lambda d: int(d.get("ativo", True)),
+            },
+            indices=["id_instituicao", "area", "carga_horaria", "ativo"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=()) -> List[CursoPresencial]:
+        return [CursoPresencialMapper.from_dict(d, validar=False) for d in self._tabela.onde(condicao, parametros)]
+
+    def salvar(self, curso: CursoPresencial) -> None:
+        self._tabela.gravar(CursoPresencialMapper.to_dict(curso))
+
+    def salvar_muitos(self, cursos: Iterable[CursoPresencial]) -> None:
+        self._tabela.gravar_muitos([CursoPresencialMapper.to_dict(c) for c in cursos])
+
+    def buscar_por_id(self, id_curso: int) -> Optional[CursoPresencial]:
+        d = self._tabela.buscar(id_curso)
+        return CursoPresencialMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todos(self) -> List[CursoPresencial]:
+        return self._listar_onde("")
+
+    def versao(self) -> Optional[Hashable]:
+        return self._tabela.versao()
+
+    def listar_por_nome(self, nome: str) -> List[CursoPresencial]:
+        return [c for c in self.listar_todos() if nome.lower() in c.nome.lower()]
+
+    def listar_por_tipo(self, tipo: str) -> List[CursoPresencial]:
+        if tipo.lower() == "presencial":
+            return self.listar_todos()
+        return []
+
+    def listar_por_carga_horaria_minima(self, carga_horaria: int) -> List[CursoPresencial]:
+        return self._listar_onde("carga_horaria >= ?", (carga_horaria,))
+
+    def buscar_por_filtros(self, **filtros) -> List[CursoPresencial]:
+        resultado = []
+        for curso in self.listar_todos():
+            corresponde = True
+            for campo, valor in filtros.items():
+                if not hasattr(curso, campo):
+                    raise AttributeError(f"O campo '{campo}' não existe no curso")
+                atributo = getattr(curso, campo)
+                if isinstance(atributo, list):
+                    if valor not in atributo:
+                        corresponde = False
+                        break
+                elif hasattr(atributo, 'value'):
+                    if atributo.value != valor:
+                        corresponde = False
+                        break
+                elif atributo != valor:
+                    corresponde = False
+                    break
+            if corresponde:
+                resultado.append(curso)
+        return resultado
+
+    def atualizar(self, curso: CursoPresencial) -> None:
+        if not self._tabela.substituir(CursoPresencialMapper.to_dict(curso)):
+            raise ValueError("Curso Presencial não encontrado")
+
+    def atualizar_muitos(self, cursos: Iterable[CursoPresencial]) -> None:
+        if not self._tabela.substituir_muitos([CursoPresencialMapper.to_dict(c) for c in cursos]):
+            raise ValueError("Curso Presencial não encontrado")
+
+    def remover_por_id(self, id_curso: int) -> bool:
+        return self._tabela.remover(id_curso)
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
+
+    # ==============================
+    # MÉTODOS ESPECÍFICOS PRESENCIAL
+    # ==============================
+
+    def listar_ativos(self) -> List[CursoPresencial]:
+        return self._listar_onde("ativo = 1")
+
+    def listar_inativos(self) -> List[CursoPresencial]:
+        return self._listar_onde("ativo = 0")
+
+    def listar_por_area(self, area: str) -> List[CursoPresencial]:
+        return self._listar_onde("area = ?", (area.lower(),))
+
+    def listar_por_localidade(self, localidade: str) -> List[CursoPresencial]:
+        return [c for c in self.listar_todos() if localidade.lower() in c.localidade.lower()]
+
+    def listar_por_modalidade(self, modalidade: str) -> List[CursoPresencial]:
+        return [c for c in self.listar_todos() if c.modalidade.value.lower() == modalidade.lower()]
+
+    def contar_ativos(self) -> int:
+        return self._tabela.contar("ativo = 1")
+
+    def contar_por_area(self, area: str) -> int:
+        return self._tabela.contar("area = ?", (area.lower(),))
+
+    def contar_por_localidade(self, localidade: str) -> int:
+        return len(self.listar_por_localidade(localidade))
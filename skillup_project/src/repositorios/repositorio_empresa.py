@@ -1,40 +1,41 @@
-import os
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from src.dominio.empresa import Empresa, EmpresaMapper
 from src.interfaces.interface_empresa import IEmpresa
-from src.repositorios.loader import JsonRepository
+from src.interfaces.paginacao import Pagina
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "empresa.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("empresa.json")
 
 
 class RepositorioEmpresaJSON(IEmpresa):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO, unicos=("cnpj",))
 
     def salvar(self, empresa: Empresa) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(EmpresaMapper.to_dict(empresa))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(EmpresaMapper.to_dict(empresa))
+
+    def salvar_muitos(self, empresas: Iterable[Empresa]) -> None:
+        self._json_repo.gravar_muitos([EmpresaMapper.to_dict(e) for e in empresas])
 
     def listar(self) -> List[Empresa]:
         dados = self._json_repo.carregar()
-        return [EmpresaMapper.from_dict(d) for d in dados]
+        return [EmpresaMapper.from_dict(d, validar=False) for d in dados]
+
+    def iterar(self) -> Iterator[Empresa]:
+        return (EmpresaMapper.from_dict(d, validar=False) for d in self._json_repo.iterar())
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[Empresa]:
+        dados, proximo = self._json_repo.pagina(limite, cursor)
+        return Pagina([EmpresaMapper.from_dict(d, validar=False) for d in dados], proximo)
 
     def buscar_por_id(self, id_empresa: int) -> Optional[Empresa]:
-        dados = self._json_repo.carregar()
-        for e in dados:
-            if e["id"] == id_empresa:
-                return EmpresaMapper.from_dict(e)
-        return None
+        e = self._json_repo.buscar(id_empresa)
+        return EmpresaMapper.from_dict(e, validar=False) if e else None
 
     def buscar_por_cnpj(self, cnpj: str) -> Optional[Empresa]:
-        for e in self.listar():
-            if e.cnpj == cnpj:
-                return e
-        return None
+        e = self._json_repo.buscar_unico("cnpj", cnpj)
+        return EmpresaMapper.from_dict(e, validar=False) if e else None
 
     def buscar_por_nome(self, nome: str) -> List[Empresa]:
         return [e for e in self.listar() if nome.lower() in e.nome.lower()]
@@ -64,20 +65,16 @@ class RepositorioEmpresaJSON(IEmpresa):
         return resultado
 
     def atualizar(self, empresa: Empresa) -> None:
-        dados = self._json_repo.carregar()
-        for i, e in enumerate(dados):
-            if e["id"] == empresa.id:
-                dados[i] = EmpresaMapper.to_dict(empresa)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("Empresa não encontrada")
+        if not self._json_repo.substituir(EmpresaMapper.to_dict(empresa)):
+            raise ValueError("Empresa não encontrada")
+
+    def atualizar_muitos(self, empresas: Iterable[Empresa]) -> None:
+        if not self._json_repo.substituir_muitos([EmpresaMapper.to_dict(e) for e in empresas]):
+            raise ValueError("Empresa não encontrada")
 
     def deletar(self, id_empresa: int) -> None:
-        dados = self._json_repo.carregar()
-        if not any(e["id"] == id_empresa for e in dados):
+        if not self._json_repo.remover(id_empresa):
             raise ValueError("Empresa não encontrada")
-        dados = [e for e in dados if e["id"] != id_empresa]
-        self._json_repo.salvar(dados)
 
     def contar_total(self) -> int:
         return len(self.listar())
@@ -0,0 +1,88 @@
+from typing import Iterable, Iterator, List, Optional
+from src.dominio.empresa import Empresa, EmpresaMapper
+from src.interfaces.interface_empresa import IEmpresa
+from src.interfaces.paginacao import Pagina
+from src.repositorios.repositorio_empresa import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioEmpresaSQLite(IEmpresa):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "empresa",
+            colunas={
+                "cnpj": lambda d: d["cnpj"],
+                "porte": lambda d: d["porte"].lower(),
+            },
+            indices=["porte"],
+            unicos=["cnpj"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def salvar(self, empresa: Empresa) -> None:
+        self._tabela.gravar(EmpresaMapper.to_dict(empresa))
+
+    def salvar_muitos(self, empresas: Iterable[Empresa]) -> None:
+        self._tabela.gravar_muitos([EmpresaMapper.to_dict(e) for e in empresas])
+
+    def listar(self) -> List[Empresa]:
+        return [EmpresaMapper.from_dict(d, validar=False) for d in self._tabela.carregar()]
+
+    def iterar(self) -> Iterator[Empresa]:
+        return (EmpresaMapper.from_dict(d, validar=False) for d in self._tabela.iterar())
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[Empresa]:
+        dados, proximo = self._tabela.pagina(limite, cursor)
+        return Pagina([EmpresaMapper.from_dict(d, validar=False) for d in dados], proximo)
+
+    def buscar_por_id(self, id_empresa: int) -> Optional[Empresa]:
+        d = self._tabela.buscar(id_empresa)
+        return EmpresaMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_cnpj(self, cnpj: str) -> Optional[Empresa]:
+        d = self._tabela.primeiro("cnpj = ?", (cnpj,))
+        return EmpresaMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_nome(self, nome: str) -> List[Empresa]:
+        return [e for e in self.listar() if nome.lower() in e.nome.lower()]
+
+    def buscar_por_porte(self, porte: str) -> List[Empresa]:
+        return [EmpresaMapper.from_dict(d, validar=False) for d in self._tabela.onde("porte = ?", (porte.lower(),))]
+
+    def buscar_por_filtros(self, **filtros) -> List[Empresa]:
+        resultado = []
+        for empresa in self.listar():
+            corresponde = True
+            for campo, valor in filtros.items():
+                if not hasattr(empresa, campo):
+                    raise AttributeError(f"O campo '{campo}' não existe na empresa")
+                atributo = getattr(empresa, campo)
+                if isinstance(atributo, list):
+                    if valor not in atributo:
+                        corresponde = False
+                        break
+                elif atributo != valor:
+                    corresponde = False
+                    break
+            if corresponde:
+                resultado.append(empresa)
+        return resultado
+
+    def atualizar(self, empresa: Empresa) -> None:
+        if not self._tabela.substituir(EmpresaMapper.to_dict(empresa)):
+            raise ValueError("Empresa não encontrada")
+
+    def atualizar_muitos(self, empresas: Iterable[Empresa]) -> None:
+        if not self._tabela.substituir_muitos([EmpresaMapper.to_dict(e) for e in empresas]):
+            raise ValueError("Empresa não encontrada")
+
+    def deletar(self, id_empresa: int) -> None:
+        if not self._tabela.remover(id_empresa):
+            raise ValueError("Empresa não encontrada")
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
+
+    def contar_por_porte(self, porte: str) -> int:
+        return self._tabela.contar("porte = ?", (porte.lower(),))
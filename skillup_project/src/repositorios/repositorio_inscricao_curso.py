@@ -1,63 +1,72 @@
-import os
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from src.dominio.inscricao_curso import InscricaoCurso, InscricaoCursoMapper, StatusInscricao
 from src.interfaces.interface_inscricao_curso import IInscricaoCursoRepositorio
-from src.repositorios.loader import JsonRepository
+from src.interfaces.paginacao import Pagina
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "inscricao_curso.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("inscricao_curso.json")
+
+# Filtro de `paginar` -> campo gravado (também nome da coluna no SQLite)
+CAMPOS_PAGINACAO = {"id_aluno": "aluno_id", "id_curso": "curso_id", "status": "status"}
 
 
 class RepositorioInscricaoCursoJSON(IInscricaoCursoRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO)
 
     def salvar(self, inscricao: InscricaoCurso) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(InscricaoCursoMapper.to_dict(inscricao))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(InscricaoCursoMapper.to_dict(inscricao))
+
+    def salvar_muitos(self, inscricoes: Iterable[InscricaoCurso]) -> None:
+        self._json_repo.gravar_muitos([InscricaoCursoMapper.to_dict(i) for i in inscricoes])
+
+    def atualizar_muitos(self, inscricoes: Iterable[InscricaoCurso]) -> None:
+        if not self._json_repo.substituir_muitos([InscricaoCursoMapper.to_dict(i) for i in inscricoes]):
+            raise ValueError("Inscrição não encontrada")
+
+    def _listar_por_indice(self, campo: str, valor) -> List[InscricaoCurso]:
+        return [InscricaoCursoMapper.from_dict(d, validar=False) for d in self._json_repo.buscar_por_indice(campo, valor)]
 
     def buscar_por_id(self, id_inscricao: int) -> Optional[InscricaoCurso]:
-        dados = self._json_repo.carregar()
-        for i in dados:
-            if i["id"] == id_inscricao:
-                return InscricaoCursoMapper.from_dict(i)
-        return None
+        i = self._json_repo.buscar(id_inscricao)
+        return InscricaoCursoMapper.from_dict(i, validar=False) if i else None
 
     def listar_todas(self) -> List[InscricaoCurso]:
         dados = self._json_repo.carregar()
-        return [InscricaoCursoMapper.from_dict(d) for d in dados]
+        return [InscricaoCursoMapper.from_dict(d, validar=False) for d in dados]
+
+    def iterar(self) -> Iterator[InscricaoCurso]:
+        return (InscricaoCursoMapper.from_dict(d, validar=False) for d in self._json_repo.iterar())
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[InscricaoCurso]:
+        dados, proximo = self._json_repo.pagina(limite, cursor, CAMPOS_PAGINACAO.get(campo), valor)
+        return Pagina([InscricaoCursoMapper.from_dict(d, validar=False) for d in dados], proximo)
 
     def listar_por_aluno(self, id_aluno: int) -> List[InscricaoCurso]:
-        return [i for i in self.listar_todas() if i.id_aluno == id_aluno]
+        return self._listar_por_indice("aluno_id", id_aluno)
 
     def listar_por_curso(self, id_curso: int) -> List[InscricaoCurso]:
-        return [i for i in self.listar_todas() if i.id_curso == id_curso]
+        return self._listar_por_indice("curso_id", id_curso)
 
     def listar_por_status(self, status: str) -> List[InscricaoCurso]:
-        return [i for i in self.listar_todas() if i.status.value == int(status)]
+        return self._listar_por_indice("status", status)
 
     def contar_por_aluno(self, id_aluno: int) -> int:
-        return len(self.listar_por_aluno(id_aluno))
+        return self._json_repo.contar_por_indice("aluno_id", id_aluno)
 
     def contar_por_curso(self, id_curso: int) -> int:
-        return len(self.listar_por_curso(id_curso))
+        return self._json_repo.contar_por_indice("curso_id", id_curso)
 
     def contar_por_status(self, status: str) -> int:
-        return len(self.listar_por_status(status))
+        return self._json_repo.contar_por_indice("status", status)
 
     def atualizar_status(self, id_inscricao: int, novo_status: str) -> bool:
-        dados = self._json_repo.carregar()
-        for i, insc in enumerate(dados):
-            if insc["id"] == id_inscricao:
-                dados[i]["status"] = int(novo_status)
-                self._json_repo.salvar(dados)
-                return True
-        return False
+        insc = self._json_repo.buscar(id_inscricao)
+        if insc is None:
+            return False
+        self._json_repo.substituir({**insc, "status": novo_status})
+        return True
 
     def excluir(self, id_inscricao: int) -> None:
-        dados = self._json_repo.carregar()
-        dados = [i for i in dados if i["id"] != id_inscricao]
-        self._json_repo.salvar(dados)
+        self._json_repo.remover(id_inscricao)
@@ -0,0 +1,77 @@
+from typing import Iterable, Iterator, List, Optional
+from src.dominio.inscricao_curso import InscricaoCurso, InscricaoCursoMapper
+from src.interfaces.interface_inscricao_curso import IInscricaoCursoRepositorio
+from src.interfaces.paginacao import Pagina
+from src.repositorios.repositorio_inscricao_curso import CAMINHO_ARQUIVO, CAMPOS_PAGINACAO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioInscricaoCursoSQLite(IInscricaoCursoRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "inscricao_curso",
+            colunas={
+                "aluno_id": lambda d: d["aluno_id"],
+                "curso_id": lambda d: d["curso_id"],
+                "status": lambda d: d["status"],
+            },
+            indices=["aluno_id", "curso_id", "status"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=()) -> List[InscricaoCurso]:
+        return [InscricaoCursoMapper.from_dict(d, validar=False) for d in self._tabela.onde(condicao, parametros)]
+
+    def salvar(self, inscricao: InscricaoCurso) -> None:
+        self._tabela.gravar(InscricaoCursoMapper.to_dict(inscricao))
+
+    def salvar_muitos(self, inscricoes: Iterable[InscricaoCurso]) -> None:
+        self._tabela.gravar_muitos([InscricaoCursoMapper.to_dict(i) for i in inscricoes])
+
+    def atualizar_muitos(self, inscricoes: Iterable[InscricaoCurso]) -> None:
+        if not self._tabela.substituir_muitos([InscricaoCursoMapper.to_dict(i) for i in inscricoes]):
+            raise ValueError("Inscrição não encontrada")
+
+    def buscar_por_id(self, id_inscricao: int) -> Optional[InscricaoCurso]:
+        d = self._tabela.buscar(id_inscricao)
+        return InscricaoCursoMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todas(self) -> List[InscricaoCurso]:
+        return self._listar_onde("")
+
+    def iterar(self) -> Iterator[InscricaoCurso]:
+        return (InscricaoCursoMapper.from_dict(d, validar=False) for d in self._tabela.iterar())
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[InscricaoCurso]:
+        coluna = CAMPOS_PAGINACAO.get(campo)
+        condicao, parametros = (f"{coluna} = ?", (valor,)) if coluna else ("", ())
+        dados, proximo = self._tabela.pagina(limite, cursor, condicao, parametros)
+        return Pagina([InscricaoCursoMapper.from_dict(d, validar=False) for d in dados], proximo)
+
+    def listar_por_aluno(self, id_aluno: int) -> List[InscricaoCurso]:
+        return self._listar_onde("aluno_id = ?", (id_aluno,))
+
+    def listar_por_curso(self, id_curso: int) -> List[InscricaoCurso]:
+        return self._listar_onde("curso_id = ?", (id_curso,))
+
+    def listar_por_status(self, status: str) -> List[InscricaoCurso]:
+        return self._listar_onde("status = ?", (status,))
+
+    def contar_por_aluno(self, id_aluno: int) -> int:
+        return self._tabela.contar("aluno_id = ?", (id_aluno,))
+
+    def contar_por_curso(self, id_curso: int) -> int:
+        return self._tabela.contar("curso_id = ?", (id_curso,))
+
+    def contar_por_status(self, status: str) -> int:
+        return self._tabela.contar("status = ?", (status,))
+
+    def atualizar_status(self, id_inscricao: int, novo_status: str) -> bool:
+        insc = self._tabela.buscar(id_inscricao)
+        if insc is None:
+            return False
+        return self._tabela.substituir({**insc, "status": novo_status})
+
+    def excluir(self, id_inscricao: int) -> None:
+        self._tabela.remover(id_inscricao)
@@ -1,34 +1,29 @@
-import os
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from src.dominio.instituicao_ensino import InstituicaoAreaEnsino, InstituicaoAreaEnsinoMapper
 from src.interfaces.interface_instituicao_area_ensino import IInstituicaoAreaEnsinoRepositorio
-from src.repositorios.loader import JsonRepository
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "instituicao_area_ensino.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("instituicao_area_ensino.json")
 
 
 class RepositorioInstituicaoAreaEnsinoJSON(IInstituicaoAreaEnsinoRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO, chave="id_instituicao_area")
 
     def salvar(self, inst_area: InstituicaoAreaEnsino) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(InstituicaoAreaEnsinoMapper.to_dict(inst_area))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(InstituicaoAreaEnsinoMapper.to_dict(inst_area))
+
+    def salvar_muitos(self, inst_areas: Iterable[InstituicaoAreaEnsino]) -> None:
+        self._json_repo.gravar_muitos([InstituicaoAreaEnsinoMapper.to_dict(i) for i in inst_areas])
 
     def buscar_por_id(self, id_instituicao_area: int) -> Optional[InstituicaoAreaEnsino]:
-        dados = self._json_repo.carregar()
-        for ia in dados:
-            if ia["id_instituicao_area"] == id_instituicao_area:
-                return InstituicaoAreaEnsinoMapper.from_dict(ia)
-        return None
+        ia = self._json_repo.buscar(id_instituicao_area)
+        return InstituicaoAreaEnsinoMapper.from_dict(ia, validar=False) if ia else None
 
     def listar_todas(self) -> List[InstituicaoAreaEnsino]:
         dados = self._json_repo.carregar()
-        return [InstituicaoAreaEnsinoMapper.from_dict(d) for d in dados]
+        return [InstituicaoAreaEnsinoMapper.from_dict(d, validar=False) for d in dados]
 
     def listar_por_instituicao(self, id_instituicao: int) -> List[InstituicaoAreaEnsino]:
         return [ia for ia in self.listar_todas() if ia.id_instituicao == id_instituicao]
@@ -43,31 +38,18 @@ class RepositorioInstituicaoAreaEnsinoJSON(IInstituicaoAreaEnsinoRepositorio):
         return None
 
     def atualizar(self, inst_area: InstituicaoAreaEnsino) -> None:
-        dados = self._json_repo.carregar()
-        for i, ia in enumerate(dados):
-            if ia["id_instituicao_area"] == inst_area.id_instituicao_area:
-                dados[i] = InstituicaoAreaEnsinoMapper.to_dict(inst_area)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("InstituicaoAreaEnsino não encontrada")
+        if not self._json_repo.substituir(InstituicaoAreaEnsinoMapper.to_dict(inst_area)):
+            raise ValueError("InstituicaoAreaEnsino não encontrada")
+
+    def atualizar_muitos(self, inst_areas: Iterable[InstituicaoAreaEnsino]) -> None:
+        if not self._json_repo.substituir_muitos([InstituicaoAreaEnsinoMapper.to_dict(i) for i in inst_areas]):
+            raise ValueError("InstituicaoAreaEnsino não encontrada")
 
     def remover_por_id(self, id_instituicao_area: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [ia for ia in dados if ia["id_instituicao_area"] != id_instituicao_area]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover(id_instituicao_area)
 
     def remover_por_instituicao(self, id_instituicao: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [ia for ia in dados if ia["id_instituicao"] != id_instituicao]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover_onde(lambda ia: ia["id_instituicao"] == id_instituicao) > 0
 
     def contar_areas_por_instituicao(self, id_instituicao: int) -> int:
         return len(self.listar_por_instituicao(id_instituicao))
@@ -0,0 +1,66 @@
+from typing import Iterable, List, Optional
+from src.dominio.instituicao_ensino import InstituicaoAreaEnsino, InstituicaoAreaEnsinoMapper
+from src.interfaces.interface_instituicao_area_ensino import IInstituicaoAreaEnsinoRepositorio
+from src.repositorios.repositorio_instituicao_area_ensino import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioInstituicaoAreaEnsinoSQLite(IInstituicaoAreaEnsinoRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "instituicao_area_ensino",
+            chave="id_instituicao_area",
+            colunas={
+                "id_instituicao": lambda d: d["id_instituicao"],
+                "id_area": lambda d: d["id_area"],
+            },
+            indices=[("id_instituicao", "id_area"), "id_area"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=()) -> List[InstituicaoAreaEnsino]:
+        return [InstituicaoAreaEnsinoMapper.from_dict(d, validar=False) for d in self._tabela.onde(condicao, parametros)]
+
+    def salvar(self, inst_area: InstituicaoAreaEnsino) -> None:
+        self._tabela.gravar(InstituicaoAreaEnsinoMapper.to_dict(inst_area))
+
+    def salvar_muitos(self, inst_areas: Iterable[InstituicaoAreaEnsino]) -> None:
+        self._tabela.gravar_muitos([InstituicaoAreaEnsinoMapper.to_dict(i) for i in inst_areas])
+
+    def buscar_por_id(self, id_instituicao_area: int) -> Optional[InstituicaoAreaEnsino]:
+        d = self._tabela.buscar(id_instituicao_area)
+        return InstituicaoAreaEnsinoMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todas(self) -> List[InstituicaoAreaEnsino]:
+        return self._listar_onde("")
+
+    def listar_por_instituicao(self, id_instituicao: int) -> List[InstituicaoAreaEnsino]:
+        return self._listar_onde("id_instituicao = ?", (id_instituicao,))
+
+    def listar_por_area(self, id_area: int) -> List[InstituicaoAreaEnsino]:
+        return self._listar_onde("id_area = ?", (id_area,))
+
+    def buscar_por_instituicao_e_area(self, id_instituicao: int, id_area: int) -> Optional[InstituicaoAreaEnsino]:
+        d = self._tabela.primeiro("id_instituicao = ? AND id_area = ?", (id_instituicao, id_area))
+        return InstituicaoAreaEnsinoMapper.from_dict(d, validar=False) if d else None
+
+    def atualizar(self, inst_area: InstituicaoAreaEnsino) -> None:
+        if not self._tabela.substituir(InstituicaoAreaEnsinoMapper.to_dict(inst_area)):
+            raise ValueError("InstituicaoAreaEnsino não encontrada")
+
+    def atualizar_muitos(self, inst_areas: Iterable[InstituicaoAreaEnsino]) -> None:
+        if not self._tabela.substituir_muitos([InstituicaoAreaEnsinoMapper.to_dict(i) for i in inst_areas]):
+            raise ValueError("InstituicaoAreaEnsino não encontrada")
+
+    def remover_por_id(self, id_instituicao_area: int) -> bool:
+        return self._tabela.remover(id_instituicao_area)
+
+    def remover_por_instituicao(self, id_instituicao: int) -> bool:
+        return self._tabela.remover_onde("id_instituicao = ?", (id_instituicao,)) > 0
+
+    def contar_areas_por_instituicao(self, id_instituicao: int) -> int:
+        return self._tabela.contar("id_instituicao = ?", (id_instituicao,))
+
+    def contar_instituicoes_por_area(self, id_area: int) -> int:
+        return self._tabela.contar("id_area = ?", (id_area,))
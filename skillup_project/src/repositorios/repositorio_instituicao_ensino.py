@@ -1,40 +1,33 @@
-import os
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from src.dominio.instituicao_ensino import InstituicaoEnsino, InstituicaoEnsinoMapper
 from src.interfaces.interface_instituicao_ensino import IInstituicaoEnsino
-from src.repositorios.loader import JsonRepository
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "instituicao_ensino.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("instituicao_ensino.json")
 
 
 class RepositorioInstituicaoEnsinoJSON(IInstituicaoEnsino):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO, unicos=("cnpj",))
 
     def salvar(self, instituicao: InstituicaoEnsino) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(InstituicaoEnsinoMapper.to_dict(instituicao))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(InstituicaoEnsinoMapper.to_dict(instituicao))
+
+    def salvar_muitos(self, instituicoes: Iterable[InstituicaoEnsino]) -> None:
+        self._json_repo.gravar_muitos([InstituicaoEnsinoMapper.to_dict(i) for i in instituicoes])
 
     def listar(self) -> List[InstituicaoEnsino]:
         dados = self._json_repo.carregar()
-        return [InstituicaoEnsinoMapper.from_dict(d) for d in dados]
+        return [InstituicaoEnsinoMapper.from_dict(d, validar=False) for d in dados]
 
     def buscar_por_id(self, id_instituicao: int) -> Optional[InstituicaoEnsino]:
-        dados = self._json_repo.carregar()
-        for i in dados:
-            if i["id"] == id_instituicao:
-                return InstituicaoEnsinoMapper.from_dict(i)
-        return None
+        i = self._json_repo.buscar(id_instituicao)
+        return InstituicaoEnsinoMapper.from_dict(i, validar=False) if i else None
 
     def buscar_por_cnpj(self, cnpj: str) -> Optional[InstituicaoEnsino]:
-        for i in self.listar():
-            if i.cnpj == cnpj:
-                return i
-        return None
+        i = self._json_repo.buscar_unico("cnpj", cnpj)
+        return InstituicaoEnsinoMapper.from_dict(i, validar=False) if i else None
 
     def buscar_por_nome(self, nome: str) -> List[InstituicaoEnsino]:
         return [i for i in self.listar() if nome.lower() in i.nome_fantasia.lower() or nome.lower() in i.razao_social.lower()]
@@ -70,20 +63,16 @@ class RepositorioInstituicaoEnsinoJSON(IInstituicaoEnsino):
         return resultado
 
     def atualizar(self, instituicao: InstituicaoEnsino) -> None:
-        dados = self._json_repo.carregar()
-        for i, inst in enumerate(dados):
-            if inst["id"] == instituicao.id:
-                dados[i] = InstituicaoEnsinoMapper.to_dict(instituicao)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("Instituição de ensino não encontrada")
+        if not self._json_repo.substituir(InstituicaoEnsinoMapper.to_dict(instituicao)):
+            raise ValueError("Instituição de ensino não encontrada")
+
+    def atualizar_muitos(self, instituicoes: Iterable[InstituicaoEnsino]) -> None:
+        if not self._json_repo.substituir_muitos([InstituicaoEnsinoMapper.to_dict(i) for i in instituicoes]):
+            raise ValueError("Instituição de ensino não encontrada")
 
     def deletar(self, id_instituicao: int) -> None:
-        dados = self._json_repo.carregar()
-        if not any(i["id"] == id_instituicao for i in dados):
+        if not self._json_repo.remover(id_instituicao):
             raise ValueError("Instituição de ensino não encontrada")
-        dados = [i for i in dados if i["id"] != id_instituicao]
-        self._json_repo.salvar(dados)
 
     def contar_total(self) -> int:
         return len(self.listar())
@@ -0,0 +1,87 @@
+from typing import Iterable, List, Optional
+from src.dominio.instituicao_ensino import InstituicaoEnsino, InstituicaoEnsinoMapper
+from src.interfaces.interface_instituicao_ensino import IInstituicaoEnsino
+from src.repositorios.repositorio_instituicao_ensino import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioInstituicaoEnsinoSQLite(IInstituicaoEnsino):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "instituicao_ensino",
+            colunas={
+                "cnpj": lambda d: d["cnpj"],
+                "tipo": lambda d: (d.get("tipo") or "").lower(),
+                "credenciada": lambda d: int(bool(d.get("credenciada"))),
+            },
+            indices=["tipo", "credenciada"],
+            unicos=["cnpj"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def salvar(self, instituicao: InstituicaoEnsino) -> None:
+        self._tabela.gravar(InstituicaoEnsinoMapper.to_dict(instituicao))
+
+    def salvar_muitos(self, instituicoes: Iterable[InstituicaoEnsino]) -> None:
+        self._tabela.gravar_muitos([InstituicaoEnsinoMapper.to_dict(i) for i in instituicoes])
+
+    def listar(self) -> List[InstituicaoEnsino]:
+        return [InstituicaoEnsinoMapper.from_dict(d, validar=False) for d in self._tabela.carregar()]
+
+    def buscar_por_id(self, id_instituicao: int) -> Optional[InstituicaoEnsino]:
+        d = self._tabela.buscar(id_instituicao)
+        return InstituicaoEnsinoMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_cnpj(self, cnpj: str) -> Optional[InstituicaoEnsino]:
+        d = self._tabela.primeiro("cnpj = ?", (cnpj,))
+        return InstituicaoEnsinoMapper.from_dict(d, validar=False) if d else None
+
+    def buscar_por_nome(self, nome: str) -> List[InstituicaoEnsino]:
+        return [i for i in self.listar() if nome.lower() in i.nome_fantasia.lower() or nome.lower() in i.razao_social.lower()]
+
+    def buscar_por_tipo(self, tipo: str) -> List[InstituicaoEnsino]:
+        return [InstituicaoEnsinoMapper.from_dict(d, validar=False) for d in self._tabela.onde("tipo = ?", (tipo.lower(),))]
+
+    def buscar_credenciadas(self) -> List[InstituicaoEnsino]:
+        return [InstituicaoEnsinoMapper.from_dict(d, validar=False) for d in self._tabela.onde("credenciada = 1")]
+
+    def buscar_por_modalidade(self, modalidade: str) -> List[InstituicaoEnsino]:
+        return [i for i in self.listar() if modalidade.lower() in [m.lower() for m in i.modalidades]]
+
+    def buscar_por_filtros(self, **filtros) -> List[InstituicaoEnsino]:
+        resultado = []
+        for inst in self.listar():
+            corresponde = True
+            for campo, valor in filtros.items():
+                if not hasattr(inst, campo):
+                    raise AttributeError(f"O campo '{campo}' não existe na instituição")
+                atributo = getattr(inst, campo)
+                if isinstance(atributo, list):
+                    if valor not in atributo:
+                        corresponde = False
+                        break
+                elif atributo != valor:
+                    corresponde = False
+                    break
+            if corresponde:
+                resultado.append(inst)
+        return resultado
+
+    def atualizar(self, instituicao: InstituicaoEnsino) -> None:
+        if not self._tabela.substituir(InstituicaoEnsinoMapper.to_dict(instituicao)):
+            raise ValueError("Instituição de ensino não encontrada")
+
+    def atualizar_muitos(self, instituicoes: Iterable[InstituicaoEnsino]) -> None:
+        if not self._tabela.substituir_muitos([InstituicaoEnsinoMapper.to_dict(i) for i in instituicoes]):
+            raise ValueError("Instituição de ensino não encontrada")
+
+    def deletar(self, id_instituicao: int) -> None:
+        if not self._tabela.remover(id_instituicao):
+            raise ValueError("Instituição de ensino não encontrada")
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
+
+    def contar_credenciadas(self) -> int:
+        return self._tabela.contar("credenciada = 1")
@@ -0,0 +1,36 @@
+from typing import Hashable, Iterable, Iterator, Optional
+from src.dominio.recomendacao_salva import RecomendacaoSalva, RecomendacaoSalvaMapper
+from src.interfaces.interface_recomendacao_salva import IRecomendacaoSalvaRepositorio
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
+
+CAMINHO_ARQUIVO = caminho_dados("recomendacao_salva.json")
+
+
+class RepositorioRecomendacaoSalvaJSON(IRecomendacaoSalvaRepositorio):
+    """Recomendações pré-calculadas num arquivo JSON, uma por candidato.
+
+    A busca usa o índice primário do cache (id_candidato), sem percorrer a lista.
+    """
+
+    def __init__(self, caminho_arquivo: Optional[str] = None):
+        self._json_repo = abrir_armazenamento(caminho_arquivo or CAMINHO_ARQUIVO, chave="id_candidato")
+
+    def buscar_por_candidato(self, id_candidato: int) -> Optional[RecomendacaoSalva]:
+        d = self._json_repo.buscar(id_candidato)
+        return RecomendacaoSalvaMapper.from_dict(d) if d else None
+
+    def iterar(self) -> Iterator[RecomendacaoSalva]:
+        return (RecomendacaoSalvaMapper.from_dict(d) for d in self._json_repo.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._json_repo.versao()
+
+    def salvar_muitos(self, recomendacoes: Iterable[RecomendacaoSalva]) -> None:
+        self._json_repo.gravar_muitos([RecomendacaoSalvaMapper.to_dict(r) for r in recomendacoes])
+
+    def substituir_todas(self, recomendacoes: Iterable[RecomendacaoSalva]) -> None:
+        self._json_repo.salvar([RecomendacaoSalvaMapper.to_dict(r) for r in recomendacoes])
+
+    def remover_por_candidato(self, id_candidato: int) -> bool:
+        return self._json_repo.remover(id_candidato)
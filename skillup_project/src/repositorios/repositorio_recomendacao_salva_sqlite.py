@@ -0,0 +1,36 @@
+from typing import Hashable, Iterable, Iterator, Optional
+from src.dominio.recomendacao_salva import RecomendacaoSalva, RecomendacaoSalvaMapper
+from src.interfaces.interface_recomendacao_salva import IRecomendacaoSalvaRepositorio
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+from src.repositorios.unidade_trabalho import UnidadeDeTrabalho
+
+
+class RepositorioRecomendacaoSalvaSQLite(IRecomendacaoSalvaRepositorio):
+    """Recomendações pré-calculadas numa tabela SQLite com id_candidato como chave primária."""
+
+    def __init__(self, caminho_banco: Optional[str] = None):
+        # Dado derivado: não há JSON a importar, o lote recalcula tudo
+        self._tabela = TabelaSQLite(conectar(caminho_banco), "recomendacao_salva", chave="id_candidato")
+
+    def buscar_por_candidato(self, id_candidato: int) -> Optional[RecomendacaoSalva]:
+        d = self._tabela.buscar(id_candidato)
+        return RecomendacaoSalvaMapper.from_dict(d) if d else None
+
+    def iterar(self) -> Iterator[RecomendacaoSalva]:
+        return (RecomendacaoSalvaMapper.from_dict(d) for d in self._tabela.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._tabela.versao()
+
+    def salvar_muitos(self, recomendacoes: Iterable[RecomendacaoSalva]) -> None:
+        self._tabela.gravar_muitos([RecomendacaoSalvaMapper.to_dict(r) for r in recomendacoes])
+
+    def substituir_todas(self, recomendacoes: Iterable[RecomendacaoSalva]) -> None:
+        registros = [RecomendacaoSalvaMapper.to_dict(r) for r in recomendacoes]
+        # Uma transação: quem lê no meio vê o conteúdo antigo inteiro
+        with UnidadeDeTrabalho():
+            self._tabela.remover_onde("1 = 1")
+            self._tabela.gravar_muitos(registros)
+
+    def remover_por_candidato(self, id_candidato: int) -> bool:
+        return self._tabela.remover(id_candidato)
@@ -1,37 +1,39 @@
-import os
-from typing import List, Optional
+from typing import Hashable, Iterable, Iterator, List, Optional
 from src.dominio.requisitos_vaga import RequisitoVaga, RequisitoVagaMapper
 from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
-from src.repositorios.loader import JsonRepository
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "requisitos_vaga.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("requisitos_vaga.json")
 
 
 class RepositorioRequisitoVagaJSON(IRequisitoVagaRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO)
 
     def salvar(self, requisito: RequisitoVaga) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(RequisitoVagaMapper.to_dict(requisito))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(RequisitoVagaMapper.to_dict(requisito))
+
+    def salvar_muitos(self, requisitos: Iterable[RequisitoVaga]) -> None:
+        self._json_repo.gravar_muitos([RequisitoVagaMapper.to_dict(r) for r in requisitos])
 
     def buscar_por_id(self, id_requisito: int) -> Optional[RequisitoVaga]:
-        dados = self._json_repo.carregar()
-        for r in dados:
-            if r["id"] == id_requisito:
-                return RequisitoVagaMapper.from_dict(r)
-        return None
+        r = self._json_repo.buscar(id_requisito)
+        return RequisitoVagaMapper.from_dict(r, validar=False) if r else None
 
     def listar_todos(self) -> List[RequisitoVaga]:
         dados = self._json_repo.carregar()
-        return [RequisitoVagaMapper.from_dict(d) for d in dados]
+        return [RequisitoVagaMapper.from_dict(d, validar=False) for d in dados]
+
+    def iterar(self) -> Iterator[RequisitoVaga]:
+        return (RequisitoVagaMapper.from_dict(d, validar=False) for d in self._json_repo.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._json_repo.versao()
 
     def listar_por_vaga(self, id_vaga: int) -> List[RequisitoVaga]:
-        return [r for r in self.listar_todos() if r.id_vaga == id_vaga]
+        dados = self._json_repo.buscar_por_indice("vaga_id", id_vaga)
+        return [RequisitoVagaMapper.from_dict(d, validar=False) for d in dados]
 
     def listar_por_competencia(self, id_competencia: int) -> List[RequisitoVaga]:
         return [r for r in self.listar_todos() if r.id_competencia == id_competencia]
@@ -49,31 +51,18 @@ class RepositorioRequisitoVagaJSON(IRequisitoVagaRepositorio):
         return None
 
     def atualizar(self, requisito: RequisitoVaga) -> None:
-        dados = self._json_repo.carregar()
-        for i, r in enumerate(dados):
-            if r["id"] == requisito.id:
-                dados[i] = RequisitoVagaMapper.to_dict(requisito)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("RequisitoVaga não encontrado")
+        if not self._json_repo.substituir(RequisitoVagaMapper.to_dict(requisito)):
+            raise ValueError("RequisitoVaga não encontrado")
+
+    def atualizar_muitos(self, requisitos: Iterable[RequisitoVaga]) -> None:
+        if not self._json_repo.substituir_muitos([RequisitoVagaMapper.to_dict(r) for r in requisitos]):
+            raise ValueError("RequisitoVaga não encontrado")
 
     def remover_por_id(self, id_requisito: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [r for r in dados if r["id"] != id_requisito]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover(id_requisito)
 
     def remover_por_vaga(self, id_vaga: int) -> bool:
-        dados = self._json_repo.carregar()
-        tamanho_inicial = len(dados)
-        dados = [r for r in dados if r["vaga_id"] != id_vaga]
-        if len(dados) < tamanho_inicial:
-            self._json_repo.salvar(dados)
-            return True
-        return False
+        return self._json_repo.remover_onde(lambda r: r["vaga_id"] == id_vaga) > 0
 
     def contar_requisitos_vaga(self, id_vaga: int) -> int:
         return len(self.listar_por_vaga(id_vaga))
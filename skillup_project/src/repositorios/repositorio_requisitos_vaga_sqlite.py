@@ -0,0 +1,78 @@
+from typing import Hashable, Iterable, Iterator, List, Optional
+from src.dominio.requisitos_vaga import RequisitoVaga, RequisitoVagaMapper
+from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
+from src.repositorios.repositorio_requisitos_vaga import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioRequisitoVagaSQLite(IRequisitoVagaRepositorio):
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "requisito_vaga",
+            colunas={
+                "id_vaga": lambda d: d["vaga_id"],
+                "id_competencia": lambda d: d["competencia_id"],
+                "obrigatorio": lambda d: int(d.get("obrigatorio", True)),
+            },
+            indices=[("id_vaga", "id_competencia"), "id_competencia"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=()) -> List[RequisitoVaga]:
+        return [RequisitoVagaMapper.from_dict(d, validar=False) for d in self._tabela.onde(condicao, parametros)]
+
+    def salvar(self, requisito: RequisitoVaga) -> None:
+        self._tabela.gravar(RequisitoVagaMapper.to_dict(requisito))
+
+    def salvar_muitos(self, requisitos: Iterable[RequisitoVaga]) -> None:
+        self._tabela.gravar_muitos([RequisitoVagaMapper.to_dict(r) for r in requisitos])
+
+    def buscar_por_id(self, id_requisito: int) -> Optional[RequisitoVaga]:
+        d = self._tabela.buscar(id_requisito)
+        return RequisitoVagaMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todos(self) -> List[RequisitoVaga]:
+        return self._listar_onde("")
+
+    def iterar(self) -> Iterator[RequisitoVaga]:
+        return (RequisitoVagaMapper.from_dict(d, validar=False) for d in self._tabela.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._tabela.versao()
+
+    def listar_por_vaga(self, id_vaga: int) -> List[RequisitoVaga]:
+        return self._listar_onde("id_vaga = ?", (id_vaga,))
+
+    def listar_por_competencia(self, id_competencia: int) -> List[RequisitoVaga]:
+        return self._listar_onde("id_competencia = ?", (id_competencia,))
+
+    def listar_obrigatorios_por_vaga(self, id_vaga: int) -> List[RequisitoVaga]:
+        return self._listar_onde("id_vaga = ? AND obrigatorio = 1", (id_vaga,))
+
+    def listar_por_nivel_minimo(self, nivel: str) -> List[RequisitoVaga]:
+        return [r for r in self.listar_todos() if r.nivel_minimo.lower() == nivel.lower()]
+
+    def buscar_por_vaga_e_competencia(self, id_vaga: int, id_competencia: int) -> Optional[RequisitoVaga]:
+        d = self._tabela.primeiro("id_vaga = ? AND id_competencia = ?", (id_vaga, id_competencia))
+        return RequisitoVagaMapper.from_dict(d, validar=False) if d else None
+
+    def atualizar(self, requisito: RequisitoVaga) -> None:
+        if not self._tabela.substituir(RequisitoVagaMapper.to_dict(requisito)):
+            raise ValueError("RequisitoVaga não encontrado")
+
+    def atualizar_muitos(self, requisitos: Iterable[RequisitoVaga]) -> None:
+        if not self._tabela.substituir_muitos([RequisitoVagaMapper.to_dict(r) for r in requisitos]):
+            raise ValueError("RequisitoVaga não encontrado")
+
+    def remover_por_id(self, id_requisito: int) -> bool:
+        return self._tabela.remover(id_requisito)
+
+    def remover_por_vaga(self, id_vaga: int) -> bool:
+        return self._tabela.remover_onde("id_vaga = ?", (id_vaga,)) > 0
+
+    def contar_requisitos_vaga(self, id_vaga: int) -> int:
+        return self._tabela.contar("id_vaga = ?", (id_vaga,))
+
+    def contar_requisitos_obrigatorios(self, id_vaga: int) -> int:
+        return self._tabela.contar("id_vaga = ? AND obrigatorio = 1", (id_vaga,))
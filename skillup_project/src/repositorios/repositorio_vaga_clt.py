@@ -1,34 +1,43 @@
-import os
-from typing import List, Optional
+from typing import Hashable, Iterable, Iterator, List, Optional
 from src.dominio.vaga import VagaCLT, VagaCLTMapper, Vaga
 from src.interfaces.interface_vaga import IVagaRepositorio
-from src.repositorios.loader import JsonRepository
+from src.interfaces.paginacao import Pagina
+from src.repositorios.armazenamento import abrir_armazenamento
+from src.repositorios.arquivos import caminho_dados
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CAMINHO_ARQUIVO = os.path.normpath(
-    os.path.join(BASE_DIR, "..", "data", "vaga_clt.json")
-)
+CAMINHO_ARQUIVO = caminho_dados("vaga_clt.json")
 
 
 class RepositorioVagaCLTJSON(IVagaRepositorio):
     def __init__(self):
-        self._json_repo = JsonRepository(CAMINHO_ARQUIVO)
+        self._json_repo = abrir_armazenamento(CAMINHO_ARQUIVO)
 
     def salvar(self, vaga: VagaCLT) -> None:
-        dados = self._json_repo.carregar()
-        dados.append(VagaCLTMapper.to_dict(vaga))
-        self._json_repo.salvar(dados)
+        self._json_repo.gravar(VagaCLTMapper.to_dict(vaga))
+
+    def salvar_muitos(self, vagas: Iterable[VagaCLT]) -> None:
+        self._json_repo.gravar_muitos([VagaCLTMapper.to_dict(v) for v in vagas])
 
     def buscar_por_id(self, id_vaga: int) -> Optional[VagaCLT]:
-        dados = self._json_repo.carregar()
-        for v in dados:
-            if v["id"] == id_vaga:
-                return VagaCLTMapper.from_dict(v)
-        return None
+        v = self._json_repo.buscar(id_vaga)
+        return VagaCLTMapper.from_dict(v, validar=False) if v else None
 
     def listar_todas(self) -> List[VagaCLT]:
         dados = self._json_repo.carregar()
-        return [VagaCLTMapper.from_dict(d) for d in dados]
+        return [VagaCLTMapper.from_dict(d, validar=False) for d in dados]
+
+    def iterar(self) -> Iterator[VagaCLT]:
+        return (VagaCLTMapper.from_dict(d, validar=False) for d in self._json_repo.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._json_repo.versao()
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[VagaCLT]:
+        # Os filtros comparam sem caixa, o que o índice hash não faz
+        if campo is not None:
+            return super()._pagina(campo, valor, limite, cursor)
+        dados, proximo = self._json_repo.pagina(limite, cursor)
+        return Pagina([VagaCLTMapper.from_dict(d, validar=False) for d in dados], proximo)
 
     def listar_ativas(self) -> List[VagaCLT]:
         return [v for v in self.listar_todas() if v.ativa]
@@ -74,20 +83,16 @@ class RepositorioVagaCLTJSON(IVagaRepositorio):
         return resultado
 
     def atualizar(self, vaga: VagaCLT) -> None:
-        dados = self._json_repo.carregar()
-        for i, v in enumerate(dados):
-            if v["id"] == vaga.id:
-                dados[i] = VagaCLTMapper.to_dict(vaga)
-                self._json_repo.salvar(dados)
-                return
-        raise ValueError("Vaga CLT não encontrada")
+        if not self._json_repo.substituir(VagaCLTMapper.to_dict(vaga)):
+            raise ValueError("Vaga CLT não encontrada")
+
+    def atualizar_muitos(self, vagas: Iterable[VagaCLT]) -> None:
+        if not self._json_repo.substituir_muitos([VagaCLTMapper.to_dict(v) for v in vagas]):
+            raise ValueError("Vaga CLT não encontrada")
 
     def excluir(self, id_vaga: int) -> None:
-        dados = self._json_repo.carregar()
-        if not any(v["id"] == id_vaga for v in dados):
+        if not self._json_repo.remover(id_vaga):
             raise ValueError("Vaga CLT não encontrada")
-        dados = [v for v in dados if v["id"] != id_vaga]
-        self._json_repo.salvar(dados)
 
     def contar_total(self) -> int:
         return len(self.listar_todas())
@@ -103,7 +108,9 @@ class RepositorioVagaCLTJSON(IVagaRepositorio):
     # ==============================
 
     def listar_por_faixa_salarial(self, salario_min: float, salario_max: float) -> List[VagaCLT]:
-        return [v for v in self.listar_todas() if salario_min <= v.salario_base <= salario_max]
+        dados = self._json_repo.buscar_por_faixa("salario_base", salario_min, salario_max)
+        return [VagaCLTMapper.from_dict(d, validar=False) for d in dados]
 
     def listar_por_salario_minimo(self, salario_min: float) -> List[VagaCLT]:
-        return [v for v in self.listar_todas() if v.salario_base >= salario_min]
+        dados = self._json_repo.buscar_por_faixa("salario_base", salario_min)
+        return [VagaCLTMapper.from_dict(d, validar=False) for d in dados]
@@ -0,0 +1,130 @@
+from typing import Hashable, Iterable, Iterator, List, Optional
+from src.dominio.vaga import VagaCLT, VagaCLTMapper
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.interfaces.paginacao import Pagina
+from src.repositorios.repositorio_vaga_clt import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioVagaCLTSQLite(IVagaRepositorio):
+    # Consultas por faixa vêm do menor valor ao maior, como no repositório JSON
+    _POR_VALOR = "salario_base, id"
+
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "vaga_clt",
+            colunas={
+                "id_empresa": lambda d: d["id_empresa"],
+                "area": lambda d: d["area"].lower(),
+                "modalidade": lambda d: d["modalidade"].lower(),
+                "tipo": lambda d: d["tipo"].lower(),
+                "ativa": lambda d: int(d.get("ativa", True)),
+                "salario_base": lambda d: d.get("salario_base", 0.0),
+            },
+            indices=["id_empresa", "area", "modalidade", "tipo", "ativa", "salario_base"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=(), ordem=None) -> List[VagaCLT]:
+        dados = self._tabela.onde(condicao, parametros, ordem)
+        return [VagaCLTMapper.from_dict(d, validar=False) for d in dados]
+
+    def salvar(self, vaga: VagaCLT) -> None:
+        self._tabela.gravar(VagaCLTMapper.to_dict(vaga))
+
+    def salvar_muitos(self, vagas: Iterable[VagaCLT]) -> None:
+        self._tabela.gravar_muitos([VagaCLTMapper.to_dict(v) for v in vagas])
+
+    def buscar_por_id(self, id_vaga: int) -> Optional[VagaCLT]:
+        d = self._tabela.buscar(id_vaga)
+        return VagaCLTMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todas(self) -> List[VagaCLT]:
+        return self._listar_onde("")
+
+    def iterar(self) -> Iterator[VagaCLT]:
+        return (VagaCLTMapper.from_dict(d, validar=False) for d in self._tabela.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._tabela.versao()
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[VagaCLT]:
+        # Área, modalidade e tipo são colunas gravadas em minúsculas; título não é coluna
+        if campo == "titulo":
+            return super()._pagina(campo, valor, limite, cursor)
+        condicao, parametros = (f"{campo} = ?", (valor.lower(),)) if campo else ("", ())
+        dados, proximo = self._tabela.pagina(limite, cursor, condicao, parametros)
+        return Pagina([VagaCLTMapper.from_dict(d, validar=False) for d in dados], proximo)
+
+    def listar_ativas(self) -> List[VagaCLT]:
+        return self._listar_onde("ativa = 1")
+
+    def listar_inativas(self) -> List[VagaCLT]:
+        return self._listar_onde("ativa = 0")
+
+    def listar_por_area(self, area: str) -> List[VagaCLT]:
+        return self._listar_onde("area = ?", (area.lower(),))
+
+    def listar_por_modalidade(self, modalidade: str) -> List[VagaCLT]:
+        return self._listar_onde("modalidade = ?", (modalidade.lower(),))
+
+    def listar_por_tipo(self, tipo: str) -> List[VagaCLT]:
+        return self._listar_onde("tipo = ?", (tipo.lower(),))
+
+    def listar_por_titulo(self, titulo: str) -> List[VagaCLT]:
+        return [v for v in self.listar_todas() if titulo.lower() in v.titulo.lower()]
+
+    def buscar_por_filtros(self, **filtros) -> List[VagaCLT]:
+        resultado = []
+        for vaga in self.listar_todas():
+            corresponde = True
+            for campo, valor in filtros.items():
+                if not hasattr(vaga, campo):
+                    raise AttributeError(f"O campo '{campo}' não existe na vaga")
+                atributo = getattr(vaga, campo)
+                if isinstance(atributo, list):
+                    if valor not in atributo:
+                        corresponde = False
+                        break
+                elif hasattr(atributo, 'value'):
+                    if atributo.value != valor:
+                        corresponde = False
+                        break
+                elif atributo != valor:
+                    corresponde = False
+                    break
+            if corresponde:
+                resultado.append(vaga)
+        return resultado
+
+    def atualizar(self, vaga: VagaCLT) -> None:
+        if not self._tabela.substituir(VagaCLTMapper.to_dict(vaga)):
+            raise ValueError("Vaga CLT não encontrada")
+
+    def atualizar_muitos(self, vagas: Iterable[VagaCLT]) -> None:
+        if not self._tabela.substituir_muitos([VagaCLTMapper.to_dict(v) for v in vagas]):
+            raise ValueError("Vaga CLT não encontrada")
+
+    def excluir(self, id_vaga: int) -> None:
+        if not self._tabela.remover(id_vaga):
+            raise ValueError("Vaga CLT não encontrada")
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
+
+    def contar_ativas(self) -> int:
+        return self._tabela.contar("ativa = 1")
+
+    def contar_por_area(self, area: str) -> int:
+        return self._tabela.contar("area = ?", (area.lower(),))
+
+    # ==============================
+    # MÉTODOS ESPECÍFICOS CLT
+    # ==============================
+
+    def listar_por_faixa_salarial(self, salario_min: float, salario_max: float) -> List[VagaCLT]:
+        return self._listar_onde("salario_base BETWEEN ? AND ?", (salario_min, salario_max), ordem=self._POR_VALOR)
+
+    def listar_por_salario_minimo(self, salario_min: float) -> List[VagaCLT]:
+        return self._listar_onde("salario_base >= ?", (salario_min,), ordem=self._POR_VALOR)
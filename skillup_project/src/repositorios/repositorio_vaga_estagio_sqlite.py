@@ -0,0 +1,133 @@
+from typing import Hashable, Iterable, Iterator, List, Optional
+from src.dominio.vaga import VagaEstagio, VagaEstagioMapper
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.interfaces.paginacao import Pagina
+from src.repositorios.repositorio_vaga_estagio import CAMINHO_ARQUIVO
+from src.repositorios.sqlite_db import TabelaSQLite, conectar
+
+
+class RepositorioVagaEstagioSQLite(IVagaRepositorio):
+    # Consultas por faixa vêm do menor valor ao maior, como no repositório JSON
+    _POR_VALOR = "bolsa_auxilio, id"
+
+    def __init__(self, caminho_banco: Optional[str] = None, importar_json: bool = True):
+        self._tabela = TabelaSQLite(
+            conectar(caminho_banco),
+            "vaga_estagio",
+            colunas={
+                "id_empresa": lambda d: d["id_empresa"],
+                "area": lambda d: d["area"].lower(),
+                "modalidade": lambda d: d["modalidade"].lower(),
+                "tipo": lambda d: d["tipo"].lower(),
+                "ativa": lambda d: int(d.get("ativa", True)),
+                "bolsa_auxilio": lambda d: d.get("bolsa_auxilio", 0.0),
+            },
+            indices=["id_empresa", "area", "modalidade", "tipo", "ativa", "bolsa_auxilio"],
+            origem_json=CAMINHO_ARQUIVO if importar_json else None,
+        )
+
+    def _listar_onde(self, condicao: str, parametros=(), ordem=None) -> List[VagaEstagio]:
+        dados = self._tabela.onde(condicao, parametros, ordem)
+        return [VagaEstagioMapper.from_dict(d, validar=False) for d in dados]
+
+    def salvar(self, vaga: VagaEstagio) -> None:
+        self._tabela.gravar(VagaEstagioMapper.to_dict(vaga))
+
+    def salvar_muitos(self, vagas: Iterable[VagaEstagio]) -> None:
+        self._tabela.gravar_muitos([VagaEstagioMapper.to_dict(v) for v in vagas])
+
+    def buscar_por_id(self, id_vaga: int) -> Optional[VagaEstagio]:
+        d = self._tabela.buscar(id_vaga)
+        return VagaEstagioMapper.from_dict(d, validar=False) if d else None
+
+    def listar_todas(self) -> List[VagaEstagio]:
+        return self._listar_onde("")
+
+    def iterar(self) -> Iterator[VagaEstagio]:
+        return (VagaEstagioMapper.from_dict(d, validar=False) for d in self._tabela.iterar())
+
+    def versao(self) -> Optional[Hashable]:
+        return self._tabela.versao()
+
+    def _pagina(self, campo: Optional[str], valor, limite: int, cursor) -> Pagina[VagaEstagio]:
+        # Área, modalidade e tipo são colunas gravadas em minúsculas; título não é coluna
+        if campo == "titulo":
+            return super()._pagina(campo, valor, limite, cursor)
+        condicao, parametros = (f"{campo} = ?", (valor.lower(),)) if campo else ("", ())
+        dados, proximo = self._tabela.pagina(limite, cursor, condicao, parametros)
+        return Pagina([VagaEstagioMapper.from_dict(d, validar=False) for d in dados], proximo)
+
+    def listar_ativas(self) -> List[VagaEstagio]:
+        return self._listar_onde("ativa = 1")
+
+    def listar_inativas(self) -> List[VagaEstagio]:
+        return self._listar_onde("ativa = 0")
+
+    def listar_por_area(self, area: str) -> List[VagaEstagio]:
+        return self._listar_onde("area = ?", (area.lower(),))
+
+    def listar_por_modalidade(self, modalidade: str) -> List[VagaEstagio]:
+        return self._listar_onde("modalidade = ?", (modalidade.lower(),))
+
+    def listar_por_tipo(self, tipo: str) -> List[VagaEstagio]:
+        return self._listar_onde("tipo = ?", (tipo.lower(),))
+
+    def listar_por_titulo(self, titulo: str) -> List[VagaEstagio]:
+        return [v for v in self.listar_todas() if titulo.lower() in v.titulo.lower()]
+
+    def buscar_por_filtros(self, **filtros) -> List[VagaEstagio]:
+        resultado = []
+        for vaga in self.listar_todas():
+            corresponde = True
+            for campo, valor in filtros.items():
+                if not hasattr(vaga, campo):
+                    raise AttributeError(f"O campo '{campo}' não existe na vaga")
+                atributo = getattr(vaga, campo)
+                if isinstance(atributo, list):
+                    if valor not in atributo:
+                        corresponde = False
+                        break
+                elif hasattr(atributo, 'value'):
+                    if atributo.value != valor:
+                        corresponde = False
+                        break
+                elif atributo != valor:
+                    corresponde = False
+                    break
+            if corresponde:
+                resultado.append(vaga)
+        return resultado
+
+    def atualizar(self, vaga: VagaEstagio) -> None:
+        if not self._tabela.substituir(VagaEstagioMapper.to_dict(vaga)):
+            raise ValueError("Vaga Estágio não encontrada")
+
+    def atualizar_muitos(self, vagas: Iterable[VagaEstagio]) -> None:
+        if not self._tabela.substituir_muitos([VagaEstagioMapper.to_dict(v) for v in vagas]):
+            raise ValueError("Vaga Estágio não encontrada")
+
+    def excluir(self, id_vaga: int) -> None:
+        if not self._tabela.remover(id_vaga):
+            raise ValueError("Vaga Estágio não encontrada")
+
+    def contar_total(self) -> int:
+        return self._tabela.contar()
+
+    def contar_ativas(self) -> int:
+        return self._tabela.contar("ativa = 1")
+
+    def contar_por_area(self, area: str) -> int:
+        return self._tabela.contar("area = ?", (area.lower(),))
+
+    # ==============================
+    # MÉTODOS ESPECÍFICOS ESTÁGIO
+    # ==============================
+
+    def listar_por_instituicao(self, instituicao: str) -> List[VagaEstagio]:
+        return [v for v in self.listar_todas() if instituicao.lower() in v.instituicao_conveniada.lower()]
+
+    def listar_por_faixa_bolsa(self, bolsa_min: float, bolsa_max: float) -> List[VagaEstagio]:
+        return self._listar_onde("bolsa_auxilio BETWEEN ? AND ?", (bolsa_min, bolsa_max), ordem=self._POR_VALOR)
+
+    def listar_por_bolsa_minima(self, bolsa_min: float) -> List[VagaEstagio]:
+        return self._listar_onde("bolsa_auxilio >= ?", (bolsa_min,), ordem=self._POR_VALOR)
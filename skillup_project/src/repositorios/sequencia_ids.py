@@ -0,0 +1,59 @@
+import json
+import os
+from typing import Callable, Dict
+
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.repositorios.arquivos import caminho_dados, escrever_atomico, trava_do_arquivo
+
+CAMINHO_ARQUIVO = caminho_dados("sequencias.json")
+
+
+class SequenciaIdsJSON(ISequenciaIds):
+    """Sequências de IDs guardadas num JSON pequeno ({entidade: último ID}).
+
+    Cada reserva relê o arquivo, avança o contador e o regrava de forma atômica
+    (arquivo temporário com fsync + os.replace), sob a trava exclusiva do
+    arquivo (ver arquivos.TravaArquivo), que vale entre threads e processos.
+    O custo não depende do tamanho das tabelas.
+    """
+
+    def __init__(self, caminho_arquivo: str = CAMINHO_ARQUIVO):
+        self._caminho_arquivo = caminho_arquivo
+        self._trava = trava_do_arquivo(caminho_arquivo)
+
+    # ------------------------------------------------------------------
+    # Helpers privados
+    # ------------------------------------------------------------------
+
+    def _ler(self) -> Dict[str, int]:
+        try:
+            with open(self._caminho_arquivo, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _escrever(self, contadores: Dict[str, int]) -> None:
+        escrever_atomico(
+            self._caminho_arquivo, lambda f: json.dump(contadores, f, indent=4, ensure_ascii=False)
+        )
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def proximo(self, entidade: str, maior_existente: Callable[[], int] = lambda: 0) -> int:
+        return self.reservar(entidade, 1, maior_existente)[0]
+
+    def reservar(
+        self, entidade: str, quantidade: int, maior_existente: Callable[[], int] = lambda: 0
+    ) -> range:
+        if quantidade < 1:
+            raise ValueError("Quantidade de IDs deve ser positiva")
+        with self._trava.exclusiva():
+            contadores = self._ler()
+            ultimo = contadores.get(entidade)
+            if ultimo is None:
+                ultimo = maior_existente() or 0
+            contadores[entidade] = ultimo + quantidade
+            self._escrever(contadores)
+        return range(ultimo + 1, ultimo + quantidade + 1)
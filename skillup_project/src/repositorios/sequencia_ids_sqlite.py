@@ -0,0 +1,59 @@
+from typing import Callable, Optional
+
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.repositorios.sqlite_db import conectar, trava_da_conexao
+
+
+class SequenciaIdsSQLite(ISequenciaIds):
+    """Sequências de IDs numa tabela do banco SQLite (entidade, ultimo).
+
+    A reserva roda numa transação BEGIN IMMEDIATE, que bloqueia outros
+    escritores do mesmo banco até o contador ser atualizado. Se uma unidade de
+    trabalho já abriu a transação da conexão, a reserva entra nela.
+    """
+
+    def __init__(self, caminho_banco: Optional[str] = None):
+        self._conexao = conectar(caminho_banco)
+        self._lock = trava_da_conexao(self._conexao)
+        with self._lock, self._conexao:
+            self._conexao.execute(
+                "CREATE TABLE IF NOT EXISTS sequencia "
+                "(entidade TEXT PRIMARY KEY, ultimo INTEGER NOT NULL)"
+            )
+
+    def proximo(self, entidade: str, maior_existente: Callable[[], int] = lambda: 0) -> int:
+        return self.reservar(entidade, 1, maior_existente)[0]
+
+    def reservar(
+        self, entidade: str, quantidade: int, maior_existente: Callable[[], int] = lambda: 0
+    ) -> range:
+        if quantidade < 1:
+            raise ValueError("Quantidade de IDs deve ser positiva")
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT ultimo FROM sequencia WHERE entidade = ?", (entidade,)
+            ).fetchone()
+            # Fora da transação: pode ler as tabelas pela mesma conexão
+            inicial = None if linha else (maior_existente() or 0)
+
+            em_unidade = self._conexao.in_transaction
+            self._conexao.execute("SAVEPOINT sequencia" if em_unidade else "BEGIN IMMEDIATE")
+            try:
+                self._conexao.execute(
+                    "INSERT INTO sequencia (entidade, ultimo) VALUES (?, ?) "
+                    "ON CONFLICT(entidade) DO NOTHING",
+                    (entidade, inicial or 0),
+                )
+                ultimo = self._conexao.execute(
+                    "UPDATE sequencia SET ultimo = ultimo + ? WHERE entidade = ? RETURNING ultimo",
+                    (quantidade, entidade),
+                ).fetchone()[0] - quantidade
+                self._conexao.execute("RELEASE sequencia" if em_unidade else "COMMIT")
+            except Exception:
+                if em_unidade:
+                    self._conexao.execute("ROLLBACK TO sequencia")
+                    self._conexao.execute("RELEASE sequencia")
+                else:
+                    self._conexao.execute("ROLLBACK")
+                raise
+        return range(ultimo + 1, ultimo + quantidade + 1)
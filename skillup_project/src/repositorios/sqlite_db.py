@@ -0,0 +1,371 @@
+import json
+import os
+import sqlite3
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.dominio.excecoes import ChaveDuplicadaError
+from src.repositorios.arquivos import caminho_dados
+from src.repositorios.loader import JsonRepository
+from src.repositorios.unidade_trabalho import unidade_ativa
+
+
+CAMINHO_BANCO = os.environ.get("SKILLUP_DB", caminho_dados("skillup.db"))
+
+
+# ==============================
+# CONEXÕES
+# ==============================
+
+# Uma conexão por arquivo, compartilhada por todos os repositórios
+_CONEXOES: Dict[str, sqlite3.Connection] = {}
+_CONEXOES_LOCK = threading.RLock()
+
+# Uma trava por conexão, usada por todas as tabelas dela: uma unidade de
+# trabalho a segura do começo ao fim da sua transação
+_TRAVAS: Dict[int, threading.RLock] = {}
+
+# Marca da última escrita em cada tabela (por conexão), tirada de um contador
+# global para nunca se repetir. O PRAGMA data_version só muda com escritas de
+# outras conexões; junto com esta marca, forma a versão da tabela.
+_ESCRITAS: Dict[Tuple[int, str], int] = {}
+_MARCAS = itertools.count(1)
+
+
+def trava_da_conexao(conexao: sqlite3.Connection) -> threading.RLock:
+    with _CONEXOES_LOCK:
+        return _TRAVAS.setdefault(id(conexao), threading.RLock())
+
+
+def conectar(caminho_banco: Optional[str] = None) -> sqlite3.Connection:
+    """Retorna a conexão compartilhada com o banco informado (ou o padrão)."""
+    caminho = caminho_banco or CAMINHO_BANCO
+    chave = caminho if caminho == ":memory:" else os.path.abspath(caminho)
+    with _CONEXOES_LOCK:
+        conexao = _CONEXOES.get(chave)
+        if conexao is None:
+            if caminho != ":memory:":
+                os.makedirs(os.path.dirname(chave), exist_ok=True)
+            conexao = sqlite3.connect(caminho, check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            _CONEXOES[chave] = conexao
+        return conexao
+
+
+def fechar_conexoes() -> None:
+    """Fecha todas as conexões abertas."""
+    with _CONEXOES_LOCK:
+        for conexao in _CONEXOES.values():
+            conexao.close()
+        _CONEXOES.clear()
+        _TRAVAS.clear()
+
+
+# ==============================
+# TABELA
+# ==============================
+
+Extrator = Callable[[dict], Any]
+
+# Linhas lidas por consulta em `TabelaSQLite.iterar`
+TAMANHO_LOTE = 500
+
+
+class _LoteIncompleto(Exception):
+    """Desfaz a transação de `substituir_muitos` quando alguma chave não existe."""
+
+
+class _TransacaoNaUnidade:
+    """Conexão SQLite dentro de uma unidade de trabalho (ver unidade_trabalho.py).
+
+    Abre uma transação na primeira escrita e a mantém até o fim da unidade,
+    segurando a trava da conexão para que outras threads não escrevam nela.
+    """
+
+    def __init__(self, conexao: sqlite3.Connection):
+        self._conexao = conexao
+        self._trava = trava_da_conexao(conexao)
+        self._trava.acquire()
+        try:
+            if not conexao.in_transaction:
+                conexao.execute("BEGIN")
+        except Exception:
+            self._trava.release()
+            raise
+
+    def preparar(self) -> Callable[[], None]:
+        return self._conexao.commit
+
+    def encerrar(self, confirmada: bool) -> None:
+        try:
+            if not confirmada:
+                self._conexao.rollback()
+        finally:
+            self._trava.release()
+
+
+class TabelaSQLite:
+    """Tabela SQLite que guarda registros no mesmo formato dos arquivos JSON.
+
+    Cada linha tem a chave primária, algumas colunas indexadas extraídas do
+    registro (usadas em WHERE) e o registro completo serializado em `dados`.
+    Assim os Mappers existentes continuam valendo para os dois backends.
+
+    `colunas` mapeia o nome de cada coluna indexada para a função que extrai
+    seu valor do registro. `indices` lista as colunas (ou tuplas de colunas)
+    que recebem índice; `unicos` as que recebem índice UNIQUE.
+    """
+
+    def __init__(
+        self,
+        conexao: sqlite3.Connection,
+        nome: str,
+        chave: str = "id",
+        colunas: Optional[Dict[str, Extrator]] = None,
+        indices: Sequence = (),
+        unicos: Sequence = (),
+        origem_json: Optional[str] = None,
+    ):
+        self._conexao = conexao
+        self._nome = nome
+        self._chave = chave
+        self._colunas = dict(colunas or {})
+        self._unicos = [c for c in unicos if isinstance(c, str)]
+        self._lock = trava_da_conexao(conexao)
+        self._chave_escritas = (id(conexao), nome)
+        with self._lock:
+            _ESCRITAS.setdefault(self._chave_escritas, next(_MARCAS))
+        criada = self._criar(indices, unicos)
+        if criada and origem_json:
+            self._importar_json(origem_json)
+
+    @property
+    def chave(self) -> str:
+        return self._chave
+
+    def versao(self) -> Tuple[int, int]:
+        """Muda a cada escrita nesta tabela e a cada escrita confirmada por outro processo no banco."""
+        with self._lock:
+            (externa,) = self._conexao.execute("PRAGMA data_version").fetchone()
+            return externa, _ESCRITAS[self._chave_escritas]
+
+    # ------------------------------------------------------------------
+    # Esquema
+    # ------------------------------------------------------------------
+
+    def _criar(self, indices: Sequence, unicos: Sequence) -> bool:
+        """Cria tabela e índices se não existirem. Retorna True se a tabela é nova."""
+        with self._lock:
+            existe = self._conexao.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (self._nome,),
+            ).fetchone()
+
+            definicoes = [f"{self._chave} INTEGER PRIMARY KEY"]
+            definicoes += list(self._colunas)
+            definicoes.append("dados TEXT NOT NULL")
+
+            with self._conexao:
+                self._conexao.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self._nome} ({', '.join(definicoes)})"
+                )
+                for cols, unico in [(c, False) for c in indices] + [(c, True) for c in unicos]:
+                    cols = (cols,) if isinstance(cols, str) else tuple(cols)
+                    prefixo = "uq" if unico else "idx"
+                    nome_indice = f"{prefixo}_{self._nome}_{'_'.join(cols)}"
+                    self._conexao.execute(
+                        f"CREATE {'UNIQUE ' if unico else ''}INDEX IF NOT EXISTS "
+                        f"{nome_indice} ON {self._nome} ({', '.join(cols)})"
+                    )
+            return existe is None
+
+    def _importar_json(self, caminho_json: str) -> None:
+        """Carrega o conteúdo do arquivo JSON equivalente numa tabela recém-criada."""
+        if os.path.exists(caminho_json):
+            self.gravar_muitos(JsonRepository(caminho_json, self._chave).carregar())
+
+    # ------------------------------------------------------------------
+    # Helpers privados
+    # ------------------------------------------------------------------
+
+    def _linha(self, registro: dict) -> tuple:
+        valores = [registro[self._chave]]
+        valores += [extrair(registro) for extrair in self._colunas.values()]
+        valores.append(json.dumps(registro, ensure_ascii=False))
+        return tuple(valores)
+
+    def _duplicada(self, erro: sqlite3.IntegrityError, registros: List[dict]) -> ChaveDuplicadaError:
+        """Traduz a violação de um índice UNIQUE para ChaveDuplicadaError."""
+        mensagem = str(erro)
+        for campo in self._unicos:
+            if mensagem.endswith(f"{self._nome}.{campo}"):
+                valores = [self._colunas[campo](r) for r in registros]
+                return ChaveDuplicadaError(campo, valores[0] if len(valores) == 1 else valores)
+        return ChaveDuplicadaError(self._chave, None, mensagem)
+
+    def _sql_upsert(self) -> str:
+        # ON CONFLICT só na chave primária: conflito num índice UNIQUE deve
+        # falhar (INSERT OR REPLACE apagaria a outra linha silenciosamente)
+        nomes = [self._chave, *self._colunas, "dados"]
+        marcadores = ", ".join("?" for _ in nomes)
+        atualizacoes = ", ".join(f"{c} = excluded.{c}" for c in nomes[1:])
+        return (
+            f"INSERT INTO {self._nome} ({', '.join(nomes)}) VALUES ({marcadores}) "
+            f"ON CONFLICT({self._chave}) DO UPDATE SET {atualizacoes}"
+        )
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def onde(
+        self,
+        condicao: str = "",
+        parametros: Sequence = (),
+        ordem: Optional[str] = None,
+        limite: Optional[int] = None,
+    ) -> List[dict]:
+        """Retorna os registros que satisfazem a condição SQL (sobre as colunas indexadas)."""
+        sql = f"SELECT dados FROM {self._nome}"
+        if condicao:
+            sql += f" WHERE {condicao}"
+        sql += f" ORDER BY {ordem or self._chave}"
+        if limite is not None:
+            sql += " LIMIT ?"
+            parametros = (*parametros, limite)
+        with self._lock:
+            linhas = self._conexao.execute(sql, tuple(parametros)).fetchall()
+        return [json.loads(dados) for (dados,) in linhas]
+
+    def pagina(
+        self,
+        limite: int,
+        cursor: Any = None,
+        condicao: str = "",
+        parametros: Sequence = (),
+    ) -> Tuple[List[dict], Any]:
+        """Como `JsonRepository.pagina`: até `limite` registros com chave maior que `cursor`.
+
+        A condição é combinada com `chave > ?`, então cada página é uma busca
+        na chave primária, sem OFFSET. Devolve (registros, próximo cursor ou None).
+        """
+        condicoes = [f"({condicao})"] if condicao else []
+        if cursor is not None:
+            condicoes.append(f"{self._chave} > ?")
+            parametros = (*parametros, cursor)
+        registros = self.onde(" AND ".join(condicoes), parametros, limite=limite + 1)
+        if len(registros) <= limite:
+            return registros, None
+        del registros[limite:]
+        return registros, registros[-1][self._chave]
+
+    def iterar(self, condicao: str = "", parametros: Sequence = (), lote: int = TAMANHO_LOTE) -> Iterator[dict]:
+        """Percorre os registros em ordem de chave, lendo `lote` linhas por consulta.
+
+        Cada lote é uma página de `pagina`, então o lock não fica preso
+        enquanto quem itera processa os registros.
+        """
+        cursor = None
+        while True:
+            registros, cursor = self.pagina(lote, cursor, condicao, parametros)
+            yield from registros
+            if cursor is None:
+                return
+
+    def primeiro(self, condicao: str, parametros: Sequence = ()) -> Optional[dict]:
+        registros = self.onde(condicao, parametros, limite=1)
+        return registros[0] if registros else None
+
+    def carregar(self) -> List[dict]:
+        return self.onde()
+
+    def buscar(self, valor_chave: Any) -> Optional[dict]:
+        return self.primeiro(f"{self._chave} = ?", (valor_chave,))
+
+    def contar(self, condicao: str = "", parametros: Sequence = ()) -> int:
+        sql = f"SELECT COUNT(*) FROM {self._nome}"
+        if condicao:
+            sql += f" WHERE {condicao}"
+        with self._lock:
+            return self._conexao.execute(sql, tuple(parametros)).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _transacao(self):
+        """Transação de uma escrita. Com uma unidade de trabalho aberta, a escrita entra
+        na transação da unidade dentro de um savepoint: se falhar, só ela é desfeita."""
+        unidade = unidade_ativa()
+        if unidade is None:
+            with self._lock, self._conexao:
+                try:
+                    yield
+                finally:
+                    self._marcar_escrita()
+            return
+        unidade.participante(self._conexao, lambda: _TransacaoNaUnidade(self._conexao))
+        with self._lock:
+            self._conexao.execute("SAVEPOINT escrita")
+            try:
+                yield
+            except BaseException:
+                self._conexao.execute("ROLLBACK TO escrita")
+                self._conexao.execute("RELEASE escrita")
+                raise
+            finally:
+                self._marcar_escrita()
+            self._conexao.execute("RELEASE escrita")
+
+    def _marcar_escrita(self) -> None:
+        # Também marca escritas desfeitas: no pior caso quem depende da versão relê à toa
+        _ESCRITAS[self._chave_escritas] = next(_MARCAS)
+
+    def gravar(self, registro: dict) -> None:
+        """Insere o registro ou substitui o existente com a mesma chave."""
+        self.gravar_muitos([registro])
+
+    def gravar_muitos(self, registros: List[dict]) -> None:
+        """Insere ou substitui todos os registros numa transação; se algum violar um índice único, nada é gravado."""
+        try:
+            with self._transacao():
+                self._conexao.executemany(self._sql_upsert(), [self._linha(r) for r in registros])
+        except sqlite3.IntegrityError as erro:
+            raise self._duplicada(erro, registros) from erro
+
+    def substituir(self, registro: dict) -> bool:
+        """Substitui o registro com a mesma chave. Retorna False se não existir."""
+        return self.substituir_muitos([registro])
+
+    def substituir_muitos(self, registros: List[dict]) -> bool:
+        """Substitui todos os registros numa transação. Se algum não existir, desfaz e retorna False."""
+        atribuicoes = ", ".join(f"{c} = ?" for c in [*self._colunas, "dados"])
+        linhas = [self._linha(r) for r in registros]
+        try:
+            with self._transacao():
+                cursor = self._conexao.executemany(
+                    f"UPDATE {self._nome} SET {atribuicoes} WHERE {self._chave} = ?",
+                    [(*linha[1:], linha[0]) for linha in linhas],
+                )
+                if cursor.rowcount < len(linhas):
+                    raise _LoteIncompleto
+        except _LoteIncompleto:
+            return False
+        except sqlite3.IntegrityError as erro:
+            raise self._duplicada(erro, registros) from erro
+        return True
+
+    def remover(self, valor_chave: Any) -> bool:
+        return self.remover_onde(f"{self._chave} = ?", (valor_chave,)) > 0
+
+    def remover_onde(self, condicao: str, parametros: Sequence = ()) -> int:
+        """Remove os registros que satisfazem a condição. Retorna quantos saíram."""
+        with self._transacao():
+            cursor = self._conexao.execute(
+                f"DELETE FROM {self._nome} WHERE {condicao}", tuple(parametros)
+            )
+        return cursor.rowcount
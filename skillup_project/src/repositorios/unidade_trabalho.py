@@ -0,0 +1,117 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Protocol
+
+from src.interfaces.interface_unidade_trabalho import IUnidadeDeTrabalho
+
+
+# ==============================
+# UNIDADE ATIVA (POR THREAD)
+# ==============================
+
+_ESTADO = threading.local()
+
+
+def unidade_ativa() -> Optional["UnidadeDeTrabalho"]:
+    """Unidade de trabalho aberta na thread atual, ou None."""
+    return getattr(_ESTADO, "unidade", None)
+
+
+class Participante(Protocol):
+    """Um armazenamento envolvido numa unidade: um arquivo JSON ou uma conexão SQLite."""
+
+    def preparar(self) -> Optional[Callable[[], None]]:
+        """Grava o que pode falhar sem alterar os dados confirmados e devolve a
+        função que publica essa gravação (None se não há nada a gravar)."""
+        ...
+
+    def encerrar(self, confirmada: bool) -> None:
+        """Libera o participante ao fim da unidade, confirmada ou não."""
+        ...
+
+
+# ==============================
+# UNIDADE DE TRABALHO
+# ==============================
+
+class UnidadeDeTrabalho(IUnidadeDeTrabalho):
+    """Agrupa as leituras e escritas de vários repositórios numa só gravação.
+
+    Enquanto está aberta, na thread que a abriu:
+    - cada arquivo JSON é lido uma vez; as leituras seguintes devolvem os
+      mesmos registros (mapa de identidade) sem voltar ao disco;
+    - as escritas vão para uma cópia do arquivo em memória. Em `confirmar`,
+      cada arquivo alterado é gravado uma única vez: todos vão primeiro para
+      arquivos temporários e só então substituem os originais, então uma
+      falha de escrita não deixa parte dos arquivos alterada;
+    - no SQLite, as escritas de todas as tabelas ficam numa única transação.
+
+    Uma unidade aberta dentro de outra participa da externa.
+    """
+
+    def __init__(self):
+        self._participantes: Dict[Any, Participante] = {}
+        self._aberta = False
+        self._aninhada = False
+
+    def abrir(self) -> None:
+        if self._aberta:
+            raise RuntimeError("A unidade de trabalho já está aberta")
+        self._aberta = True
+        if unidade_ativa() is not None:
+            # As escritas continuam indo para a unidade externa
+            self._aninhada = True
+        else:
+            _ESTADO.unidade = self
+
+    def participante(self, chave: Any, criar: Callable[[], Participante]) -> Participante:
+        """Participante registrado com `chave`, criado por `criar` no primeiro uso."""
+        participante = self._participantes.get(chave)
+        if participante is None:
+            participante = self._participantes[chave] = criar()
+        return participante
+
+    def confirmar(self) -> None:
+        if self._fechar_aninhada():
+            return
+        publicacoes = []
+        # Ordem fixa (pela chave: o caminho do arquivo), para que dois processos
+        # confirmando unidades não esperem cada um pela trava de arquivo do outro
+        participantes = sorted(self._participantes.items(), key=lambda item: str(item[0]))
+        try:
+            for _, participante in participantes:
+                publicar = participante.preparar()
+                if publicar is not None:
+                    publicacoes.append(publicar)
+            for publicar in publicacoes:
+                publicar()
+        except BaseException:
+            self._encerrar(False)
+            raise
+        self._encerrar(True)
+
+    def desfazer(self) -> None:
+        if self._fechar_aninhada():
+            return
+        self._encerrar(False)
+
+    def _fechar_aninhada(self) -> bool:
+        if not self._aberta:
+            raise RuntimeError("A unidade de trabalho não está aberta")
+        if self._aninhada:
+            self._aberta = self._aninhada = False
+            return True
+        return False
+
+    def _encerrar(self, confirmada: bool) -> None:
+        # Todos os participantes são liberados (travas, temporários) mesmo se um falhar
+        erro = None
+        for participante in self._participantes.values():
+            try:
+                participante.encerrar(confirmada)
+            except BaseException as e:
+                erro = erro or e
+        self._participantes.clear()
+        self._aberta = False
+        _ESTADO.unidade = None
+        if erro is not None:
+            raise erro
@@ -0,0 +1,234 @@
+import heapq
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from src.dominio.candidatura import TipoVagaCandidatura
+from src.dominio.vaga import Modalidade, TipoVaga, Vaga
+from src.services.service_busca_vaga import EstatisticasTexto, MotorBuscaVaga, salario_da_vaga
+
+
+# ==============================
+# ORDENAÇÕES DISPONÍVEIS
+# ==============================
+
+ORDENACOES: Dict[str, Callable[[Vaga], Any]] = {
+    "id": lambda v: v.id,
+    "titulo": lambda v: v.titulo.casefold(),
+    "salario": lambda v: salario_da_vaga(v) or 0.0,
+    "prazo": lambda v: v.prazo_inscricao or date.max,
+}
+
+
+# ==============================
+# RESULTADO
+# ==============================
+
+@dataclass(frozen=True, slots=True)
+class VagaEncontrada:
+    """Vaga de um resultado federado, com o tipo que a identifica junto do ID."""
+    vaga: Vaga
+    tipo: TipoVagaCandidatura
+    pontuacao: Optional[float] = None   # relevância na busca textual
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoBusca:
+    """Uma página de resultados, já ordenada. Iterar percorre os itens da página."""
+    itens: List[VagaEncontrada]
+    total: int
+    pagina: int
+    por_pagina: int
+
+    @property
+    def total_paginas(self) -> int:
+        return -(-self.total // self.por_pagina)
+
+    @property
+    def tem_proxima(self) -> bool:
+        return self.pagina < self.total_paginas
+
+    def __iter__(self) -> Iterator[VagaEncontrada]:
+        return iter(self.itens)
+
+    def __len__(self) -> int:
+        return len(self.itens)
+
+
+# ==============================
+# MOTOR FEDERADO
+# ==============================
+
+class MotorBuscaFederada:
+    """Busca vagas em vários repositórios ao mesmo tempo (CLT, estágio, ...).
+
+    Cada tipo de vaga tem o seu MotorBuscaVaga; a consulta é feita em cada
+    motor, um depois do outro, e as listas ordenadas de cada um são
+    intercaladas com heapq.merge. Só a página pedida é materializada.
+    (Os motores respondem de índices em memória, em Python puro: threads
+    não os rodariam em paralelo por causa do GIL.)
+
+    A ordem dos `motores` desempata itens com a mesma chave de ordenação.
+    As vagas dos resultados são as dos índices dos motores: somente leitura.
+    """
+
+    def __init__(self, motores: Mapping[TipoVagaCandidatura, MotorBuscaVaga]):
+        self._motores: List[Tuple[TipoVagaCandidatura, MotorBuscaVaga]] = list(motores.items())
+
+    # ------------------------------------------------------------------
+    # Buscas
+    # ------------------------------------------------------------------
+
+    def buscar(
+        self,
+        *,
+        area: Optional[str] = None,
+        modalidade: Optional[Modalidade] = None,
+        tipo: Optional[TipoVaga] = None,
+        localidade: Optional[str] = None,
+        salario_min: Optional[float] = None,
+        salario_max: Optional[float] = None,
+        apenas_ativas: bool = True,
+        ordenar_por: str = "id",
+        decrescente: bool = False,
+        pagina: int = 1,
+        por_pagina: int = 20,
+    ) -> ResultadoBusca:
+        """Busca com filtros (ver MotorBuscaVaga.buscar) em todos os tipos de vaga."""
+        chave = self._ordenacao(ordenar_por)
+        listas = self._em_cada_motor(
+            lambda motor: self._ordenar(
+                motor.buscar(
+                    area=area,
+                    modalidade=modalidade,
+                    tipo=tipo,
+                    localidade=localidade,
+                    salario_min=salario_min,
+                    salario_max=salario_max,
+                    apenas_ativas=apenas_ativas,
+                ),
+                ordenar_por,
+                chave,
+                decrescente,
+            )
+        )
+        return self._paginar(listas, chave, decrescente, pagina, por_pagina)
+
+    def buscar_por_candidato(
+        self,
+        areas_interesse: List[str],
+        localidade_candidato: str = "",
+        apenas_ativas: bool = True,
+        pagina: int = 1,
+        por_pagina: int = 20,
+    ) -> ResultadoBusca:
+        """Vagas compatíveis com o perfil (ver MotorBuscaVaga.buscar_por_candidato), por ID."""
+        listas = self._em_cada_motor(
+            lambda motor: motor.buscar_por_candidato(
+                areas_interesse, localidade_candidato, apenas_ativas
+            )
+        )
+        return self._paginar(listas, ORDENACOES["id"], False, pagina, por_pagina)
+
+    def buscar_texto(
+        self,
+        consulta: str,
+        apenas_ativas: bool = True,
+        pagina: int = 1,
+        por_pagina: int = 20,
+    ) -> ResultadoBusca:
+        """Busca textual (BM25) em todos os tipos de vaga, mais relevante primeiro.
+
+        IDF e tamanho médio são os do conjunto de todos os motores (as
+        estatísticas de cada um são somadas antes de pontuar), então as
+        pontuações de motores diferentes são comparáveis. As N melhores do
+        conjunto estão entre as N melhores de cada motor, então cada um só
+        precisa devolver `pagina * por_pagina` vagas.
+        """
+        self._validar_pagina(pagina, por_pagina)
+        limite = pagina * por_pagina
+        estatisticas = sum(
+            self._em_cada_motor(lambda motor: motor.estatisticas_texto(consulta, apenas_ativas)),
+            EstatisticasTexto(),
+        )
+        parciais = self._em_cada_motor(
+            lambda motor: motor.buscar_texto_pontuado(consulta, limite, apenas_ativas, estatisticas)
+        )
+
+        total = sum(encontradas for encontradas, _ in parciais)
+        fluxos = [
+            self._fluxo_pontuado(melhores, posicao, tipo)
+            for posicao, ((tipo, _), (_, melhores)) in enumerate(zip(self._motores, parciais))
+        ]
+        inicio = (pagina - 1) * por_pagina
+        itens = [e[-1] for e in islice(heapq.merge(*fluxos), inicio, inicio + por_pagina)]
+        return ResultadoBusca(itens, total, pagina, por_pagina)
+
+    # ------------------------------------------------------------------
+    # Helpers privados
+    # ------------------------------------------------------------------
+
+    def _em_cada_motor(self, consulta: Callable[[MotorBuscaVaga], Any]) -> List[Any]:
+        """Executa a consulta em cada motor; resultados na ordem dos motores."""
+        return [consulta(motor) for _, motor in self._motores]
+
+    @staticmethod
+    def _ordenacao(ordenar_por: str) -> Callable[[Vaga], Any]:
+        try:
+            return ORDENACOES[ordenar_por]
+        except KeyError:
+            opcoes = ", ".join(ORDENACOES)
+            raise ValueError(f"Ordenação inválida: {ordenar_por!r} (use {opcoes})") from None
+
+    @staticmethod
+    def _ordenar(
+        vagas: List[Vaga], ordenar_por: str, chave: Callable[[Vaga], Any], decrescente: bool
+    ) -> List[Vaga]:
+        # Os motores já devolvem as vagas por ID crescente
+        if ordenar_por == "id" and not decrescente:
+            return vagas
+        return sorted(vagas, key=lambda v: (chave(v), v.id), reverse=decrescente)
+
+    @staticmethod
+    def _validar_pagina(pagina: int, por_pagina: int) -> None:
+        if pagina < 1:
+            raise ValueError("A página deve ser maior ou igual a 1")
+        if por_pagina < 1:
+            raise ValueError("O tamanho da página deve ser maior ou igual a 1")
+
+    def _paginar(
+        self,
+        listas: List[List[Vaga]],
+        chave: Callable[[Vaga], Any],
+        decrescente: bool,
+        pagina: int,
+        por_pagina: int,
+    ) -> ResultadoBusca:
+        """Intercala as listas ordenadas de cada motor e recorta a página pedida."""
+        self._validar_pagina(pagina, por_pagina)
+        fluxos = [
+            self._fluxo_ordenado(vagas, posicao, tipo, chave)
+            for posicao, ((tipo, _), vagas) in enumerate(zip(self._motores, listas))
+        ]
+        intercalado = heapq.merge(*fluxos, key=lambda e: e[:3], reverse=decrescente)
+        inicio = (pagina - 1) * por_pagina
+        itens = [
+            VagaEncontrada(vaga, tipo)
+            for _, _, _, tipo, vaga in islice(intercalado, inicio, inicio + por_pagina)
+        ]
+        return ResultadoBusca(itens, sum(len(v) for v in listas), pagina, por_pagina)
+
+    @staticmethod
+    def _fluxo_ordenado(
+        vagas: List[Vaga], posicao: int, tipo: TipoVagaCandidatura, chave: Callable[[Vaga], Any]
+    ) -> Iterator[tuple]:
+        for vaga in vagas:
+            yield chave(vaga), vaga.id, posicao, tipo, vaga
+
+    @staticmethod
+    def _fluxo_pontuado(
+        melhores: List[Tuple[Vaga, float]], posicao: int, tipo: TipoVagaCandidatura
+    ) -> Iterator[tuple]:
+        for vaga, pontuacao in melhores:
+            yield -pontuacao, posicao, vaga.id, VagaEncontrada(vaga, tipo, pontuacao)
@@ -1,18 +1,261 @@
-from typing import List, Optional
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from src.dominio.vaga import Vaga, VagaCLT, VagaEstagio, Modalidade, TipoVaga
+from src.interfaces.interface_observador_vaga import IObservadorVaga
 from src.interfaces.interface_vaga import IVagaRepositorio
+from src.repositorios.indice_ordenado import IndiceOrdenado
 
 
-class MotorBuscaVaga:
+# ==============================
+# ÍNDICE INVERTIDO DE ATRIBUTOS
+# ==============================
+
+# Atributos indexados; o valor de cada um já vem normalizado
+AREA = "area"
+MODALIDADE = "modalidade"
+TIPO = "tipo"
+LOCALIDADE = "localidade"
+
+
+# Parâmetros do BM25 (valores usuais da literatura)
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Ocorrências no título contam como PESO_TITULO ocorrências no texto
+PESO_TITULO = 2
+
+_PALAVRA = re.compile(r"\w+")
+
+
+@dataclass(frozen=True, slots=True)
+class EstatisticasTexto:
+    """Estatísticas de um corpus usadas pelo BM25: quantas vagas há, a soma dos
+    tamanhos dos textos e em quantas vagas aparece cada termo da consulta.
+
+    Somadas entre motores (`+`), dão o IDF e o tamanho médio do conjunto todo,
+    e as pontuações de motores diferentes ficam comparáveis entre si.
+    """
+    documentos: int = 0
+    tamanho_total: int = 0
+    vagas_com_termo: Dict[str, int] = field(default_factory=dict)
+
+    def __add__(self, outra: "EstatisticasTexto") -> "EstatisticasTexto":
+        vagas_com_termo = dict(self.vagas_com_termo)
+        for termo, quantidade in outra.vagas_com_termo.items():
+            vagas_com_termo[termo] = vagas_com_termo.get(termo, 0) + quantidade
+        return EstatisticasTexto(
+            self.documentos + outra.documentos,
+            self.tamanho_total + outra.tamanho_total,
+            vagas_com_termo,
+        )
+
+
+def _normalizar(texto: Optional[str]) -> str:
+    return (texto or "").lower()
+
+
+def salario_da_vaga(vaga: Vaga) -> Optional[float]:
+    """Valor pago pela vaga: salário (CLT) ou bolsa (estágio)."""
+    if isinstance(vaga, VagaCLT):
+        return vaga.salario_base
+    if isinstance(vaga, VagaEstagio):
+        return vaga.bolsa_auxilio
+    return None
+
+
+def tokenizar(texto: Optional[str]) -> List[str]:
+    """Quebra o texto em palavras minúsculas e sem acentos ("Ação" -> "acao")."""
+    decomposto = unicodedata.normalize("NFKD", (texto or "").casefold())
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return _PALAVRA.findall(sem_acentos)
+
+
+class _IndiceVagas:
+    """Listas invertidas (atributo, valor) -> IDs das vagas com esse valor.
+
+    Uma busca com vários filtros é a interseção das listas envolvidas,
+    começando pela menor; só as vagas do resultado são tocadas.
+
+    Também guarda o índice de texto (termo -> {ID: frequência}) sobre título,
+    descrição e requisitos, usado no ranqueamento BM25, e os IDs ordenados
+    pelo salário (ou bolsa) para faixas salariais e "mais bem pagas".
+    """
+
+    def __init__(self, vagas: Iterable[Vaga]):
+        self.vagas: Dict[int, Vaga] = {}
+        self._listas: Dict[str, Dict[Any, Set[int]]] = {
+            AREA: {}, MODALIDADE: {}, TIPO: {}, LOCALIDADE: {},
+        }
+        # Chaves (e salário) de cada vaga, para tirá-la das listas certas ao atualizar
+        self._chaves: Dict[int, Tuple[Tuple[str, Any], ...]] = {}
+        self._termos: Dict[str, Dict[int, int]] = {}
+        self._frequencias: Dict[int, Counter] = {}
+        self._tamanho_total = 0
+        # Montado de uma vez no fim; inserir vaga a vaga custaria O(N²)
+        self.salarios: Optional[IndiceOrdenado] = None
+        self._salario: Dict[int, float] = {}
+        for vaga in vagas:
+            self.adicionar(vaga)
+        self.salarios = IndiceOrdenado((v, i) for i, v in self._salario.items())
+
+    @staticmethod
+    def _chaves_da_vaga(vaga: Vaga) -> Tuple[Tuple[str, Any], ...]:
+        return (
+            (AREA, _normalizar(vaga.area)),
+            (MODALIDADE, vaga.modalidade),
+            (TIPO, vaga.tipo),
+            (LOCALIDADE, _normalizar(getattr(vaga, "localidade", ""))),
+        )
+
+    def adicionar(self, vaga: Vaga) -> None:
+        self.remover(vaga.id)
+        chaves = self._chaves_da_vaga(vaga)
+        for campo, valor in chaves:
+            self._listas[campo].setdefault(valor, set()).add(vaga.id)
+        self._chaves[vaga.id] = chaves
+        self.vagas[vaga.id] = vaga
+        salario = salario_da_vaga(vaga)
+        if salario is not None:
+            self._salario[vaga.id] = salario
+            if self.salarios is not None:
+                self.salarios.adicionar(salario, vaga.id)
+
+        frequencias = self._frequencias_da_vaga(vaga)
+        for termo, quantidade in frequencias.items():
+            self._termos.setdefault(termo, {})[vaga.id] = quantidade
+        self._frequencias[vaga.id] = frequencias
+        self._tamanho_total += frequencias.total()
+
+    def remover(self, id_vaga: int) -> None:
+        chaves = self._chaves.pop(id_vaga, None)
+        if chaves is None:
+            return
+        for campo, valor in chaves:
+            ids = self._listas[campo][valor]
+            ids.discard(id_vaga)
+            if not ids:
+                del self._listas[campo][valor]
+        del self.vagas[id_vaga]
+        salario = self._salario.pop(id_vaga, None)
+        if self.salarios is not None and salario is not None:
+            self.salarios.remover(salario, id_vaga)
+
+        frequencias = self._frequencias.pop(id_vaga)
+        for termo in frequencias:
+            ids = self._termos[termo]
+            del ids[id_vaga]
+            if not ids:
+                del self._termos[termo]
+        self._tamanho_total -= frequencias.total()
+
+    @staticmethod
+    def _frequencias_da_vaga(vaga: Vaga) -> Counter:
+        frequencias = Counter()
+        for termo in tokenizar(vaga.titulo):
+            frequencias[termo] += PESO_TITULO
+        frequencias.update(tokenizar(vaga.descricao))
+        for requisito in getattr(vaga, "requisitos", None) or ():
+            frequencias.update(tokenizar(requisito))
+        return frequencias
+
+    def ids(self, campo: str, *valores: Any) -> Set[int]:
+        """IDs com qualquer um dos valores no atributo (união das listas)."""
+        listas = self._listas[campo]
+        if len(valores) == 1:
+            return listas.get(valores[0], set())
+        resultado: Set[int] = set()
+        for valor in valores:
+            resultado |= listas.get(valor, set())
+        return resultado
+
+    def intersecao(self, conjuntos: List[Set[int]]) -> Iterable[int]:
+        """IDs presentes em todos os conjuntos; sem conjuntos, todos os IDs."""
+        if not conjuntos:
+            return self.vagas.keys()
+        conjuntos.sort(key=len)
+        menor, *demais = conjuntos
+        return menor.intersection(*demais) if demais else menor
+
+    def vagas_por_id(self, ids: Iterable[int]) -> List[Vaga]:
+        return [self.vagas[i] for i in sorted(ids)]
+
+    def estatisticas(self, termos: Iterable[str]) -> EstatisticasTexto:
+        return EstatisticasTexto(
+            len(self.vagas),
+            self._tamanho_total,
+            {termo: len(self._termos.get(termo, ())) for termo in set(termos)},
+        )
+
+    def pontuar_texto(
+        self, termos: Iterable[str], estatisticas: Optional[EstatisticasTexto] = None
+    ) -> Dict[int, float]:
+        """Pontuação BM25 de cada vaga que contém ao menos um dos termos.
+
+        IDF e tamanho médio vêm de `estatisticas` (ex.: as de vários motores
+        somadas) ou, por padrão, deste índice.
+        """
+        termos = set(termos)
+        if not self.vagas:
+            return {}
+        if estatisticas is None:
+            estatisticas = self.estatisticas(termos)
+        total = estatisticas.documentos
+        tamanho_medio = estatisticas.tamanho_total / total or 1.0
+        pontuacoes: Dict[int, float] = {}
+        for termo in termos:
+            ocorrencias = self._termos.get(termo)
+            if not ocorrencias:
+                continue
+            com_termo = estatisticas.vagas_com_termo.get(termo, len(ocorrencias))
+            idf = math.log(1 + (total - com_termo + 0.5) / (com_termo + 0.5))
+            for id_vaga, frequencia in ocorrencias.items():
+                tamanho = self._frequencias[id_vaga].total()
+                normalizacao = BM25_K1 * (1 - BM25_B + BM25_B * tamanho / tamanho_medio)
+                pontuacoes[id_vaga] = pontuacoes.get(id_vaga, 0.0) + (
+                    idf * frequencia * (BM25_K1 + 1) / (frequencia + normalizacao)
+                )
+        return pontuacoes
+
+
+# ==============================
+# MOTOR DE BUSCA
+# ==============================
+
+class MotorBuscaVaga(IObservadorVaga):
     """Motor de busca de vagas com filtros combinados.
 
     Permite buscar vagas por área, modalidade, tipo, localidade,
     faixa salarial e status (ativa/inativa), combinando critérios.
+
+    Área, modalidade, tipo e localidade são respondidos por índices
+    invertidos montados na primeira busca (um para as vagas ativas, outro
+    para todas); a faixa salarial, por bisseção num índice ordenado.
+
+    Cada índice guarda a versão do repositório de que foi montado, e toda
+    busca a compara com a atual (como o cache dos repositórios compara a
+    assinatura do arquivo): escritas de outros processos, ou feitas por fora
+    dos serviços, fazem o índice ser remontado. Os avisos de `IObservadorVaga`
+    atualizam o índice no lugar sem remontá-lo; registre o motor nos serviços
+    que gravam vagas no mesmo repositório.
+
+    As vagas devolvidas são os objetos do índice, compartilhados entre as
+    buscas: trate-as como somente leitura. Para alterar uma vaga, busque-a
+    no serviço ou no repositório.
     """
 
     def __init__(self, repositorio: IVagaRepositorio):
         self._repo = repositorio
+        self._indices: Dict[bool, Optional[_IndiceVagas]] = {True: None, False: None}
+        # Versão do repositório refletida por cada índice
+        self._versoes: Dict[bool, Any] = {True: None, False: None}
+        self._lock = threading.RLock()
 
     # ------------------------------------------------------------------
     # Busca principal com múltiplos filtros
@@ -33,36 +276,110 @@ class MotorBuscaVaga:
 
         Parâmetros opcionais — se omitidos, o critério não é aplicado.
         """
-        vagas = self._repo.listar_ativas() if apenas_ativas else self._repo.listar_todas()
-        resultado: List[Vaga] = []
+        with self._lock:
+            indice = self._indice(apenas_ativas)
+            filtros: List[Set[int]] = []
 
-        for vaga in vagas:
-            if area and vaga.area.lower() != area.lower():
-                continue
+            if area:
+                filtros.append(indice.ids(AREA, _normalizar(area)))
 
-            if modalidade and vaga.modalidade != modalidade:
-                continue
+            if modalidade:
+                filtros.append(indice.ids(MODALIDADE, modalidade))
 
-            if tipo and vaga.tipo != tipo:
-                continue
+            if tipo:
+                filtros.append(indice.ids(TIPO, tipo))
 
-            if localidade and vaga.modalidade != Modalidade.REMOTO \
-                    and not self._localidade_coincide(vaga, localidade):
-                continue
+            # Vagas remotas atendem a qualquer localidade
+            if localidade:
+                filtros.append(
+                    indice.ids(LOCALIDADE, _normalizar(localidade))
+                    | indice.ids(MODALIDADE, Modalidade.REMOTO)
+                )
+
+            if salario_min is None and salario_max is None:
+                return indice.vagas_por_id(indice.intersecao(filtros))
+
+            # A faixa vira mais um filtro quando é a lista mais curta; senão
+            # é mais barato conferir o salário só das vagas já filtradas
+            inicio, fim = indice.salarios.limites(salario_min, salario_max)
+            if not filtros or fim - inicio <= min(map(len, filtros)):
+                filtros.append(set(indice.salarios.faixa(salario_min, salario_max)))
+                return indice.vagas_por_id(indice.intersecao(filtros))
 
-            if salario_min is not None or salario_max is not None:
-                salario = self._extrair_salario(vaga)
-                if salario is None:
-                    continue
-                if salario_min is not None and salario < salario_min:
-                    continue
-                if salario_max is not None and salario > salario_max:
-                    continue
+            vagas = indice.vagas_por_id(indice.intersecao(filtros))
 
+        resultado: List[Vaga] = []
+        for vaga in vagas:
+            salario = salario_da_vaga(vaga)
+            if salario is None:
+                continue
+            if salario_min is not None and salario < salario_min:
+                continue
+            if salario_max is not None and salario > salario_max:
+                continue
             resultado.append(vaga)
 
         return resultado
 
+    def mais_bem_pagas(
+        self, n: int = 10, area: Optional[str] = None, apenas_ativas: bool = True
+    ) -> List[Vaga]:
+        """Retorna as `n` vagas de maior salário (ou bolsa), da mais bem paga à menos.
+
+        Percorre o índice salarial do topo para baixo e para ao juntar `n`
+        vagas, então o custo depende de quão comum é a área, não do total.
+        """
+        with self._lock:
+            indice = self._indice(apenas_ativas)
+            ids = indice.salarios.decrescente()
+            if area:
+                da_area = indice.ids(AREA, _normalizar(area))
+                ids = (i for i in ids if i in da_area)
+            return [indice.vagas[i] for i in islice(ids, max(n, 0))]
+
+    # ------------------------------------------------------------------
+    # Busca textual
+    # ------------------------------------------------------------------
+
+    def buscar_texto(
+        self, consulta: str, limit: int = 10, apenas_ativas: bool = True
+    ) -> List[Vaga]:
+        """Retorna as vagas mais relevantes para a consulta, da mais relevante à menos.
+
+        A consulta é comparada, sem acentos nem caixa, com título, descrição e
+        requisitos. Basta uma palavra em comum para a vaga entrar no resultado;
+        a ordem segue o BM25, com o título pesando mais. Empates favorecem o menor ID.
+        """
+        _, melhores = self.buscar_texto_pontuado(consulta, limit, apenas_ativas)
+        return [vaga for vaga, _ in melhores]
+
+    def buscar_texto_pontuado(
+        self,
+        consulta: str,
+        limit: int = 10,
+        apenas_ativas: bool = True,
+        estatisticas: Optional[EstatisticasTexto] = None,
+    ) -> Tuple[int, List[Tuple[Vaga, float]]]:
+        """Como `buscar_texto`, mas devolve (total de vagas encontradas, [(vaga, pontuação)]).
+
+        `estatisticas` substitui as do próprio índice no BM25 (ver `estatisticas_texto`).
+        """
+        termos = tokenizar(consulta)
+        if not termos:
+            return 0, []
+        with self._lock:
+            indice = self._indice(apenas_ativas)
+            pontuacoes = indice.pontuar_texto(termos, estatisticas)
+            melhores = heapq.nlargest(
+                max(limit, 0), pontuacoes.items(), key=lambda par: (par[1], -par[0])
+            )
+            return len(pontuacoes), [(indice.vagas[i], p) for i, p in melhores]
+
+    def estatisticas_texto(self, consulta: str, apenas_ativas: bool = True) -> EstatisticasTexto:
+        """Estatísticas BM25 das vagas deste motor para os termos da consulta."""
+        with self._lock:
+            return self._indice(apenas_ativas).estatisticas(tokenizar(consulta))
+
     # ------------------------------------------------------------------
     # Busca por compatibilidade com candidato
     # ------------------------------------------------------------------
@@ -79,45 +396,64 @@ class MotorBuscaVaga:
         - A área da vaga deve estar nas áreas de interesse do candidato.
         - Se a vaga possui localidade, ela deve coincidir com a do candidato.
         """
-        vagas = self._repo.listar_ativas() if apenas_ativas else self._repo.listar_todas()
-        areas_lower = [a.lower() for a in areas_interesse]
-        resultado: List[Vaga] = []
+        with self._lock:
+            indice = self._indice(apenas_ativas)
+            filtros = [indice.ids(AREA, *{_normalizar(a) for a in areas_interesse})]
 
-        for vaga in vagas:
-            if vaga.area.lower() not in areas_lower:
-                continue
+            if localidade_candidato:
+                filtros.append(
+                    indice.ids(LOCALIDADE, "", _normalizar(localidade_candidato))
+                    | indice.ids(MODALIDADE, Modalidade.REMOTO)
+                )
 
-            if vaga.modalidade != Modalidade.REMOTO \
-                    and localidade_candidato \
-                    and hasattr(vaga, "localidade") and vaga.localidade:
-                if vaga.localidade.lower() != localidade_candidato.lower():
-                    continue
+            return indice.vagas_por_id(indice.intersecao(filtros))
 
-            resultado.append(vaga)
+    # ------------------------------------------------------------------
+    # Manutenção dos índices (IObservadorVaga)
+    # ------------------------------------------------------------------
 
-        return resultado
+    def vaga_salva(self, vaga: Vaga) -> None:
+        with self._lock:
+            todas, ativas = self._indices[False], self._indices[True]
+            if todas is not None:
+                todas.adicionar(vaga)
+            if ativas is not None:
+                if vaga.ativa:
+                    ativas.adicionar(vaga)
+                else:
+                    ativas.remover(vaga.id)
+            self._versao_atualizada()
+
+    def vaga_removida(self, id_vaga: int) -> None:
+        with self._lock:
+            for indice in self._indices.values():
+                if indice is not None:
+                    indice.remover(id_vaga)
+            self._versao_atualizada()
+
+    def invalidar(self) -> None:
+        """Descarta os índices; a próxima busca relê o repositório."""
+        with self._lock:
+            self._indices = {True: None, False: None}
 
     # ------------------------------------------------------------------
     # Helpers privados
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _localidade_coincide(vaga: Vaga, localidade: str) -> bool:
-        """Verifica se a vaga possui localidade e se coincide.
+    def _indice(self, apenas_ativas: bool) -> _IndiceVagas:
+        indice = self._indices[apenas_ativas]
+        versao = self._repo.versao()
+        # Sem versão informada (None), valem só os avisos
+        if indice is None or (versao is not None and versao != self._versoes[apenas_ativas]):
+            vagas = self._repo.listar_ativas() if apenas_ativas else self._repo.listar_todas()
+            indice = self._indices[apenas_ativas] = _IndiceVagas(vagas)
+            self._versoes[apenas_ativas] = versao
+        return indice
 
-        Vagas remotas são compatíveis com qualquer localidade.
-        """
-        if vaga.modalidade == Modalidade.REMOTO:
-            return True
-        if hasattr(vaga, "localidade") and vaga.localidade:
-            return vaga.localidade.lower() == localidade.lower()
-        return False
-
-    @staticmethod
-    def _extrair_salario(vaga: Vaga) -> Optional[float]:
-        """Extrai o valor salarial da vaga (salário ou bolsa)."""
-        if isinstance(vaga, VagaCLT):
-            return vaga.salario_base
-        if isinstance(vaga, VagaEstagio):
-            return vaga.bolsa_auxilio
-        return None
+    def _versao_atualizada(self) -> None:
+        # O aviso vem logo depois da escrita que ele descreve: os índices já a
+        # refletem, então passam a valer para a versão atual do repositório
+        versao = self._repo.versao()
+        for apenas_ativas, indice in self._indices.items():
+            if indice is not None:
+                self._versoes[apenas_ativas] = versao
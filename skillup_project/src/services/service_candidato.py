@@ -1,24 +1,99 @@
+from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple
 from src.dominio.candidato import Candidato, CandidatoMapper
 from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
+from src.interfaces.lote import ErroLote, ResultadoLote
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.interfaces.paginacao import Pagina, TAMANHO_PAGINA
 
 
 class CandidatoService:
     ''' Serviço de domínio para gerenciamento de candidatos. Contém a lógica de negócio e validações relacionadas aos candidatos.
     Recebe um repositório que implementa a interface ICandidatoRepositorio para realizar operações de persistência.'''
-    def __init__(self, repositorio: ICandidatoRepositorio):
-        ''' Inicializa o serviço com um repositório específico.'''
+    def __init__(
+        self,
+        repositorio: ICandidatoRepositorio,
+        sequencia: Optional[ISequenciaIds] = None,
+        observadores: Sequence[IObservadorCandidato] = (),
+    ):
+        ''' Inicializa o serviço com um repositório específico. Sem `sequencia`, o ID é o maior existente + 1.'''
         self.repo = repositorio
+        self._sequencia = sequencia
+        self._observadores = list(observadores)
+
+    def adicionar_observador(self, observador: IObservadorCandidato) -> None:
+        ''' Registra um observador avisado após cada escrita de candidato.'''
+        self._observadores.append(observador)
+
+    @property
+    def observadores(self) -> Tuple[IObservadorCandidato, ...]:
+        ''' Observadores registrados (a importação em massa avisa os mesmos).'''
+        return tuple(self._observadores)
+
+    def _notificar_salvos(self, candidatos) -> None:
+        for observador in self._observadores:
+            observador.candidatos_salvos(candidatos)
+
+    def _maior_id(self) -> int:
+        return max((c.id for c in self.repo.listar()), default=0)
 
     def cadastrar(self, nome, cpf, email, areas_interesse, nivel_formacao, localidade=""):
         ''' Cadastra um novo candidato. Realiza validações de negócio, como verificar se já existe um candidato com o mesmo CPF.'''
-        candidatos = self.repo.listar()
-
-        if any(c.cpf == cpf for c in candidatos):
+        if self.repo.buscar_por_cpf(cpf):
             raise ValueError("Já existe candidato com este CPF")
 
-        novo_id = 1 if not candidatos else max(c.id for c in candidatos) + 1
+        if self._sequencia:
+            novo_id = self._sequencia.proximo("candidato", self._maior_id)
+        else:
+            novo_id = self._maior_id() + 1
+
+        candidato = self._novo_candidato(novo_id, nome, cpf, email, areas_interesse, nivel_formacao, localidade)
 
-        candidato = Candidato(
+        self.repo.salvar(candidato)
+        self._notificar_salvos([candidato])
+        return candidato
+
+    def cadastrar_lote(self, dados: Iterable[Mapping[str, Any]]) -> ResultadoLote[Candidato]:
+        ''' Cadastra vários candidatos com uma única gravação. Cada item de `dados` traz os argumentos de `cadastrar` (nome, cpf, email...).
+        Um item recusado (CPF ou e-mail já usado, dado inválido) não impede os demais: o motivo vem em `erros`, com a posição do item.'''
+        erros = []
+        aceitos = []
+        cpfs, emails = set(), set()
+        for posicao, item in enumerate(dados):
+            cpf, email = item.get("cpf"), item.get("email")
+            if cpf in cpfs or self.repo.buscar_por_cpf(cpf):
+                erros.append(ErroLote(posicao, "Já existe candidato com este CPF"))
+            elif email in emails or self.repo.buscar_por_email(email):
+                erros.append(ErroLote(posicao, "Já existe candidato com este e-mail"))
+            else:
+                cpfs.add(cpf)
+                emails.add(email)
+                aceitos.append((posicao, item))
+
+        candidatos = []
+        for novo_id, (posicao, item) in zip(self._reservar_ids(len(aceitos)), aceitos):
+            try:
+                candidatos.append(self._novo_candidato(novo_id, **item))
+            except (TypeError, ValueError) as erro:
+                erros.append(ErroLote(posicao, str(erro)))
+
+        if candidatos:
+            self.repo.salvar_muitos(candidatos)
+            self._notificar_salvos(candidatos)
+        erros.sort(key=lambda e: e.posicao)
+        return ResultadoLote(candidatos, erros)
+
+    def _reservar_ids(self, quantidade: int) -> range:
+        if quantidade < 1:
+            return range(0)
+        if self._sequencia:
+            return self._sequencia.reservar("candidato", quantidade, self._maior_id)
+        inicio = self._maior_id() + 1
+        return range(inicio, inicio + quantidade)
+
+    @staticmethod
+    def _novo_candidato(novo_id, nome, cpf, email, areas_interesse, nivel_formacao, localidade=""):
+        return Candidato(
             novo_id,
             nome,
             cpf,
@@ -28,13 +103,14 @@ class CandidatoService:
             localidade=localidade
         )
 
-        self.repo.salvar(candidato)
-        return candidato
-
     def listar(self):
         ''' Lista todos os candidatos utilizando o repositório. Retorna uma lista de objetos Candidato.'''
         return self.repo.listar()
 
+    def paginar(self, limite: int = TAMANHO_PAGINA, cursor=None) -> Pagina:
+        ''' Retorna uma página de candidatos em ordem de ID. Passe o `proximo_cursor` da página anterior para obter a seguinte.'''
+        return self.repo.paginar(limite, cursor)
+
     def buscar_por_id(self, id_candidato: int):
         ''' Busca um candidato pelo ID utilizando o repositório. Se o candidato não for encontrado, uma exceção é levantada.'''
         candidato = self.repo.buscar_por_id(id_candidato)
@@ -65,12 +141,15 @@ class CandidatoService:
         candidato = self.buscar_por_id(id_candidato)
         candidato.atualizar_dado(campo, novo_valor)
         self.repo.atualizar(candidato)
+        self._notificar_salvos([candidato])
         return candidato
 
     def deletar(self, id_candidato: int):
         ''' Deleta um candidato identificado pelo ID. Se o candidato não for encontrado, uma exceção é levantada.'''
         self.buscar_por_id(id_candidato)
         self.repo.deletar(id_candidato)
+        for observador in self._observadores:
+            observador.candidato_removido(id_candidato)
 
     def buscar_por_cpf(self, cpf: str):
         '''Busca um candidato pelo CPF utilizando o repositório. Se o candidato não for encontrado, uma exceção é levantada.'''
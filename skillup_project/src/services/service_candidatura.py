@@ -1,8 +1,12 @@
-from typing import Optional
+from contextlib import nullcontext
+from typing import Callable, Optional
 from src.dominio.candidatura import Candidatura, StatusCandidatura, TipoVagaCandidatura
 from src.interfaces.interface_candidatura import ICandidaturaRepositorio
 from src.interfaces.interface_vaga import IVagaRepositorio
 from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.interfaces.interface_unidade_trabalho import IUnidadeDeTrabalho
+from src.interfaces.paginacao import Pagina, TAMANHO_PAGINA
 
 
 class CandidaturaService:
@@ -14,12 +18,23 @@ class CandidaturaService:
         repositorio: ICandidaturaRepositorio,
         repo_vaga_clt: Optional[IVagaRepositorio] = None,
         repo_vaga_estagio: Optional[IVagaRepositorio] = None,
-        repo_candidato: Optional[ICandidatoRepositorio] = None
+        repo_candidato: Optional[ICandidatoRepositorio] = None,
+        sequencia: Optional[ISequenciaIds] = None,
+        unidade_trabalho: Optional[Callable[[], IUnidadeDeTrabalho]] = None,
     ):
         self.repo = repositorio
         self._repo_vaga_clt = repo_vaga_clt
         self._repo_vaga_estagio = repo_vaga_estagio
         self._repo_candidato = repo_candidato
+        self._sequencia = sequencia
+        self._unidade_trabalho = unidade_trabalho
+
+    def _unidade(self):
+        """Unidade de trabalho de uma operação (sem fábrica, cada escrita grava sozinha)."""
+        return self._unidade_trabalho() if self._unidade_trabalho else nullcontext()
+
+    def _maior_id(self) -> int:
+        return max((c.id for c in self.repo.listar_todas()), default=0)
 
     # ==========================================
     # CRUD
@@ -33,44 +48,47 @@ class CandidaturaService:
         status: str = "Enviado"
     ):
         """Cadastra uma nova candidatura. Valida duplicidade e integridade referencial."""
-        # Validação de integridade referencial: candidato deve existir
-        if self._repo_candidato:
-            candidato = self._repo_candidato.buscar_por_id(id_candidato)
-            if not candidato:
-                raise ValueError(f"Candidato com ID {id_candidato} não encontrado.")
+        with self._unidade():
+            # Validação de integridade referencial: candidato deve existir
+            if self._repo_candidato:
+                candidato = self._repo_candidato.buscar_por_id(id_candidato)
+                if not candidato:
+                    raise ValueError(f"Candidato com ID {id_candidato} não encontrado.")
         
-        # Validação de integridade referencial: vaga deve existir no repositório correto
-        if tipo_vaga == TipoVagaCandidatura.CLT and self._repo_vaga_clt:
-            vaga = self._repo_vaga_clt.buscar_por_id(id_vaga)
-            if not vaga:
-                raise ValueError(f"Vaga CLT com ID {id_vaga} não encontrada.")
-            if not vaga.ativa:
-                raise ValueError("Não é possível se candidatar a uma vaga inativa.")
-        elif tipo_vaga == TipoVagaCandidatura.ESTAGIO and self._repo_vaga_estagio:
-            vaga = self._repo_vaga_estagio.buscar_por_id(id_vaga)
-            if not vaga:
-                raise ValueError(f"Vaga de Estágio com ID {id_vaga} não encontrada.")
-            if not vaga.ativa:
-                raise ValueError("Não é possível se candidatar a uma vaga inativa.")
+            # Validação de integridade referencial: vaga deve existir no repositório correto
+            if tipo_vaga == TipoVagaCandidatura.CLT and self._repo_vaga_clt:
+                vaga = self._repo_vaga_clt.buscar_por_id(id_vaga)
+                if not vaga:
+                    raise ValueError(f"Vaga CLT com ID {id_vaga} não encontrada.")
+                if not vaga.ativa:
+                    raise ValueError("Não é possível se candidatar a uma vaga inativa.")
+            elif tipo_vaga == TipoVagaCandidatura.ESTAGIO and self._repo_vaga_estagio:
+                vaga = self._repo_vaga_estagio.buscar_por_id(id_vaga)
+                if not vaga:
+                    raise ValueError(f"Vaga de Estágio com ID {id_vaga} não encontrada.")
+                if not vaga.ativa:
+                    raise ValueError("Não é possível se candidatar a uma vaga inativa.")
         
-        # Verifica duplicidade considerando tipo_vaga
-        existentes = self.repo.listar_por_candidato(id_candidato)
-        if any(c.id_vaga == id_vaga and c.tipo_vaga == tipo_vaga for c in existentes):
-            raise ValueError("Candidato já possui candidatura para esta vaga")
-
-        todas = self.repo.listar_todas()
-        novo_id = 1 if not todas else max(c.id for c in todas) + 1
-
-        candidatura = Candidatura(
-            id=novo_id,
-            id_vaga=id_vaga,
-            tipo_vaga=tipo_vaga,
-            id_candidato=id_candidato,
-            status=StatusCandidatura(status),
-        )
-
-        self.repo.salvar(candidatura)
-        return candidatura
+            # Verifica duplicidade considerando tipo_vaga
+            existentes = self.repo.listar_por_candidato(id_candidato)
+            if any(c.id_vaga == id_vaga and c.tipo_vaga == tipo_vaga for c in existentes):
+                raise ValueError("Candidato já possui candidatura para esta vaga")
+
+            if self._sequencia:
+                novo_id = self._sequencia.proximo("candidatura", self._maior_id)
+            else:
+                novo_id = self._maior_id() + 1
+
+            candidatura = Candidatura(
+                id=novo_id,
+                id_vaga=id_vaga,
+                tipo_vaga=tipo_vaga,
+                id_candidato=id_candidato,
+                status=StatusCandidatura(status),
+            )
+
+            self.repo.salvar(candidatura)
+            return candidatura
 
     def listar_todas(self):
         """Lista todas as candidaturas."""
@@ -104,6 +122,10 @@ class CandidaturaService:
         """Retorna todas as candidaturas com um status específico."""
         return self.repo.listar_por_status(status)
 
+    def paginar(self, limite: int = TAMANHO_PAGINA, cursor=None, **filtro) -> Pagina:
+        """Página de candidaturas por ID; filtros: id_candidato, id_vaga ou status."""
+        return self.repo.paginar(limite, cursor, **filtro)
+
     # ==========================================
     # CONTAGEM
     # ==========================================
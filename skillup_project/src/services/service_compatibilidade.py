@@ -0,0 +1,237 @@
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.dominio.requisitos_vaga import TipoVagaRequisito
+from src.dominio.vaga import Vaga, VagaEstagio
+from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
+
+
+# ==============================
+# PESOS DE COMPATIBILIDADE
+# ==============================
+
+class PesoCompatibilidade(IntEnum):
+    """Pesos de cada tipo de requisito no índice de compatibilidade.
+
+    Quando a vaga só tem requisitos de um tipo, o índice é a cobertura desse tipo.
+    """
+    OBRIGATORIO = 70
+    OPCIONAL = 30
+
+
+# Nível atribuído a uma competência que o candidato não possui
+# (um abaixo de INICIANTE, para que a falta pese mais que qualquer nível)
+NIVEL_AUSENTE = -1
+# Maior lacuna possível: requisito AVANCADO (2) e competência ausente (-1)
+LACUNA_MAXIMA = 3
+
+
+# ==============================
+# ESTRUTURAS PRÉ-CALCULADAS
+# ==============================
+
+# (id_competencia, nível mínimo como inteiro, obrigatório)
+ItemRequisito = Tuple[int, int, bool]
+# Requisitos de uma vaga; chave: (tipo de vaga, id da vaga)
+ChaveVaga = Tuple[TipoVagaRequisito, int]
+# Perfil de um candidato: id_competencia -> nível como inteiro
+Perfil = Dict[int, int]
+# Índice invertido: id_competencia -> {id_candidato: nível como inteiro}
+IndiceInvertido = Dict[int, Dict[int, int]]
+
+
+@dataclass(frozen=True, slots=True)
+class Compatibilidade:
+    """Resultado da comparação entre os requisitos de uma vaga e um perfil."""
+    indice: float                 # 0.0 a 1.0, ponderado pelos pesos acima
+    cobertura_obrigatorios: float  # 0.0 a 1.0 (1.0 se a vaga não tiver obrigatórios)
+    cobertura_opcionais: float     # 0.0 a 1.0 (1.0 se a vaga não tiver opcionais)
+    atende_obrigatorios: bool      # todos os obrigatórios no nível mínimo ou acima
+    faltantes: Tuple[int, ...] = ()  # competências obrigatórias abaixo do nível
+
+    @property
+    def percentual(self) -> int:
+        return round(self.indice * 100)
+
+
+SEM_REQUISITOS = Compatibilidade(1.0, 1.0, 1.0, True)
+
+
+# ==============================
+# MOTOR DE COMPATIBILIDADE
+# ==============================
+
+class MotorCompatibilidade:
+    """Compara requisitos de vagas com as competências dos candidatos.
+
+    Os requisitos de todas as vagas são lidos de uma vez e agrupados em
+    vetores por vaga; o perfil do candidato vira um dicionário
+    competência -> nível. Pontuar uma vaga é então só percorrer o vetor
+    dela, sem novas consultas aos repositórios.
+
+    Para cada requisito, o crédito é proporcional à lacuna de nível:
+    crédito = 1 - lacuna / LACUNA_MAXIMA, com lacuna = max(0, mínimo - nível).
+    """
+
+    def __init__(
+        self,
+        repo_requisito: IRequisitoVagaRepositorio,
+        repo_competencia_candidato: ICompetenciaCandidatoRepositorio,
+    ):
+        self._repo_requisito = repo_requisito
+        self._repo_competencia_candidato = repo_competencia_candidato
+        self._lock = threading.Lock()
+        self._vetores: Optional[Dict[ChaveVaga, Tuple[ItemRequisito, ...]]] = None
+        self._versao_vetores = None
+
+    # ------------------------------------------------------------------
+    # Pré-cálculo
+    # ------------------------------------------------------------------
+
+    def vetores_requisitos(self) -> Dict[ChaveVaga, Tuple[ItemRequisito, ...]]:
+        """Requisitos cadastrados agrupados por vaga.
+
+        O dicionário é compartilhado entre as chamadas e não deve ser alterado;
+        é remontado (uma passada pelo repositório) quando a versão dos
+        requisitos muda, ou a cada chamada se o repositório não informa versão.
+        """
+        versao = self._repo_requisito.versao()
+        with self._lock:
+            if self._vetores is None or versao is None or versao != self._versao_vetores:
+                self._vetores = self._agrupar_requisitos()
+                self._versao_vetores = versao
+            return self._vetores
+
+    def invalidar_requisitos(self) -> None:
+        """Descarta os vetores guardados; a próxima chamada relê o repositório."""
+        with self._lock:
+            self._vetores = None
+
+    def _agrupar_requisitos(self) -> Dict[ChaveVaga, Tuple[ItemRequisito, ...]]:
+        grupos: Dict[ChaveVaga, List[ItemRequisito]] = defaultdict(list)
+        for r in self._repo_requisito.iterar():
+            grupos[(r.tipo_vaga, r.id_vaga)].append(
+                (r.id_competencia, r.nivel_como_inteiro(), r.obrigatorio)
+            )
+        return {chave: tuple(itens) for chave, itens in grupos.items()}
+
+    def versao(self) -> Tuple[Any, Any]:
+        """Versões dos repositórios de requisitos e de competências (ver Versionado)."""
+        return self._repo_requisito.versao(), self._repo_competencia_candidato.versao()
+
+    def perfil(self, id_candidato: int) -> Perfil:
+        """Competências do candidato como {id_competencia: nível}."""
+        return {
+            c.id_competencia: c.nivel_como_inteiro()
+            for c in self._repo_competencia_candidato.listar_por_candidato(id_candidato)
+        }
+
+    def perfis(self) -> Dict[int, Perfil]:
+        """Perfis de todos os candidatos (uma passada pelo repositório)."""
+        perfis: Dict[int, Perfil] = defaultdict(dict)
+        for c in self._repo_competencia_candidato.iterar():
+            perfis[c.id_candidato][c.id_competencia] = c.nivel_como_inteiro()
+        return dict(perfis)
+
+    def requisitos_da_vaga(self, vaga: Vaga) -> Tuple[ItemRequisito, ...]:
+        """Vetor de requisitos de uma única vaga."""
+        tipo, id_vaga = self.chave_vaga(vaga)
+        return tuple(
+            (r.id_competencia, r.nivel_como_inteiro(), r.obrigatorio)
+            for r in self._repo_requisito.listar_por_vaga(id_vaga)
+            if r.tipo_vaga == tipo
+        )
+
+    def indice_invertido(self, ids_competencia: Iterable[int]) -> IndiceInvertido:
+        """Candidatos que possuem cada competência, com o nível de cada um.
+
+        Só as competências pedidas são lidas, então o custo depende de quantos
+        candidatos têm essas competências e não do total de candidatos.
+        """
+        return {
+            id_competencia: {
+                c.id_candidato: c.nivel_como_inteiro()
+                for c in self._repo_competencia_candidato.listar_por_competencia(id_competencia)
+            }
+            for id_competencia in set(ids_competencia)
+        }
+
+    @staticmethod
+    def perfil_no_indice(id_candidato: int, indice: IndiceInvertido) -> Perfil:
+        """Perfil do candidato restrito às competências do índice invertido."""
+        return {
+            id_competencia: candidatos[id_candidato]
+            for id_competencia, candidatos in indice.items()
+            if id_candidato in candidatos
+        }
+
+    @staticmethod
+    def chave_vaga(vaga: Vaga) -> ChaveVaga:
+        tipo = TipoVagaRequisito.ESTAGIO if isinstance(vaga, VagaEstagio) else TipoVagaRequisito.CLT
+        return (tipo, vaga.id)
+
+    # ------------------------------------------------------------------
+    # Pontuação
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def pontuar(requisitos: Iterable[ItemRequisito], perfil: Perfil) -> Compatibilidade:
+        """Calcula a compatibilidade de um perfil com um vetor de requisitos."""
+        peso_obrig = credito_obrig = 0.0
+        peso_opc = credito_opc = 0.0
+        faltantes: List[int] = []
+
+        for id_competencia, nivel_minimo, obrigatorio in requisitos:
+            lacuna = nivel_minimo - perfil.get(id_competencia, NIVEL_AUSENTE)
+            credito = 1.0 if lacuna <= 0 else 1.0 - lacuna / LACUNA_MAXIMA
+            if obrigatorio:
+                peso_obrig += 1
+                credito_obrig += credito
+                if lacuna > 0:
+                    faltantes.append(id_competencia)
+            else:
+                peso_opc += 1
+                credito_opc += credito
+
+        if not peso_obrig and not peso_opc:
+            return SEM_REQUISITOS
+
+        cobertura_obrig = credito_obrig / peso_obrig if peso_obrig else 1.0
+        cobertura_opc = credito_opc / peso_opc if peso_opc else 1.0
+        # Só os tipos de requisito presentes na vaga entram na média
+        peso_total = pontos = 0
+        if peso_obrig:
+            peso_total += PesoCompatibilidade.OBRIGATORIO
+            pontos += PesoCompatibilidade.OBRIGATORIO * cobertura_obrig
+        if peso_opc:
+            peso_total += PesoCompatibilidade.OPCIONAL
+            pontos += PesoCompatibilidade.OPCIONAL * cobertura_opc
+        indice = pontos / peso_total
+        return Compatibilidade(
+            indice=indice,
+            cobertura_obrigatorios=cobertura_obrig,
+            cobertura_opcionais=cobertura_opc,
+            atende_obrigatorios=not faltantes,
+            faltantes=tuple(faltantes),
+        )
+
+    def ranquear_vagas(
+        self,
+        id_candidato: int,
+        vagas: Iterable[Vaga],
+        vetores: Optional[Dict[ChaveVaga, Tuple[ItemRequisito, ...]]] = None,
+    ) -> List[Tuple[Vaga, Compatibilidade]]:
+        """Pontua as vagas para o candidato em uma passada, maior índice primeiro."""
+        if vetores is None:
+            vetores = self.vetores_requisitos()
+        perfil = self.perfil(id_candidato)
+        resultado = [
+            (vaga, self.pontuar(vetores.get(self.chave_vaga(vaga), ()), perfil))
+            for vaga in vagas
+        ]
+        resultado.sort(key=lambda par: par[1].indice, reverse=True)
+        return resultado
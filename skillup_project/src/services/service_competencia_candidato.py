@@ -1,13 +1,35 @@
+from typing import Optional, Sequence
+
 from src.dominio.competencia_candidato import CompetenciaCandidato
 from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
 
 
 class CompetenciaCandidatoService:
     """Serviço de domínio para gerenciamento de competências de candidatos.
     Contém a lógica de negócio e validações relacionadas às competências dos candidatos."""
 
-    def __init__(self, repositorio: ICompetenciaCandidatoRepositorio):
+    def __init__(
+        self,
+        repositorio: ICompetenciaCandidatoRepositorio,
+        observadores: Sequence[IObservadorCandidato] = (),
+        sequencia: Optional[ISequenciaIds] = None,
+    ):
         self.repo = repositorio
+        self._observadores = list(observadores)
+        self._sequencia = sequencia
+
+    def _maior_id(self) -> int:
+        return max((c.id for c in self.repo.listar_todas()), default=0)
+
+    def adicionar_observador(self, observador: IObservadorCandidato) -> None:
+        """Registra um observador avisado após cada mudança nas competências de um candidato."""
+        self._observadores.append(observador)
+
+    def _notificar(self, id_candidato: int) -> None:
+        for observador in self._observadores:
+            observador.competencias_alteradas([id_candidato])
 
     # ==========================================
     # CRUD
@@ -19,8 +41,10 @@ class CompetenciaCandidatoService:
         if existente:
             raise ValueError("Candidato já possui esta competência cadastrada")
 
-        todas = self.repo.listar_todas()
-        novo_id = 1 if not todas else max(c.id for c in todas) + 1
+        if self._sequencia:
+            novo_id = self._sequencia.proximo("competencia_candidato", self._maior_id)
+        else:
+            novo_id = self._maior_id() + 1
 
         comp_candidato = CompetenciaCandidato(
             id=novo_id,
@@ -30,6 +54,7 @@ class CompetenciaCandidatoService:
         )
 
         self.repo.salvar(comp_candidato)
+        self._notificar(id_candidato)
         return comp_candidato
 
     def listar_todas(self):
@@ -72,18 +97,23 @@ class CompetenciaCandidatoService:
         comp = self.buscar_por_id(id_competencia_candidato)
         comp.atualizar_nivel(novo_nivel)
         self.repo.atualizar(comp)
+        self._notificar(comp.id_candidato)
         return comp
 
     def remover(self, id_competencia_candidato: int):
         """Remove uma competência do candidato pelo ID."""
-        self.buscar_por_id(id_competencia_candidato)
+        comp = self.buscar_por_id(id_competencia_candidato)
         removido = self.repo.remover_por_id(id_competencia_candidato)
         if not removido:
             raise ValueError("Falha ao remover competência do candidato")
+        self._notificar(comp.id_candidato)
 
     def remover_por_candidato(self, id_candidato: int):
         """Remove todas as competências de um candidato."""
-        return self.repo.remover_por_candidato(id_candidato)
+        removidas = self.repo.remover_por_candidato(id_candidato)
+        if removidas:
+            self._notificar(id_candidato)
+        return removidas
 
     # ==========================================
     # FORMATAÇÃO
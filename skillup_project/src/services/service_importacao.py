@@ -0,0 +1,303 @@
+"""
+Importação em massa de cadastros a partir de arquivos CSV ou JSONL.
+
+O arquivo é lido linha a linha. Cada linha passa pelos validadores do domínio,
+pelas referências (empresa, instituição) e pelas chaves únicas, mantidas em
+conjuntos na memória; as linhas aceitas são gravadas em lotes com
+`salvar_muitos`. As linhas recusadas vão para um arquivo de rejeitados.
+"""
+
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+from src.dominio.candidato import CandidatoMapper
+from src.dominio.empresa import EmpresaMapper
+from src.dominio.validators import (
+    CnpjValidador,
+    CpfValidador,
+    EmailValidador,
+    IdValidador,
+    PorteValidador,
+    Validador,
+)
+from src.dominio.vaga import VagaCLTMapper, VagaEstagioMapper
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.interfaces.paginacao import Paginavel
+
+# Linhas gravadas por chamada a salvar_muitos
+TAMANHO_LOTE_IMPORTACAO = 5000
+
+# ID usado só para validar a entidade; o definitivo é atribuído ao gravar o lote
+_ID_PROVISORIO = 1
+
+
+# ==========================================
+# Conversões das colunas de CSV
+# ==========================================
+
+def _lista(texto: str) -> List[str]:
+    """Lista separada por ponto e vírgula: "TI;Dados"."""
+    return [parte.strip() for parte in texto.split(";") if parte.strip()]
+
+
+def _booleano(texto: str) -> bool:
+    valor = texto.strip().lower()
+    if valor in ("1", "true", "sim", "s"):
+        return True
+    if valor in ("0", "false", "nao", "não", "n"):
+        return False
+    raise ValueError(f"Valor booleano inválido: {texto!r}")
+
+
+# ==========================================
+# Avisos aos observadores, um por lote gravado
+# ==========================================
+
+def _avisar_candidatos(observador, lote: List[Any]) -> None:
+    observador.candidatos_salvos(lote)
+
+
+def _avisar_vagas(observador, lote: List[Any]) -> None:
+    observador.vagas_salvas(lote)
+
+
+# ==========================================
+# Tipos importáveis
+# ==========================================
+
+@dataclass(frozen=True)
+class TipoImportacao:
+    """Como importar uma entidade: mapper, conversões do CSV, validações e chaves únicas."""
+    entidade: str       # nome da entidade na sequência de IDs
+    mapper: Any         # *Mapper com from_dict
+    conversores: Mapping[str, Callable[[str], Any]] = field(default_factory=dict)
+    validadores: Mapping[str, Validador] = field(default_factory=dict)
+    unicos: Tuple[str, ...] = ()
+    # campo -> nome do repositório referenciado (ver ImportadorService)
+    referencias: Mapping[str, str] = field(default_factory=dict)
+    # Como avisar um observador (IObservadorCandidato, IObservadorVaga) de um lote gravado
+    avisar: Optional[Callable[[Any, List[Any]], None]] = None
+
+
+_CONVERSORES_VAGA = {
+    "id_empresa": int,
+    "requisitos": _lista,
+    "ativa": _booleano,
+}
+
+TIPOS_IMPORTACAO: Dict[str, TipoImportacao] = {
+    "candidatos": TipoImportacao(
+        entidade="candidato",
+        mapper=CandidatoMapper,
+        conversores={"areas_interesse": _lista},
+        validadores={"cpf": CpfValidador(), "email": EmailValidador()},
+        unicos=("cpf", "email"),
+        avisar=_avisar_candidatos,
+    ),
+    "empresas": TipoImportacao(
+        entidade="empresa",
+        mapper=EmpresaMapper,
+        validadores={"cnpj": CnpjValidador(), "porte": PorteValidador()},
+        unicos=("cnpj",),
+    ),
+    "vagas_clt": TipoImportacao(
+        entidade="vaga_clt",
+        mapper=VagaCLTMapper,
+        conversores={**_CONVERSORES_VAGA, "salario_base": float},
+        validadores={"id_empresa": IdValidador()},
+        referencias={"id_empresa": "empresa"},
+        avisar=_avisar_vagas,
+    ),
+    "vagas_estagio": TipoImportacao(
+        entidade="vaga_estagio",
+        mapper=VagaEstagioMapper,
+        conversores={**_CONVERSORES_VAGA, "bolsa_auxilio": float, "id_instituicao_conveniada": int},
+        validadores={"id_empresa": IdValidador(), "id_instituicao_conveniada": IdValidador()},
+        referencias={"id_empresa": "empresa", "id_instituicao_conveniada": "instituicao"},
+        avisar=_avisar_vagas,
+    ),
+}
+
+
+@dataclass
+class EstatisticasImportacao:
+    """Resumo de uma importação."""
+    lidas: int = 0
+    importadas: int = 0
+    rejeitadas: int = 0
+    lotes: int = 0
+    segundos: float = 0.0
+    arquivo_rejeitados: Optional[str] = None
+
+    @property
+    def linhas_por_segundo(self) -> float:
+        return self.lidas / self.segundos if self.segundos > 0 else 0.0
+
+
+class ImportadorService:
+    ''' Importa em massa os cadastros de um TipoImportacao para o repositório.
+    `referencias` liga os nomes usados em TipoImportacao.referencias aos repositórios
+    (ex.: {"empresa": repo_empresa}); referências sem repositório não são checadas.
+    Passe a mesma `sequencia` e os mesmos `observadores` dos services da entidade:
+    os IDs importados não se repetem nos cadastros feitos por eles, e cada lote
+    gravado gera um aviso (ver TipoImportacao.avisar), como as escritas em lote dos services.'''
+
+    def __init__(
+        self,
+        tipo: TipoImportacao,
+        repositorio: Paginavel,
+        sequencia: Optional[ISequenciaIds] = None,
+        referencias: Optional[Mapping[str, Paginavel]] = None,
+        tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO,
+        observadores: Sequence[Any] = (),
+    ):
+        if tamanho_lote < 1:
+            raise ValueError("O tamanho do lote deve ser maior ou igual a 1")
+        self.tipo = tipo
+        self.repo = repositorio
+        self._sequencia = sequencia
+        self._referencias = dict(referencias or {})
+        self._tamanho_lote = tamanho_lote
+        self._observadores = list(observadores) if tipo.avisar else []
+        self._maior_id = 0
+        self._chaves: Dict[str, Set[Any]] = {}
+        self._ids_referenciados: Dict[str, Set[int]] = {}
+
+    def importar(self, caminho: str, caminho_rejeitados: Optional[str] = None) -> EstatisticasImportacao:
+        """
+        Importa um arquivo .csv (com cabeçalho) ou .jsonl (um objeto por linha).
+        param caminho: Arquivo de entrada.
+        param caminho_rejeitados: Onde gravar as linhas recusadas, em JSONL
+            (padrão: <arquivo>.rejeitados.jsonl).
+        return: EstatisticasImportacao com as contagens e a vazão.
+        Lotes já gravados permanecem se a gravação de um lote falhar.
+        """
+        formato = os.path.splitext(caminho)[1].lower()
+        if formato not in (".csv", ".jsonl"):
+            raise ValueError("Formato não suportado. Use um arquivo .csv ou .jsonl")
+        preparar = self._preparar_csv if formato == ".csv" else self._preparar_jsonl
+        caminho_rejeitados = caminho_rejeitados or os.path.splitext(caminho)[0] + ".rejeitados.jsonl"
+
+        inicio = time.perf_counter()
+        estatisticas = EstatisticasImportacao(arquivo_rejeitados=caminho_rejeitados)
+        self._carregar_chaves()
+
+        lote = []
+        with open(caminho, "r", encoding="utf-8", newline="") as entrada, \
+                open(caminho_rejeitados, "w", encoding="utf-8") as rejeitados:
+            linhas = self._ler_csv(entrada) if formato == ".csv" else self._ler_jsonl(entrada)
+            for numero, bruto in linhas:
+                estatisticas.lidas += 1
+                try:
+                    lote.append(self._validar(preparar(bruto)))
+                except (KeyError, TypeError, ValueError) as erro:
+                    estatisticas.rejeitadas += 1
+                    registro = {"linha": numero, "erro": self._mensagem(erro), "dados": bruto}
+                    rejeitados.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                    continue
+                if len(lote) >= self._tamanho_lote:
+                    self._gravar(lote, estatisticas)
+                    lote = []
+            if lote:
+                self._gravar(lote, estatisticas)
+
+        estatisticas.segundos = time.perf_counter() - inicio
+        return estatisticas
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _ler_csv(arquivo) -> Iterator[Tuple[int, dict]]:
+        leitor = csv.DictReader(arquivo)
+        for linha in leitor:
+            yield leitor.line_num, linha
+
+    @staticmethod
+    def _ler_jsonl(arquivo) -> Iterator[Tuple[int, str]]:
+        for numero, texto in enumerate(arquivo, start=1):
+            texto = texto.strip()
+            if texto:
+                yield numero, texto
+
+    def _preparar_csv(self, linha: dict) -> dict:
+        # Colunas vazias ficam de fora para valerem os padrões do mapper
+        dados = {}
+        for campo, texto in linha.items():
+            if campo is None or texto is None or not texto.strip():
+                continue
+            conversor = self.tipo.conversores.get(campo)
+            dados[campo] = conversor(texto) if conversor else texto.strip()
+        return dados
+
+    @staticmethod
+    def _preparar_jsonl(texto: str) -> dict:
+        dados = json.loads(texto)
+        if not isinstance(dados, dict):
+            raise ValueError("Cada linha deve conter um objeto JSON")
+        return dados
+
+    # ------------------------------------------------------------------
+    # Validação
+    # ------------------------------------------------------------------
+
+    def _carregar_chaves(self) -> None:
+        """Lê uma vez o repositório para o maior ID, as chaves únicas e os IDs referenciados."""
+        self._maior_id = 0
+        self._chaves = {campo: set() for campo in self.tipo.unicos}
+        for entidade in self.repo.iterar():
+            self._maior_id = max(self._maior_id, entidade.id)
+            for campo, valores in self._chaves.items():
+                valores.add(getattr(entidade, campo))
+        self._ids_referenciados = {
+            campo: {entidade.id for entidade in self._referencias[nome].iterar()}
+            for campo, nome in self.tipo.referencias.items()
+            if nome in self._referencias
+        }
+
+    def _validar(self, dados: dict):
+        for campo, validador in self.tipo.validadores.items():
+            if dados.get(campo) is not None:
+                validador.validar(dados[campo])
+        for campo, ids in self._ids_referenciados.items():
+            if dados.get(campo) is not None and dados[campo] not in ids:
+                raise ValueError(f"{campo} {dados[campo]} não encontrado")
+        for campo, valores in self._chaves.items():
+            if dados.get(campo) in valores:
+                raise ValueError(f"Já existe cadastro com este {campo}: {dados[campo]}")
+
+        entidade = self.tipo.mapper.from_dict({**dados, "id": _ID_PROVISORIO})
+        for campo, valores in self._chaves.items():
+            valores.add(getattr(entidade, campo))
+        return entidade
+
+    @staticmethod
+    def _mensagem(erro: Exception) -> str:
+        if isinstance(erro, KeyError):
+            return f"Campo obrigatório ausente: {erro.args[0]}"
+        return str(erro)
+
+    # ------------------------------------------------------------------
+    # Gravação
+    # ------------------------------------------------------------------
+
+    def _gravar(self, lote: List[Any], estatisticas: EstatisticasImportacao) -> None:
+        for entidade, novo_id in zip(lote, self._reservar_ids(len(lote))):
+            entidade.id = novo_id
+        self.repo.salvar_muitos(lote)
+        for observador in self._observadores:
+            self.tipo.avisar(observador, lote)
+        self._maior_id = max(self._maior_id, lote[-1].id)
+        estatisticas.importadas += len(lote)
+        estatisticas.lotes += 1
+
+    def _reservar_ids(self, quantidade: int) -> range:
+        if self._sequencia:
+            return self._sequencia.reservar(self.tipo.entidade, quantidade, lambda: self._maior_id)
+        inicio = self._maior_id + 1
+        return range(inicio, inicio + quantidade)
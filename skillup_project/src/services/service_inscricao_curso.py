@@ -1,5 +1,6 @@
+from contextlib import nullcontext
 from datetime import date
-from typing import Optional, List
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from src.dominio.candidato import Candidato
 from src.dominio.curso_abs import Curso
@@ -7,10 +8,14 @@ from src.dominio.curso_presencial import CursoPresencial
 from src.dominio.inscricao_curso import InscricaoCurso, StatusInscricao, TipoCursoInscricao
 from src.dominio.competencia_candidato import CompetenciaCandidato
 from src.interfaces.interface_inscricao_curso import IInscricaoCursoRepositorio
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
 from src.interfaces.interface_curso import ICursoRepositorio
 from src.interfaces.interface_candidato import ICandidatoRepositorio
 from src.interfaces.interface_curso_competencia import ICursoCompetenciaRepositorio
 from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.interfaces.interface_unidade_trabalho import IUnidadeDeTrabalho
+from src.interfaces.paginacao import Pagina, TAMANHO_PAGINA
 
 
 class InscricaoCursoService:
@@ -33,6 +38,9 @@ class InscricaoCursoService:
         repo_candidato: Optional[ICandidatoRepositorio] = None,
         repo_curso_competencia: Optional[ICursoCompetenciaRepositorio] = None,
         repo_competencia_candidato: Optional[ICompetenciaCandidatoRepositorio] = None,
+        sequencia: Optional[ISequenciaIds] = None,
+        unidade_trabalho: Optional[Callable[[], IUnidadeDeTrabalho]] = None,
+        observadores: Sequence[IObservadorCandidato] = (),
     ):
         self._repo_inscricao = repo_inscricao
         self._repo_curso_ead = repo_curso_ead
@@ -40,6 +48,32 @@ class InscricaoCursoService:
         self._repo_candidato = repo_candidato
         self._repo_curso_competencia = repo_curso_competencia
         self._repo_competencia_candidato = repo_competencia_candidato
+        self._sequencia = sequencia
+        self._unidade_trabalho = unidade_trabalho
+        self._observadores = list(observadores)
+
+    def adicionar_observador(self, observador: IObservadorCandidato) -> None:
+        """Registra um observador avisado quando a conclusão de cursos muda competências de candidatos."""
+        self._observadores.append(observador)
+
+    def _notificar_competencias(self, ids_candidatos: Iterable[int]) -> None:
+        """Avisa os observadores depois que a unidade de trabalho foi confirmada."""
+        ids_candidatos = sorted(set(ids_candidatos))
+        for observador in self._observadores:
+            observador.competencias_alteradas(ids_candidatos)
+
+    def _unidade(self):
+        """Unidade de trabalho de uma operação (sem fábrica, cada escrita grava sozinha)."""
+        return self._unidade_trabalho() if self._unidade_trabalho else nullcontext()
+
+    def _novo_id(self, entidade: str, listar) -> int:
+        """Próximo ID da entidade: pela sequência, ou maior ID de `listar()` + 1."""
+        def maior_id() -> int:
+            return max((r.id for r in listar()), default=0)
+
+        if self._sequencia:
+            return self._sequencia.proximo(entidade, maior_id)
+        return maior_id() + 1
 
     def _buscar_curso(self, id_curso: int, tipo_curso: TipoCursoInscricao) -> Optional[Curso]:
         """Busca curso no repositório correto baseado no tipo."""
@@ -56,46 +90,46 @@ class InscricaoCursoService:
         tipo_curso: TipoCursoInscricao
     ) -> InscricaoCurso:
         """Inscreve um candidato em um curso, validando todas as regras de negócio."""
-        # 1. Buscar curso no repositório correto
-        curso = self._buscar_curso(id_curso, tipo_curso)
-        if not curso:
-            raise ValueError(f"Curso {tipo_curso.value} com ID {id_curso} não encontrado.")
-
-        if not curso.ativo:
-            raise ValueError("Curso não está ativo para inscrições.")
-
-        # 2. Buscar candidato
-        if self._repo_candidato:
-            candidato = self._repo_candidato.buscar_por_id(id_candidato)
-            if not candidato:
-                raise ValueError(f"Candidato com ID {id_candidato} não encontrado.")
-        else:
-            candidato = None
-
-        # 3. Verificar duplicidade considerando tipo_curso
-        inscricoes_aluno = self._repo_inscricao.listar_por_aluno(id_candidato)
-        if any(i.id_curso == id_curso and i.tipo_curso == tipo_curso for i in inscricoes_aluno):
-            raise ValueError("Candidato já está inscrito neste curso.")
-
-        # 4. Regra de localidade para cursos presenciais
-        if tipo_curso == TipoCursoInscricao.PRESENCIAL and isinstance(curso, CursoPresencial) and candidato:
-            self._validar_localidade(candidato, curso)
-
-        # 5. Gerar ID e criar inscrição
-        todas = self._repo_inscricao.listar_todas()
-        novo_id = 1 if not todas else max(i.id for i in todas) + 1
-
-        inscricao = InscricaoCurso(
-            id=novo_id,
-            id_curso=id_curso,
-            tipo_curso=tipo_curso,
-            id_aluno=id_candidato,
-            data_inscricao=date.today(),
-            status=StatusInscricao.DEFERIDO,
-        )
-
-        self._repo_inscricao.salvar(inscricao)
-        return inscricao
+        with self._unidade():
+            # 1. Buscar curso no repositório correto
+            curso = self._buscar_curso(id_curso, tipo_curso)
+            if not curso:
+                raise ValueError(f"Curso {tipo_curso.value} com ID {id_curso} não encontrado.")
+
+            if not curso.ativo:
+                raise ValueError("Curso não está ativo para inscrições.")
+
+            # 2. Buscar candidato
+            if self._repo_candidato:
+                candidato = self._repo_candidato.buscar_por_id(id_candidato)
+                if not candidato:
+                    raise ValueError(f"Candidato com ID {id_candidato} não encontrado.")
+            else:
+                candidato = None
+
+            # 3. Verificar duplicidade considerando tipo_curso
+            inscricoes_aluno = self._repo_inscricao.listar_por_aluno(id_candidato)
+            if any(i.id_curso == id_curso and i.tipo_curso == tipo_curso for i in inscricoes_aluno):
+                raise ValueError("Candidato já está inscrito neste curso.")
+
+            # 4. Regra de localidade para cursos presenciais
+            if tipo_curso == TipoCursoInscricao.PRESENCIAL and isinstance(curso, CursoPresencial) and candidato:
+                self._validar_localidade(candidato, curso)
+
+            # 5. Gerar ID e criar inscrição
+            novo_id = self._novo_id("inscricao_curso", self._repo_inscricao.listar_todas)
+
+            inscricao = InscricaoCurso(
+                id=novo_id,
+                id_curso=id_curso,
+                tipo_curso=tipo_curso,
+                id_aluno=id_candidato,
+                data_inscricao=date.today(),
+                status=StatusInscricao.DEFERIDO,
+            )
+
+            self._repo_inscricao.salvar(inscricao)
+            return inscricao
 
     def listar_por_candidato(self, id_candidato: int):
         """Lista todas as inscrições de um candidato."""
@@ -105,6 +139,10 @@ class InscricaoCursoService:
         """Lista todas as inscrições em um curso."""
         return self._repo_inscricao.listar_por_curso(id_curso)
 
+    def paginar(self, limite: int = TAMANHO_PAGINA, cursor=None, **filtro) -> Pagina:
+        """Página de inscrições por ID; filtros: id_aluno, id_curso ou status."""
+        return self._repo_inscricao.paginar(limite, cursor, **filtro)
+
     def buscar_por_id(self, id_inscricao: int) -> InscricaoCurso:
         """Busca uma inscrição pelo ID. Lança ValueError se não encontrada."""
         inscricao = self._repo_inscricao.buscar_por_id(id_inscricao)
@@ -129,59 +167,63 @@ class InscricaoCursoService:
         Returns:
             Lista de CompetenciaCandidato criadas ou atualizadas.
         """
-        # 1. Buscar e validar inscrição
-        inscricao = self.buscar_por_id(id_inscricao)
-
-        if inscricao.status != StatusInscricao.DEFERIDO:
-            raise ValueError("Somente inscrições deferidas podem ser concluídas.")
+        with self._unidade():
+            # 1. Buscar e validar inscrição
+            inscricao = self.buscar_por_id(id_inscricao)
+
+            if inscricao.status != StatusInscricao.DEFERIDO:
+                raise ValueError("Somente inscrições deferidas podem ser concluídas.")
+
+            # 2. Verificar se os repositórios de competência estão disponíveis
+            if not self._repo_curso_competencia or not self._repo_competencia_candidato:
+                # Conclui sem atribuir competências (repositórios não configurados)
+                inscricao.concluir()
+                self._repo_inscricao.salvar(inscricao)
+                return []
+
+            # 3. Buscar competências do curso
+            competencias_curso = self._repo_curso_competencia.listar_por_curso(inscricao.id_curso)
+
+            competencias_criadas: List[CompetenciaCandidato] = []
+
+            # 4. Para cada competência do curso, criar ou atualizar competência do candidato
+            for comp_curso in competencias_curso:
+                # Verificar se candidato já possui essa competência
+                comp_existente = self._repo_competencia_candidato.buscar_por_candidato_e_competencia(
+                    inscricao.id_aluno, comp_curso.id_competencia
+                )
 
-        # 2. Verificar se os repositórios de competência estão disponíveis
-        if not self._repo_curso_competencia or not self._repo_competencia_candidato:
-            # Conclui sem atribuir competências (repositórios não configurados)
+                if comp_existente:
+                    # Atualizar nível se o novo for maior
+                    nivel_curso = self._nivel_para_int(comp_curso.nivel_conferido)
+                    nivel_atual = self._nivel_para_int(comp_existente.nivel_atual)
+
+                    if nivel_curso > nivel_atual:
+                        comp_existente.atualizar_nivel(comp_curso.nivel_conferido)
+                        self._repo_competencia_candidato.atualizar(comp_existente)
+                        competencias_criadas.append(comp_existente)
+                else:
+                    # Criar nova competência para o candidato
+                    novo_id = self._novo_id(
+                        "competencia_candidato", self._repo_competencia_candidato.listar_todas
+                    )
+
+                    nova_comp = CompetenciaCandidato(
+                        id=novo_id,
+                        id_candidato=inscricao.id_aluno,
+                        id_competencia=comp_curso.id_competencia,
+                        nivel_atual=comp_curso.nivel_conferido,
+                    )
+
+                    self._repo_competencia_candidato.salvar(nova_comp)
+                    competencias_criadas.append(nova_comp)
+
+            # 5. Marcar inscrição como concluída
             inscricao.concluir()
             self._repo_inscricao.salvar(inscricao)
-            return []
-
-        # 3. Buscar competências do curso
-        competencias_curso = self._repo_curso_competencia.listar_por_curso(inscricao.id_curso)
-
-        competencias_criadas: List[CompetenciaCandidato] = []
-
-        # 4. Para cada competência do curso, criar ou atualizar competência do candidato
-        for comp_curso in competencias_curso:
-            # Verificar se candidato já possui essa competência
-            comp_existente = self._repo_competencia_candidato.buscar_por_candidato_e_competencia(
-                inscricao.id_aluno, comp_curso.id_competencia
-            )
-
-            if comp_existente:
-                # Atualizar nível se o novo for maior
-                nivel_curso = self._nivel_para_int(comp_curso.nivel_conferido)
-                nivel_atual = self._nivel_para_int(comp_existente.nivel_atual)
-
-                if nivel_curso > nivel_atual:
-                    comp_existente.atualizar_nivel(comp_curso.nivel_conferido)
-                    self._repo_competencia_candidato.atualizar(comp_existente)
-                    competencias_criadas.append(comp_existente)
-            else:
-                # Criar nova competência para o candidato
-                todas = self._repo_competencia_candidato.listar_todas()
-                novo_id = 1 if not todas else max(c.id for c in todas) + 1
-
-                nova_comp = CompetenciaCandidato(
-                    id=novo_id,
-                    id_candidato=inscricao.id_aluno,
-                    id_competencia=comp_curso.id_competencia,
-                    nivel_atual=comp_curso.nivel_conferido,
-                )
-
-                self._repo_competencia_candidato.salvar(nova_comp)
-                competencias_criadas.append(nova_comp)
-
-        # 5. Marcar inscrição como concluída
-        inscricao.concluir()
-        self._repo_inscricao.salvar(inscricao)
 
+        if competencias_criadas:
+            self._notificar_competencias([inscricao.id_aluno])
         return competencias_criadas
 
     @staticmethod
@@ -195,7 +237,8 @@ class InscricaoCursoService:
 
         Regras:
         - Busca todas as inscrições DEFERIDAS do curso.
-        - Conclui cada inscrição, atribuindo competências aos alunos.
+        - Conclui cada inscrição, atribuindo competências aos alunos (mesmas
+          regras de `concluir_inscricao`, com uma gravação por repositório).
         - Desativa o curso para novas inscrições.
 
         Args:
@@ -208,41 +251,120 @@ class InscricaoCursoService:
                 - concluidos: quantidade de alunos que concluíram
                 - competencias_atribuidas: total de competências atribuídas
         """
-        # 1. Buscar curso
-        curso = self._buscar_curso(id_curso, tipo_curso)
-        if not curso:
-            raise ValueError(f"Curso {tipo_curso.value} com ID {id_curso} não encontrado.")
+        with self._unidade():
+            # 1. Buscar curso
+            curso = self._buscar_curso(id_curso, tipo_curso)
+            if not curso:
+                raise ValueError(f"Curso {tipo_curso.value} com ID {id_curso} não encontrado.")
+
+            # 2. Buscar todas inscrições do curso
+            inscricoes = self._repo_inscricao.listar_por_curso(id_curso)
+            inscricoes_deferidas = [i for i in inscricoes if i.status == StatusInscricao.DEFERIDO and i.tipo_curso == tipo_curso]
+
+            total_inscritos = len(inscricoes_deferidas)
+
+            # 3. Concluir as inscrições deferidas de uma vez
+            concluidas, competencias_atribuidas = self._concluir_em_lote(inscricoes_deferidas)
+
+            # 4. Desativar o curso
+            curso.ativo = False
+            if tipo_curso == TipoCursoInscricao.EAD and self._repo_curso_ead:
+                self._repo_curso_ead.atualizar(curso)
+            elif tipo_curso == TipoCursoInscricao.PRESENCIAL and self._repo_curso_presencial:
+                self._repo_curso_presencial.atualizar(curso)
+
+            resultado = {
+                "total_inscritos": total_inscritos,
+                "concluidos": len(concluidas),
+                "competencias_atribuidas": competencias_atribuidas
+            }
+
+        if competencias_atribuidas:
+            self._notificar_competencias(i.id_aluno for i in concluidas)
+        return resultado
+
+    def _concluir_em_lote(self, inscricoes: List[InscricaoCurso]) -> Tuple[List[InscricaoCurso], int]:
+        """Conclui inscrições deferidas de um mesmo curso como `concluir_inscricao`.
+
+        As competências do curso são lidas uma vez, as dos alunos são indexadas por
+        (candidato, competência) numa única leitura, e as promoções, inclusões e
+        inscrições concluídas são gravadas no final, uma escrita por repositório.
+        Uma inscrição que falhe não impede as outras.
 
-        # 2. Buscar todas inscrições do curso
-        inscricoes = self._repo_inscricao.listar_por_curso(id_curso)
-        inscricoes_deferidas = [i for i in inscricoes if i.status == StatusInscricao.DEFERIDO and i.tipo_curso == tipo_curso]
+        Returns:
+            (inscrições concluídas, total de competências atribuídas)
+        """
+        if not inscricoes:
+            return [], 0
 
-        total_inscritos = len(inscricoes_deferidas)
-        concluidos = 0
-        competencias_atribuidas = 0
+        competencias_curso = []
+        if self._repo_curso_competencia and self._repo_competencia_candidato:
+            competencias_curso = self._repo_curso_competencia.listar_por_curso(inscricoes[0].id_curso)
+        existentes, maior_id = self._indexar_competencias({i.id_aluno for i in inscricoes}) \
+            if competencias_curso else ({}, 0)
 
-        # 3. Concluir cada inscrição deferida
-        for inscricao in inscricoes_deferidas:
+        promovidas: Dict[Tuple[int, int], CompetenciaCandidato] = {}
+        novas: Dict[Tuple[int, int], str] = {}   # (candidato, competência) -> nível
+        concluidas: List[InscricaoCurso] = []
+        atribuidas = 0
+
+        for inscricao in inscricoes:
             try:
-                competencias = self.concluir_inscricao(inscricao.id)
-                concluidos += 1
-                competencias_atribuidas += len(competencias)
+                for comp_curso in competencias_curso:
+                    chave = (inscricao.id_aluno, comp_curso.id_competencia)
+                    nivel_curso = self._nivel_para_int(comp_curso.nivel_conferido)
+                    comp_existente = existentes.get(chave)
+                    if chave in novas:
+                        if nivel_curso > self._nivel_para_int(novas[chave]):
+                            novas[chave] = comp_curso.nivel_conferido
+                            atribuidas += 1
+                    elif comp_existente:
+                        if nivel_curso > self._nivel_para_int(comp_existente.nivel_atual):
+                            comp_existente.atualizar_nivel(comp_curso.nivel_conferido)
+                            promovidas[chave] = comp_existente
+                            atribuidas += 1
+                    else:
+                        novas[chave] = comp_curso.nivel_conferido
+                        atribuidas += 1
+                inscricao.concluir()
+                concluidas.append(inscricao)
             except Exception:
                 # Se falhar uma inscrição, continua com as outras
                 pass
 
-        # 4. Desativar o curso
-        curso.ativo = False
-        if tipo_curso == TipoCursoInscricao.EAD and self._repo_curso_ead:
-            self._repo_curso_ead.atualizar(curso)
-        elif tipo_curso == TipoCursoInscricao.PRESENCIAL and self._repo_curso_presencial:
-            self._repo_curso_presencial.atualizar(curso)
-
-        return {
-            "total_inscritos": total_inscritos,
-            "concluidos": concluidos,
-            "competencias_atribuidas": competencias_atribuidas
-        }
+        criadas = [
+            CompetenciaCandidato(
+                id=novo_id, id_candidato=id_candidato, id_competencia=id_competencia, nivel_atual=nivel
+            )
+            for novo_id, ((id_candidato, id_competencia), nivel)
+            in zip(self._reservar_ids("competencia_candidato", len(novas), maior_id), novas.items())
+        ]
+        if promovidas or criadas:
+            self._repo_competencia_candidato.salvar_muitos([*promovidas.values(), *criadas])
+        if concluidas:
+            self._repo_inscricao.atualizar_muitos(concluidas)
+        return concluidas, atribuidas
+
+    def _indexar_competencias(
+        self, alunos: Set[int]
+    ) -> Tuple[Dict[Tuple[int, int], CompetenciaCandidato], int]:
+        """Competências dos `alunos` por (candidato, competência) e o maior ID, numa leitura."""
+        indice: Dict[Tuple[int, int], CompetenciaCandidato] = {}
+        maior_id = 0
+        for comp in self._repo_competencia_candidato.iterar():
+            maior_id = max(maior_id, comp.id)
+            if comp.id_candidato in alunos:
+                # Mesma escolha de buscar_por_candidato_e_competencia: a primeira encontrada
+                indice.setdefault((comp.id_candidato, comp.id_competencia), comp)
+        return indice, maior_id
+
+    def _reservar_ids(self, entidade: str, quantidade: int, maior_id: int) -> range:
+        """`quantidade` IDs seguidos: pela sequência, ou a partir de `maior_id` + 1."""
+        if quantidade < 1:
+            return range(0)
+        if self._sequencia:
+            return self._sequencia.reservar(entidade, quantidade, lambda: maior_id)
+        return range(maior_id + 1, maior_id + quantidade + 1)
 
     # ------------------------------------------------------------------
     # Validação de localidade
@@ -1,6 +1,7 @@
+import heapq
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.dominio.candidato import Candidato
 from src.dominio.curso_abs import Curso
@@ -8,6 +9,16 @@ from src.dominio.curso_presencial import CursoPresencial
 from src.dominio.vaga import Vaga, VagaCLT, VagaEstagio, Modalidade
 from src.interfaces.interface_vaga import IVagaRepositorio
 from src.interfaces.interface_curso import ICursoRepositorio
+from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.services.service_compatibilidade import (
+    ChaveVaga,
+    Compatibilidade,
+    IndiceInvertido,
+    ItemRequisito,
+    MotorCompatibilidade,
+    Perfil,
+)
+from src.services.service_tabela_vagas import TabelaVagas
 
 
 # ==============================
@@ -20,6 +31,7 @@ class PesoRecomendacao(IntEnum):
     LOCALIDADE = 30        # localidade coincide (presencial/híbrido)
     REMOTO = 20            # bônus por ser remoto (máxima flexibilidade)
     HIBRIDO = 10           # bônus menor por ser híbrido
+    COMPETENCIAS = 40      # máximo por compatibilidade de competências (proporcional)
 
 
 # ==============================
@@ -31,6 +43,7 @@ class ItemRankeado:
     """Wrapper genérico que associa uma pontuação a um item."""
     item: object
     pontuacao: int = 0
+    compatibilidade: Optional[Compatibilidade] = None
 
 
 @dataclass
@@ -54,15 +67,31 @@ class RecomendacaoService:
         • Vagas/cursos PRESENCIAIS ou HÍBRIDOS → recomendados apenas se a
           localidade coincidir com a do candidato.
     - Apenas itens ativos são recomendados por padrão.
+    - Competências (se houver `motor_compatibilidade`): vagas ganham até
+      PesoRecomendacao.COMPETENCIAS pontos conforme o candidato cobre os
+      requisitos da vaga.
+
+    As mesmas regras valem no sentido inverso (candidatos para uma vaga),
+    que exige `repo_candidato`.
+
+    Com `tabela_vagas` (uma TabelaVagas sobre o mesmo repositório), área e
+    localidade são filtradas nas colunas da tabela e só as vagas que passam
+    são pontuadas, em vez de percorrer todas as vagas ativas.
     """
 
     def __init__(
         self,
         repo_vaga: IVagaRepositorio,
         repo_curso: ICursoRepositorio,
+        motor_compatibilidade: Optional[MotorCompatibilidade] = None,
+        repo_candidato: Optional[ICandidatoRepositorio] = None,
+        tabela_vagas: Optional[TabelaVagas] = None,
     ):
         self._repo_vaga = repo_vaga
         self._repo_curso = repo_curso
+        self._motor = motor_compatibilidade
+        self._repo_candidato = repo_candidato
+        self._tabela_vagas = tabela_vagas
 
     # ------------------------------------------------------------------
     # API pública
@@ -82,45 +111,211 @@ class RecomendacaoService:
         """Retorna cursos recomendados ordenados por pontuação (maior primeiro)."""
         return self._recomendar_cursos(candidato)
 
+    def ranquear_candidatos_para_vaga(self, id_vaga: int, top_k: int = 10) -> List[ItemRankeado]:
+        """Retorna os `top_k` candidatos mais compatíveis com a vaga (maior pontuação primeiro).
+
+        Os requisitos da vaga são lidos uma vez e as competências dos candidatos
+        vêm de um índice invertido restrito a esses requisitos. Se a vaga tem
+        requisitos, os candidatos do índice (com ao menos uma das competências
+        exigidas) são lidos e pontuados primeiro. Os demais têm todos o mesmo
+        perfil vazio, e a pontuação deles não passa de um teto calculado uma
+        vez: eles só são percorridos se ainda faltam resultados ou se o teto
+        alcança o pior dos melhores. Assim o ranking é o mesmo de pontuar todos
+        os candidatos. Sem requisitos, todos os candidatos são percorridos.
+        Os melhores resultados ficam num heap de tamanho `top_k`, então a
+        memória não cresce com o número de candidatos. Empates favorecem o menor ID.
+        """
+        if self._repo_candidato is None:
+            raise ValueError("Repositório de candidatos não configurado")
+        vaga = self._repo_vaga.buscar_por_id(id_vaga)
+        if vaga is None:
+            raise ValueError("Vaga não encontrada")
+        if top_k <= 0:
+            return []
+
+        requisitos: Tuple[ItemRequisito, ...] = ()
+        indice = None
+        if self._motor:
+            requisitos = self._motor.requisitos_da_vaga(vaga)
+            indice = self._motor.indice_invertido(r[0] for r in requisitos)
+
+        # Heap mínimo de (pontuação, -id, item): a raiz é o pior dos melhores
+        melhores: List[Tuple[int, int, ItemRankeado]] = []
+        if not requisitos:
+            candidatos = self._repo_candidato.iterar()
+            self._manter_melhores(melhores, top_k, vaga, candidatos, requisitos, indice)
+        else:
+            no_indice = set().union(*indice.values())
+            candidatos = self._candidatos_do_indice(no_indice)
+            self._manter_melhores(melhores, top_k, vaga, candidatos, requisitos, indice)
+            if len(melhores) < top_k or melhores[0][0] <= self._teto_sem_competencias(vaga, requisitos):
+                restantes = (c for c in self._repo_candidato.iterar() if c.id not in no_indice)
+                self._manter_melhores(melhores, top_k, vaga, restantes, requisitos, indice)
+
+        melhores.sort(key=lambda e: e[:2], reverse=True)
+        return [item for _, _, item in melhores]
+
     # ------------------------------------------------------------------
     # Lógica interna
     # ------------------------------------------------------------------
 
-    def _recomendar_vagas(self, candidato: Candidato) -> List[ItemRankeado]:
-        vagas = self._repo_vaga.listar_ativas()
-        areas_lower = [a.lower() for a in candidato.areas_interesse]
-        rankeados: List[ItemRankeado] = []
-
-        for vaga in vagas:
-            pontuacao = 0
+    def _manter_melhores(
+        self,
+        melhores: List[Tuple[int, int, ItemRankeado]],
+        top_k: int,
+        vaga: Vaga,
+        candidatos: Iterable[Candidato],
+        requisitos: Tuple[ItemRequisito, ...],
+        indice: Optional[IndiceInvertido],
+    ) -> None:
+        """Pontua os candidatos e mantém no heap `melhores` os `top_k` de maior pontuação."""
+        for candidato in candidatos:
+            perfil = None
+            if indice is not None:
+                perfil = MotorCompatibilidade.perfil_no_indice(candidato.id, indice)
+            resultado = self._pontuar_vaga(
+                vaga,
+                [a.lower() for a in candidato.areas_interesse],
+                candidato.localidade,
+                requisitos,
+                perfil,
+            )
+            if resultado is None:
+                continue
 
-            # 1. Área deve corresponder (obrigatório)
-            if vaga.area.lower() not in areas_lower:
+            pontuacao, compatibilidade = resultado
+            chave = (pontuacao, -candidato.id)
+            if len(melhores) == top_k and chave <= melhores[0][:2]:
                 continue
+            entrada = (*chave, ItemRankeado(candidato, pontuacao, compatibilidade))
+            if len(melhores) < top_k:
+                heapq.heappush(melhores, entrada)
+            else:
+                heapq.heapreplace(melhores, entrada)
+
+    @classmethod
+    def _teto_sem_competencias(cls, vaga: Vaga, requisitos: Tuple[ItemRequisito, ...]) -> int:
+        """Maior pontuação possível na vaga para um candidato sem nenhuma das competências exigidas."""
+        localidade_vaga = getattr(vaga, "localidade", "")
+        return (
+            PesoRecomendacao.AREA
+            + cls._pontuar_modalidade_localidade(vaga.modalidade, localidade_vaga, localidade_vaga)
+            + cls.pontuar_competencias(requisitos, {})[0]
+        )
+
+    def _candidatos_do_indice(self, ids: Iterable[int]) -> Iterator[Candidato]:
+        """Candidatos com os IDs informados (os do índice invertido), em ordem de ID, lidos um a um."""
+        for id_candidato in sorted(ids):
+            candidato = self._repo_candidato.buscar_por_id(id_candidato)
+            if candidato is not None:
+                yield candidato
 
-            pontuacao += PesoRecomendacao.AREA
+    def _recomendar_vagas(self, candidato: Candidato) -> List[ItemRankeado]:
+        areas_lower = [a.lower() for a in candidato.areas_interesse]
+        if self._tabela_vagas is not None:
+            vagas = self._tabela_vagas.compativeis(areas_lower, candidato.localidade)
+        else:
+            vagas = self._repo_vaga.listar_ativas()
+
+        # Requisitos de todas as vagas e perfil do candidato, lidos uma vez
+        vetores = perfil = None
+        if self._motor:
+            vetores = self._motor.vetores_requisitos()
+            perfil = self._motor.perfil(candidato.id)
+        return self.ranquear_vagas(vagas, areas_lower, candidato.localidade, vetores, perfil)
+
+    @classmethod
+    def ranquear_vagas(
+        cls,
+        vagas: Iterable[Vaga],
+        areas_lower: List[str],
+        localidade_candidato: str,
+        vetores: Optional[Dict[ChaveVaga, Tuple[ItemRequisito, ...]]] = None,
+        perfil: Optional[Perfil] = None,
+    ) -> List[ItemRankeado]:
+        """Pontua as vagas para um candidato e as ordena (maior primeiro), sem consultar repositórios.
 
-            # 2. Localidade: presencial/híbrido exige match
-            localidade_vaga = getattr(vaga, "localidade", "")
-            if not self._localidade_compativel(
-                vaga.modalidade, localidade_vaga, candidato.localidade
-            ):
+        `perfil` None indica que as competências não entram na pontuação.
+        """
+        rankeados: List[ItemRankeado] = []
+        for vaga in vagas:
+            requisitos = ()
+            if vetores is not None:
+                requisitos = vetores.get(MotorCompatibilidade.chave_vaga(vaga), ())
+            resultado = cls._pontuar_vaga(vaga, areas_lower, localidade_candidato, requisitos, perfil)
+            if resultado is None:
                 continue
 
-            # 3. Pontuação de modalidade e localidade
-            pontuacao += self._pontuar_modalidade_localidade(
-                vaga.modalidade, localidade_vaga, candidato.localidade
+            pontuacao, compatibilidade = resultado
+            rankeados.append(
+                ItemRankeado(item=vaga, pontuacao=pontuacao, compatibilidade=compatibilidade)
             )
 
-            rankeados.append(ItemRankeado(item=vaga, pontuacao=pontuacao))
-
         # Ordenar por pontuação decrescente
         rankeados.sort(key=lambda r: r.pontuacao, reverse=True)
         return rankeados
 
+    @classmethod
+    def _pontuar_vaga(
+        cls,
+        vaga: Vaga,
+        areas_lower: List[str],
+        localidade_candidato: str,
+        requisitos: Tuple[ItemRequisito, ...],
+        perfil: Optional[Perfil],
+    ) -> Optional[Tuple[int, Optional[Compatibilidade]]]:
+        """Pontua um par vaga/candidato. Retorna None se o par não é compatível.
+
+        `perfil` None indica que as competências não entram na pontuação.
+        """
+        pontuacao = 0
+
+        # 1. Área deve corresponder (obrigatório)
+        if vaga.area.lower() not in areas_lower:
+            return None
+
+        pontuacao += PesoRecomendacao.AREA
+
+        # 2. Localidade: presencial/híbrido exige match
+        localidade_vaga = getattr(vaga, "localidade", "")
+        if not cls._localidade_compativel(
+            vaga.modalidade, localidade_vaga, localidade_candidato
+        ):
+            return None
+
+        # 3. Pontuação de modalidade e localidade
+        pontuacao += cls._pontuar_modalidade_localidade(
+            vaga.modalidade, localidade_vaga, localidade_candidato
+        )
+
+        # 4. Cobertura dos requisitos de competência
+        compatibilidade = None
+        if perfil is not None:
+            pontos, compatibilidade = cls.pontuar_competencias(requisitos, perfil)
+            pontuacao += pontos
+
+        return pontuacao, compatibilidade
+
+    @staticmethod
+    def pontuar_competencias(
+        requisitos: Tuple[ItemRequisito, ...], perfil: Perfil
+    ) -> Tuple[int, Compatibilidade]:
+        """Pontos (até PesoRecomendacao.COMPETENCIAS) pela cobertura dos requisitos da vaga."""
+        compatibilidade = MotorCompatibilidade.pontuar(requisitos, perfil)
+        return round(PesoRecomendacao.COMPETENCIAS * compatibilidade.indice), compatibilidade
+
     def _recomendar_cursos(self, candidato: Candidato) -> List[ItemRankeado]:
-        cursos = self._repo_curso.listar_todos()
         areas_lower = [a.lower() for a in candidato.areas_interesse]
+        return self.ranquear_cursos(self._repo_curso.listar_todos(), areas_lower, candidato.localidade)
+
+    @classmethod
+    def ranquear_cursos(
+        cls,
+        cursos: Iterable[Curso],
+        areas_lower: List[str],
+        localidade_candidato: str,
+    ) -> List[ItemRankeado]:
+        """Pontua os cursos ativos para um candidato e os ordena (maior primeiro), sem consultar repositórios."""
         rankeados: List[ItemRankeado] = []
 
         for curso in cursos:
@@ -141,14 +336,14 @@ class RecomendacaoService:
             if isinstance(curso, CursoPresencial):
                 localidade_curso = curso.localidade
 
-            if not self._localidade_compativel(
-                curso.modalidade, localidade_curso, candidato.localidade
+            if not cls._localidade_compativel(
+                curso.modalidade, localidade_curso, localidade_candidato
             ):
                 continue
 
             # 3. Pontuação de modalidade e localidade
-            pontuacao += self._pontuar_modalidade_localidade(
-                curso.modalidade, localidade_curso, candidato.localidade
+            pontuacao += cls._pontuar_modalidade_localidade(
+                curso.modalidade, localidade_curso, localidade_candidato
             )
 
             rankeados.append(ItemRankeado(item=curso, pontuacao=pontuacao))
@@ -161,6 +356,26 @@ class RecomendacaoService:
     # Helpers
     # ------------------------------------------------------------------
 
+    @classmethod
+    def pontuacao_fixa(cls, modalidade: Modalidade, localidade_item: str) -> Optional[Tuple[str, int]]:
+        """Parte da pontuação de um item que não depende do candidato.
+
+        Retorna (localidade exigida, pontos de área + modalidade + localidade),
+        válidos para todo candidato com a área do item e a localidade exigida
+        ("" quando qualquer candidato serve), ou None se nenhum candidato é
+        compatível. Competências não entram.
+        """
+        if modalidade == Modalidade.REMOTO or not localidade_item:
+            exigida = ""
+        else:
+            exigida = localidade_item.strip().lower()
+            if not exigida:
+                return None
+        pontos = PesoRecomendacao.AREA + cls._pontuar_modalidade_localidade(
+            modalidade, localidade_item, localidade_item
+        )
+        return exigida, pontos
+
     @staticmethod
     def _pontuar_modalidade_localidade(
         modalidade: Modalidade,
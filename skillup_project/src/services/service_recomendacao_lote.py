@@ -0,0 +1,318 @@
+"""
+Cálculo em lote das recomendações de todos os candidatos.
+
+Vagas ativas, cursos ativos e requisitos são lidos uma vez e agrupados por
+área e localidade num CatalogoRecomendacao. Os candidatos são divididos em partições,
+pontuadas em paralelo num ProcessPoolExecutor: cada processo recebe o
+catálogo uma única vez (no initializer) e depois só as partições. As
+melhores vagas e cursos de cada candidato vão para o repositório de
+recomendações salvas, de onde a tela do candidato lê pela chave.
+"""
+
+import bisect
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.dominio.curso_abs import Curso
+from src.dominio.recomendacao_salva import CursoRecomendado, RecomendacaoSalva, VagaRecomendada
+from src.dominio.vaga import Vaga
+from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_curso import ICursoRepositorio
+from src.interfaces.interface_recomendacao_salva import IRecomendacaoSalvaRepositorio
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.services.service_compatibilidade import (
+    ChaveVaga,
+    Compatibilidade,
+    ItemRequisito,
+    MotorCompatibilidade,
+    Perfil,
+)
+from src.services.service_recomendacao import PesoRecomendacao, RecomendacaoService
+
+# Vagas e cursos guardados por candidato
+TOP_N_RECOMENDACOES = 10
+# Candidatos enviados de cada vez a um processo
+TAMANHO_PARTICAO = 500
+
+# (id, áreas de interesse em minúsculas, localidade, perfil ou None)
+CandidatoNoLote = Tuple[int, Tuple[str, ...], str, Optional[Perfil]]
+
+
+# ==============================
+# CATÁLOGO COMPARTILHADO
+# ==============================
+
+# (-pontuação fixa, ID, item): em ordem crescente, do melhor para o pior, com
+# empates pelo ID, que é a ordem das listagens dos repositórios (e portanto a
+# do sort estável do cálculo sob demanda)
+ItemDoCatalogo = Tuple[int, int, object]
+# (área em minúsculas, localidade exigida do candidato; "" = qualquer uma)
+Grupo = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class CatalogoRecomendacao:
+    """O que a pontuação lê, carregado uma vez e enviado a cada processo.
+
+    Área e localidade decidem se um item serve a um candidato, e os pontos
+    delas só dependem do item (RecomendacaoService.pontuacao_fixa). Então os
+    itens ficam em grupos por (área, localidade exigida), cada grupo já
+    ordenado pela pontuação fixa: um candidato junta só os grupos das suas
+    áreas, sem localidade exigida ou com a localidade dele, e lê do começo.
+    """
+    vagas: Dict[Grupo, List[ItemDoCatalogo]]
+    cursos: Dict[Grupo, List[ItemDoCatalogo]]
+    vetores: Optional[Dict[ChaveVaga, Tuple[ItemRequisito, ...]]] = None
+    top_n: int = TOP_N_RECOMENDACOES
+    gerada_em: str = ""
+
+    @staticmethod
+    def entrada(item) -> Optional[Tuple[Grupo, ItemDoCatalogo]]:
+        """Grupo e entrada de uma vaga ou curso, ou None se nenhum candidato é compatível."""
+        fixa = RecomendacaoService.pontuacao_fixa(item.modalidade, getattr(item, "localidade", ""))
+        if fixa is None:
+            return None
+        exigida, pontos = fixa
+        return (item.area.lower(), exigida), (-pontos, item.id, item)
+
+    @classmethod
+    def agrupar(cls, itens: Iterable) -> Dict[Grupo, List[ItemDoCatalogo]]:
+        """Agrupa vagas ou cursos por (área, localidade exigida), ordenados pela pontuação fixa."""
+        grupos: Dict[Grupo, List[ItemDoCatalogo]] = {}
+        for item in itens:
+            entrada = cls.entrada(item)
+            if entrada is not None:
+                grupos.setdefault(entrada[0], []).append(entrada[1])
+        for lista in grupos.values():
+            lista.sort(key=lambda e: e[:2])
+        return grupos
+
+    @staticmethod
+    def incluir(grupos: Dict[Grupo, List[ItemDoCatalogo]], grupo: Grupo, entrada: ItemDoCatalogo) -> None:
+        """Insere a entrada no grupo mantendo a ordem (o ID não pode já estar no grupo)."""
+        bisect.insort(grupos.setdefault(grupo, []), entrada)
+
+    @staticmethod
+    def retirar(grupos: Dict[Grupo, List[ItemDoCatalogo]], grupo: Grupo, entrada: ItemDoCatalogo) -> None:
+        lista = grupos[grupo]
+        # (-pontos, id) vem logo antes da entrada completa: a busca nunca compara os itens
+        del lista[bisect.bisect_left(lista, entrada[:2])]
+        if not lista:
+            del grupos[grupo]
+
+    @staticmethod
+    def grupos_do_candidato(areas_lower: Sequence[str], localidade: str) -> List[Grupo]:
+        localidade = localidade.strip().lower()
+        grupos = []
+        for area in set(areas_lower):
+            grupos.append((area, ""))
+            if localidade:
+                grupos.append((area, localidade))
+        return grupos
+
+    @staticmethod
+    def _melhores_sem_competencias(
+        grupos: Dict[Grupo, List[ItemDoCatalogo]], chaves: List[Grupo], top_n: int
+    ) -> List[Tuple[int, object, None]]:
+        listas = [grupos[g] for g in chaves if g in grupos]
+        return [(-negativo, item, None) for negativo, _, item in islice(heapq.merge(*listas), top_n)]
+
+    def melhores_vagas(
+        self, areas_lower: Sequence[str], localidade: str, perfil: Optional[Perfil]
+    ) -> List[Tuple[int, Vaga, Optional[Compatibilidade]]]:
+        """As `top_n` vagas do candidato como (pontuação, vaga, compatibilidade), maior primeiro."""
+        chaves = self.grupos_do_candidato(areas_lower, localidade)
+        if perfil is None or self.vetores is None:
+            return self._melhores_sem_competencias(self.vagas, chaves, self.top_n)
+
+        # Heap mínimo de (pontuação, -ID, vaga, compatibilidade) com as melhores até aqui.
+        # As vagas chegam em ordem decrescente de pontuação fixa: quando nem o máximo
+        # de competências alcança a pior das melhores, as restantes também não alcançam.
+        melhores: List[tuple] = []
+        listas = [self.vagas[g] for g in chaves if g in self.vagas]
+        for negativo, id_vaga, vaga in heapq.merge(*listas):
+            if len(melhores) == self.top_n and -negativo + PesoRecomendacao.COMPETENCIAS < melhores[0][0]:
+                break
+            requisitos = self.vetores.get(MotorCompatibilidade.chave_vaga(vaga), ())
+            pontos, compatibilidade = RecomendacaoService.pontuar_competencias(requisitos, perfil)
+            entrada = (-negativo + pontos, -id_vaga, vaga, compatibilidade)
+            if len(melhores) < self.top_n:
+                heapq.heappush(melhores, entrada)
+            elif entrada[:2] > melhores[0][:2]:
+                heapq.heapreplace(melhores, entrada)
+        melhores.sort(key=lambda e: e[:2], reverse=True)
+        return [(pontuacao, vaga, compatibilidade) for pontuacao, _, vaga, compatibilidade in melhores]
+
+    def melhores_cursos(self, areas_lower: Sequence[str], localidade: str) -> List[Tuple[int, Curso, None]]:
+        """Os `top_n` cursos do candidato como (pontuação, curso, None), maior primeiro."""
+        chaves = self.grupos_do_candidato(areas_lower, localidade)
+        return self._melhores_sem_competencias(self.cursos, chaves, self.top_n)
+
+
+def recomendar_do_catalogo(
+    catalogo: CatalogoRecomendacao, candidato: CandidatoNoLote, gerada_em: Optional[str] = None
+) -> RecomendacaoSalva:
+    """Melhores vagas e cursos de um candidato, pelas mesmas regras do RecomendacaoService."""
+    id_candidato, areas_lower, localidade, perfil = candidato
+    return RecomendacaoSalva(
+        id_candidato=id_candidato,
+        vagas=tuple(
+            VagaRecomendada(
+                id=vaga.id,
+                titulo=vaga.titulo,
+                area=vaga.area,
+                modalidade=vaga.modalidade.value,
+                pontuacao=pontuacao,
+                percentual=compatibilidade.percentual if compatibilidade else None,
+            )
+            for pontuacao, vaga, compatibilidade in catalogo.melhores_vagas(areas_lower, localidade, perfil)
+        ),
+        cursos=tuple(
+            CursoRecomendado(
+                id=curso.id,
+                nome=curso.nome,
+                area=curso.area,
+                carga_horaria=curso.carga_horaria,
+                pontuacao=pontuacao,
+            )
+            for pontuacao, curso, _ in catalogo.melhores_cursos(areas_lower, localidade)
+        ),
+        gerada_em=catalogo.gerada_em if gerada_em is None else gerada_em,
+    )
+
+
+# ==============================
+# PROCESSOS DO LOTE
+# ==============================
+
+# Catálogo do processo de trabalho, definido uma vez por _iniciar_processo
+_catalogo_do_processo: Optional[CatalogoRecomendacao] = None
+
+
+def _iniciar_processo(catalogo: CatalogoRecomendacao) -> None:
+    global _catalogo_do_processo
+    _catalogo_do_processo = catalogo
+
+
+def _recomendar_particao(particao: List[CandidatoNoLote]) -> List[RecomendacaoSalva]:
+    return [recomendar_do_catalogo(_catalogo_do_processo, c) for c in particao]
+
+
+# ==============================
+# RESULTADO DO LOTE
+# ==============================
+
+@dataclass
+class EstatisticasRecomendacaoLote:
+    """Resumo de uma execução do lote."""
+    candidatos: int = 0
+    particoes: int = 0
+    processos: int = 0
+    segundos: float = 0.0
+
+    @property
+    def candidatos_por_segundo(self) -> float:
+        return self.candidatos / self.segundos if self.segundos > 0 else 0.0
+
+
+# ==============================
+# SERVIÇO
+# ==============================
+
+class RecomendacaoLoteService:
+    ''' Pré-calcula as recomendações de todos os candidatos e as grava no repositório.
+    Com `processos` 1 (ou uma única partição) tudo roda no próprio processo;
+    o padrão é um processo por CPU. Ao fim, o conteúdo do repositório é trocado
+    de uma vez, então candidatos excluídos deixam de ter recomendação salva.'''
+
+    def __init__(
+        self,
+        repo_vaga: IVagaRepositorio,
+        repo_curso: ICursoRepositorio,
+        repo_candidato: ICandidatoRepositorio,
+        repo_recomendacao: IRecomendacaoSalvaRepositorio,
+        motor_compatibilidade: Optional[MotorCompatibilidade] = None,
+        top_n: int = TOP_N_RECOMENDACOES,
+        tamanho_particao: int = TAMANHO_PARTICAO,
+        processos: Optional[int] = None,
+    ):
+        if top_n < 1:
+            raise ValueError("O número de recomendações por candidato deve ser maior ou igual a 1")
+        if tamanho_particao < 1:
+            raise ValueError("O tamanho da partição deve ser maior ou igual a 1")
+        if processos is not None and processos < 1:
+            raise ValueError("O número de processos deve ser maior ou igual a 1")
+        self._repo_vaga = repo_vaga
+        self._repo_curso = repo_curso
+        self._repo_candidato = repo_candidato
+        self._repo_recomendacao = repo_recomendacao
+        self._motor = motor_compatibilidade
+        self._top_n = top_n
+        self._tamanho_particao = tamanho_particao
+        self._processos = processos or os.cpu_count() or 1
+
+    def buscar(self, id_candidato: int) -> Optional[RecomendacaoSalva]:
+        """Recomendação pré-calculada do candidato, ou None se o lote ainda não a gerou."""
+        return self._repo_recomendacao.buscar_por_candidato(id_candidato)
+
+    def carregar_catalogo(self) -> CatalogoRecomendacao:
+        """Lê vagas ativas, cursos ativos e requisitos de vaga uma única vez."""
+        cursos = [c for c in self._repo_curso.listar_todos() if c.ativo]
+        return CatalogoRecomendacao(
+            vagas=CatalogoRecomendacao.agrupar(self._repo_vaga.listar_ativas()),
+            cursos=CatalogoRecomendacao.agrupar(cursos),
+            vetores=self._motor.vetores_requisitos() if self._motor else None,
+            top_n=self._top_n,
+            gerada_em=datetime.now().isoformat(timespec="seconds"),
+        )
+
+    def executar(self) -> EstatisticasRecomendacaoLote:
+        """
+        Recalcula e grava as recomendações de todos os candidatos.
+        return: EstatisticasRecomendacaoLote com as contagens e o tempo.
+        """
+        inicio = time.perf_counter()
+        catalogo = self.carregar_catalogo()
+        particoes = list(self._particoes())
+        estatisticas = EstatisticasRecomendacaoLote(
+            candidatos=sum(len(p) for p in particoes),
+            particoes=len(particoes),
+            processos=min(self._processos, len(particoes)) or 1,
+        )
+
+        recomendacoes: List[RecomendacaoSalva] = []
+        if estatisticas.processos == 1:
+            for particao in particoes:
+                recomendacoes.extend(recomendar_do_catalogo(catalogo, c) for c in particao)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=estatisticas.processos,
+                initializer=_iniciar_processo,
+                initargs=(catalogo,),
+            ) as executor:
+                for resultado in executor.map(_recomendar_particao, particoes):
+                    recomendacoes.extend(resultado)
+
+        self._repo_recomendacao.substituir_todas(recomendacoes)
+        estatisticas.segundos = time.perf_counter() - inicio
+        return estatisticas
+
+    def _particoes(self) -> Iterator[List[CandidatoNoLote]]:
+        """Candidatos em listas de `tamanho_particao`, já com o perfil de competências."""
+        perfis = self._motor.perfis() if self._motor else None
+        particao: List[CandidatoNoLote] = []
+        for candidato in self._repo_candidato.iterar():
+            perfil = perfis.get(candidato.id, {}) if perfis is not None else None
+            areas = tuple(a.lower() for a in candidato.areas_interesse)
+            particao.append((candidato.id, areas, candidato.localidade, perfil))
+            if len(particao) >= self._tamanho_particao:
+                yield particao
+                particao = []
+        if particao:
+            yield particao
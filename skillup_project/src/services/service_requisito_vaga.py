@@ -1,13 +1,20 @@
+from typing import Any, Dict, Iterable, Mapping, Optional, Set
 from src.dominio.requisitos_vaga import RequisitoVaga, TipoVagaRequisito
 from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
+from src.interfaces.lote import ErroLote, ResultadoLote
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
 
 
 class RequisitoVagaService:
     """Serviço de domínio para gerenciamento de requisitos de vagas.
     Contém a lógica de negócio e validações relacionadas aos requisitos de vagas."""
 
-    def __init__(self, repositorio: IRequisitoVagaRepositorio):
+    def __init__(self, repositorio: IRequisitoVagaRepositorio, sequencia: Optional[ISequenciaIds] = None):
         self.repo = repositorio
+        self._sequencia = sequencia
+
+    def _maior_id(self) -> int:
+        return max((r.id for r in self.repo.listar_todos()), default=0)
 
     # ==========================================
     # CRUD
@@ -26,8 +33,10 @@ class RequisitoVagaService:
         if existente:
             raise ValueError("Vaga já possui este requisito de competência")
 
-        todos = self.repo.listar_todos()
-        novo_id = 1 if not todos else max(r.id for r in todos) + 1
+        if self._sequencia:
+            novo_id = self._sequencia.proximo("requisito_vaga", self._maior_id)
+        else:
+            novo_id = self._maior_id() + 1
 
         requisito = RequisitoVaga(
             id=novo_id,
@@ -41,6 +50,47 @@ class RequisitoVagaService:
         self.repo.salvar(requisito)
         return requisito
 
+    def cadastrar_lote(self, dados: Iterable[Mapping[str, Any]]) -> ResultadoLote[RequisitoVaga]:
+        """Cadastra vários requisitos com uma única gravação.
+
+        Cada item de `dados` traz os argumentos de `cadastrar` (id_vaga, id_competencia,
+        nivel_minimo, tipo_vaga, obrigatorio). Um item recusado (requisito repetido ou
+        inválido) não impede os demais: o motivo vem em `erros`, com a posição do item.
+        """
+        erros = []
+        aceitos = []
+        # Competências já exigidas por vaga, lidas uma vez por vaga do lote
+        competencias: Dict[int, Set[int]] = {}
+        for posicao, item in enumerate(dados):
+            id_vaga, id_competencia = item.get("id_vaga"), item.get("id_competencia")
+            if id_vaga not in competencias:
+                competencias[id_vaga] = {r.id_competencia for r in self.repo.listar_por_vaga(id_vaga)}
+            if id_competencia in competencias[id_vaga]:
+                erros.append(ErroLote(posicao, "Vaga já possui este requisito de competência"))
+            else:
+                competencias[id_vaga].add(id_competencia)
+                aceitos.append((posicao, item))
+
+        requisitos = []
+        for novo_id, (posicao, item) in zip(self._reservar_ids(len(aceitos)), aceitos):
+            try:
+                requisitos.append(RequisitoVaga(id=novo_id, **item))
+            except (TypeError, ValueError) as erro:
+                erros.append(ErroLote(posicao, str(erro)))
+
+        if requisitos:
+            self.repo.salvar_muitos(requisitos)
+        erros.sort(key=lambda e: e.posicao)
+        return ResultadoLote(requisitos, erros)
+
+    def _reservar_ids(self, quantidade: int) -> range:
+        if quantidade < 1:
+            return range(0)
+        if self._sequencia:
+            return self._sequencia.reservar("requisito_vaga", quantidade, self._maior_id)
+        inicio = self._maior_id() + 1
+        return range(inicio, inicio + quantidade)
+
     def listar_todos(self):
         """Lista todos os requisitos de vagas."""
         return self.repo.listar_todos()
@@ -0,0 +1,298 @@
+"""
+Modelo de leitura colunar das vagas (CLT e estágio) para filtros em massa.
+
+Cada atributo filtrável vira uma coluna indexada pela linha da vaga:
+salário (ou bolsa) em array('d'), com NaN quando não há; ativa como bitmask;
+área, modalidade, tipo e localidade codificados por dicionário em array('H').
+Um filtro é uma máscara sobre as linhas e os filtros se combinam com & e |:
+cada valor de cada coluna tem o bitset (int do Python) das suas linhas, a
+faixa salarial sai de um índice ordenado, e só as linhas do resultado são
+percorridas.
+"""
+
+import math
+import threading
+from array import array
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+from src.dominio.vaga import Modalidade, Vaga
+from src.interfaces.interface_observador_vaga import IObservadorVaga
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.repositorios.indice_ordenado import IndiceOrdenado
+from src.services.service_busca_vaga import AREA, LOCALIDADE, MODALIDADE, TIPO, salario_da_vaga
+
+# Acima disto, uma coluna de códigos passa de array('H') para array('I')
+_MAIOR_CODIGO_H = 0xFFFF
+
+# Reconstrói a tabela quando as linhas removidas passam da metade
+_MINIMO_PARA_COMPACTAR = 1024
+
+# Posições dos bits ligados em cada byte, para percorrer um bitset byte a byte
+_BITS_DO_BYTE = tuple(tuple(i for i in range(8) if byte >> i & 1) for byte in range(256))
+
+
+def _linhas_do_bitset(mascara: int) -> List[int]:
+    linhas: List[int] = []
+    for posicao, byte in enumerate(mascara.to_bytes((mascara.bit_length() + 7) // 8, "little")):
+        if byte:
+            base = posicao * 8
+            linhas.extend(base + bit for bit in _BITS_DO_BYTE[byte])
+    return linhas
+
+
+def _bitset_das_linhas(linhas: Iterable[int], total: int) -> int:
+    bits = bytearray((total + 7) // 8)
+    for linha in linhas:
+        bits[linha >> 3] |= 1 << (linha & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _area(valor: Optional[str]) -> str:
+    return (valor or "").lower()
+
+
+def _localidade(valor: Optional[str]) -> str:
+    return (valor or "").strip().lower()
+
+
+class _ColunaCodificada:
+    """Um atributo categórico: código de cada linha e o dicionário valor -> código.
+
+    `bits` guarda, para cada código, o bitset das linhas com ele.
+    """
+
+    __slots__ = ("codigos", "dicionario", "bits")
+
+    def __init__(self):
+        self.codigos = array("H")
+        self.dicionario: Dict[Any, int] = {}
+        self.bits: Dict[int, int] = {}
+
+    def definir(self, linha: int, valor: Any, com_bits: bool = True) -> None:
+        codigo = self.dicionario.get(valor)
+        if codigo is None:
+            codigo = self.dicionario[valor] = len(self.dicionario)
+            if codigo > _MAIOR_CODIGO_H and self.codigos.typecode == "H":
+                self.codigos = array("I", self.codigos)
+        if linha == len(self.codigos):
+            self.codigos.append(codigo)
+        else:
+            if com_bits:
+                self.bits[self.codigos[linha]] &= ~(1 << linha)
+            self.codigos[linha] = codigo
+        if com_bits:
+            self.bits[codigo] = self.bits.get(codigo, 0) | (1 << linha)
+
+    def montar_bits(self) -> None:
+        """Monta os bitsets de uma vez (ligar bit a bit num int custaria O(N²))."""
+        linhas: Dict[int, List[int]] = {}
+        for linha, codigo in enumerate(self.codigos):
+            linhas.setdefault(codigo, []).append(linha)
+        self.bits = {codigo: _bitset_das_linhas(grupo, grupo[-1] + 1) for codigo, grupo in linhas.items()}
+
+    def codigos_de(self, valores: Iterable[Any]) -> List[int]:
+        """Códigos dos valores conhecidos (valores nunca vistos não casam com nenhuma linha)."""
+        return [self.dicionario[v] for v in valores if v in self.dicionario]
+
+
+# ==============================
+# TABELA COLUNAR
+# ==============================
+
+class TabelaVagas(IObservadorVaga):
+    """Vagas de um repositório em colunas, para filtrar muitas de uma vez.
+
+    A tabela é montada na primeira consulta com `listar_todas()` e mantida
+    pelos avisos de `IObservadorVaga`: registre-a nos serviços que gravam
+    vagas no repositório. Antes de cada consulta a versão do repositório (ver
+    Versionado) é conferida; se mudou sem aviso (importação, outro processo,
+    outra instância do repositório), a tabela é remontada. Os resultados
+    seguem a ordem do repositório.
+    """
+
+    def __init__(self, repositorio: IVagaRepositorio):
+        self._repo = repositorio
+        self._lock = threading.RLock()
+        self._carregada = False
+        self._versao: Optional[Hashable] = None
+        self._limpar()
+
+    def _limpar(self) -> None:
+        self._vagas: List[Optional[Vaga]] = []
+        self._linhas: Dict[int, int] = {}
+        self._salario = array("d")
+        self._ativa = 0
+        self._viva = 0
+        self._colunas = {campo: _ColunaCodificada() for campo in (AREA, MODALIDADE, TIPO, LOCALIDADE)}
+        # Faixa salarial: índice ordenado de (salário, linha)
+        self._salarios = IndiceOrdenado()
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def filtrar(
+        self,
+        *,
+        areas: Optional[Iterable[str]] = None,
+        modalidades: Optional[Iterable[Modalidade]] = None,
+        tipos: Optional[Iterable[Any]] = None,
+        localidades: Optional[Iterable[str]] = None,
+        salario_min: Optional[float] = None,
+        salario_max: Optional[float] = None,
+        apenas_ativas: bool = True,
+    ) -> List[Vaga]:
+        """Vagas que atendem a todos os filtros informados.
+
+        Cada filtro aceita vários valores (basta um coincidir); área e
+        localidade ignoram caixa. Com faixa salarial, vagas sem salário ficam de fora.
+        """
+        with self._lock:
+            self._carregar()
+            if not self._vagas:
+                return []
+            mascara = self._base(apenas_ativas)
+            if areas is not None:
+                mascara = mascara & self._com_valores(AREA, {_area(a) for a in areas})
+            if modalidades is not None:
+                mascara = mascara & self._com_valores(MODALIDADE, modalidades)
+            if tipos is not None:
+                mascara = mascara & self._com_valores(TIPO, tipos)
+            if localidades is not None:
+                mascara = mascara & self._com_valores(LOCALIDADE, {_localidade(l) for l in localidades})
+            if salario_min is not None or salario_max is not None:
+                mascara = mascara & self._na_faixa(salario_min, salario_max)
+            return self._vagas_da(mascara)
+
+    def compativeis(self, areas_interesse: Iterable[str], localidade_candidato: str) -> List[Vaga]:
+        """Vagas ativas que passam pelas regras de área e localidade da recomendação.
+
+        A área deve estar entre as de interesse. A vaga deve ser remota, não
+        ter localidade ou ficar na localidade do candidato.
+        """
+        with self._lock:
+            self._carregar()
+            if not self._vagas:
+                return []
+            mascara = self._base(True) & self._com_valores(AREA, {_area(a) for a in areas_interesse})
+            localidades = {""}
+            if _localidade(localidade_candidato):
+                localidades.add(_localidade(localidade_candidato))
+            mascara = mascara & (
+                self._com_valores(MODALIDADE, (Modalidade.REMOTO,))
+                | self._com_valores(LOCALIDADE, localidades)
+            )
+            return self._vagas_da(mascara)
+
+    # ------------------------------------------------------------------
+    # Manutenção (IObservadorVaga)
+    # ------------------------------------------------------------------
+
+    def vaga_salva(self, vaga: Vaga) -> None:
+        with self._lock:
+            if self._carregada:
+                self._definir(vaga)
+                self._versao_atualizada()
+
+    def vaga_removida(self, id_vaga: int) -> None:
+        with self._lock:
+            if not self._carregada:
+                return
+            linha = self._linhas.pop(id_vaga, None)
+            if linha is None:
+                return
+            self._vagas[linha] = None
+            self._viva &= ~(1 << linha)
+            self._ativa &= ~(1 << linha)
+            if not math.isnan(self._salario[linha]):
+                self._salarios.remover(self._salario[linha], linha)
+            self._salario[linha] = math.nan
+            removidas = len(self._vagas) - len(self._linhas)
+            if removidas >= _MINIMO_PARA_COMPACTAR and removidas * 2 > len(self._vagas):
+                self._montar([v for v in self._vagas if v is not None])
+            self._versao_atualizada()
+
+    def invalidar(self) -> None:
+        """Descarta as colunas; a próxima consulta relê o repositório."""
+        with self._lock:
+            self._carregada = False
+            self._limpar()
+
+    # ------------------------------------------------------------------
+    # Helpers privados
+    # ------------------------------------------------------------------
+
+    def _carregar(self) -> None:
+        versao = self._repo.versao()
+        # Sem versão informada (None), valem só os avisos
+        if self._carregada and (versao is None or versao == self._versao):
+            return
+        self._montar(self._repo.listar_todas())
+        self._carregada = True
+        self._versao = versao
+
+    def _versao_atualizada(self) -> None:
+        # O aviso vem logo depois da escrita que ele descreve: a tabela já a
+        # reflete, então passa a valer para a versão atual do repositório
+        self._versao = self._repo.versao()
+
+    def _montar(self, vagas: Iterable[Vaga]) -> None:
+        self._limpar()
+        for vaga in vagas:
+            self._definir(vaga, com_bits=False)
+        total = len(self._vagas)
+        self._viva = _bitset_das_linhas(range(total), total)
+        self._ativa = _bitset_das_linhas((i for i, v in enumerate(self._vagas) if v.ativa), total)
+        for coluna in self._colunas.values():
+            coluna.montar_bits()
+        self._salarios = IndiceOrdenado(
+            (valor, linha) for linha, valor in enumerate(self._salario) if not math.isnan(valor)
+        )
+
+    def _definir(self, vaga: Vaga, com_bits: bool = True) -> None:
+        """Grava a vaga na sua linha (nova no fim). Sem `com_bits`, deixa bitsets e
+        índice salarial para `_montar`."""
+        linha = self._linhas.get(vaga.id)
+        if linha is None:
+            linha = self._linhas[vaga.id] = len(self._vagas)
+            self._vagas.append(vaga)
+            self._salario.append(math.nan)
+        else:
+            self._vagas[linha] = vaga
+
+        self._colunas[AREA].definir(linha, _area(vaga.area), com_bits)
+        self._colunas[MODALIDADE].definir(linha, vaga.modalidade, com_bits)
+        self._colunas[TIPO].definir(linha, vaga.tipo, com_bits)
+        self._colunas[LOCALIDADE].definir(linha, _localidade(getattr(vaga, "localidade", "")), com_bits)
+        salario = salario_da_vaga(vaga)
+        salario = float(salario) if isinstance(salario, (int, float)) else math.nan
+        if not com_bits:
+            self._salario[linha] = salario
+            return
+
+        bit = 1 << linha
+        self._viva |= bit
+        self._ativa = self._ativa | bit if vaga.ativa else self._ativa & ~bit
+        if not math.isnan(self._salario[linha]):
+            self._salarios.remover(self._salario[linha], linha)
+        if not math.isnan(salario):
+            self._salarios.adicionar(salario, linha)
+        self._salario[linha] = salario
+
+    # Máscaras: bitsets (int) sobre as linhas
+
+    def _base(self, apenas_ativas: bool) -> int:
+        return self._ativa if apenas_ativas else self._viva
+
+    def _com_valores(self, campo: str, valores: Iterable[Any]) -> int:
+        coluna = self._colunas[campo]
+        mascara = 0
+        for codigo in coluna.codigos_de(valores):
+            mascara |= coluna.bits.get(codigo, 0)
+        return mascara
+
+    def _na_faixa(self, minimo: Optional[float], maximo: Optional[float]) -> int:
+        return _bitset_das_linhas(self._salarios.faixa(minimo, maximo), len(self._vagas))
+
+    def _vagas_da(self, mascara: int) -> List[Vaga]:
+        return [self._vagas[linha] for linha in _linhas_do_bitset(mascara)]
@@ -1,7 +1,10 @@
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 from src.dominio.vaga import VagaCLT, Modalidade, TipoVaga
 from src.interfaces.interface_vaga import IVagaRepositorio
 from src.interfaces.interface_empresa import IEmpresa
+from src.interfaces.interface_observador_vaga import IObservadorVaga
+from src.interfaces.paginacao import Pagina, TAMANHO_PAGINA
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
 
 
 class VagaCLTService:
@@ -11,10 +14,30 @@ class VagaCLTService:
     def __init__(
         self,
         repositorio: IVagaRepositorio,
-        repo_empresa: Optional[IEmpresa] = None
+        repo_empresa: Optional[IEmpresa] = None,
+        sequencia: Optional[ISequenciaIds] = None,
+        observadores: Sequence[IObservadorVaga] = (),
     ):
         self.repo = repositorio
         self._repo_empresa = repo_empresa
+        self._sequencia = sequencia
+        self._observadores = list(observadores)
+
+    def _maior_id(self) -> int:
+        return max((v.id for v in self.repo.listar_todas()), default=0)
+
+    def adicionar_observador(self, observador: IObservadorVaga) -> None:
+        """Registra um observador avisado após cada escrita de vaga."""
+        self._observadores.append(observador)
+
+    @property
+    def observadores(self) -> Tuple[IObservadorVaga, ...]:
+        """Observadores registrados (a importação em massa avisa os mesmos)."""
+        return tuple(self._observadores)
+
+    def _notificar_salva(self, vaga) -> None:
+        for observador in self._observadores:
+            observador.vaga_salva(vaga)
 
     # ==========================================
     # CRUD
@@ -39,8 +62,10 @@ class VagaCLTService:
             if not empresa:
                 raise ValueError(f"Empresa com ID {id_empresa} não encontrada.")
         
-        todas = self.repo.listar_todas()
-        novo_id = 1 if not todas else max(v.id for v in todas) + 1
+        if self._sequencia:
+            novo_id = self._sequencia.proximo("vaga_clt", self._maior_id)
+        else:
+            novo_id = self._maior_id() + 1
 
         vaga = VagaCLT(
             id=novo_id,
@@ -56,6 +81,7 @@ class VagaCLTService:
         )
 
         self.repo.salvar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     def listar_por_empresa(self, id_empresa: int):
@@ -77,6 +103,8 @@ class VagaCLTService:
         """Exclui uma vaga CLT pelo ID."""
         self.buscar_por_id(id_vaga)
         self.repo.excluir(id_vaga)
+        for observador in self._observadores:
+            observador.vaga_removida(id_vaga)
 
     # ==========================================
     # LISTAGENS
@@ -106,6 +134,10 @@ class VagaCLTService:
         """Retorna vagas cujo título contém a string fornecida."""
         return self.repo.listar_por_titulo(titulo)
 
+    def paginar(self, limite: int = TAMANHO_PAGINA, cursor=None, **filtro) -> Pagina:
+        """Página de vagas por ID; filtros: area, modalidade, tipo ou titulo."""
+        return self.repo.paginar(limite, cursor, **filtro)
+
     def buscar_por_filtros(self, **filtros):
         """Busca vagas com filtros dinâmicos."""
         return self.repo.buscar_por_filtros(**filtros)
@@ -134,6 +166,7 @@ class VagaCLTService:
             raise AttributeError(f"O campo '{campo}' não existe na vaga CLT")
         setattr(vaga, campo, novo_valor)
         self.repo.atualizar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     def publicar(self, id_vaga: int):
@@ -141,6 +174,7 @@ class VagaCLTService:
         vaga = self.buscar_por_id(id_vaga)
         vaga.publicar()
         self.repo.atualizar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     def pausar(self, id_vaga: int):
@@ -148,6 +182,7 @@ class VagaCLTService:
         vaga = self.buscar_por_id(id_vaga)
         vaga.pausar()
         self.repo.atualizar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     # ==========================================
@@ -1,8 +1,11 @@
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 from src.dominio.vaga import VagaEstagio, Modalidade, TipoVaga
 from src.interfaces.interface_vaga import IVagaRepositorio
 from src.interfaces.interface_empresa import IEmpresa
+from src.interfaces.interface_observador_vaga import IObservadorVaga
+from src.interfaces.paginacao import Pagina, TAMANHO_PAGINA
 from src.interfaces.interface_instituicao_ensino import IInstituicaoEnsino
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
 
 
 class VagaEstagioService:
@@ -13,11 +16,31 @@ class VagaEstagioService:
         self,
         repositorio: IVagaRepositorio,
         repo_empresa: Optional[IEmpresa] = None,
-        repo_instituicao: Optional[IInstituicaoEnsino] = None
+        repo_instituicao: Optional[IInstituicaoEnsino] = None,
+        observadores: Sequence[IObservadorVaga] = (),
+        sequencia: Optional[ISequenciaIds] = None,
     ):
         self.repo = repositorio
         self._repo_empresa = repo_empresa
         self._repo_instituicao = repo_instituicao
+        self._observadores = list(observadores)
+        self._sequencia = sequencia
+
+    def _maior_id(self) -> int:
+        return max((v.id for v in self.repo.listar_todas()), default=0)
+
+    def adicionar_observador(self, observador: IObservadorVaga) -> None:
+        """Registra um observador avisado após cada escrita de vaga."""
+        self._observadores.append(observador)
+
+    @property
+    def observadores(self) -> Tuple[IObservadorVaga, ...]:
+        """Observadores registrados (a importação em massa avisa os mesmos)."""
+        return tuple(self._observadores)
+
+    def _notificar_salva(self, vaga) -> None:
+        for observador in self._observadores:
+            observador.vaga_salva(vaga)
 
     # ==========================================
     # CRUD
@@ -49,8 +72,10 @@ class VagaEstagioService:
             if not instituicao:
                 raise ValueError(f"Instituição com ID {id_instituicao_conveniada} não encontrada.")
         
-        todas = self.repo.listar_todas()
-        novo_id = 1 if not todas else max(v.id for v in todas) + 1
+        if self._sequencia:
+            novo_id = self._sequencia.proximo("vaga_estagio", self._maior_id)
+        else:
+            novo_id = self._maior_id() + 1
 
         vaga = VagaEstagio(
             id=novo_id,
@@ -67,6 +92,7 @@ class VagaEstagioService:
         )
 
         self.repo.salvar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     def listar_por_empresa(self, id_empresa: int):
@@ -88,6 +114,8 @@ class VagaEstagioService:
         """Exclui uma vaga de estágio pelo ID."""
         self.buscar_por_id(id_vaga)
         self.repo.excluir(id_vaga)
+        for observador in self._observadores:
+            observador.vaga_removida(id_vaga)
 
     # ==========================================
     # LISTAGENS
@@ -117,6 +145,10 @@ class VagaEstagioService:
         """Retorna vagas cujo título contém a string fornecida."""
         return self.repo.listar_por_titulo(titulo)
 
+    def paginar(self, limite: int = TAMANHO_PAGINA, cursor=None, **filtro) -> Pagina:
+        """Página de vagas por ID; filtros: area, modalidade, tipo ou titulo."""
+        return self.repo.paginar(limite, cursor, **filtro)
+
     def buscar_por_filtros(self, **filtros):
         """Busca vagas com filtros dinâmicos."""
         return self.repo.buscar_por_filtros(**filtros)
@@ -145,6 +177,7 @@ class VagaEstagioService:
             raise AttributeError(f"O campo '{campo}' não existe na vaga de estágio")
         setattr(vaga, campo, novo_valor)
         self.repo.atualizar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     def publicar(self, id_vaga: int):
@@ -152,6 +185,7 @@ class VagaEstagioService:
         vaga = self.buscar_por_id(id_vaga)
         vaga.publicar()
         self.repo.atualizar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     def pausar(self, id_vaga: int):
@@ -159,6 +193,7 @@ class VagaEstagioService:
         vaga = self.buscar_por_id(id_vaga)
         vaga.pausar()
         self.repo.atualizar(vaga)
+        self._notificar_salva(vaga)
         return vaga
 
     # ==========================================
@@ -0,0 +1,335 @@
+"""
+Visão materializada das recomendações: candidato -> melhores vagas e cursos.
+
+O lote (RecomendacaoLoteService) recalcula todos os candidatos de uma vez;
+esta visão mantém as mesmas linhas em dia entre uma execução e outra,
+recebendo os avisos dos serviços de vaga, de candidato e de competências.
+Ela guarda o catálogo do lote (vagas agrupadas por área e localidade
+exigida) e dois índices: que candidatos cada grupo atende e que linhas
+salvas contêm cada vaga. Assim, quando uma vaga muda, só são pontuados os
+candidatos que já a recomendavam ou cuja linha ela pode alcançar; quando
+o perfil de um candidato muda, só a linha dele é recalculada.
+"""
+
+import threading
+from datetime import datetime
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.dominio.candidato import Candidato
+from src.dominio.recomendacao_salva import RecomendacaoSalva
+from src.dominio.vaga import Vaga
+from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_curso import ICursoRepositorio
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
+from src.interfaces.interface_observador_vaga import IObservadorVaga
+from src.interfaces.interface_recomendacao_salva import IRecomendacaoSalvaRepositorio
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.services.service_compatibilidade import MotorCompatibilidade, Perfil
+from src.services.service_recomendacao import PesoRecomendacao
+from src.services.service_recomendacao_lote import (
+    TOP_N_RECOMENDACOES,
+    CatalogoRecomendacao,
+    Grupo,
+    ItemDoCatalogo,
+    recomendar_do_catalogo,
+)
+
+# (áreas de interesse em minúsculas, localidade como cadastrada)
+_ChaveCandidato = Tuple[Tuple[str, ...], str]
+
+# Fontes da visão, na ordem das versões guardadas (ver `_versoes`)
+_VAGAS, _CURSOS, _CANDIDATOS, _COMPETENCIAS, _LINHAS = range(5)
+
+
+class VisaoRecomendacoes(IObservadorVaga, IObservadorCandidato):
+    """Recomendações salvas mantidas em dia pelos avisos de vagas e candidatos.
+
+    Os índices são montados na primeira leitura ou aviso, a partir das vagas
+    ativas, dos cursos ativos, dos candidatos e das linhas já salvas (do lote
+    ou desta visão). Registre a visão no serviço de vagas CLT, no de
+    candidatos, no de competências e no de inscrições em curso.
+
+    A visão guarda a versão de cada repositório (ver Versionado) e a confere
+    a cada leitura e aviso, como o cache dos repositórios confere a
+    assinatura do arquivo. Se só as linhas salvas mudaram por fora (o lote,
+    outro processo), os índices são remontados a partir delas. Se vagas,
+    cursos, candidatos, requisitos ou competências mudaram sem aviso, os
+    índices são remontados e as linhas salvas deixam de ser confiáveis: cada
+    uma é recalculada quando for lida, ou antes, se um aviso a alcançar.
+    """
+
+    def __init__(
+        self,
+        repo_vaga: IVagaRepositorio,
+        repo_curso: ICursoRepositorio,
+        repo_candidato: ICandidatoRepositorio,
+        repo_recomendacao: IRecomendacaoSalvaRepositorio,
+        motor_compatibilidade: Optional[MotorCompatibilidade] = None,
+        top_n: int = TOP_N_RECOMENDACOES,
+    ):
+        if top_n < 1:
+            raise ValueError("O número de recomendações por candidato deve ser maior ou igual a 1")
+        self._repo_vaga = repo_vaga
+        self._repo_curso = repo_curso
+        self._repo_candidato = repo_candidato
+        self._repo_recomendacao = repo_recomendacao
+        self._motor = motor_compatibilidade
+        self._top_n = top_n
+        self._lock = threading.RLock()
+        self._montada = False
+        # Versões das fontes refletidas nos índices
+        self._vistas: Tuple = ()
+        # Candidatos com linha recalculada desde a última mudança de fonte sem
+        # aviso; None quando todas as linhas salvas são confiáveis
+        self._conferidas: Optional[Set[int]] = None
+        self._limpar()
+
+    def _limpar(self) -> None:
+        self._catalogo: Optional[CatalogoRecomendacao] = None
+        # Grupo e entrada de cada vaga no catálogo
+        self._entradas: Dict[int, Tuple[Grupo, ItemDoCatalogo]] = {}
+        self._candidatos: Dict[int, _ChaveCandidato] = {}
+        # Candidatos que cada grupo de vagas atende
+        self._publico: Dict[Grupo, Set[int]] = {}
+        # Pior pontuação de cada linha salva, ou None se ela tem menos de top_n vagas
+        self._piores: Dict[int, Optional[int]] = {}
+        self._vagas_da_linha: Dict[int, Tuple[int, ...]] = {}
+        # Linhas salvas que contêm cada vaga
+        self._linhas_com: Dict[int, Set[int]] = {}
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def buscar(self, id_candidato: int) -> Optional[RecomendacaoSalva]:
+        """
+        Recomendação do candidato. Se ainda não há linha salva, ela é calculada e salva agora.
+        param id_candidato: ID do candidato.
+        return: RecomendacaoSalva ou None se o candidato não existe.
+        """
+        with self._lock:
+            self._sincronizar()
+            if id_candidato not in self._candidatos:
+                return None
+            if id_candidato in self._piores and self._confiavel(id_candidato):
+                salva = self._repo_recomendacao.buscar_por_candidato(id_candidato)
+                if salva is not None:
+                    return salva
+            return self._recalcular([id_candidato])[0]
+
+    # ------------------------------------------------------------------
+    # Manutenção (IObservadorVaga)
+    # ------------------------------------------------------------------
+
+    def vaga_salva(self, vaga: Vaga) -> None:
+        self.vagas_salvas([vaga])
+
+    def vagas_salvas(self, vagas: Sequence[Vaga]) -> None:
+        with self._lock:
+            self._sincronizar(_VAGAS)
+            afetados: Set[int] = set()
+            for vaga in vagas:
+                afetados |= self._incluir_vaga(vaga)
+            # Um candidato alcançado por várias vagas do lote é recalculado uma vez
+            self._recalcular(afetados)
+            self._carimbar(_VAGAS)
+
+    def vaga_removida(self, id_vaga: int) -> None:
+        with self._lock:
+            self._sincronizar(_VAGAS)
+            self._recalcular(self._retirar_vaga(id_vaga))
+            self._carimbar(_VAGAS)
+
+    # ------------------------------------------------------------------
+    # Manutenção (IObservadorCandidato)
+    # ------------------------------------------------------------------
+
+    def candidatos_salvos(self, candidatos: Sequence[Candidato]) -> None:
+        with self._lock:
+            self._sincronizar(_CANDIDATOS)
+            alterados = []
+            for candidato in candidatos:
+                chave = (tuple(a.lower() for a in candidato.areas_interesse), candidato.localidade)
+                if self._candidatos.get(candidato.id) != chave:
+                    self._indexar_candidato(candidato.id, chave)
+                    alterados.append(candidato.id)
+            self._recalcular(alterados)
+            self._carimbar(_CANDIDATOS)
+
+    def candidato_removido(self, id_candidato: int) -> None:
+        with self._lock:
+            self._sincronizar(_CANDIDATOS)
+            self._indexar_candidato(id_candidato, None)
+            self._indexar_linha(id_candidato, None)
+            self._repo_recomendacao.remover_por_candidato(id_candidato)
+            self._carimbar(_CANDIDATOS, _LINHAS)
+
+    def competencias_alteradas(self, ids_candidatos: Collection[int]) -> None:
+        if self._motor is None:
+            return
+        with self._lock:
+            self._sincronizar(_COMPETENCIAS)
+            self._recalcular(ids_candidatos)
+            self._carimbar(_COMPETENCIAS)
+
+    def invalidar(self) -> None:
+        """Descarta catálogo e índices; a próxima leitura ou aviso relê os repositórios."""
+        with self._lock:
+            self._montada = False
+            self._conferidas = None
+            self._limpar()
+
+    # ------------------------------------------------------------------
+    # Helpers privados
+    # ------------------------------------------------------------------
+
+    def _versoes(self) -> Tuple:
+        return (
+            self._repo_vaga.versao(),
+            self._repo_curso.versao(),
+            self._repo_candidato.versao(),
+            self._motor.versao() if self._motor else None,
+            self._repo_recomendacao.versao(),
+        )
+
+    def _sincronizar(self, avisada: Optional[int] = None) -> None:
+        """Monta a visão, ou a remonta se algum repositório mudou sem aviso.
+
+        `avisada` é a fonte da escrita que está sendo avisada: a mudança de
+        versão dela é esperada e não remonta nada.
+        """
+        versoes = self._versoes()
+        if self._montada:
+            mudaram = {
+                fonte
+                for fonte, (vista, atual) in enumerate(zip(self._vistas, versoes))
+                if vista != atual and fonte != avisada
+            }
+            if not mudaram:
+                return
+            self._montada = False
+            self._limpar()
+            if mudaram != {_LINHAS}:
+                self._conferidas = set()
+        self._montar()
+        self._vistas = versoes
+
+    def _incluir_vaga(self, vaga: Vaga) -> Set[int]:
+        """Põe a vaga no catálogo no estado gravado; retorna os candidatos cujas linhas ela afeta."""
+        afetados = self._retirar_vaga(vaga.id)
+        if self._catalogo.vetores is not None:
+            self._catalogo.vetores[MotorCompatibilidade.chave_vaga(vaga)] = (
+                self._motor.requisitos_da_vaga(vaga)
+            )
+        entrada = CatalogoRecomendacao.entrada(vaga) if vaga.ativa else None
+        if entrada is not None:
+            grupo, item = entrada
+            CatalogoRecomendacao.incluir(self._catalogo.vagas, grupo, item)
+            self._entradas[vaga.id] = entrada
+            afetados |= self._alcancados(grupo, -item[0])
+        return afetados
+
+    def _carimbar(self, *fontes: int) -> None:
+        """Registra as versões atuais das fontes que esta visão acabou de acompanhar."""
+        atuais = self._versoes()
+        self._vistas = tuple(
+            atuais[fonte] if fonte in fontes else vista for fonte, vista in enumerate(self._vistas)
+        )
+
+    def _confiavel(self, id_candidato: int) -> bool:
+        return self._conferidas is None or id_candidato in self._conferidas
+
+    def _montar(self) -> None:
+        self._catalogo = CatalogoRecomendacao(
+            vagas=CatalogoRecomendacao.agrupar(self._repo_vaga.listar_ativas()),
+            cursos=CatalogoRecomendacao.agrupar(c for c in self._repo_curso.listar_todos() if c.ativo),
+            # Cópia: vaga_salva atualiza os vetores do catálogo no lugar
+            vetores=dict(self._motor.vetores_requisitos()) if self._motor else None,
+            top_n=self._top_n,
+        )
+        for grupo, lista in self._catalogo.vagas.items():
+            for item in lista:
+                self._entradas[item[1]] = (grupo, item)
+        for candidato in self._repo_candidato.iterar():
+            chave = (tuple(a.lower() for a in candidato.areas_interesse), candidato.localidade)
+            self._indexar_candidato(candidato.id, chave)
+        for salva in self._repo_recomendacao.iterar():
+            self._indexar_linha(salva.id_candidato, salva)
+        self._montada = True
+
+    def _retirar_vaga(self, id_vaga: int) -> Set[int]:
+        """Tira a vaga do catálogo e devolve os candidatos cuja linha salva a contém."""
+        entrada = self._entradas.pop(id_vaga, None)
+        if entrada is not None:
+            CatalogoRecomendacao.retirar(self._catalogo.vagas, *entrada)
+        return set(self._linhas_com.get(id_vaga, ()))
+
+    def _alcancados(self, grupo: Grupo, pontos_fixos: int) -> Set[int]:
+        """Candidatos do grupo em cuja linha uma vaga com esses pontos fixos pode entrar."""
+        maximo = pontos_fixos + (PesoRecomendacao.COMPETENCIAS if self._motor else 0)
+        return {
+            id_candidato
+            for id_candidato in self._publico.get(grupo, ())
+            if id_candidato in self._piores
+            and (self._piores[id_candidato] is None or maximo >= self._piores[id_candidato])
+        }
+
+    def _indexar_candidato(self, id_candidato: int, chave: Optional[_ChaveCandidato]) -> None:
+        anterior = self._candidatos.pop(id_candidato, None)
+        if anterior is not None:
+            for grupo in CatalogoRecomendacao.grupos_do_candidato(*anterior):
+                publico = self._publico[grupo]
+                publico.discard(id_candidato)
+                if not publico:
+                    del self._publico[grupo]
+        if chave is not None:
+            self._candidatos[id_candidato] = chave
+            for grupo in CatalogoRecomendacao.grupos_do_candidato(*chave):
+                self._publico.setdefault(grupo, set()).add(id_candidato)
+
+    def _indexar_linha(self, id_candidato: int, salva: Optional[RecomendacaoSalva]) -> None:
+        for id_vaga in self._vagas_da_linha.pop(id_candidato, ()):
+            linhas = self._linhas_com[id_vaga]
+            linhas.discard(id_candidato)
+            if not linhas:
+                del self._linhas_com[id_vaga]
+        self._piores.pop(id_candidato, None)
+        if salva is None:
+            return
+        self._vagas_da_linha[id_candidato] = tuple(v.id for v in salva.vagas)
+        for id_vaga in self._vagas_da_linha[id_candidato]:
+            self._linhas_com.setdefault(id_vaga, set()).add(id_candidato)
+        self._piores[id_candidato] = (
+            salva.vagas[-1].pontuacao if len(salva.vagas) >= self._top_n else None
+        )
+
+    def _perfis(self, ids_candidatos: List[int]) -> Dict[int, Perfil]:
+        if self._motor is None:
+            return {}
+        if len(ids_candidatos) == 1:
+            return {ids_candidatos[0]: self._motor.perfil(ids_candidatos[0])}
+        # Uma passada pelas competências em vez de uma consulta por candidato
+        return self._motor.perfis()
+
+    def _recalcular(self, ids_candidatos: Iterable[int]) -> List[RecomendacaoSalva]:
+        """Recalcula e grava, numa única escrita, as linhas dos candidatos informados."""
+        ids = sorted(i for i in set(ids_candidatos) if i in self._candidatos)
+        if not ids:
+            return []
+        perfis = self._perfis(ids)
+        gerada_em = datetime.now().isoformat(timespec="seconds")
+        linhas = [
+            recomendar_do_catalogo(
+                self._catalogo,
+                (i, *self._candidatos[i], perfis.get(i, {}) if self._motor else None),
+                gerada_em,
+            )
+            for i in ids
+        ]
+        self._repo_recomendacao.salvar_muitos(linhas)
+        self._carimbar(_LINHAS)
+        for salva in linhas:
+            self._indexar_linha(salva.id_candidato, salva)
+        if self._conferidas is not None:
+            self._conferidas.update(ids)
+        return linhas
@@ -1,5 +1,8 @@
+from typing import Optional
 from src.dominio.empresa import Empresa
 from src.interfaces.interface_empresa import IEmpresa
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.interfaces.paginacao import Pagina, TAMANHO_PAGINA
 
 
 class EmpresaService:
@@ -11,21 +14,26 @@ class EmpresaService:
     para realizar operações de persistência.
     """
 
-    def __init__(self, repositorio: IEmpresa):
-        """Inicializa o serviço com um repositório específico."""
+    def __init__(self, repositorio: IEmpresa, sequencia: Optional[ISequenciaIds] = None):
+        """Inicializa o serviço com um repositório específico. Sem `sequencia`, o ID é o maior existente + 1."""
         self.repo = repositorio
+        self._sequencia = sequencia
+
+    def _maior_id(self) -> int:
+        return max((e.id for e in self.repo.listar()), default=0)
 
     def cadastrar(self, nome, cnpj, porte):
         """
         Cadastra uma nova empresa.
         Validação: não permitir CNPJ duplicado.
         """
-        empresas = self.repo.listar()
-
-        if any(e.cnpj == cnpj for e in empresas):
+        if self.repo.buscar_por_cnpj(cnpj):
             raise ValueError("Já existe empresa com este CNPJ")
 
-        novo_id = 1 if not empresas else max(e.id for e in empresas) + 1
+        if self._sequencia:
+            novo_id = self._sequencia.proximo("empresa", self._maior_id)
+        else:
+            novo_id = self._maior_id() + 1
 
         empresa = Empresa(
             novo_id,
@@ -41,6 +49,10 @@ class EmpresaService:
         """Lista todas as empresas utilizando o repositório."""
         return self.repo.listar()
 
+    def paginar(self, limite: int = TAMANHO_PAGINA, cursor=None) -> Pagina:
+        """Retorna uma página de empresas em ordem de ID."""
+        return self.repo.paginar(limite, cursor)
+
     def buscar_por_id(self, id_empresa: int):
         """Busca uma empresa pelo ID. Se não encontrar, lança exceção."""
         empresa = self.repo.buscar_por_id(id_empresa)
@@ -2,8 +2,11 @@
 Configuração compartilhada de testes do SkillUp.
 Fixtures disponíveis para todos os módulos de teste.
 """
+import atexit
+import shutil
 import sys
 import os
+import tempfile
 from datetime import date
 
 import pytest
@@ -11,6 +14,12 @@ import pytest
 # Garante que o diretório raiz do projeto está no sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# Antes de importar os repositórios: nada do que os testes gravam por engano
+# com os caminhos padrão vai para src/data
+_DIRETORIO_DADOS = tempfile.mkdtemp(prefix="skillup-dados-")
+os.environ["SKILLUP_DADOS"] = _DIRETORIO_DADOS
+atexit.register(shutil.rmtree, _DIRETORIO_DADOS, True)
+
 
 @pytest.fixture
 def future_date():
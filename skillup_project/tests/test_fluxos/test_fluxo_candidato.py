@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from src.aplicacao.fluxo_candidato import FluxoCandidato
+from src.dominio.recomendacao_salva import CursoRecomendado, RecomendacaoSalva, VagaRecomendada
 
 class TestFluxoCandidatoInicializacao:
     """Testes de inicialização"""
@@ -130,6 +131,34 @@ class TestFluxoCandidatoMenuPrincipal:
         fluxo._explorar_vagas()
         fluxo.motor_busca_vagas.buscar_por_candidato.assert_called_once()
 
+    @patch('builtins.input', side_effect=['', '2', ''])
+    @patch('os.system')
+    def test_explorar_vagas_candidatar_estagio(self, mock_os, mock_input, fluxo, mock_services):
+        """Testa candidatura a uma vaga de estágio listada na busca federada"""
+        from src.dominio.candidatura import TipoVagaCandidatura
+        from src.services.service_busca_federada import ResultadoBusca, VagaEncontrada
+        vaga_clt, vaga_estagio = MagicMock(id=3), MagicMock(id=3)
+        fluxo.motor_busca_vagas.buscar_por_candidato.return_value = ResultadoBusca(
+            [VagaEncontrada(vaga_clt, TipoVagaCandidatura.CLT),
+             VagaEncontrada(vaga_estagio, TipoVagaCandidatura.ESTAGIO)],
+            total=2, pagina=1, por_pagina=10,
+        )
+        fluxo._explorar_vagas()
+        mock_services["service_candidatura"].cadastrar.assert_called_once_with(
+            3, TipoVagaCandidatura.ESTAGIO, fluxo.candidato_logado.id
+        )
+
+    @patch('builtins.input', side_effect=['python', ''])
+    @patch('os.system')
+    def test_explorar_vagas_por_palavra_chave(self, mock_os, mock_input, fluxo):
+        """Testa a busca textual de vagas"""
+        fluxo.motor_busca_vagas.buscar_texto.return_value = []
+        fluxo._explorar_vagas()
+        fluxo.motor_busca_vagas.buscar_texto.assert_called_once_with(
+            "python", pagina=1, por_pagina=fluxo.VAGAS_POR_PAGINA
+        )
+        fluxo.motor_busca_vagas.buscar_por_candidato.assert_not_called()
+
 
 class TestFluxoCandidatoCompetencias:
     """Testes de gerenciamento de competências do candidato"""
@@ -274,3 +303,34 @@ class TestFluxoCandidatoRecomendacoes:
         
         fluxo._ver_recomendacoes()
         # Não deve quebrar, apenas exibir mensagem
+
+    @patch('builtins.input', return_value='')
+    @patch('os.system')
+    def test_ver_recomendacoes_pre_calculadas(self, mock_os, mock_input, fluxo, mock_services, capsys):
+        """Testa que a linha da visão de recomendações é exibida sem recalcular"""
+        fluxo.visao_recomendacoes = MagicMock()
+        fluxo.visao_recomendacoes.buscar.return_value = RecomendacaoSalva(
+            id_candidato=1,
+            vagas=(VagaRecomendada(7, "Dev Python", "Tecnologia", "Remoto", 90, 80),),
+            cursos=(CursoRecomendado(3, "Curso Python", "Tecnologia", 40, 70),),
+            gerada_em="2026-01-01T03:00:00",
+        )
+
+        fluxo._ver_recomendacoes()
+
+        fluxo.visao_recomendacoes.buscar.assert_called_once_with(1)
+        mock_services["service_recomendacao"].recomendar.assert_not_called()
+        saida = capsys.readouterr().out
+        assert "Dev Python" in saida and "80%" in saida and "Curso Python" in saida
+
+    @patch('builtins.input', return_value='')
+    @patch('os.system')
+    def test_ver_recomendacoes_ainda_nao_calculadas(self, mock_os, mock_input, fluxo, mock_services):
+        """Testa que, sem linha na visão, o cálculo é feito na hora"""
+        fluxo.visao_recomendacoes = MagicMock()
+        fluxo.visao_recomendacoes.buscar.return_value = None
+        mock_services["service_recomendacao"].recomendar.return_value = MagicMock(vagas=[], cursos=[])
+
+        fluxo._ver_recomendacoes()
+
+        mock_services["service_recomendacao"].recomendar.assert_called_once()
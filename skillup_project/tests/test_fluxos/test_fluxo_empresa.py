@@ -195,7 +195,7 @@ class TestFluxoEmpresaGerenciarVagas:
         
         assert mock_services["service_vaga_clt"].listar_por_empresa.called
 
-    @patch('builtins.input', side_effect=['5'])  # Voltar imediatamente
+    @patch('builtins.input', side_effect=['6'])  # Voltar imediatamente
     @patch('os.system')
     def test_gerenciar_vagas_voltar(self, mock_os, mock_input, fluxo):
         """Testa voltar do menu gerenciar vagas"""
@@ -252,6 +252,28 @@ class TestFluxoEmpresaGerenciarVagas:
         
         mock_services["service_vaga_clt"].pausar.assert_called_once_with(1)
 
+    @patch('builtins.input', side_effect=['1', ''])
+    @patch('os.system')
+    def test_ranquear_candidatos(self, mock_os, mock_input, fluxo, mock_services, capsys):
+        """Testa o ranking de candidatos para uma vaga da empresa"""
+        mock_vaga = MagicMock()
+        mock_vaga.id_empresa = 1
+        mock_services["service_vaga_clt"].buscar_por_id.return_value = mock_vaga
+        candidato = MagicMock()
+        candidato.id = 7
+        candidato.nome = "Ana"
+        item = MagicMock(item=candidato, pontuacao=90)
+        item.compatibilidade.percentual = 75
+        fluxo.service_recomendacao = MagicMock()
+        fluxo.service_recomendacao.ranquear_candidatos_para_vaga.return_value = [item]
+
+        fluxo._ranquear_candidatos()
+
+        fluxo.service_recomendacao.ranquear_candidatos_para_vaga.assert_called_once_with(1)
+        saida = capsys.readouterr().out
+        assert "[7] Ana" in saida
+        assert "75%" in saida
+
 
 class TestFluxoEmpresaCandidaturas:
     """Testes de visualização de candidaturas"""
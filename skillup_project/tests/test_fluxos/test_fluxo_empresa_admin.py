@@ -2,13 +2,14 @@
 Testes automatizados para FluxoEmpresaAdmin
 """
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from src.aplicacao.fluxo_empresa_admin import FluxoEmpresaAdmin
+from src.interfaces.paginacao import Pagina
 
 
 class TestFluxoEmpresaAdminInicializacao:
@@ -74,4 +75,42 @@ class TestFluxoEmpresaAdminMenu:
         empresa = MagicMock(id=1, nome="Empresa Teste")
         fluxo.service_empresa.buscar_por_id.return_value = empresa
         fluxo._buscar_por_id()
-        fluxo.service_empresa.buscar_por_id.assert_called_once_with(1)
\ No newline at end of file
+        fluxo.service_empresa.buscar_por_id.assert_called_once_with(1)
+
+class TestFluxoEmpresaAdminListagens:
+    """Testes das listagens paginadas"""
+
+    @pytest.fixture
+    def fluxo(self):
+        return FluxoEmpresaAdmin(
+            service_empresa=MagicMock(),
+            service_vaga_clt=MagicMock(),
+            service_vaga_estagio=MagicMock(),
+            service_requisito_vaga=MagicMock(),
+            service_candidatura=MagicMock(),
+        )
+
+    @staticmethod
+    def _candidatura(id_c):
+        return MagicMock(id=id_c, id_vaga=1, id_candidato=2, status="enviado")
+
+    @patch('builtins.input', side_effect=['', ''])
+    @patch('os.system')
+    def test_listar_candidaturas_busca_proxima_pagina_sob_demanda(self, mock_os, mock_input, fluxo):
+        """Busca a segunda página só depois do ENTER"""
+        fluxo.service_candidatura.paginar.side_effect = [
+            Pagina([self._candidatura(1)], 1),
+            Pagina([self._candidatura(2)]),
+        ]
+        fluxo._listar_todas_candidaturas()
+        assert fluxo.service_candidatura.paginar.call_args_list == [
+            call(fluxo.ITENS_POR_PAGINA, None), call(fluxo.ITENS_POR_PAGINA, 1),
+        ]
+
+    @patch('builtins.input', side_effect=['V', ''])
+    @patch('os.system')
+    def test_listar_candidaturas_interrompe(self, mock_os, mock_input, fluxo):
+        """V encerra a listagem sem ler a próxima página"""
+        fluxo.service_candidatura.paginar.return_value = Pagina([self._candidatura(1)], 1)
+        fluxo._listar_todas_candidaturas()
+        fluxo.service_candidatura.paginar.assert_called_once()
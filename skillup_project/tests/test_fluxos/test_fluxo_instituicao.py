@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from src.aplicacao.fluxo_instituicao import FluxoInstituicao
+from src.interfaces.paginacao import Pagina
 
 class TestFluxoInstituicaoInicializacao:
     """Testes de inicialização"""
@@ -298,11 +299,11 @@ class TestFluxoInstituicaoVerInscritos:
         mock_inscricao.id_candidato = 10
         mock_inscricao.data_inscricao = "2025-01-01"
         mock_inscricao.status = "ativo"
-        mock_services["service_inscricao_curso"].listar_por_curso.return_value = [mock_inscricao]
+        mock_services["service_inscricao_curso"].paginar.return_value = Pagina([mock_inscricao])
         
         fluxo._listar_inscritos_ead()
         
-        mock_services["service_inscricao_curso"].listar_por_curso.assert_called()
+        mock_services["service_inscricao_curso"].paginar.assert_called_once_with(20, None, id_curso=1)
 
     @patch('builtins.input', side_effect=['1', ''])
     @patch('os.system')
@@ -0,0 +1,164 @@
+import json
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.repositorios import arquivos, loader
+from src.repositorios.arquivos import (
+    SUFIXO_TEMPORARIO,
+    SUFIXO_TRAVA,
+    caminho_dados,
+    escrever_atomico,
+    trava_do_arquivo,
+)
+from src.repositorios.journal import JournalJsonRepository
+from src.repositorios.loader import JsonRepository
+
+
+def _gravar_em_outro_processo(caminho: str, inicio: int, quantidade: int, journal: bool) -> None:
+    loader.limpar_cache()
+    classe = JournalJsonRepository if journal else JsonRepository
+    repo = classe(caminho)
+    for i in range(inicio, inicio + quantidade):
+        repo.gravar({"id": i})
+
+
+class TestCaminhoDados(unittest.TestCase):
+    """Diretório padrão dos arquivos de dados."""
+
+    def test_usa_skillup_dados_quando_definido(self):
+        with patch.dict(os.environ, {"SKILLUP_DADOS": "/tmp/outro"}):
+            self.assertEqual(caminho_dados("vaga_clt.json"), os.path.join("/tmp/outro", "vaga_clt.json"))
+        with patch.dict(os.environ, {"SKILLUP_DADOS": ""}):
+            self.assertEqual(
+                caminho_dados("vaga_clt.json"),
+                os.path.join(arquivos.DIRETORIO_DADOS_PADRAO, "vaga_clt.json"),
+            )
+
+    def test_testes_nao_gravam_em_src_data(self):
+        self.assertNotEqual(os.path.dirname(caminho_dados("x.json")), arquivos.DIRETORIO_DADOS_PADRAO)
+
+
+class TestEscritaAtomica(unittest.TestCase):
+    """Escrita por temporário + os.replace."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_falha_no_meio_preserva_o_arquivo(self):
+        escrever_atomico(self.caminho, lambda f: json.dump([{"id": 1}], f))
+
+        def quebra(f):
+            f.write('[{"id": 2},')
+            raise OSError("disco cheio")
+
+        with self.assertRaises(OSError):
+            escrever_atomico(self.caminho, quebra)
+        with open(self.caminho, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), [{"id": 1}])
+        self.assertFalse(os.path.exists(self.caminho + SUFIXO_TEMPORARIO))
+
+    def test_repositorio_nao_reescreve_no_lugar(self):
+        repo = JsonRepository(self.caminho)
+        repo.salvar([{"id": 1}])
+        inode = os.stat(self.caminho).st_ino
+        with open(self.caminho, encoding="utf-8") as aberto:
+            repo.gravar({"id": 2})
+            # Quem já tinha o arquivo aberto continua vendo a versão inteira anterior
+            self.assertEqual(json.load(aberto), [{"id": 1}])
+        self.assertNotEqual(os.stat(self.caminho).st_ino, inode)
+
+
+@unittest.skipIf(arquivos.fcntl is None, "fcntl indisponível")
+class TestTravaArquivo(unittest.TestCase):
+    """Trava de leitores e escritor entre processos."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+        self.trava = trava_do_arquivo(self.caminho)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _outro_consegue(self, modo) -> bool:
+        # Outra descrição de arquivo conta como outro processo para o flock
+        with open(self.caminho + SUFIXO_TRAVA, "a") as f:
+            try:
+                arquivos.fcntl.flock(f, modo | arquivos.fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            arquivos.fcntl.flock(f, arquivos.fcntl.LOCK_UN)
+            return True
+
+    def test_leitores_compartilham_e_escritor_exclui(self):
+        fcntl = arquivos.fcntl
+        with self.trava.compartilhada():
+            self.assertTrue(self._outro_consegue(fcntl.LOCK_SH))
+            self.assertFalse(self._outro_consegue(fcntl.LOCK_EX))
+        with self.trava.exclusiva():
+            self.assertFalse(self._outro_consegue(fcntl.LOCK_SH))
+        self.assertTrue(self._outro_consegue(fcntl.LOCK_EX))
+
+    def test_reentrante_e_promove_a_exclusiva(self):
+        fcntl = arquivos.fcntl
+        with self.trava.exclusiva():
+            with self.trava.compartilhada():
+                self.assertFalse(self._outro_consegue(fcntl.LOCK_SH))
+            self.assertFalse(self._outro_consegue(fcntl.LOCK_SH))
+        with self.trava.compartilhada():
+            with self.trava.exclusiva():
+                self.assertFalse(self._outro_consegue(fcntl.LOCK_SH))
+            self.assertTrue(self._outro_consegue(fcntl.LOCK_SH))
+
+    def test_mesma_trava_para_o_mesmo_arquivo(self):
+        self.assertIs(trava_do_arquivo(os.path.join(self._tmp.name, ".", "dados.json")), self.trava)
+
+
+@unittest.skipIf(
+    arquivos.fcntl is None or "fork" not in multiprocessing.get_all_start_methods(),
+    "fcntl ou fork indisponível",
+)
+class TestVariosProcessos(unittest.TestCase):
+    """Processos gravando no mesmo arquivo não perdem as escritas uns dos outros."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        loader.limpar_cache()
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def _gravar_em_paralelo(self, journal: bool) -> list:
+        caminho = os.path.join(self._tmp.name, "dados.json")
+        contexto = multiprocessing.get_context("fork")
+        processos = [
+            contexto.Process(target=_gravar_em_outro_processo, args=(caminho, n * 100, 40, journal))
+            for n in range(4)
+        ]
+        for processo in processos:
+            processo.start()
+        for processo in processos:
+            processo.join(timeout=60)
+            self.assertEqual(processo.exitcode, 0)
+        classe = JournalJsonRepository if journal else JsonRepository
+        return sorted(r["id"] for r in classe(caminho).carregar())
+
+    def test_json(self):
+        esperado = [n * 100 + i for n in range(4) for i in range(40)]
+        self.assertEqual(self._gravar_em_paralelo(journal=False), esperado)
+
+    def test_journal(self):
+        esperado = [n * 100 + i for n in range(4) for i in range(40)]
+        self.assertEqual(self._gravar_em_paralelo(journal=True), esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from src.repositorios.indice_ordenado import IndiceOrdenado
+
+
+class TestIndiceOrdenado(unittest.TestCase):
+    """Testes do índice ordenado usado nas consultas por faixa."""
+
+    def setUp(self):
+        self.indice = IndiceOrdenado([(5000.0, 1), (3000.0, 2), (8000.0, 3), (5000.0, 4)])
+
+    def test_faixa_inclusiva_em_ordem_de_valor(self):
+        self.assertEqual(self.indice.faixa(3000.0, 5000.0), [2, 1, 4])
+        self.assertEqual(self.indice.faixa(minimo=5000.0), [1, 4, 3])
+        self.assertEqual(self.indice.faixa(maximo=2999.0), [])
+        self.assertEqual(self.indice.faixa(9000.0, 1000.0), [])
+
+    def test_limites_contam_sem_materializar(self):
+        inicio, fim = self.indice.limites(4000.0, 9000.0)
+        self.assertEqual(fim - inicio, 3)
+
+    def test_adicionar_e_remover(self):
+        self.indice.adicionar(4000.0, 5)
+        self.assertTrue(self.indice.remover(5000.0, 4))
+        self.assertFalse(self.indice.remover(5000.0, 99))
+        self.assertEqual(self.indice.faixa(), [2, 5, 1, 3])
+        self.assertEqual(len(self.indice), 4)
+
+    def test_decrescente(self):
+        self.assertEqual(list(self.indice.decrescente()), [3, 4, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
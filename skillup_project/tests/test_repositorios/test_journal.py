@@ -0,0 +1,199 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.repositorios import armazenamento, loader
+from src.repositorios.journal import JournalJsonRepository
+from src.repositorios.loader import JsonRepository
+
+
+class TestJournalJsonRepository(unittest.TestCase):
+    """Testes do armazenamento com journal append-only."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+        self.caminho_journal = self.caminho + ".journal"
+        loader.limpar_cache()
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def _linhas_journal(self):
+        with open(self.caminho_journal, "r", encoding="utf-8") as f:
+            return [json.loads(l) for l in f if l.strip()]
+
+    def test_gravar_anexa_ao_journal_sem_reescrever_snapshot(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.salvar([{"id": 1, "nome": "A"}])
+        with open(self.caminho, "rb") as f:
+            snapshot = f.read()
+
+        repo.gravar({"id": 2, "nome": "B"})
+
+        with open(self.caminho, "rb") as f:
+            self.assertEqual(f.read(), snapshot)
+        self.assertEqual(self._linhas_journal(), [{"op": "gravar", "registro": {"id": 2, "nome": "B"}}])
+        self.assertEqual(repo.carregar(), [{"id": 1, "nome": "A"}, {"id": 2, "nome": "B"}])
+
+    def test_replay_reconstroi_estado_apos_limpar_cache(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.salvar([{"id": 1, "nome": "A"}, {"id": 2, "nome": "B"}])
+        repo.gravar({"id": 1, "nome": "A2"})
+        repo.remover(2)
+        repo.gravar({"id": 3, "nome": "C"})
+
+        loader.limpar_cache()
+
+        self.assertEqual(
+            JournalJsonRepository(self.caminho).carregar(),
+            [{"id": 1, "nome": "A2"}, {"id": 3, "nome": "C"}],
+        )
+
+    def test_iterar_aplica_journal_na_ordem_do_replay(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.salvar([{"id": 1, "nome": "A"}, {"id": 2, "nome": "B"}, {"id": 3, "nome": "C"}])
+        repo.gravar({"id": 1, "nome": "A2"})
+        repo.remover(2)
+        repo.remover(3)
+        repo.gravar({"id": 4, "nome": "D"})
+        repo.gravar({"id": 3, "nome": "C2"})
+
+        loader.limpar_cache()
+        repo = JournalJsonRepository(self.caminho)
+        registros = list(repo.iterar())
+
+        self.assertEqual(registros, [{"id": 1, "nome": "A2"}, {"id": 4, "nome": "D"}, {"id": 3, "nome": "C2"}])
+        self.assertEqual(registros, repo.carregar())
+
+    def test_gravar_muitos_anexa_uma_linha_por_registro(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.salvar([{"id": 1, "nome": "A"}])
+        repo.gravar_muitos([{"id": 1, "nome": "A2"}, {"id": 2, "nome": "B"}])
+
+        self.assertEqual([op["registro"]["id"] for op in self._linhas_journal()], [1, 2])
+        loader.limpar_cache()
+        self.assertEqual(
+            JournalJsonRepository(self.caminho).carregar(),
+            [{"id": 1, "nome": "A2"}, {"id": 2, "nome": "B"}],
+        )
+
+    def test_linha_incompleta_no_fim_e_ignorada(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.salvar([{"id": 1}])
+        repo.gravar({"id": 2})
+        with open(self.caminho_journal, "a", encoding="utf-8") as f:
+            f.write('{"op": "gravar", "regis')
+
+        loader.limpar_cache()
+
+        self.assertEqual(JournalJsonRepository(self.caminho).carregar(), [{"id": 1}, {"id": 2}])
+
+    def test_append_depois_de_linha_incompleta_nao_se_perde(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.gravar({"id": 1})
+        with open(self.caminho_journal, "a", encoding="utf-8") as f:
+            f.write('{"op": "gravar", "registro": {"id": 2, "nome": "Jo')
+        # O mesmo repositório continua gravando: o append corta a linha incompleta
+        repo.gravar({"id": 3})
+
+        loader.limpar_cache()
+
+        self.assertEqual(JournalJsonRepository(self.caminho).carregar(), [{"id": 1}, {"id": 3}])
+
+    def test_abrir_corta_linha_incompleta(self):
+        JournalJsonRepository(self.caminho).gravar({"id": 1, "nome": "Ação"})
+        with open(self.caminho_journal, "ab") as f:
+            f.write('{"op": "gravar", "registro": {"id": 2, "nome": "Aç'.encode("utf-8")[:-1])
+        loader.limpar_cache()
+
+        repo = JournalJsonRepository(self.caminho)
+        with open(self.caminho_journal, "rb") as f:
+            self.assertTrue(f.read().endswith(b"\n"))
+        repo.gravar({"id": 3})
+        loader.limpar_cache()
+
+        self.assertEqual(
+            JournalJsonRepository(self.caminho).carregar(), [{"id": 1, "nome": "Ação"}, {"id": 3}]
+        )
+
+    def test_linha_corrompida_no_meio_nao_e_ignorada(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.gravar({"id": 1})
+        with open(self.caminho_journal, "a", encoding="utf-8") as f:
+            f.write('{"op": "grav\n{"op": "gravar", "registro": {"id": 2}}\n')
+        loader.limpar_cache()
+
+        with self.assertRaisesRegex(ValueError, "linha 2"):
+            repo.carregar()
+
+    def test_substituir_inexistente_nao_anexa(self):
+        repo = JournalJsonRepository(self.caminho)
+        repo.salvar([{"id": 1}])
+        self.assertFalse(repo.substituir({"id": 9}))
+        self.assertFalse(os.path.exists(self.caminho_journal))
+
+    def test_compactacao_incorpora_journal_no_snapshot(self):
+        repo = JournalJsonRepository(self.caminho, limite_journal=0)
+        repo.salvar([{"id": 1}])
+        repo.gravar({"id": 2})
+
+        self.assertFalse(os.path.exists(self.caminho_journal))
+        with open(self.caminho, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), [{"id": 1}, {"id": 2}])
+
+    def test_compactacao_regrava_snapshot_binario(self):
+        repo = JournalJsonRepository(self.caminho, snapshot_binario=True)
+        repo.salvar([{"id": 1}])
+        repo.gravar({"id": 2})
+        repo.remover(1)
+        repo.compactar()
+
+        loader.limpar_cache()
+        with patch.object(JsonRepository, "_ler_json") as ler_json:
+            self.assertEqual(JournalJsonRepository(self.caminho, snapshot_binario=True).carregar(), [{"id": 2}])
+            ler_json.assert_not_called()
+
+    def test_chave_personalizada(self):
+        repo = JournalJsonRepository(self.caminho, chave="id_candidatura")
+        repo.gravar({"id_candidatura": 5, "status": "Enviada"})
+        repo.gravar({"id_candidatura": 5, "status": "Aprovada"})
+        self.assertEqual(repo.carregar(), [{"id_candidatura": 5, "status": "Aprovada"}])
+
+
+class TestAbrirArmazenamento(unittest.TestCase):
+    """Testes da seleção do modo de armazenamento."""
+
+    def tearDown(self):
+        armazenamento.configurar_modo(armazenamento.MODO_ARQUIVO)
+
+    def test_modo_arquivo_retorna_json_repository(self):
+        armazenamento.configurar_modo(armazenamento.MODO_ARQUIVO)
+        repo = armazenamento.abrir_armazenamento("/tmp/x.json")
+        self.assertIs(type(repo), JsonRepository)
+
+    def test_modo_journal_retorna_journal(self):
+        armazenamento.configurar_modo(armazenamento.MODO_JOURNAL)
+        repo = armazenamento.abrir_armazenamento("/tmp/x.json", chave="id_area")
+        self.assertIsInstance(repo, JournalJsonRepository)
+        self.assertEqual(repo.chave, "id_area")
+
+    def test_snapshot_binario_configuravel(self):
+        armazenamento.configurar_snapshot_binario(True)
+        try:
+            repo = armazenamento.abrir_armazenamento("/tmp/x.json")
+        finally:
+            armazenamento.configurar_snapshot_binario(False)
+        self.assertEqual(repo._caminho_binario, "/tmp/x.json" + loader.SUFIXO_BINARIO)
+        self.assertIsNone(armazenamento.abrir_armazenamento("/tmp/x.json")._caminho_binario)
+
+    def test_modo_invalido(self):
+        with self.assertRaises(ValueError):
+            armazenamento.configurar_modo("banco")
+
+
+if __name__ == "__main__":
+    unittest.main()
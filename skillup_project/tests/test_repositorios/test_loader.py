@@ -0,0 +1,362 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.dominio.candidato import Candidato
+from src.dominio.excecoes import ChaveDuplicadaError
+from src.dominio.vaga import Modalidade, TipoVaga, VagaCLT
+from src.repositorios import loader
+from src.repositorios.loader import JsonRepository, iterar_array_json
+from src.repositorios.repositorio_candidato import RepositorioCandidatoJSON
+from src.repositorios.repositorio_vaga_clt import RepositorioVagaCLTJSON
+
+
+class TestJsonRepositoryCache(unittest.TestCase):
+    """Testes do cache em memória do JsonRepository."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+        loader.limpar_cache()
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def _escrever_externo(self, lista):
+        with open(self.caminho, "w", encoding="utf-8") as f:
+            json.dump(lista, f)
+        # Garante mtime diferente mesmo em sistemas de arquivos com baixa resolução
+        st = os.stat(self.caminho)
+        os.utime(self.caminho, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    def test_arquivo_inexistente_retorna_lista_vazia(self):
+        self.assertEqual(JsonRepository(self.caminho).carregar(), [])
+
+    def test_leituras_repetidas_nao_reabrem_arquivo(self):
+        self._escrever_externo([{"id": 1}])
+        repo = JsonRepository(self.caminho)
+        repo.carregar()
+        with patch.object(JsonRepository, "_ler_arquivo") as mock_ler:
+            self.assertEqual(repo.carregar(), [{"id": 1}])
+            mock_ler.assert_not_called()
+
+    def test_cache_compartilhado_entre_instancias(self):
+        repo_a = JsonRepository(self.caminho)
+        repo_b = JsonRepository(self.caminho)
+        repo_a.salvar([{"id": 1}])
+        with patch.object(JsonRepository, "_ler_arquivo") as mock_ler:
+            self.assertEqual(repo_b.carregar(), [{"id": 1}])
+            mock_ler.assert_not_called()
+
+    def test_alteracao_externa_invalida_cache(self):
+        repo = JsonRepository(self.caminho)
+        repo.salvar([{"id": 1}])
+        self._escrever_externo([{"id": 1}, {"id": 2}])
+        self.assertEqual(len(repo.carregar()), 2)
+
+    def test_versao_muda_a_cada_gravacao(self):
+        repo = JsonRepository(self.caminho)
+        self.assertEqual(repo.versao(), ())
+        repo.salvar([{"id": 1}])
+        depois_de_salvar = repo.versao()
+        self.assertNotEqual(depois_de_salvar, ())
+        self.assertEqual(repo.versao(), depois_de_salvar)
+        self._escrever_externo([{"id": 1}, {"id": 2}])
+        self.assertNotEqual(JsonRepository(self.caminho).versao(), depois_de_salvar)
+
+    def test_carregar_retorna_copia_da_lista(self):
+        repo = JsonRepository(self.caminho)
+        repo.salvar([{"id": 1}])
+        dados = repo.carregar()
+        dados.append({"id": 2})
+        self.assertEqual(len(repo.carregar()), 1)
+
+    def test_json_invalido_retorna_lista_vazia(self):
+        with open(self.caminho, "w", encoding="utf-8") as f:
+            f.write("{invalido")
+        self.assertEqual(JsonRepository(self.caminho).carregar(), [])
+
+
+class TestJsonRepositoryIndices(unittest.TestCase):
+    """Testes dos índices primário e secundários do JsonRepository."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+        loader.limpar_cache()
+        self.repo = JsonRepository(self.caminho)
+        self.repo.salvar([
+            {"id": 1, "vaga": 10, "status": "Enviado"},
+            {"id": 2, "vaga": 10, "status": "Aceito"},
+            {"id": 3, "vaga": 11, "status": "Enviado"},
+        ])
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def test_buscar_por_indice(self):
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_indice("vaga", 10)], [1, 2])
+        self.assertEqual(self.repo.contar_por_indice("status", "Enviado"), 2)
+        self.assertEqual(self.repo.buscar_por_indice("vaga", 99), [])
+
+    def test_indice_mantido_nas_operacoes_pontuais(self):
+        self.repo.contar_por_indice("vaga", 10)  # constrói o índice
+        self.repo.gravar({"id": 4, "vaga": 10, "status": "Enviado"})
+        self.repo.substituir({"id": 1, "vaga": 11, "status": "Enviado"})
+        self.repo.remover(2)
+
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_indice("vaga", 10)], [4])
+        self.assertEqual(sorted(r["id"] for r in self.repo.buscar_por_indice("vaga", 11)), [1, 3])
+        self.assertIsNone(self.repo.buscar(2))
+        self.assertEqual(self.repo.buscar(1)["vaga"], 11)
+
+    def test_consulta_indexada_nao_percorre_lista(self):
+        self.repo.contar_por_indice("vaga", 10)
+        self.repo.buscar(1)
+        entrada = loader._CACHE[self.repo._chave_cache]
+        entrada.dados = _ListaSemIteracao(entrada.dados)
+        self.assertEqual(self.repo.contar_por_indice("vaga", 10), 2)
+        self.assertEqual(self.repo.buscar(3)["vaga"], 11)
+
+    def test_salvar_lista_inteira_reconstroi_indices(self):
+        self.repo.contar_por_indice("vaga", 10)
+        self.repo.salvar([{"id": 9, "vaga": 10, "status": "Enviado"}])
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_indice("vaga", 10)], [9])
+
+    def test_pagina_por_cursor(self):
+        self.repo.gravar({"id": 0, "vaga": 11, "status": "Aceito"})
+        registros, cursor = self.repo.pagina(2)
+        self.assertEqual(([r["id"] for r in registros], cursor), ([0, 1], 1))
+        registros, cursor = self.repo.pagina(2, cursor)
+        self.assertEqual(([r["id"] for r in registros], cursor), ([2, 3], None))
+        registros, cursor = self.repo.pagina(1, 0, "vaga", 11)
+        self.assertEqual(([r["id"] for r in registros], cursor), ([3], None))
+        self.assertEqual(self.repo.pagina(5, None, "vaga", 99), ([], None))
+
+    def test_buscar_por_faixa_ordena_pelo_valor(self):
+        self.repo.salvar([
+            {"id": 1, "salario": 5000.0},
+            {"id": 2, "salario": 3000},
+            {"id": 3, "salario": 8000.0},
+            {"id": 4, "salario": None},
+        ])
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_faixa("salario", 3000, 5000)], [2, 1])
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_faixa("salario", 4000)], [1, 3])
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_faixa("salario", maximo=100)], [])
+
+    def test_indice_ordenado_mantido_nas_operacoes_pontuais(self):
+        self.repo.salvar([{"id": 1, "salario": 5000.0}, {"id": 2, "salario": 3000.0}])
+        self.repo.buscar_por_faixa("salario")  # constrói o índice
+        self.repo.gravar({"id": 3, "salario": 4000.0})
+        self.repo.substituir({"id": 1, "salario": 1000.0})
+        self.repo.remover(2)
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_faixa("salario")], [1, 3])
+
+
+    def test_gravar_muitos_escreve_uma_vez(self):
+        self.repo.contar_por_indice("vaga", 10)
+        lote = [
+            {"id": 2, "vaga": 11, "status": "Aceito"},
+            {"id": 4, "vaga": 10, "status": "Enviado"},
+            {"id": 1, "vaga": 11, "status": "Enviado"},
+        ]
+        with patch.object(JsonRepository, "_escrever", wraps=self.repo._escrever) as mock_escrever:
+            self.repo.gravar_muitos(lote)
+            mock_escrever.assert_called_once()
+        self.assertEqual([r["id"] for r in self.repo.carregar()], [1, 2, 3, 4])
+        self.assertEqual([r["id"] for r in self.repo.buscar_por_indice("vaga", 10)], [4])
+        loader.limpar_cache()
+        self.assertEqual(self.repo.buscar(2)["vaga"], 11)
+
+    def test_substituir_muitos_com_chave_inexistente_nao_grava(self):
+        self.assertFalse(self.repo.substituir_muitos([
+            {"id": 1, "vaga": 12, "status": "Aceito"}, {"id": 9, "vaga": 12, "status": "Aceito"},
+        ]))
+        self.assertEqual(self.repo.buscar(1)["vaga"], 10)
+        self.assertTrue(self.repo.substituir_muitos([{"id": 1, "vaga": 12, "status": "Aceito"}]))
+        self.assertEqual(self.repo.buscar(1)["vaga"], 12)
+
+class TestJsonRepositoryUnicos(unittest.TestCase):
+    """Testes dos campos únicos do JsonRepository."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+        loader.limpar_cache()
+        self.repo = JsonRepository(self.caminho, unicos=("cpf",))
+        self.repo.gravar({"id": 1, "cpf": "111"})
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def test_valor_repetido_levanta_erro_tipado(self):
+        with self.assertRaises(ChaveDuplicadaError) as ctx:
+            self.repo.gravar({"id": 2, "cpf": "111"})
+        self.assertEqual((ctx.exception.campo, ctx.exception.valor), ("cpf", "111"))
+        self.assertEqual(self.repo.carregar(), [{"id": 1, "cpf": "111"}])
+
+    def test_regravar_mesmo_registro_e_permitido(self):
+        self.repo.gravar({"id": 1, "cpf": "111", "nome": "A"})
+        self.repo.gravar({"id": 1, "cpf": "222"})
+        self.repo.gravar({"id": 2, "cpf": "111"})
+        self.assertEqual(self.repo.buscar_unico("cpf", "111")["id"], 2)
+        self.assertEqual(self.repo.buscar_unico("cpf", "222")["id"], 1)
+
+
+    def test_gravar_muitos_com_valor_repetido_nao_grava_nada(self):
+        with self.assertRaises(ChaveDuplicadaError):
+            self.repo.gravar_muitos([{"id": 2, "cpf": "222"}, {"id": 3, "cpf": "222"}])
+        self.assertEqual(self.repo.carregar(), [{"id": 1, "cpf": "111"}])
+
+class TestLeituraEmBlocos(unittest.TestCase):
+    """Testes da leitura incremental de arrays JSON."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+        loader.limpar_cache()
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def test_registros_divididos_entre_blocos(self):
+        registros = [{"id": i, "nome": f"Nome {i}", "tags": ["a", "b"], "nota": i / 3} for i in range(50)]
+        texto = json.dumps(registros, indent=4)
+        for tamanho in (1, 7, 64, len(texto)):
+            self.assertEqual(list(iterar_array_json(io.StringIO(texto), tamanho)), registros)
+
+    def test_array_vazio_e_conteudo_invalido(self):
+        self.assertEqual(list(iterar_array_json(io.StringIO(" [ ] "))), [])
+        self.assertEqual(list(iterar_array_json(io.StringIO('{"id": 1}'))), [])
+        self.assertEqual(list(iterar_array_json(io.StringIO('[{"id": 1}, {"id"'), 4)), [{"id": 1}])
+
+    def test_iterar_sem_cache_nao_carrega_arquivo(self):
+        with open(self.caminho, "w", encoding="utf-8") as f:
+            json.dump([{"id": 1}, {"id": 2}], f)
+        repo = JsonRepository(self.caminho)
+        with patch.object(JsonRepository, "_ler_arquivo") as mock_ler:
+            self.assertEqual(list(repo.iterar()), [{"id": 1}, {"id": 2}])
+            mock_ler.assert_not_called()
+        self.assertEqual(loader._CACHE, {})
+
+    def test_iterar_usa_cache_ja_carregado(self):
+        repo = JsonRepository(self.caminho)
+        repo.salvar([{"id": 1}, {"id": 2}])
+        with patch.object(JsonRepository, "_iterar_arquivo") as mock_iterar:
+            registros = repo.iterar()
+            self.assertEqual(next(registros), {"id": 1})
+            repo.gravar({"id": 3})
+            self.assertEqual(list(registros), [{"id": 2}])
+            mock_iterar.assert_not_called()
+
+    def test_iterar_arquivo_inexistente(self):
+        self.assertEqual(list(JsonRepository(self.caminho).iterar()), [])
+
+
+class TestSnapshotBinario(unittest.TestCase):
+    """Testes do snapshot binário (marshal) ao lado do JSON."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "dados.json")
+        self.caminho_binario = self.caminho + loader.SUFIXO_BINARIO
+        loader.limpar_cache()
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def test_gravacao_gera_binario_e_leitura_a_frio_o_usa(self):
+        repo = JsonRepository(self.caminho, snapshot_binario=True)
+        repo.salvar([{"id": 1, "tags": ["a"]}])
+        repo.gravar({"id": 2, "tags": []})
+        self.assertTrue(os.path.exists(self.caminho_binario))
+
+        loader.limpar_cache()
+        with patch.object(JsonRepository, "_ler_json") as ler_json:
+            self.assertEqual(repo.carregar(), [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}])
+            ler_json.assert_not_called()
+
+    def test_binario_de_outro_json_e_ignorado_e_regravado(self):
+        repo = JsonRepository(self.caminho, snapshot_binario=True)
+        repo.salvar([{"id": 1}])
+        with open(self.caminho, "w", encoding="utf-8") as f:
+            json.dump([{"id": 9}], f)
+        loader.limpar_cache()
+
+        self.assertEqual(repo.carregar(), [{"id": 9}])
+        loader.limpar_cache()
+        with patch.object(JsonRepository, "_ler_json") as ler_json:
+            self.assertEqual(repo.carregar(), [{"id": 9}])
+            ler_json.assert_not_called()
+
+    def test_binario_corrompido_cai_no_json(self):
+        repo = JsonRepository(self.caminho, snapshot_binario=True)
+        repo.salvar([{"id": 1}])
+        with open(self.caminho_binario, "wb") as f:
+            f.write(b"\x00lixo")
+        loader.limpar_cache()
+        self.assertEqual(repo.carregar(), [{"id": 1}])
+
+    def test_desativado_nao_cria_binario(self):
+        JsonRepository(self.caminho).salvar([{"id": 1}])
+        self.assertFalse(os.path.exists(self.caminho_binario))
+
+
+class TestBuscarPorIdNosRepositorios(unittest.TestCase):
+    """buscar_por_id dos repositórios JSON usa o índice primário (arquivos em SKILLUP_DADOS)."""
+
+    def setUp(self):
+        loader.limpar_cache()
+
+    def tearDown(self):
+        for caminho in self._caminhos:
+            if os.path.exists(caminho):
+                os.remove(caminho)
+        loader.limpar_cache()
+
+    def _sem_varredura(self, repo):
+        self._caminhos = [repo._json_repo._caminho_arquivo]
+        repo._json_repo.buscar(None)  # carrega o cache e o índice primário
+        entrada = loader._CACHE[repo._json_repo._chave_cache]
+        entrada.dados = _ListaSemIteracao(entrada.dados)
+
+    def test_candidato(self):
+        repo = RepositorioCandidatoJSON()
+        for i in (1, 2):
+            repo.salvar(Candidato(
+                id=i, nome=f"Pessoa {i}", _cpf=f"1112223334{i}", email=f"p{i}@email.com",
+                _areas_interesse=["TI"], nivel_formacao="Superior",
+            ))
+        self._sem_varredura(repo)
+        self.assertEqual(repo.buscar_por_id(2).nome, "Pessoa 2")
+        self.assertIsNone(repo.buscar_por_id(3))
+
+    def test_vaga_clt(self):
+        repo = RepositorioVagaCLTJSON()
+        repo.salvar_muitos([
+            VagaCLT(
+                id=i, id_empresa=1, titulo=f"Vaga {i}", descricao="Descrição", area="TI",
+                modalidade=Modalidade.REMOTO, tipo=TipoVaga.EMPREGO, salario_base=3000.0,
+            )
+            for i in (1, 2)
+        ])
+        self._sem_varredura(repo)
+        self.assertEqual(repo.buscar_por_id(1).titulo, "Vaga 1")
+        self.assertIsNone(repo.buscar_por_id(3))
+
+
+class _ListaSemIteracao(list):
+    def __iter__(self):
+        raise AssertionError("consulta indexada não deveria percorrer a lista")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from types import SimpleNamespace
+
+from src.interfaces.paginacao import Pagina, Paginavel, paginar_lista
+
+
+def _itens(*ids):
+    return [SimpleNamespace(id=i) for i in ids]
+
+
+class _RepositorioEmMemoria(Paginavel):
+    _LISTAGENS = {None: "listar_todos", "grupo": "listar_por_grupo"}
+
+    def __init__(self, itens):
+        self._itens = itens
+
+    def listar_todos(self):
+        return list(self._itens)
+
+    def listar_por_grupo(self, grupo):
+        return [i for i in self._itens if i.id % 2 == grupo]
+
+
+class TestPaginacao(unittest.TestCase):
+    """Testes da paginação por cursor comum às interfaces de repositório."""
+
+    def test_paginar_lista_independe_da_ordem(self):
+        itens = _itens(5, 1, 4, 2, 3)
+        primeira = paginar_lista(itens, 2)
+        self.assertEqual(([i.id for i in primeira], primeira.proximo_cursor), ([1, 2], 2))
+        ultima = paginar_lista(itens, 3, primeira.proximo_cursor)
+        self.assertEqual([i.id for i in ultima], [3, 4, 5])
+        self.assertFalse(ultima.tem_proxima)
+
+    def test_pagina_vazia(self):
+        pagina = paginar_lista([], 10)
+        self.assertEqual((len(pagina), pagina.proximo_cursor), (0, None))
+
+    def test_paginavel_usa_listagem_do_filtro(self):
+        repo = _RepositorioEmMemoria(_itens(1, 2, 3, 4, 5))
+        self.assertEqual([i.id for i in repo.paginar(2, grupo=1)], [1, 3])
+        self.assertEqual([i.id for i in repo.paginar(2, 3, grupo=1)], [5])
+        self.assertEqual(repo.paginar(10).proximo_cursor, None)
+
+    def test_paginavel_valida_parametros(self):
+        repo = _RepositorioEmMemoria([])
+        with self.assertRaises(ValueError):
+            repo.paginar(0)
+        with self.assertRaises(ValueError):
+            repo.paginar(5, cor="azul")
+        with self.assertRaises(ValueError):
+            repo.paginar(5, grupo=1, cor="azul")
+
+    def test_pagina_iteravel(self):
+        pagina = Pagina(_itens(1, 2), 2)
+        self.assertEqual([i.id for i in pagina], [1, 2])
+        self.assertTrue(pagina.tem_proxima)
+
+
+if __name__ == "__main__":
+    unittest.main()
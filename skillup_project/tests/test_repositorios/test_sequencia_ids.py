@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from src.repositorios import sqlite_db
+from src.repositorios.sequencia_ids import SequenciaIdsJSON
+from src.repositorios.sequencia_ids_sqlite import SequenciaIdsSQLite
+
+
+class _ContratoSequencia:
+    """Comportamento esperado de qualquer ISequenciaIds."""
+
+    def _sequencia(self):
+        raise NotImplementedError
+
+    def test_inicia_pelo_maior_existente_uma_unica_vez(self):
+        chamadas = []
+
+        def maior():
+            chamadas.append(1)
+            return 7
+
+        seq = self._sequencia()
+        self.assertEqual(seq.proximo("vaga_clt", maior), 8)
+        self.assertEqual(seq.proximo("vaga_clt", maior), 9)
+        self.assertEqual(len(chamadas), 1)
+
+    def test_entidades_independentes(self):
+        seq = self._sequencia()
+        self.assertEqual(seq.proximo("candidato"), 1)
+        self.assertEqual(seq.proximo("empresa"), 1)
+        self.assertEqual(seq.proximo("candidato"), 2)
+
+    def test_reservar_bloco(self):
+        seq = self._sequencia()
+        seq.proximo("candidatura", lambda: 3)
+        self.assertEqual(seq.reservar("candidatura", 5), range(5, 10))
+        self.assertEqual(seq.proximo("candidatura"), 10)
+        with self.assertRaises(ValueError):
+            seq.reservar("candidatura", 0)
+
+    def test_persistente_entre_instancias(self):
+        self._sequencia().reservar("inscricao_curso", 3)
+        self.assertEqual(self._sequencia().proximo("inscricao_curso", lambda: 100), 4)
+
+    def test_threads_nao_repetem_ids(self):
+        seq = self._sequencia()
+        ids = []
+        lock = threading.Lock()
+
+        def trabalhar():
+            for _ in range(20):
+                novo = seq.proximo("candidatura")
+                with lock:
+                    ids.append(novo)
+
+        threads = [threading.Thread(target=trabalhar) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(ids), list(range(1, 81)))
+
+
+class TestSequenciaIdsJSON(_ContratoSequencia, unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "sequencias.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _sequencia(self):
+        return SequenciaIdsJSON(self.caminho)
+
+    def test_arquivo_guarda_ultimo_id_por_entidade(self):
+        self._sequencia().reservar("candidato", 2, lambda: 10)
+        with open(self.caminho, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"candidato": 12})
+
+
+class TestSequenciaIdsSQLite(_ContratoSequencia, unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho_banco = os.path.join(self._tmp.name, "teste.db")
+
+    def tearDown(self):
+        sqlite_db.fechar_conexoes()
+        self._tmp.cleanup()
+
+    def _sequencia(self):
+        return SequenciaIdsSQLite(self.caminho_banco)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,276 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.dominio.excecoes import ChaveDuplicadaError
+from src.dominio.candidatura import Candidatura, StatusCandidatura, TipoVagaCandidatura
+from src.dominio.vaga import Modalidade, TipoVaga, VagaCLT
+from src.repositorios import sqlite_db
+from src.dominio.recomendacao_salva import CursoRecomendado, RecomendacaoSalva, VagaRecomendada
+from src.repositorios import loader
+from src.repositorios.repositorio_candidatura_sqlite import RepositorioCandidaturaSQLite
+from src.repositorios.repositorio_recomendacao_salva import RepositorioRecomendacaoSalvaJSON
+from src.repositorios.repositorio_recomendacao_salva_sqlite import RepositorioRecomendacaoSalvaSQLite
+from src.repositorios.repositorio_vaga_clt_sqlite import RepositorioVagaCLTSQLite
+from src.repositorios.sqlite_db import TabelaSQLite
+
+
+def _vaga(id_vaga: int, area: str = "TI", salario: float = 3000.0, ativa: bool = True) -> VagaCLT:
+    return VagaCLT(
+        id=id_vaga,
+        id_empresa=1,
+        titulo=f"Vaga {id_vaga}",
+        descricao="Descrição",
+        area=area,
+        modalidade=Modalidade.REMOTO,
+        tipo=TipoVaga.EMPREGO,
+        ativa=ativa,
+        salario_base=salario,
+    )
+
+
+class _BaseSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho_banco = os.path.join(self._tmp.name, "teste.db")
+
+    def tearDown(self):
+        sqlite_db.fechar_conexoes()
+        self._tmp.cleanup()
+
+
+class TestTabelaSQLite(_BaseSQLite):
+    """Testes da tabela genérica usada pelos repositórios SQLite."""
+
+    def _tabela(self, **kwargs) -> TabelaSQLite:
+        return TabelaSQLite(
+            sqlite_db.conectar(self.caminho_banco),
+            "item",
+            colunas={"grupo": lambda d: d["grupo"]},
+            indices=["grupo"],
+            **kwargs,
+        )
+
+    def test_gravar_e_substituir_por_chave(self):
+        tabela = self._tabela()
+        tabela.gravar({"id": 1, "grupo": "a"})
+        tabela.gravar({"id": 1, "grupo": "b"})
+        self.assertEqual(tabela.carregar(), [{"id": 1, "grupo": "b"}])
+        self.assertFalse(tabela.substituir({"id": 2, "grupo": "c"}))
+
+    def test_consulta_por_coluna_usa_indice(self):
+        tabela = self._tabela()
+        conexao = sqlite_db.conectar(self.caminho_banco)
+        plano = conexao.execute(
+            "EXPLAIN QUERY PLAN SELECT dados FROM item WHERE grupo = ?", ("a",)
+        ).fetchall()
+        self.assertIn("idx_item_grupo", " ".join(str(linha) for linha in plano))
+        tabela.gravar({"id": 1, "grupo": "a"})
+        tabela.gravar({"id": 2, "grupo": "b"})
+        self.assertEqual(tabela.onde("grupo = ?", ("b",)), [{"id": 2, "grupo": "b"}])
+        self.assertEqual(tabela.contar("grupo = ?", ("a",)), 1)
+
+    def test_indice_unico_rejeita_duplicata_sem_apagar_linha(self):
+        tabela = TabelaSQLite(
+            sqlite_db.conectar(self.caminho_banco),
+            "pessoa",
+            colunas={"cpf": lambda d: d["cpf"]},
+            unicos=["cpf"],
+        )
+        tabela.gravar({"id": 1, "cpf": "111"})
+        tabela.gravar({"id": 1, "cpf": "111", "nome": "A"})
+        with self.assertRaises(ChaveDuplicadaError) as ctx:
+            tabela.gravar({"id": 2, "cpf": "111"})
+        self.assertEqual(ctx.exception.campo, "cpf")
+        self.assertEqual(tabela.carregar(), [{"id": 1, "cpf": "111", "nome": "A"}])
+
+    def test_pagina_por_cursor(self):
+        tabela = self._tabela()
+        for id_item in range(1, 6):
+            tabela.gravar({"id": id_item, "grupo": "a" if id_item % 2 else "b"})
+        itens, cursor = tabela.pagina(2)
+        self.assertEqual(([i["id"] for i in itens], cursor), ([1, 2], 2))
+        itens, cursor = tabela.pagina(2, cursor)
+        self.assertEqual(([i["id"] for i in itens], cursor), ([3, 4], 4))
+        itens, cursor = tabela.pagina(2, cursor)
+        self.assertEqual(([i["id"] for i in itens], cursor), ([5], None))
+        itens, cursor = tabela.pagina(2, 1, "grupo = ?", ("a",))
+        self.assertEqual(([i["id"] for i in itens], cursor), ([3, 5], None))
+
+    def test_iterar_em_lotes(self):
+        tabela = self._tabela()
+        tabela.gravar_muitos([{"id": i, "grupo": "a" if i % 2 else "b"} for i in range(1, 8)])
+        self.assertEqual([i["id"] for i in tabela.iterar(lote=3)], list(range(1, 8)))
+        self.assertEqual([i["id"] for i in tabela.iterar("grupo = ?", ("b",), lote=2)], [2, 4, 6])
+
+    def test_substituir_muitos_desfaz_lote_incompleto(self):
+        tabela = self._tabela()
+        tabela.gravar_muitos([{"id": 1, "grupo": "a"}, {"id": 2, "grupo": "a"}])
+        self.assertFalse(tabela.substituir_muitos([{"id": 1, "grupo": "b"}, {"id": 9, "grupo": "b"}]))
+        self.assertEqual(tabela.contar("grupo = ?", ("b",)), 0)
+        self.assertTrue(tabela.substituir_muitos([{"id": 1, "grupo": "b"}, {"id": 2, "grupo": "b"}]))
+        self.assertEqual(tabela.contar("grupo = ?", ("b",)), 2)
+
+    def test_versao_muda_com_escritas_desta_e_de_outra_conexao(self):
+        tabela = self._tabela()
+        inicial = tabela.versao()
+        self.assertEqual(tabela.versao(), inicial)
+        # Outra instância sobre a mesma conexão compartilhada
+        self._tabela().gravar({"id": 1, "grupo": "a"})
+        local = tabela.versao()
+        self.assertNotEqual(local, inicial)
+        # Outra conexão, como a de outro processo
+        with sqlite3.connect(self.caminho_banco) as outra:
+            outra.execute("DELETE FROM item")
+        outra.close()
+        self.assertNotEqual(tabela.versao(), local)
+
+    def test_importa_json_somente_na_criacao(self):
+        caminho_json = os.path.join(self._tmp.name, "item.json")
+        with open(caminho_json, "w", encoding="utf-8") as f:
+            json.dump([{"id": 1, "grupo": "a"}, {"id": 2, "grupo": "b"}], f)
+
+        tabela = self._tabela(origem_json=caminho_json)
+        self.assertEqual(tabela.contar(), 2)
+
+        tabela.remover(1)
+        self._tabela(origem_json=caminho_json)
+        self.assertEqual(tabela.contar(), 1)
+
+
+class TestRepositorioCandidaturaSQLite(_BaseSQLite):
+    """Testes do repositório SQLite de candidaturas."""
+
+    def setUp(self):
+        super().setUp()
+        self.repo = RepositorioCandidaturaSQLite(self.caminho_banco, importar_json=False)
+        for id_c, id_vaga, id_candidato in [(1, 10, 100), (2, 10, 101), (3, 11, 100)]:
+            self.repo.salvar(Candidatura(id_c, id_vaga, TipoVagaCandidatura.CLT, id_candidato))
+
+    def test_listar_e_contar_por_fk(self):
+        self.assertEqual([c.id for c in self.repo.listar_por_vaga(10)], [1, 2])
+        self.assertEqual([c.id for c in self.repo.listar_por_candidato(100)], [1, 3])
+        self.assertEqual(self.repo.contar_por_vaga(11), 1)
+
+    def test_atualizar_status(self):
+        self.assertTrue(self.repo.atualizar_status(2, StatusCandidatura.ACEITO.value))
+        self.assertFalse(self.repo.atualizar_status(99, StatusCandidatura.ACEITO.value))
+        self.assertEqual(self.repo.buscar_por_id(2).status, StatusCandidatura.ACEITO)
+        self.assertEqual(self.repo.contar_por_status(StatusCandidatura.ENVIADO.value), 2)
+
+    def test_excluir(self):
+        self.repo.excluir(1)
+        self.assertIsNone(self.repo.buscar_por_id(1))
+        self.assertEqual(len(self.repo.listar_todas()), 2)
+
+    def test_iterar_devolve_candidaturas(self):
+        candidaturas = list(self.repo.iterar())
+        self.assertTrue(all(isinstance(c, Candidatura) for c in candidaturas))
+        self.assertEqual([c.id for c in candidaturas], [1, 2, 3])
+
+    def test_salvar_e_atualizar_muitos(self):
+        self.repo.salvar_muitos([
+            Candidatura(4, 12, TipoVagaCandidatura.CLT, 102), Candidatura(5, 12, TipoVagaCandidatura.CLT, 103),
+        ])
+        self.assertEqual(self.repo.contar_por_vaga(12), 2)
+        aceita = self.repo.buscar_por_id(4)
+        aceita.status = StatusCandidatura.ACEITO
+        with self.assertRaises(ValueError):
+            self.repo.atualizar_muitos([aceita, Candidatura(99, 12, TipoVagaCandidatura.CLT, 104)])
+        self.assertEqual(self.repo.buscar_por_id(4).status, StatusCandidatura.ENVIADO)
+        self.repo.atualizar_muitos([aceita])
+        self.assertEqual(self.repo.buscar_por_id(4).status, StatusCandidatura.ACEITO)
+
+    def test_paginar_por_vaga(self):
+        pagina = self.repo.paginar(1, id_vaga=10)
+        self.assertEqual(([c.id for c in pagina], pagina.proximo_cursor), ([1], 1))
+        pagina = self.repo.paginar(1, pagina.proximo_cursor, id_vaga=10)
+        self.assertEqual(([c.id for c in pagina], pagina.tem_proxima), ([2], False))
+
+
+class TestRepositorioVagaCLTSQLite(_BaseSQLite):
+    """Testes do repositório SQLite de vagas CLT."""
+
+    def setUp(self):
+        super().setUp()
+        self.repo = RepositorioVagaCLTSQLite(self.caminho_banco, importar_json=False)
+        self.repo.salvar(_vaga(1, "TI", 3000.0))
+        self.repo.salvar(_vaga(2, "Saúde", 5000.0, ativa=False))
+        self.repo.salvar(_vaga(3, "ti", 8000.0))
+
+    def test_listar_por_area_ignora_caixa(self):
+        self.assertEqual([v.id for v in self.repo.listar_por_area("Ti")], [1, 3])
+        self.assertEqual(self.repo.contar_por_area("SAÚDE"), 1)
+
+    def test_paginar_por_area_ignora_caixa(self):
+        self.assertEqual([v.id for v in self.repo.paginar(5, area="TI")], [1, 3])
+        self.assertEqual([v.id for v in self.repo.paginar(5, 1, titulo="vaga")], [2, 3])
+
+    def test_ativas_e_faixa_salarial(self):
+        self.assertEqual([v.id for v in self.repo.listar_ativas()], [1, 3])
+        self.assertEqual([v.id for v in self.repo.listar_por_faixa_salarial(4000, 9000)], [2, 3])
+
+    def test_atualizar_e_excluir(self):
+        vaga = self.repo.buscar_por_id(1)
+        vaga.pausar()
+        self.repo.atualizar(vaga)
+        self.assertEqual(self.repo.contar_ativas(), 1)
+
+        self.repo.excluir(1)
+        with self.assertRaisesRegex(ValueError, "Vaga CLT não encontrada"):
+            self.repo.excluir(1)
+
+
+
+class _ContratoRecomendacaoSalva:
+    """Mesmo comportamento nos dois backends de recomendações pré-calculadas."""
+
+    def _recomendacao(self, id_candidato: int, pontuacao: int = 90) -> RecomendacaoSalva:
+        return RecomendacaoSalva(
+            id_candidato=id_candidato,
+            vagas=(VagaRecomendada(7, "Dev", "TI", "Remoto", pontuacao, 80),),
+            cursos=(CursoRecomendado(3, "Python", "TI", 40, 70),),
+            gerada_em="2026-01-01T03:00:00",
+        )
+
+    def test_buscar_por_candidato(self):
+        self.repo.salvar_muitos([self._recomendacao(1), self._recomendacao(2)])
+        self.assertEqual(self.repo.buscar_por_candidato(2), self._recomendacao(2))
+        self.assertIsNone(self.repo.buscar_por_candidato(3))
+
+    def test_substituir_todas(self):
+        self.repo.salvar_muitos([self._recomendacao(1), self._recomendacao(2)])
+        self.repo.substituir_todas([self._recomendacao(2, pontuacao=50)])
+        self.assertIsNone(self.repo.buscar_por_candidato(1))
+        self.assertEqual(self.repo.buscar_por_candidato(2).vagas[0].pontuacao, 50)
+        self.assertTrue(self.repo.remover_por_candidato(2))
+        self.assertFalse(self.repo.remover_por_candidato(2))
+
+    def test_iterar(self):
+        self.repo.salvar_muitos([self._recomendacao(1), self._recomendacao(2, pontuacao=50)])
+        self.assertEqual(
+            sorted(self.repo.iterar(), key=lambda r: r.id_candidato),
+            [self._recomendacao(1), self._recomendacao(2, pontuacao=50)],
+        )
+
+
+class TestRepositorioRecomendacaoSalvaSQLite(_ContratoRecomendacaoSalva, _BaseSQLite):
+
+    def setUp(self):
+        super().setUp()
+        self.repo = RepositorioRecomendacaoSalvaSQLite(self.caminho_banco)
+
+
+class TestRepositorioRecomendacaoSalvaJSON(_ContratoRecomendacaoSalva, _BaseSQLite):
+
+    def setUp(self):
+        super().setUp()
+        loader.limpar_cache()
+        self.repo = RepositorioRecomendacaoSalvaJSON(os.path.join(self._tmp.name, "recomendacao_salva.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.dominio.excecoes import ChaveDuplicadaError, ConflitoEscritaError
+from src.repositorios import loader, sqlite_db
+from src.repositorios.journal import JournalJsonRepository
+from src.repositorios.loader import JsonRepository
+from src.repositorios.sequencia_ids_sqlite import SequenciaIdsSQLite
+from src.repositorios.sqlite_db import TabelaSQLite
+from src.repositorios.unidade_trabalho import UnidadeDeTrabalho, unidade_ativa
+
+
+class TestUnidadeDeTrabalhoJSON(unittest.TestCase):
+    """Testes da unidade de trabalho sobre arquivos JSON."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho_a = os.path.join(self._tmp.name, "a.json")
+        self.caminho_b = os.path.join(self._tmp.name, "b.json")
+        loader.limpar_cache()
+        self.repo_a = JsonRepository(self.caminho_a, unicos=("email",))
+        self.repo_b = JsonRepository(self.caminho_b)
+        self.repo_a.salvar([{"id": 1, "email": "a@x.com"}])
+        self.repo_b.salvar([])
+
+    def tearDown(self):
+        loader.limpar_cache()
+        self._tmp.cleanup()
+
+    def _no_disco(self, caminho):
+        with open(caminho, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_grava_cada_arquivo_uma_vez_ao_confirmar(self):
+        with patch.object(
+            JsonRepository, "_escrever_temporario", autospec=True, side_effect=JsonRepository._escrever_temporario
+        ) as escrever:
+            with UnidadeDeTrabalho():
+                self.repo_a.gravar({"id": 2, "email": "b@x.com"})
+                self.repo_a.substituir({"id": 1, "email": "c@x.com"})
+                self.repo_b.gravar({"id": 7})
+                self.repo_b.gravar({"id": 8})
+                # Dentro da unidade as leituras veem as escritas; o disco ainda não
+                self.assertEqual(self.repo_a.buscar(1)["email"], "c@x.com")
+                self.assertEqual(self._no_disco(self.caminho_a), [{"id": 1, "email": "a@x.com"}])
+                self.assertEqual(escrever.call_count, 0)
+            self.assertEqual(escrever.call_count, 2)
+
+        self.assertEqual(self._no_disco(self.caminho_a), [{"id": 1, "email": "c@x.com"}, {"id": 2, "email": "b@x.com"}])
+        self.assertEqual([r["id"] for r in self.repo_b.carregar()], [7, 8])
+        self.assertFalse(os.path.exists(self.caminho_a + loader.SUFIXO_TEMPORARIO))
+        self.assertIsNone(unidade_ativa())
+
+    def test_excecao_desfaz_todos_os_arquivos(self):
+        with self.assertRaises(RuntimeError):
+            with UnidadeDeTrabalho():
+                self.repo_a.gravar({"id": 2, "email": "b@x.com"})
+                self.repo_b.gravar({"id": 7})
+                raise RuntimeError("falhou")
+
+        self.assertEqual(self.repo_a.carregar(), [{"id": 1, "email": "a@x.com"}])
+        self.assertEqual(self.repo_b.carregar(), [])
+        self.assertIsNone(unidade_ativa())
+
+    def test_falha_ao_preparar_nao_altera_nenhum_arquivo(self):
+        original = JsonRepository._preparar_escrita
+
+        def preparar(repo, *args):
+            if repo is self.repo_b:
+                raise OSError("disco cheio")
+            return original(repo, *args)
+
+        with patch.object(JsonRepository, "_preparar_escrita", autospec=True, side_effect=preparar):
+            with self.assertRaises(OSError):
+                with UnidadeDeTrabalho():
+                    self.repo_a.gravar({"id": 2, "email": "b@x.com"})
+                    self.repo_b.gravar({"id": 7})
+
+        self.assertEqual(self._no_disco(self.caminho_a), [{"id": 1, "email": "a@x.com"}])
+        self.assertFalse(os.path.exists(self.caminho_a + loader.SUFIXO_TEMPORARIO))
+
+    def test_lote_invalido_nao_desfaz_escritas_anteriores(self):
+        with UnidadeDeTrabalho():
+            self.repo_a.gravar({"id": 2, "email": "b@x.com"})
+            with self.assertRaises(ChaveDuplicadaError):
+                self.repo_a.gravar_muitos([{"id": 3, "email": "d@x.com"}, {"id": 4, "email": "a@x.com"}])
+        self.assertEqual([r["id"] for r in self.repo_a.carregar()], [1, 2])
+
+    def test_conflito_com_escrita_externa(self):
+        with self.assertRaises(ConflitoEscritaError):
+            with UnidadeDeTrabalho():
+                self.repo_a.gravar({"id": 2, "email": "b@x.com"})
+                with open(self.caminho_a, "w", encoding="utf-8") as f:
+                    json.dump([{"id": 9, "email": "z@x.com"}], f)
+        self.assertEqual(self.repo_a.carregar(), [{"id": 9, "email": "z@x.com"}])
+
+    def test_unidade_aninhada_participa_da_externa(self):
+        with self.assertRaises(RuntimeError):
+            with UnidadeDeTrabalho() as externa:
+                with UnidadeDeTrabalho():
+                    self.repo_b.gravar({"id": 7})
+                self.assertIs(unidade_ativa(), externa)
+                self.assertEqual(self._no_disco(self.caminho_b), [])
+                raise RuntimeError("falhou")
+        self.assertEqual(self.repo_b.carregar(), [])
+
+    def test_journal_anexa_as_operacoes_uma_vez(self):
+        caminho = os.path.join(self._tmp.name, "j.json")
+        repo = JournalJsonRepository(caminho)
+        repo.salvar([{"id": 1}])
+        with UnidadeDeTrabalho():
+            repo.gravar({"id": 2})
+            repo.remover(1)
+            self.assertFalse(os.path.exists(caminho + ".journal"))
+        with open(caminho + ".journal", encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        loader.limpar_cache()
+        self.assertEqual(JournalJsonRepository(caminho).carregar(), [{"id": 2}])
+
+    def test_journal_com_linha_incompleta_nao_perde_a_unidade(self):
+        caminho = os.path.join(self._tmp.name, "j.json")
+        repo = JournalJsonRepository(caminho)
+        repo.gravar({"id": 1})
+        with open(caminho + ".journal", "a", encoding="utf-8") as f:
+            f.write('{"op": "gravar", "regis')
+        loader.limpar_cache()
+
+        with UnidadeDeTrabalho():
+            repo.gravar({"id": 3})
+
+        loader.limpar_cache()
+        self.assertEqual(JournalJsonRepository(caminho).carregar(), [{"id": 1}, {"id": 3}])
+
+
+class TestUnidadeDeTrabalhoSQLite(unittest.TestCase):
+    """Testes da unidade de trabalho sobre o SQLite."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        conexao = sqlite_db.conectar(os.path.join(self._tmp.name, "teste.db"))
+        self.tabela_a = TabelaSQLite(conexao, "a", colunas={"email": lambda r: r["email"]}, unicos=["email"])
+        self.tabela_b = TabelaSQLite(conexao, "b")
+        self.tabela_a.gravar({"id": 1, "email": "a@x.com"})
+
+    def tearDown(self):
+        sqlite_db.fechar_conexoes()
+        self._tmp.cleanup()
+
+    def test_uma_transacao_para_todas_as_tabelas(self):
+        with self.assertRaises(RuntimeError):
+            with UnidadeDeTrabalho():
+                self.tabela_a.gravar({"id": 2, "email": "b@x.com"})
+                self.tabela_b.gravar({"id": 7})
+                self.assertEqual(self.tabela_b.contar(), 1)
+                raise RuntimeError("falhou")
+        self.assertEqual(self.tabela_a.contar(), 1)
+        self.assertEqual(self.tabela_b.contar(), 0)
+
+        with UnidadeDeTrabalho():
+            self.tabela_a.gravar({"id": 2, "email": "b@x.com"})
+            self.tabela_b.gravar({"id": 7})
+        self.assertEqual(self.tabela_a.contar(), 2)
+        self.assertEqual(self.tabela_b.contar(), 1)
+
+    def test_escrita_que_falha_desfaz_so_ela(self):
+        with UnidadeDeTrabalho():
+            self.tabela_b.gravar({"id": 7})
+            with self.assertRaises(ChaveDuplicadaError):
+                self.tabela_a.gravar_muitos([{"id": 2, "email": "b@x.com"}, {"id": 3, "email": "a@x.com"}])
+        self.assertEqual(self.tabela_a.contar(), 1)
+        self.assertEqual(self.tabela_b.contar(), 1)
+
+    def test_sequencia_dentro_da_unidade(self):
+        sequencia = SequenciaIdsSQLite(os.path.join(self._tmp.name, "teste.db"))
+        with UnidadeDeTrabalho():
+            self.tabela_b.gravar({"id": 7})
+            self.assertEqual(sequencia.proximo("b"), 1)
+        self.assertEqual(sequencia.proximo("b"), 2)
+        self.assertEqual(self.tabela_b.contar(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
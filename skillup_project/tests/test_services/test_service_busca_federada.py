@@ -0,0 +1,109 @@
+import unittest
+from datetime import date
+from unittest.mock import Mock
+
+from src.dominio.candidatura import TipoVagaCandidatura
+from src.dominio.vaga import Modalidade, TipoVaga, VagaCLT, VagaEstagio
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.services.service_busca_federada import MotorBuscaFederada
+from src.services.service_busca_vaga import MotorBuscaVaga
+
+
+def _clt(id_vaga, titulo="Dev", salario=3000.0, area="TI"):
+    return VagaCLT(
+        id=id_vaga, id_empresa=1, titulo=titulo, descricao="Descrição", area=area,
+        modalidade=Modalidade.REMOTO, tipo=TipoVaga.EMPREGO,
+        salario_base=salario, prazo_inscricao=date(2099, 1, 1),
+    )
+
+
+def _estagio(id_vaga, titulo="Estágio", bolsa=1000.0, area="TI"):
+    return VagaEstagio(
+        id=id_vaga, id_empresa=1, titulo=titulo, descricao="Descrição", area=area,
+        modalidade=Modalidade.REMOTO, tipo=TipoVaga.ESTAGIO,
+        bolsa_auxilio=bolsa, id_instituicao_conveniada=1, prazo_inscricao=date(2099, 1, 1),
+    )
+
+
+class TestMotorBuscaFederada(unittest.TestCase):
+    """Testes da busca federada entre vagas CLT e de estágio."""
+
+    def setUp(self):
+        self.repo_clt = Mock(spec=IVagaRepositorio)
+        self.repo_estagio = Mock(spec=IVagaRepositorio)
+        self.repo_clt.listar_ativas.return_value = [
+            _clt(1, "Dev Python", 5000.0), _clt(2, "Analista", 3000.0), _clt(3, "Dev Java", 7000.0),
+        ]
+        self.repo_estagio.listar_ativas.return_value = [
+            _estagio(1, "Estágio Python", 1500.0), _estagio(2, "Estágio Dados", 1200.0, area="Dados"),
+        ]
+        self.motor = MotorBuscaFederada({
+            TipoVagaCandidatura.CLT: MotorBuscaVaga(self.repo_clt),
+            TipoVagaCandidatura.ESTAGIO: MotorBuscaVaga(self.repo_estagio),
+        })
+
+    @staticmethod
+    def _chaves(resultado):
+        return [(e.tipo, e.vaga.id) for e in resultado]
+
+    def test_buscar_intercala_por_id_e_tipo(self):
+        resultado = self.motor.buscar(area="TI")
+        self.assertEqual(resultado.total, 4)
+        self.assertEqual(self._chaves(resultado), [
+            (TipoVagaCandidatura.CLT, 1), (TipoVagaCandidatura.ESTAGIO, 1),
+            (TipoVagaCandidatura.CLT, 2), (TipoVagaCandidatura.CLT, 3),
+        ])
+
+    def test_buscar_ordenado_por_salario_paginado(self):
+        primeira = self.motor.buscar(ordenar_por="salario", decrescente=True, por_pagina=2)
+        segunda = self.motor.buscar(ordenar_por="salario", decrescente=True, pagina=2, por_pagina=2)
+        salarios = [e.vaga.salario_base for e in primeira] + [3000.0]
+        self.assertEqual(salarios, [7000.0, 5000.0, 3000.0])
+        self.assertEqual(self._chaves(segunda), [
+            (TipoVagaCandidatura.CLT, 2), (TipoVagaCandidatura.ESTAGIO, 1),
+        ])
+        self.assertEqual(primeira.total_paginas, 3)
+        self.assertTrue(primeira.tem_proxima)
+
+    def test_buscar_texto_ordena_por_relevancia(self):
+        resultado = self.motor.buscar_texto("python")
+        self.assertEqual(resultado.total, 2)
+        self.assertEqual({e.tipo for e in resultado}, set(TipoVagaCandidatura))
+        pontuacoes = [e.pontuacao for e in resultado]
+        self.assertEqual(pontuacoes, sorted(pontuacoes, reverse=True))
+
+        pagina = self.motor.buscar_texto("python dados", pagina=2, por_pagina=2)
+        self.assertEqual(pagina.total, 3)
+        self.assertEqual(len(pagina), 1)
+
+    def test_buscar_texto_pontua_com_estatisticas_do_conjunto(self):
+        # "python" é comum entre as CLT e raro entre os estágios: com o IDF de
+        # cada motor, o mesmo texto valeria mais no motor de estágio
+        self.repo_clt.listar_ativas.return_value = [_clt(i, "Dev Python") for i in range(1, 4)]
+        self.repo_estagio.listar_ativas.return_value = [_estagio(1, "Dev Python")] + [
+            _estagio(i, "Estágio Dados") for i in range(2, 7)
+        ]
+
+        resultado = self.motor.buscar_texto("python")
+
+        self.assertEqual(resultado.total, 4)
+        self.assertEqual(len({e.pontuacao for e in resultado}), 1)
+        # Empate: a ordem dos motores decide, depois o ID
+        self.assertEqual(self._chaves(resultado), [
+            (TipoVagaCandidatura.CLT, 1), (TipoVagaCandidatura.CLT, 2),
+            (TipoVagaCandidatura.CLT, 3), (TipoVagaCandidatura.ESTAGIO, 1),
+        ])
+
+    def test_buscar_por_candidato(self):
+        resultado = self.motor.buscar_por_candidato(["Dados"])
+        self.assertEqual(self._chaves(resultado), [(TipoVagaCandidatura.ESTAGIO, 2)])
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            self.motor.buscar(ordenar_por="inexistente")
+        with self.assertRaises(ValueError):
+            self.motor.buscar(pagina=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,9 +13,13 @@ class TestServiceBuscaVaga(unittest.TestCase):
         self.motor = MotorBuscaVaga(self.mock_repo)
 
     def _criar_vaga_clt(self, id, area="TI", modalidade=Modalidade.PRESENCIAL,
-                        localidade="São Paulo", salario=5000.0, ativo=True):
+                        localidade="São Paulo", salario=5000.0, ativo=True,
+                        titulo="Vaga", descricao=""):
         vaga = Mock(spec=VagaCLT)
         vaga.id = id
+        vaga.titulo = titulo
+        vaga.descricao = descricao
+        vaga.requisitos = []
         vaga.area = area
         vaga.modalidade = modalidade
         vaga.localidade = localidade
@@ -25,9 +29,13 @@ class TestServiceBuscaVaga(unittest.TestCase):
         return vaga
 
     def _criar_vaga_estagio(self, id, area="TI", modalidade=Modalidade.PRESENCIAL,
-                            localidade="São Paulo", bolsa=1500.0, ativo=True):
+                            localidade="São Paulo", bolsa=1500.0, ativo=True,
+                            titulo="Estágio", descricao=""):
         vaga = Mock(spec=VagaEstagio)
         vaga.id = id
+        vaga.titulo = titulo
+        vaga.descricao = descricao
+        vaga.requisitos = []
         vaga.area = area
         vaga.modalidade = modalidade
         vaga.localidade = localidade
@@ -110,6 +118,130 @@ class TestServiceBuscaVaga(unittest.TestCase):
         resultado = self.motor.buscar(apenas_ativas=False)
         self.assertEqual(len(resultado), 2)
 
+    # -- ÍNDICE INVERTIDO --
+
+    def test_indice_montado_uma_vez(self):
+        self.mock_repo.listar_ativas.return_value = [
+            self._criar_vaga_clt(1, area="TI"), self._criar_vaga_clt(2, area="Saúde"),
+        ]
+        self.motor.buscar(area="ti")
+        self.motor.buscar(area="SAÚDE", modalidade=Modalidade.PRESENCIAL)
+        self.mock_repo.listar_ativas.assert_called_once()
+
+    def test_indice_atualizado_por_observador(self):
+        v1 = self._criar_vaga_clt(1, area="TI")
+        self.mock_repo.listar_ativas.return_value = [v1]
+        self.assertEqual(len(self.motor.buscar(area="TI")), 1)
+
+        v1.area = "Saúde"
+        self.motor.vaga_salva(v1)
+        self.assertEqual(self.motor.buscar(area="TI"), [])
+        self.assertEqual(self.motor.buscar(area="Saúde"), [v1])
+
+        v1.ativa = False
+        self.motor.vaga_salva(v1)
+        self.assertEqual(self.motor.buscar(), [])
+
+        v2 = self._criar_vaga_clt(2)
+        self.motor.vaga_salva(v2)
+        self.motor.vaga_removida(2)
+        self.assertEqual(self.motor.buscar(), [])
+        self.mock_repo.listar_ativas.assert_called_once()
+
+    def test_escrita_sem_aviso_remonta_indice(self):
+        """Outra versão do repositório (ex.: escrita de outro processo) remonta o índice."""
+        v1, v2 = self._criar_vaga_clt(1), self._criar_vaga_clt(2)
+        self.mock_repo.versao.return_value = 1
+        self.mock_repo.listar_ativas.return_value = [v1]
+        self.assertEqual(self.motor.buscar(), [v1])
+
+        self.mock_repo.versao.return_value = 2
+        self.mock_repo.listar_ativas.return_value = [v1, v2]
+        self.assertEqual(self.motor.buscar(), [v1, v2])
+        self.motor.buscar(area="TI")
+        self.assertEqual(self.mock_repo.listar_ativas.call_count, 2)
+
+    def test_aviso_acompanha_a_versao_sem_remontar(self):
+        v1, v2 = self._criar_vaga_clt(1), self._criar_vaga_clt(2)
+        self.mock_repo.versao.return_value = 1
+        self.mock_repo.listar_ativas.return_value = [v1]
+        self.motor.buscar()
+
+        # Escrita feita pelo serviço, seguida do aviso
+        self.mock_repo.versao.return_value = 2
+        self.motor.vaga_salva(v2)
+        self.assertEqual(self.motor.buscar(), [v1, v2])
+        self.mock_repo.listar_ativas.assert_called_once()
+
+    def test_faixa_salarial_atualizada_por_observador(self):
+        v1 = self._criar_vaga_clt(1, salario=3000.0)
+        v2 = self._criar_vaga_estagio(2, bolsa=1500.0)
+        self.mock_repo.listar_ativas.return_value = [v1, v2]
+        self.assertEqual(self.motor.buscar(salario_min=2000.0), [v1])
+
+        v1.salario_base = 1000.0
+        self.motor.vaga_salva(v1)
+        self.assertEqual(self.motor.buscar(salario_max=2000.0), [v1, v2])
+        self.assertEqual(self.motor.buscar(salario_min=2000.0), [])
+
+    def test_faixa_salarial_com_filtro_mais_seletivo(self):
+        vagas = [self._criar_vaga_clt(i, salario=1000.0 * i) for i in range(1, 6)]
+        vagas.append(self._criar_vaga_clt(6, area="Saúde", salario=4000.0))
+        self.mock_repo.listar_ativas.return_value = vagas
+        resultado = self.motor.buscar(area="Saúde", salario_min=2000.0)
+        self.assertEqual([v.id for v in resultado], [6])
+
+    # -- MAIS BEM PAGAS --
+
+    def test_mais_bem_pagas(self):
+        self.mock_repo.listar_ativas.return_value = [
+            self._criar_vaga_clt(1, salario=3000.0),
+            self._criar_vaga_clt(2, area="Saúde", salario=9000.0),
+            self._criar_vaga_clt(3, salario=7000.0),
+            self._criar_vaga_estagio(4, bolsa=1500.0),
+        ]
+        self.assertEqual([v.id for v in self.motor.mais_bem_pagas(2)], [2, 3])
+        self.assertEqual([v.id for v in self.motor.mais_bem_pagas(5, area="ti")], [3, 1, 4])
+        self.assertEqual(self.motor.mais_bem_pagas(0), [])
+
+    def test_invalidar_rele_repositorio(self):
+        self.mock_repo.listar_ativas.return_value = []
+        self.motor.buscar()
+        self.mock_repo.listar_ativas.return_value = [self._criar_vaga_clt(1)]
+        self.motor.invalidar()
+        self.assertEqual(len(self.motor.buscar()), 1)
+
+    # -- BUSCA TEXTUAL --
+
+    def test_buscar_texto_ignora_acentos_e_ranqueia(self):
+        v1 = self._criar_vaga_clt(1, titulo="Analista de Dados", descricao="Relatórios de gestão")
+        v2 = self._criar_vaga_clt(2, titulo="Desenvolvedor Python", descricao="APIs e dados")
+        v3 = self._criar_vaga_clt(3, titulo="Enfermeiro", descricao="Plantão")
+        v2.requisitos = ["Python avançado"]
+        self.mock_repo.listar_ativas.return_value = [v1, v2, v3]
+
+        self.assertEqual(self.motor.buscar_texto("GESTAO"), [v1])
+        self.assertEqual(self.motor.buscar_texto("python"), [v2])
+        # Título pesa mais que descrição
+        self.assertEqual(self.motor.buscar_texto("dados"), [v1, v2])
+        self.assertEqual(self.motor.buscar_texto("dados", limit=1), [v1])
+        self.assertEqual(self.motor.buscar_texto("cozinheiro"), [])
+        self.assertEqual(self.motor.buscar_texto("  "), [])
+
+    def test_buscar_texto_atualizado_por_observador(self):
+        v1 = self._criar_vaga_clt(1, titulo="Dev Java")
+        self.mock_repo.listar_ativas.return_value = [v1]
+        self.assertEqual(self.motor.buscar_texto("java"), [v1])
+
+        v1.titulo = "Dev Kotlin"
+        self.motor.vaga_salva(v1)
+        self.assertEqual(self.motor.buscar_texto("java"), [])
+        self.assertEqual(self.motor.buscar_texto("kotlin"), [v1])
+
+        v1.ativa = False
+        self.motor.vaga_salva(v1)
+        self.assertEqual(self.motor.buscar_texto("kotlin"), [])
+
     # -- BUSCA POR CANDIDATO --
 
     def test_buscar_por_candidato_area_correspondente(self):
@@ -132,6 +264,14 @@ class TestServiceBuscaVaga(unittest.TestCase):
         resultado = self.motor.buscar_por_candidato(["TI"], "Qualquer Cidade")
         self.assertEqual(len(resultado), 1)
 
+    def test_buscar_por_candidato_varias_areas(self):
+        v1 = self._criar_vaga_clt(1, area="TI")
+        v2 = self._criar_vaga_clt(2, area="Saúde", localidade="")
+        v3 = self._criar_vaga_clt(3, area="Direito")
+        self.mock_repo.listar_ativas.return_value = [v3, v2, v1]
+        resultado = self.motor.buscar_por_candidato(["ti", "Saúde"], "São Paulo")
+        self.assertEqual([v.id for v in resultado], [1, 2])
+
     def test_buscar_por_candidato_sem_area_interesse(self):
         v1 = self._criar_vaga_clt(1, area="TI")
         self.mock_repo.listar_ativas.return_value = [v1]
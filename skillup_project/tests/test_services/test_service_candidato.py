@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import Mock
 from src.services.service_candidato import CandidatoService
 from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
 
 
 class TestServiceCandidato(unittest.TestCase):
@@ -12,6 +14,7 @@ class TestServiceCandidato(unittest.TestCase):
         self.service = CandidatoService(self.mock_repo)
 
     def test_cadastrar_sucesso(self):
+        self.mock_repo.buscar_por_cpf.return_value = None
         self.mock_repo.listar.return_value = []
         c = self.service.cadastrar("Maria", "11122233344", "maria@email.com", ["TI"], "Superior", "SP")
         self.mock_repo.salvar.assert_called_once()
@@ -23,6 +26,7 @@ class TestServiceCandidato(unittest.TestCase):
         existente = Mock()
         existente.id = 5
         existente.cpf = "99988877766"
+        self.mock_repo.buscar_por_cpf.return_value = None
         self.mock_repo.listar.return_value = [existente]
         c = self.service.cadastrar("João", "22233344455", "joao@email.com", ["TI"], "Médio")
         self.assertEqual(c.id, 6)
@@ -30,9 +34,53 @@ class TestServiceCandidato(unittest.TestCase):
     def test_cadastrar_cpf_duplicado(self):
         existente = Mock()
         existente.cpf = "11122233344"
-        self.mock_repo.listar.return_value = [existente]
+        self.mock_repo.buscar_por_cpf.return_value = existente
         with self.assertRaisesRegex(ValueError, "Já existe candidato com este CPF"):
             self.service.cadastrar("Maria", "11122233344", "maria@email.com", ["TI"], "Superior")
+        self.mock_repo.buscar_por_cpf.assert_called_once_with("11122233344")
+        self.mock_repo.listar.assert_not_called()
+
+    def test_cadastrar_lote_reporta_erros_por_item(self):
+        existente = Mock()
+        self.mock_repo.buscar_por_cpf.side_effect = lambda cpf: existente if cpf == "99988877766" else None
+        self.mock_repo.buscar_por_email.return_value = None
+        sequencia = Mock(spec=ISequenciaIds)
+        sequencia.reservar.return_value = range(11, 14)
+        service = CandidatoService(self.mock_repo, sequencia)
+        dados = [
+            {"nome": "Ana", "cpf": "11122233344", "email": "ana@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Superior"},
+            {"nome": "Bia", "cpf": "99988877766", "email": "bia@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Superior"},
+            {"nome": "Caio", "cpf": "11122233344", "email": "caio@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Médio"},
+            {"nome": "Davi", "cpf": "22233344455", "email": "ana@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Médio"},
+            {"nome": "", "cpf": "33344455566", "email": "eva@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Médio"},
+            {"nome": "Fabi", "cpf": "44455566677", "email": "fabi@email.com", "areas_interesse": ["Dados"], "nivel_formacao": "Médio", "localidade": "SP"},
+        ]
+
+        resultado = service.cadastrar_lote(dados)
+
+        sequencia.reservar.assert_called_once_with("candidato", 3, service._maior_id)
+        self.assertEqual([(c.id, c.nome) for c in resultado], [(11, "Ana"), (13, "Fabi")])
+        self.assertEqual([e.posicao for e in resultado.erros], [1, 2, 3, 4])
+        self.assertIn("CPF", resultado.erros[1].mensagem)
+        self.assertIn("e-mail", resultado.erros[2].mensagem)
+        self.assertFalse(resultado.sucesso)
+        self.mock_repo.salvar_muitos.assert_called_once_with(resultado.cadastrados)
+        self.mock_repo.salvar.assert_not_called()
+
+    def test_cadastrar_lote_sem_sequencia_continua_do_maior_id(self):
+        existente = Mock()
+        existente.id = 5
+        self.mock_repo.buscar_por_cpf.return_value = None
+        self.mock_repo.buscar_por_email.return_value = None
+        self.mock_repo.listar.return_value = [existente]
+        dados = [
+            {"nome": "Ana", "cpf": "11122233344", "email": "ana@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Superior"},
+            {"nome": "Bia", "cpf": "22233344455", "email": "bia@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Superior"},
+        ]
+        resultado = self.service.cadastrar_lote(dados)
+        self.assertTrue(resultado.sucesso)
+        self.assertEqual([c.id for c in resultado], [6, 7])
+        self.mock_repo.listar.assert_called_once()
 
     def test_buscar_por_id_sucesso(self):
         candidato_mock = Mock()
@@ -77,6 +125,18 @@ class TestServiceCandidato(unittest.TestCase):
         self.service.deletar(1)
         self.mock_repo.deletar.assert_called_once_with(1)
 
+    def test_observador_avisado_nas_escritas(self):
+        observador = Mock(spec=IObservadorCandidato)
+        self.service.adicionar_observador(observador)
+        candidato = Mock()
+        self.mock_repo.buscar_por_id.return_value = candidato
+
+        self.service.atualizar(1, "localidade", "Recife")
+        observador.candidatos_salvos.assert_called_once_with([candidato])
+
+        self.service.deletar(1)
+        observador.candidato_removido.assert_called_once_with(1)
+
     def test_buscar_por_area_interesse(self):
         self.mock_repo.buscar_por_area_interesse.return_value = [Mock()]
         resultado = self.service.buscar_por_area_interesse("TI")
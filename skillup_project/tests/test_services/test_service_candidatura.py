@@ -1,7 +1,9 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from src.services.service_candidatura import CandidaturaService
 from src.interfaces.interface_candidatura import ICandidaturaRepositorio
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.interfaces.interface_unidade_trabalho import IUnidadeDeTrabalho
 from src.dominio.candidatura import StatusCandidatura, TipoVagaCandidatura
 from src.dominio.validators import PrazoValidador
 
@@ -23,6 +25,17 @@ class TestServiceCandidatura(unittest.TestCase):
         self.assertEqual(c.id_candidato, 20)
         self.assertEqual(c.status, StatusCandidatura.ENVIADO)
 
+    @patch.object(PrazoValidador, "validar", return_value=None)
+    def test_cadastrar_usa_sequencia_sem_listar_tudo(self, _mock_prazo):
+        sequencia = Mock(spec=ISequenciaIds)
+        sequencia.proximo.return_value = 42
+        service = CandidaturaService(self.mock_repo, sequencia=sequencia)
+        self.mock_repo.listar_por_candidato.return_value = []
+        c = service.cadastrar(id_vaga=10, id_candidato=20, tipo_vaga=TipoVagaCandidatura.CLT)
+        self.assertEqual(c.id, 42)
+        self.assertEqual(sequencia.proximo.call_args.args[0], "candidatura")
+        self.mock_repo.listar_todas.assert_not_called()
+
     @patch.object(PrazoValidador, "validar", return_value=None)
     def test_cadastrar_duplicado(self, _mock_prazo):
         existente = Mock()
@@ -33,6 +46,23 @@ class TestServiceCandidatura(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "já possui candidatura"):
             self.service.cadastrar(id_vaga=10, id_candidato=20, tipo_vaga=TipoVagaCandidatura.CLT)
 
+    @patch.object(PrazoValidador, "validar", return_value=None)
+    def test_cadastrar_dentro_de_unidade_de_trabalho(self, _mock_prazo):
+        unidade = MagicMock(spec=IUnidadeDeTrabalho)
+        unidade.__exit__.return_value = False
+        service = CandidaturaService(self.mock_repo, unidade_trabalho=lambda: unidade)
+        self.mock_repo.listar_por_candidato.return_value = []
+        self.mock_repo.listar_todas.return_value = []
+        service.cadastrar(id_vaga=10, id_candidato=20, tipo_vaga=TipoVagaCandidatura.CLT)
+        unidade.__enter__.assert_called_once()
+        unidade.__exit__.assert_called_once_with(None, None, None)
+
+        existente = Mock(id_vaga=10, tipo_vaga=TipoVagaCandidatura.CLT)
+        self.mock_repo.listar_por_candidato.return_value = [existente]
+        with self.assertRaises(ValueError):
+            service.cadastrar(id_vaga=10, id_candidato=20, tipo_vaga=TipoVagaCandidatura.CLT)
+        self.assertIs(unidade.__exit__.call_args.args[0], ValueError)
+
     def test_buscar_por_id_sucesso(self):
         candidatura = Mock()
         self.mock_repo.buscar_por_id.return_value = candidatura
@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import Mock
+
+from src.dominio.competencia_candidato import CompetenciaCandidato
+from src.dominio.requisitos_vaga import RequisitoVaga, TipoVagaRequisito
+from src.dominio.vaga import VagaCLT, VagaEstagio
+from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
+from src.services.service_compatibilidade import MotorCompatibilidade, SEM_REQUISITOS
+
+
+def _req(id_req, id_vaga, id_comp, nivel, obrigatorio=True, tipo=TipoVagaRequisito.CLT):
+    return RequisitoVaga(id_req, id_vaga, tipo, id_comp, nivel, obrigatorio)
+
+
+def _comp(id_cc, id_candidato, id_comp, nivel):
+    return CompetenciaCandidato(id_cc, id_candidato, id_comp, nivel)
+
+
+class TestMotorCompatibilidade(unittest.TestCase):
+    """Testes do motor de compatibilidade entre requisitos e competências."""
+
+    def setUp(self):
+        self.repo_req = Mock(spec=IRequisitoVagaRepositorio)
+        self.repo_comp = Mock(spec=ICompetenciaCandidatoRepositorio)
+        self.motor = MotorCompatibilidade(self.repo_req, self.repo_comp)
+
+    def _vaga(self, id_vaga, classe=VagaCLT):
+        vaga = Mock(spec=classe)
+        vaga.id = id_vaga
+        return vaga
+
+    def test_pontuar_cobertura_total(self):
+        c = MotorCompatibilidade.pontuar([(1, 1, True), (2, 0, False)], {1: 2, 2: 0})
+        self.assertEqual(c.indice, 1.0)
+        self.assertTrue(c.atende_obrigatorios)
+        self.assertEqual(c.faltantes, ())
+
+    def test_pontuar_lacuna_de_nivel_reduz_credito(self):
+        # Obrigatório AVANCADO com candidato INICIANTE: lacuna 2 de 3
+        c = MotorCompatibilidade.pontuar([(1, 2, True)], {1: 0})
+        self.assertAlmostEqual(c.cobertura_obrigatorios, 1 / 3)
+        self.assertEqual(c.cobertura_opcionais, 1.0)
+        self.assertFalse(c.atende_obrigatorios)
+        self.assertEqual(c.faltantes, (1,))
+
+    def test_obrigatorio_pesa_mais_que_opcional(self):
+        falta_obrig = MotorCompatibilidade.pontuar([(1, 0, True), (2, 0, False)], {2: 0})
+        falta_opc = MotorCompatibilidade.pontuar([(1, 0, True), (2, 0, False)], {1: 0})
+        self.assertLess(falta_obrig.indice, falta_opc.indice)
+
+    def test_sem_requisitos(self):
+        self.assertIs(MotorCompatibilidade.pontuar((), {}), SEM_REQUISITOS)
+
+    def test_ranquear_vagas_consulta_repositorios_uma_vez(self):
+        self.repo_req.iterar.return_value = iter([
+            _req(1, 10, 100, "AVANCADO"),
+            _req(2, 11, 100, "INICIANTE"),
+            _req(3, 10, 200, "AVANCADO", tipo=TipoVagaRequisito.ESTAGIO),
+        ])
+        self.repo_comp.listar_por_candidato.return_value = [_comp(1, 5, 100, "intermediario")]
+        vagas = [self._vaga(10), self._vaga(11), self._vaga(10, VagaEstagio), self._vaga(12)]
+
+        ranking = self.motor.ranquear_vagas(5, vagas)
+
+        self.repo_req.iterar.assert_called_once()
+        self.repo_comp.listar_por_candidato.assert_called_once_with(5)
+        self.repo_req.listar_por_vaga.assert_not_called()
+        indices = {(v.__class__.__name__, v.id): c.indice for v, c in ranking}
+        self.assertEqual(indices[("VagaCLT", 11)], 1.0)
+        self.assertEqual(indices[("VagaCLT", 12)], 1.0)
+        self.assertLess(indices[("VagaEstagio", 10)], indices[("VagaCLT", 10)])
+        self.assertEqual([c.indice for _, c in ranking], sorted(indices.values(), reverse=True))
+
+    def test_vetores_relidos_so_quando_a_versao_muda(self):
+        requisitos = [_req(1, 10, 100, "AVANCADO")]
+        self.repo_req.iterar.side_effect = lambda: iter(list(requisitos))
+        self.repo_req.versao.return_value = 1
+
+        vetores = self.motor.vetores_requisitos()
+        self.assertIs(self.motor.vetores_requisitos(), vetores)
+        self.repo_req.iterar.assert_called_once()
+
+        requisitos.append(_req(2, 11, 200, "INICIANTE", obrigatorio=False))
+        self.repo_req.versao.return_value = 2
+        self.assertEqual(
+            self.motor.vetores_requisitos(),
+            {(TipoVagaRequisito.CLT, 10): ((100, 2, True),), (TipoVagaRequisito.CLT, 11): ((200, 0, False),)},
+        )
+        self.assertEqual(self.repo_req.iterar.call_count, 2)
+
+    def test_vetores_sem_versao_sao_relidos_a_cada_chamada(self):
+        self.repo_req.iterar.side_effect = lambda: iter([_req(1, 10, 100, "AVANCADO")])
+        self.repo_req.versao.return_value = None
+        self.motor.vetores_requisitos()
+        self.motor.vetores_requisitos()
+        self.assertEqual(self.repo_req.iterar.call_count, 2)
+
+    def test_perfis_agrupa_por_candidato(self):
+        self.repo_comp.iterar.return_value = iter([
+            _comp(1, 5, 100, "avancado"), _comp(2, 6, 100, "iniciante"), _comp(3, 5, 200, "iniciante"),
+        ])
+        self.assertEqual(self.motor.perfis(), {5: {100: 2, 200: 0}, 6: {100: 0}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import Mock
 from src.services.service_competencia_candidato import CompetenciaCandidatoService
 from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
 
 
 class TestServiceCompetenciaCandidato(unittest.TestCase):
@@ -35,6 +37,16 @@ class TestServiceCompetenciaCandidato(unittest.TestCase):
         cc = self.service.cadastrar(1, 3, "iniciante")
         self.assertEqual(cc.id, 6)
 
+    def test_cadastrar_id_da_sequencia(self):
+        sequencia = Mock(spec=ISequenciaIds)
+        sequencia.proximo.return_value = 12
+        service = CompetenciaCandidatoService(self.mock_repo, sequencia=sequencia)
+        self.mock_repo.buscar_por_candidato_e_competencia.return_value = None
+        cc = service.cadastrar(1, 3, "iniciante")
+        self.assertEqual(cc.id, 12)
+        sequencia.proximo.assert_called_once_with("competencia_candidato", service._maior_id)
+        self.mock_repo.listar_todas.assert_not_called()
+
     def test_buscar_por_id_sucesso(self):
         obj = Mock()
         self.mock_repo.buscar_por_id.return_value = obj
@@ -98,6 +110,22 @@ class TestServiceCompetenciaCandidato(unittest.TestCase):
         self.service.remover_por_candidato(3)
         self.mock_repo.remover_por_candidato.assert_called_once_with(3)
 
+    # -- OBSERVADORES --
+
+    def test_observador_avisado_nas_escritas(self):
+        observador = Mock(spec=IObservadorCandidato)
+        self.service.adicionar_observador(observador)
+        self.mock_repo.buscar_por_id.return_value = Mock(id_candidato=4)
+        self.mock_repo.remover_por_id.return_value = True
+
+        self.service.atualizar_nivel(1, "avancado")
+        self.service.remover(1)
+        self.assertEqual(observador.competencias_alteradas.call_args_list, [(([4],),), (([4],),)])
+
+        self.mock_repo.remover_por_candidato.return_value = 0
+        self.service.remover_por_candidato(4)
+        self.assertEqual(observador.competencias_alteradas.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
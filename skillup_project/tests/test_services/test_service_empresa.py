@@ -12,6 +12,7 @@ class TestServiceEmpresa(unittest.TestCase):
         self.service = EmpresaService(self.mock_repo)
 
     def test_cadastrar_sucesso(self):
+        self.mock_repo.buscar_por_cnpj.return_value = None
         self.mock_repo.listar.return_value = []
         e = self.service.cadastrar("Tech SA", "12345678000199", "medio")
         self.mock_repo.salvar.assert_called_once()
@@ -21,14 +22,16 @@ class TestServiceEmpresa(unittest.TestCase):
     def test_cadastrar_cnpj_duplicado(self):
         existente = Mock()
         existente.cnpj = "12345678000199"
-        self.mock_repo.listar.return_value = [existente]
+        self.mock_repo.buscar_por_cnpj.return_value = existente
         with self.assertRaisesRegex(ValueError, "Já existe empresa com este CNPJ"):
             self.service.cadastrar("Outra SA", "12345678000199", "grande")
+        self.mock_repo.listar.assert_not_called()
 
     def test_cadastrar_id_incremental(self):
         existente = Mock()
         existente.id = 3
         existente.cnpj = "99999999000100"
+        self.mock_repo.buscar_por_cnpj.return_value = None
         self.mock_repo.listar.return_value = [existente]
         e = self.service.cadastrar("Nova SA", "12345678000199", "pequeno")
         self.assertEqual(e.id, 4)
@@ -0,0 +1,205 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from src.aplicacao.comando_importacao import executar_importacao
+from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_empresa import IEmpresa
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
+from src.dominio.vaga import Modalidade, TipoVaga
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.repositorios import loader, repositorio_vaga_clt
+from src.repositorios.repositorio_vaga_clt import RepositorioVagaCLTJSON
+from src.repositorios.sequencia_ids import SequenciaIdsJSON
+from src.services.service_busca_vaga import MotorBuscaVaga
+from src.services.service_importacao import ImportadorService, TIPOS_IMPORTACAO
+from src.services.service_tabela_vagas import TabelaVagas
+from src.services.service_vaga_clt import VagaCLTService
+
+
+class TestImportadorService(unittest.TestCase):
+    """Testes da importação em massa de cadastros."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.mock_repo = Mock(spec=ICandidatoRepositorio)
+        existente = Mock()
+        existente.id = 7
+        existente.cpf = "99988877766"
+        existente.email = "velho@email.com"
+        self.mock_repo.iterar.return_value = iter([existente])
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _arquivo(self, nome, conteudo):
+        caminho = os.path.join(self._dir.name, nome)
+        with open(caminho, "w", encoding="utf-8") as f:
+            f.write(conteudo)
+        return caminho
+
+    @staticmethod
+    def _rejeitados(estatisticas):
+        with open(estatisticas.arquivo_rejeitados, encoding="utf-8") as f:
+            return [json.loads(linha) for linha in f]
+
+    def test_importar_csv_em_lotes_com_rejeitados(self):
+        caminho = self._arquivo("candidatos.csv", (
+            "nome,cpf,email,areas_interesse,nivel_formacao,localidade\n"
+            "Ana,11122233344,ana@email.com,TI;Dados,Superior,SP\n"
+            "Bia,99988877766,bia@email.com,TI,Superior,\n"
+            "Caio,123,caio@email.com,TI,Médio,\n"
+            "Davi,22233344455,ana@email.com,TI,Médio,\n"
+            "Eva,33344455566,eva@email.com,TI,Médio,\n"
+            "Fabi,44455566677,fabi@email.com,Dados,Médio,RJ\n"
+        ))
+        sequencia = Mock(spec=ISequenciaIds)
+        sequencia.reservar.side_effect = [range(8, 10), range(10, 11)]
+        observador = Mock(spec=IObservadorCandidato)
+        importador = ImportadorService(
+            TIPOS_IMPORTACAO["candidatos"], self.mock_repo, sequencia=sequencia, tamanho_lote=2,
+            observadores=[observador],
+        )
+
+        estatisticas = importador.importar(caminho)
+
+        self.assertEqual((estatisticas.lidas, estatisticas.importadas, estatisticas.rejeitadas), (6, 3, 3))
+        self.assertEqual(estatisticas.lotes, 2)
+        gravados = [c for chamada in self.mock_repo.salvar_muitos.call_args_list for c in chamada.args[0]]
+        self.assertEqual([(c.id, c.nome) for c in gravados], [(8, "Ana"), (9, "Eva"), (10, "Fabi")])
+        self.assertEqual(list(gravados[0].areas_interesse), ["TI", "Dados"])
+        self.assertEqual(sequencia.reservar.call_args_list[0].args[:2], ("candidato", 2))
+        # Um aviso por lote gravado
+        self.assertEqual(
+            [[c.id for c in chamada.args[0]] for chamada in observador.candidatos_salvos.call_args_list],
+            [[8, 9], [10]],
+        )
+
+        rejeitados = self._rejeitados(estatisticas)
+        self.assertEqual([r["linha"] for r in rejeitados], [3, 4, 5])
+        self.assertIn("cpf", rejeitados[0]["erro"])
+        self.assertEqual(rejeitados[1]["erro"], "CPF inválido.")
+        self.assertIn("email", rejeitados[2]["erro"])
+        self.assertEqual(rejeitados[2]["dados"]["nome"], "Davi")
+        self.assertTrue(estatisticas.arquivo_rejeitados.endswith("candidatos.rejeitados.jsonl"))
+
+    def test_importar_jsonl_sem_sequencia_continua_do_maior_id(self):
+        caminho = self._arquivo("candidatos.jsonl", (
+            '{"nome": "Ana", "cpf": "11122233344", "email": "ana@email.com", "areas_interesse": ["TI"], "nivel_formacao": "Superior"}\n'
+            "\n"
+            "{quebrado\n"
+            '{"nome": "Bia", "cpf": "22233344455", "areas_interesse": ["TI"], "nivel_formacao": "Superior"}\n'
+        ))
+        importador = ImportadorService(TIPOS_IMPORTACAO["candidatos"], self.mock_repo)
+
+        estatisticas = importador.importar(caminho, os.path.join(self._dir.name, "erros.jsonl"))
+
+        self.assertEqual((estatisticas.lidas, estatisticas.importadas, estatisticas.rejeitadas), (3, 1, 2))
+        (gravados,), _ = self.mock_repo.salvar_muitos.call_args
+        self.assertEqual([c.id for c in gravados], [8])
+        rejeitados = self._rejeitados(estatisticas)
+        self.assertEqual([r["linha"] for r in rejeitados], [3, 4])
+        self.assertEqual(rejeitados[0]["dados"], "{quebrado")
+        self.assertEqual(rejeitados[1]["erro"], "Campo obrigatório ausente: email")
+
+    def test_importar_vagas_checa_empresa(self):
+        repo_vaga = Mock(spec=IVagaRepositorio)
+        repo_vaga.iterar.return_value = iter([])
+        repo_empresa = Mock(spec=IEmpresa)
+        empresa = Mock()
+        empresa.id = 3
+        repo_empresa.iterar.return_value = iter([empresa])
+        caminho = self._arquivo("vagas.csv", (
+            "id_empresa,titulo,descricao,area,modalidade,tipo,prazo_inscricao,salario_base,ativa\n"
+            "3,Dev,Python,TI,Remoto,Emprego,2099-01-01,5000,sim\n"
+            "4,QA,Testes,TI,Remoto,Emprego,2099-01-01,4000,sim\n"
+            "3,Dados,SQL,TI,Teletransporte,Emprego,2099-01-01,,nao\n"
+        ))
+        importador = ImportadorService(
+            TIPOS_IMPORTACAO["vagas_clt"], repo_vaga, referencias={"empresa": repo_empresa}
+        )
+
+        estatisticas = importador.importar(caminho)
+
+        self.assertEqual((estatisticas.importadas, estatisticas.rejeitadas), (1, 2))
+        (gravadas,), _ = repo_vaga.salvar_muitos.call_args
+        self.assertEqual((gravadas[0].id, gravadas[0].salario_base), (1, 5000.0))
+        self.assertIn("id_empresa 4", self._rejeitados(estatisticas)[0]["erro"])
+
+    def test_importar_vagas_estagio_usa_a_sequencia(self):
+        repo_vaga = Mock(spec=IVagaRepositorio)
+        repo_vaga.iterar.return_value = iter([])
+        sequencia = Mock(spec=ISequenciaIds)
+        sequencia.reservar.return_value = range(21, 22)
+        caminho = self._arquivo("estagios.csv", (
+            "id_empresa,titulo,descricao,area,modalidade,tipo,prazo_inscricao,bolsa_auxilio,ativa\n"
+            "3,Estágio,Python,TI,Remoto,Estágio,2099-01-01,1500,sim\n"
+        ))
+        importador = ImportadorService(TIPOS_IMPORTACAO["vagas_estagio"], repo_vaga, sequencia=sequencia)
+
+        importador.importar(caminho)
+
+        (gravadas,), _ = repo_vaga.salvar_muitos.call_args
+        self.assertEqual([v.id for v in gravadas], [21])
+        self.assertEqual(sequencia.reservar.call_args.args[:2], ("vaga_estagio", 1))
+
+    def test_vagas_importadas_aparecem_nos_modelos_de_leitura(self):
+        loader.limpar_cache()
+        self.addCleanup(loader.limpar_cache)
+        caminho_repo = patch.object(
+            repositorio_vaga_clt, "CAMINHO_ARQUIVO", os.path.join(self._dir.name, "vaga_clt.json")
+        )
+        caminho_repo.start()
+        self.addCleanup(caminho_repo.stop)
+        repo = RepositorioVagaCLTJSON()
+        sequencia = SequenciaIdsJSON(os.path.join(self._dir.name, "sequencias.json"))
+        service = VagaCLTService(repo, sequencia=sequencia)
+        tabela = TabelaVagas(repo)
+        motor = MotorBuscaVaga(repo)
+        service.adicionar_observador(tabela)
+        service.adicionar_observador(motor)
+        service.cadastrar(3, "Dev", "Python", "TI", Modalidade.REMOTO, TipoVaga.EMPREGO, 5000.0)
+        self.assertEqual([v.id for v in tabela.compativeis(["TI"], "")], [1])
+        self.assertEqual([v.id for v in motor.buscar(area="TI")], [1])
+
+        caminho = self._arquivo("vagas.csv", (
+            "id_empresa,titulo,descricao,area,modalidade,tipo,prazo_inscricao,salario_base,ativa\n"
+            "3,QA,Testes,TI,Remoto,Emprego,2099-01-01,4000,sim\n"
+        ))
+        ImportadorService(
+            TIPOS_IMPORTACAO["vagas_clt"], repo, sequencia=sequencia, observadores=service.observadores
+        ).importar(caminho)
+        vaga = service.cadastrar(3, "Dados", "SQL", "TI", Modalidade.REMOTO, TipoVaga.EMPREGO, 6000.0)
+
+        self.assertEqual(vaga.id, 3)
+        self.assertEqual([v.id for v in tabela.compativeis(["TI"], "")], [1, 2, 3])
+        self.assertEqual([v.id for v in motor.buscar(area="TI")], [1, 2, 3])
+
+    def test_formato_e_lote_invalidos(self):
+        with self.assertRaises(ValueError):
+            ImportadorService(TIPOS_IMPORTACAO["empresas"], self.mock_repo, tamanho_lote=0)
+        importador = ImportadorService(TIPOS_IMPORTACAO["empresas"], self.mock_repo)
+        with self.assertRaisesRegex(ValueError, "Formato não suportado"):
+            importador.importar(self._arquivo("empresas.xml", ""))
+
+    def test_comando_importacao(self):
+        caminho = self._arquivo("empresas.csv", "nome,cnpj,porte\nAcme,11222333000144,grande\n")
+        repo_empresa = Mock(spec=IEmpresa)
+        repo_empresa.iterar.return_value = iter([])
+        app = Mock()
+        app.criar_importador.side_effect = lambda tipo, tamanho_lote: ImportadorService(
+            TIPOS_IMPORTACAO[tipo], repo_empresa, tamanho_lote=tamanho_lote
+        )
+
+        codigo = executar_importacao(app, ["empresas", caminho, "--lote", "10"])
+
+        self.assertEqual(codigo, 0)
+        app.criar_importador.assert_called_once_with("empresas", tamanho_lote=10)
+        repo_empresa.salvar_muitos.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
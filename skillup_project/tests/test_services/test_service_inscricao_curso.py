@@ -1,15 +1,22 @@
+import os
+import tempfile
 import unittest
 from datetime import date
 from unittest.mock import Mock, PropertyMock
+from src.services.service_competencia_candidato import CompetenciaCandidatoService
 from src.services.service_inscricao_curso import InscricaoCursoService
 from src.interfaces.interface_inscricao_curso import IInscricaoCursoRepositorio
 from src.interfaces.interface_curso import ICursoRepositorio
 from src.interfaces.interface_candidato import ICandidatoRepositorio
 from src.interfaces.interface_curso_competencia import ICursoCompetenciaRepositorio
 from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_observador_candidato import IObservadorCandidato
 from src.dominio.curso_presencial import CursoPresencial
 from src.dominio.curso_ead import CursoEAD
 from src.dominio.inscricao_curso import StatusInscricao, TipoCursoInscricao
+from src.repositorios import loader
+from src.repositorios.repositorio_competencia_candidato import RepositorioCompetenciaCandidatoJSON
+from src.repositorios.sequencia_ids import SequenciaIdsJSON
 
 
 class TestServiceInscricaoCurso(unittest.TestCase):
@@ -220,11 +227,15 @@ class TestConclusaoInscricao(unittest.TestCase):
         self.mock_repo_competencia_candidato.buscar_por_candidato_e_competencia.return_value = None
         self.mock_repo_competencia_candidato.listar_todas.return_value = []
 
+        observador = Mock(spec=IObservadorCandidato)
+        self.service.adicionar_observador(observador)
+
         competencias = self.service.concluir_inscricao(1)
 
         self.assertEqual(len(competencias), 1)
         self.mock_repo_competencia_candidato.salvar.assert_called_once()
         inscricao.concluir.assert_called_once()
+        observador.competencias_alteradas.assert_called_once_with([5])
 
     def test_concluir_inscricao_atualiza_nivel_maior(self):
         """Atualiza nível da competência quando o curso confere nível maior."""
@@ -323,5 +334,124 @@ class TestConclusaoInscricao(unittest.TestCase):
         self.mock_repo_inscricao.salvar.assert_called_once()
 
 
+    # -- ENCERRAMENTO DE CURSO --
+
+    def test_encerrar_curso_grava_uma_vez_por_repositorio(self):
+        """Encerra o curso lendo e gravando cada repositório uma única vez."""
+        curso = self._mock_curso_ead_encerrar()
+        inscricoes = [
+            self._mock_inscricao(id=1, id_curso=10, id_aluno=5),
+            self._mock_inscricao(id=2, id_curso=10, id_aluno=6),
+            self._mock_inscricao(id=3, id_curso=10, id_aluno=7, status=StatusInscricao.INDEFERIDO),
+        ]
+        for inscricao in inscricoes:
+            inscricao.tipo_curso = TipoCursoInscricao.EAD
+        self.mock_repo_curso_ead.buscar_por_id.return_value = curso
+        self.mock_repo_inscricao.listar_por_curso.return_value = inscricoes
+        self.mock_repo_curso_competencia.listar_por_curso.return_value = [
+            self._mock_curso_competencia(id_competencia=100, nivel_conferido="avancado"),
+            self._mock_curso_competencia(id_competencia=200, nivel_conferido="intermediario"),
+        ]
+        comp_existente = self._mock_competencia_candidato(
+            id=9, id_candidato=5, id_competencia=100, nivel_atual="iniciante"
+        )
+        outro_aluno = self._mock_competencia_candidato(id=12, id_candidato=99, id_competencia=200)
+        self.mock_repo_competencia_candidato.iterar.return_value = iter([comp_existente, outro_aluno])
+
+        observador = Mock(spec=IObservadorCandidato)
+        self.service.adicionar_observador(observador)
+
+        resultado = self.service.encerrar_curso(10, TipoCursoInscricao.EAD)
+
+        self.assertEqual(resultado, {"total_inscritos": 2, "concluidos": 2, "competencias_atribuidas": 4})
+        observador.competencias_alteradas.assert_called_once_with([5, 6])
+        (gravadas,), _ = self.mock_repo_competencia_candidato.salvar_muitos.call_args
+        self.assertIs(gravadas[0], comp_existente)
+        comp_existente.atualizar_nivel.assert_called_once_with("avancado")
+        self.assertEqual(
+            [(c.id, c.id_candidato, c.id_competencia, c.nivel_atual) for c in gravadas[1:]],
+            [(13, 5, 200, "intermediario"), (14, 6, 100, "avancado"), (15, 6, 200, "intermediario")],
+        )
+        self.mock_repo_inscricao.atualizar_muitos.assert_called_once_with(inscricoes[:2])
+        self.mock_repo_curso_competencia.listar_por_curso.assert_called_once_with(10)
+        self.mock_repo_competencia_candidato.buscar_por_candidato_e_competencia.assert_not_called()
+        self.mock_repo_competencia_candidato.salvar.assert_not_called()
+        self.mock_repo_inscricao.salvar.assert_not_called()
+        self.assertFalse(curso.ativo)
+        self.mock_repo_curso_ead.atualizar.assert_called_once_with(curso)
+
+    def test_encerrar_curso_sem_inscricoes(self):
+        """Encerra curso sem inscrições deferidas sem gravar competências."""
+        self.mock_repo_curso_ead.buscar_por_id.return_value = self._mock_curso_ead_encerrar()
+        self.mock_repo_inscricao.listar_por_curso.return_value = []
+
+        resultado = self.service.encerrar_curso(10, TipoCursoInscricao.EAD)
+
+        self.assertEqual(resultado["concluidos"], 0)
+        self.mock_repo_competencia_candidato.salvar_muitos.assert_not_called()
+        self.mock_repo_inscricao.atualizar_muitos.assert_not_called()
+
+    def _mock_curso_ead_encerrar(self):
+        curso = Mock(spec=CursoEAD)
+        curso.id = 10
+        curso.ativo = True
+        return curso
+
+
+class TestIdsCompetenciasCompartilhados(unittest.TestCase):
+    """Competências criadas à mão e no encerramento de curso tiram IDs da mesma sequência."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        loader.limpar_cache()
+        self.addCleanup(loader.limpar_cache)
+        self.repo_comp = RepositorioCompetenciaCandidatoJSON(os.path.join(tmp.name, "competencia_candidato.json"))
+        sequencia = SequenciaIdsJSON(os.path.join(tmp.name, "sequencias.json"))
+
+        self.repo_inscricao = Mock(spec=IInscricaoCursoRepositorio)
+        self.repo_curso_ead = Mock(spec=ICursoRepositorio)
+        self.repo_curso_competencia = Mock(spec=ICursoCompetenciaRepositorio)
+        comp_curso = Mock(id_competencia=100, nivel_conferido="avancado")
+        self.repo_curso_competencia.listar_por_curso.return_value = [comp_curso]
+
+        self.service_comp = CompetenciaCandidatoService(self.repo_comp, sequencia=sequencia)
+        self.service_inscricao = InscricaoCursoService(
+            repo_inscricao=self.repo_inscricao,
+            repo_curso_ead=self.repo_curso_ead,
+            repo_curso_competencia=self.repo_curso_competencia,
+            repo_competencia_candidato=self.repo_comp,
+            sequencia=sequencia,
+        )
+
+    def _encerrar(self, id_curso, alunos):
+        curso = Mock(spec=CursoEAD)
+        curso.id, curso.ativo = id_curso, True
+        self.repo_curso_ead.buscar_por_id.return_value = curso
+        inscricoes = []
+        for id_aluno in alunos:
+            inscricao = Mock(id=id_aluno, id_curso=id_curso, id_aluno=id_aluno)
+            inscricao.status = StatusInscricao.DEFERIDO
+            inscricao.tipo_curso = TipoCursoInscricao.EAD
+            inscricoes.append(inscricao)
+        self.repo_inscricao.listar_por_curso.return_value = inscricoes
+        self.service_inscricao.encerrar_curso(id_curso, TipoCursoInscricao.EAD)
+
+    def test_cadastro_e_encerramento_intercalados_nao_repetem_ids(self):
+        self.service_comp.cadastrar(1, 1, "iniciante")
+        self.service_comp.cadastrar(2, 2, "iniciante")
+        self._encerrar(10, [3, 4])
+        self.service_comp.cadastrar(5, 1, "intermediario")
+        # Linhas removidas deixam o maior ID para trás: a sequência não volta
+        self.service_comp.remover(self.repo_comp.buscar_por_candidato_e_competencia(5, 1).id)
+        self.service_comp.cadastrar(6, 1, "iniciante")
+        self._encerrar(11, [7])
+
+        self.assertEqual(
+            sorted((c.id, c.id_candidato, c.id_competencia) for c in self.repo_comp.listar_todas()),
+            [(1, 1, 1), (2, 2, 2), (3, 3, 100), (4, 4, 100), (6, 6, 1), (7, 7, 100)],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,9 +5,15 @@ from src.services.service_recomendacao import (
 )
 from src.interfaces.interface_vaga import IVagaRepositorio
 from src.interfaces.interface_curso import ICursoRepositorio
+from src.interfaces.interface_candidato import ICandidatoRepositorio
 from src.dominio.vaga import VagaCLT, VagaEstagio, Modalidade, TipoVaga
 from src.dominio.curso_presencial import CursoPresencial
 from src.dominio.curso_ead import CursoEAD
+from src.dominio.requisitos_vaga import RequisitoVaga, TipoVagaRequisito
+from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
+from src.dominio.competencia_candidato import CompetenciaCandidato
+from src.services.service_compatibilidade import MotorCompatibilidade
 
 
 class TestServiceRecomendacao(unittest.TestCase):
@@ -69,6 +75,35 @@ class TestServiceRecomendacao(unittest.TestCase):
 
     # -- RECOMENDAÇÃO DE VAGAS --
 
+    def test_recomendar_vagas_com_competencias(self):
+        """Vaga cujos requisitos o candidato cobre sobe no ranking."""
+        repo_req = Mock(spec=IRequisitoVagaRepositorio)
+        repo_comp = Mock(spec=ICompetenciaCandidatoRepositorio)
+        repo_req.iterar.return_value = iter([
+            RequisitoVaga(1, 1, TipoVagaRequisito.CLT, 100, "AVANCADO", True),
+        ])
+        repo_comp.listar_por_candidato.return_value = []
+        service = RecomendacaoService(
+            self.mock_repo_vaga, self.mock_repo_curso, MotorCompatibilidade(repo_req, repo_comp)
+        )
+        exige = self._mock_vaga_clt(id=1, modalidade=Modalidade.REMOTO)
+        livre = self._mock_vaga_clt(id=2, modalidade=Modalidade.REMOTO)
+        self.mock_repo_vaga.listar_ativas.return_value = [exige, livre]
+
+        resultado = service.recomendar_vagas(self._mock_candidato(["TI"]))
+
+        self.assertEqual([r.item.id for r in resultado], [2, 1])
+        base = PesoRecomendacao.AREA + PesoRecomendacao.REMOTO
+        self.assertEqual(resultado[0].pontuacao, base + PesoRecomendacao.COMPETENCIAS)
+        self.assertEqual(resultado[1].pontuacao, base)
+        self.assertFalse(resultado[1].compatibilidade.atende_obrigatorios)
+        # Os vetores ficam no motor: a próxima recomendação não relê os requisitos
+        self.assertEqual(
+            [r.pontuacao for r in service.recomendar_vagas(self._mock_candidato(["TI"]))],
+            [r.pontuacao for r in resultado],
+        )
+        repo_req.iterar.assert_called_once()
+
     def test_recomendar_vagas_area_localidade(self):
         """Vaga presencial com área e localidade correspondentes = AREA + LOCALIDADE."""
         vaga = self._mock_vaga_clt(area="TI", localidade="São Paulo")
@@ -179,6 +214,133 @@ class TestServiceRecomendacao(unittest.TestCase):
         resultado = self.service.recomendar_cursos(candidato)
         self.assertEqual(len(resultado), 0)
 
+    # -- RANKING DE CANDIDATOS PARA UMA VAGA --
+
+    def _service_ranking(self, candidatos, requisitos=(), competencias=()):
+        repo_req = Mock(spec=IRequisitoVagaRepositorio)
+        repo_comp = Mock(spec=ICompetenciaCandidatoRepositorio)
+        repo_cand = Mock(spec=ICandidatoRepositorio)
+        repo_req.listar_por_vaga.return_value = list(requisitos)
+        repo_comp.listar_por_competencia.side_effect = lambda id_comp: [
+            c for c in competencias if c.id_competencia == id_comp
+        ]
+        repo_cand.iterar.side_effect = lambda: iter(candidatos)
+        repo_cand.buscar_por_id.side_effect = {c.id: c for c in candidatos}.get
+        service = RecomendacaoService(
+            self.mock_repo_vaga,
+            self.mock_repo_curso,
+            MotorCompatibilidade(repo_req, repo_comp),
+            repo_candidato=repo_cand,
+        )
+        return service, repo_comp, repo_cand
+
+    def _candidato(self, id, areas=("TI",), localidade="São Paulo"):
+        cand = self._mock_candidato(list(areas), localidade)
+        cand.id = id
+        return cand
+
+    def test_ranquear_candidatos_top_k_por_competencia(self):
+        self.mock_repo_vaga.buscar_por_id.return_value = self._mock_vaga_clt(id=1)
+        candidatos = [self._candidato(i) for i in range(1, 9)]
+        candidatos.append(self._candidato(9, areas=("Saúde",)))
+        competencias = [
+            CompetenciaCandidato(1, 3, 100, "avancado"),
+            CompetenciaCandidato(2, 5, 100, "iniciante"),
+            CompetenciaCandidato(3, 7, 100, "intermediario"),
+            CompetenciaCandidato(4, 9, 100, "avancado"),
+            CompetenciaCandidato(5, 2, 200, "avancado"),
+        ]
+        service, repo_comp, _ = self._service_ranking(
+            candidatos,
+            [RequisitoVaga(1, 1, TipoVagaRequisito.CLT, 100, "AVANCADO", True)],
+            competencias,
+        )
+
+        ranking = service.ranquear_candidatos_para_vaga(1, top_k=3)
+
+        # 3 cobre o requisito, 7 e 5 cobrem parcialmente; 9 é de outra área
+        self.assertEqual([r.item.id for r in ranking], [3, 7, 5])
+        self.assertEqual(ranking[0].compatibilidade.percentual, 100)
+        self.assertEqual(
+            ranking[0].pontuacao,
+            PesoRecomendacao.AREA + PesoRecomendacao.LOCALIDADE + PesoRecomendacao.COMPETENCIAS,
+        )
+        repo_comp.listar_por_competencia.assert_called_once_with(100)
+        repo_comp.listar_por_candidato.assert_not_called()
+
+    def test_ranquear_candidatos_le_so_os_candidatos_do_indice(self):
+        self.mock_repo_vaga.buscar_por_id.return_value = self._mock_vaga_clt(id=1)
+        candidatos = [self._candidato(i) for i in range(1, 201)]
+        competencias = [
+            CompetenciaCandidato(1, 40, 100, "avancado"),
+            CompetenciaCandidato(2, 80, 200, "iniciante"),
+            CompetenciaCandidato(3, 120, 300, "avancado"),
+            # Candidato removido cujas competências ficaram
+            CompetenciaCandidato(4, 999, 100, "avancado"),
+        ]
+        service, _, repo_cand = self._service_ranking(
+            candidatos,
+            [
+                RequisitoVaga(1, 1, TipoVagaRequisito.CLT, 100, "AVANCADO", True),
+                RequisitoVaga(2, 1, TipoVagaRequisito.CLT, 200, "INICIANTE", False),
+            ],
+            competencias,
+        )
+
+        # Sem nenhuma das competências, ninguém passa dos dois do índice
+        ranking = service.ranquear_candidatos_para_vaga(1, top_k=2)
+
+        self.assertEqual([r.item.id for r in ranking], [40, 80])
+        repo_cand.iterar.assert_not_called()
+        self.assertEqual(
+            sorted(c.args[0] for c in repo_cand.buscar_por_id.call_args_list), [40, 80, 999]
+        )
+
+    def test_ranquear_candidatos_completa_com_quem_esta_fora_do_indice(self):
+        self.mock_repo_vaga.buscar_por_id.return_value = self._mock_vaga_clt(id=1)
+        candidatos = [self._candidato(i) for i in range(1, 7)]
+        candidatos.append(self._candidato(7, areas=("Saúde",)))
+        candidatos.append(self._candidato(8, localidade="Recife"))
+        requisitos = [RequisitoVaga(1, 1, TipoVagaRequisito.CLT, 100, "INICIANTE", True)]
+        competencias = [CompetenciaCandidato(1, 4, 100, "avancado"), CompetenciaCandidato(2, 7, 100, "avancado")]
+        service, repo_comp, _ = self._service_ranking(candidatos, requisitos, competencias)
+        repo_comp.listar_por_candidato.side_effect = lambda id_c: [
+            c for c in competencias if c.id_candidato == id_c
+        ]
+
+        ranking = service.ranquear_candidatos_para_vaga(1, top_k=3)
+
+        # Menos acertos no índice que top_k: as vagas restantes vêm por área e localidade,
+        # com a mesma pontuação que a recomendação dá a quem não tem a competência
+        self.assertEqual([r.item.id for r in ranking], [4, 1, 2])
+        self.assertEqual(ranking[1].compatibilidade.percentual, 67)
+        motor = service._motor
+        vaga = self.mock_repo_vaga.buscar_por_id.return_value
+        for item in ranking:
+            pontuacao, _ = service._pontuar_vaga(
+                vaga, ["ti"], "São Paulo", motor.requisitos_da_vaga(vaga), motor.perfil(item.item.id)
+            )
+            self.assertEqual(item.pontuacao, pontuacao)
+        self.assertEqual(len(service.ranquear_candidatos_para_vaga(1, top_k=10)), 6)
+
+    def test_ranquear_candidatos_filtra_localidade(self):
+        self.mock_repo_vaga.buscar_por_id.return_value = self._mock_vaga_clt(id=1)
+        service, _, _ = self._service_ranking(
+            [self._candidato(1, localidade="Recife"), self._candidato(2)]
+        )
+        ranking = service.ranquear_candidatos_para_vaga(1)
+        self.assertEqual([r.item.id for r in ranking], [2])
+
+    def test_ranquear_candidatos_vaga_inexistente(self):
+        self.mock_repo_vaga.buscar_por_id.return_value = None
+        service, _, _ = self._service_ranking([])
+        with self.assertRaises(ValueError):
+            service.ranquear_candidatos_para_vaga(99)
+
+    def test_ranquear_candidatos_sem_repositorio(self):
+        with self.assertRaises(ValueError):
+            self.service.ranquear_candidatos_para_vaga(1)
+
     # -- RECOMENDAR (VAGAS + CURSOS) --
 
     def test_recomendar_retorna_recomendacao(self):
@@ -0,0 +1,160 @@
+import multiprocessing
+import random
+import unittest
+from unittest.mock import Mock
+
+from src.dominio.competencia_candidato import CompetenciaCandidato
+from src.dominio.curso_ead import CursoEAD
+from src.dominio.curso_presencial import CursoPresencial
+from src.dominio.requisitos_vaga import RequisitoVaga, TipoVagaRequisito
+from src.dominio.vaga import Modalidade, TipoVaga, VagaCLT
+from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_curso import ICursoRepositorio
+from src.interfaces.interface_recomendacao_salva import IRecomendacaoSalvaRepositorio
+from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.services.service_compatibilidade import MotorCompatibilidade
+from src.services.service_recomendacao import RecomendacaoService
+from src.services.service_recomendacao_lote import RecomendacaoLoteService
+
+AREAS = ["TI", "Saúde", "Dados"]
+LOCALIDADES = ["", "São Paulo", "Recife"]
+
+
+def _vaga(id, gerador):
+    return VagaCLT(
+        id=id, id_empresa=1, titulo=f"Vaga {id}", descricao="Descrição",
+        area=gerador.choice(AREAS), modalidade=gerador.choice(list(Modalidade)),
+        tipo=TipoVaga.EMPREGO, ativa=True, salario_base=3000.0,
+        localidade=gerador.choice(LOCALIDADES),
+    )
+
+
+def _curso(id, gerador):
+    if gerador.random() < 0.5:
+        return CursoEAD(
+            id=id, id_instituicao=1, nome=f"Curso {id}", area=gerador.choice(AREAS),
+            carga_horaria=40, modalidade=Modalidade.REMOTO, capacidade=10,
+            ativo=gerador.random() > 0.2, plataforma_url="https://cursos.exemplo.com",
+        )
+    return CursoPresencial(
+        id=id, id_instituicao=1, nome=f"Curso {id}", area=gerador.choice(AREAS),
+        carga_horaria=40, modalidade=Modalidade.PRESENCIAL, capacidade=10,
+        localidade=gerador.choice(LOCALIDADES[1:]),
+    )
+
+
+class TestRecomendacaoLoteService(unittest.TestCase):
+    """Testes do cálculo em lote das recomendações."""
+
+    def setUp(self):
+        gerador = random.Random(11)
+        self.vagas = [_vaga(i, gerador) for i in range(1, 80)]
+        self.cursos = [_curso(i, gerador) for i in range(1, 30)]
+        self.candidatos = [
+            Mock(
+                id=i,
+                areas_interesse=gerador.sample(AREAS, gerador.randint(1, 2)),
+                localidade=gerador.choice(LOCALIDADES),
+            )
+            for i in range(1, 40)
+        ]
+        requisitos = [
+            RequisitoVaga(i, v.id, TipoVagaRequisito.CLT, 100 + i % 3, "INTERMEDIARIO", i % 2 == 0)
+            for i, v in enumerate(self.vagas[::3], start=1)
+        ]
+        competencias = [
+            CompetenciaCandidato(i, c.id, 100 + i % 3, "avancado")
+            for i, c in enumerate(self.candidatos[::2], start=1)
+        ]
+
+        self.mock_repo_vaga = Mock(spec=IVagaRepositorio)
+        self.mock_repo_vaga.listar_ativas.return_value = self.vagas
+        self.mock_repo_curso = Mock(spec=ICursoRepositorio)
+        self.mock_repo_curso.listar_todos.return_value = self.cursos
+        self.mock_repo_candidato = Mock(spec=ICandidatoRepositorio)
+        self.mock_repo_candidato.iterar.side_effect = lambda: iter(self.candidatos)
+        self.mock_repo_recomendacao = Mock(spec=IRecomendacaoSalvaRepositorio)
+
+        repo_requisito = Mock(spec=IRequisitoVagaRepositorio)
+        repo_requisito.iterar.side_effect = lambda: iter(requisitos)
+        repo_comp = Mock(spec=ICompetenciaCandidatoRepositorio)
+        repo_comp.iterar.side_effect = lambda: iter(competencias)
+        repo_comp.listar_por_candidato.side_effect = lambda id_c: [
+            c for c in competencias if c.id_candidato == id_c
+        ]
+        self.motor = MotorCompatibilidade(repo_requisito, repo_comp)
+
+    def _lote(self, motor="padrao", **kwargs):
+        return RecomendacaoLoteService(
+            self.mock_repo_vaga,
+            self.mock_repo_curso,
+            self.mock_repo_candidato,
+            self.mock_repo_recomendacao,
+            self.motor if motor == "padrao" else motor,
+            **kwargs,
+        )
+
+    def _gravadas(self):
+        (recomendacoes,), _ = self.mock_repo_recomendacao.substituir_todas.call_args
+        return {r.id_candidato: r for r in recomendacoes}
+
+    def test_igual_ao_calculo_sob_demanda(self):
+        for motor in (self.motor, None):
+            with self.subTest(com_competencias=motor is not None):
+                estatisticas = self._lote(motor, top_n=5, tamanho_particao=7, processos=1).executar()
+
+                self.assertEqual(estatisticas.candidatos, 39)
+                self.assertEqual(estatisticas.particoes, 6)
+                gravadas = self._gravadas()
+                sob_demanda = RecomendacaoService(self.mock_repo_vaga, self.mock_repo_curso, motor)
+                for candidato in self.candidatos:
+                    esperado = sob_demanda.recomendar(candidato)
+                    salva = gravadas[candidato.id]
+                    self.assertEqual(
+                        [(v.id, v.pontuacao, v.percentual) for v in salva.vagas],
+                        [
+                            (r.item.id, r.pontuacao, r.compatibilidade and r.compatibilidade.percentual)
+                            for r in esperado.vagas[:5]
+                        ],
+                    )
+                    self.assertEqual(
+                        [(c.id, c.pontuacao) for c in salva.cursos],
+                        [(r.item.id, r.pontuacao) for r in esperado.cursos[:5]],
+                    )
+
+    def test_catalogo_lido_uma_vez(self):
+        self._lote(tamanho_particao=5, processos=1).executar()
+
+        self.mock_repo_vaga.listar_ativas.assert_called_once()
+        self.mock_repo_curso.listar_todos.assert_called_once()
+        self.mock_repo_candidato.iterar.assert_called_once()
+        self.mock_repo_recomendacao.substituir_todas.assert_called_once()
+
+    @unittest.skipIf("fork" not in multiprocessing.get_all_start_methods(), "fork indisponível")
+    def test_processos_dao_o_mesmo_resultado(self):
+        def itens(gravadas):
+            return {id_c: (r.vagas, r.cursos) for id_c, r in gravadas.items()}
+
+        self._lote(tamanho_particao=4, processos=1).executar()
+        em_um_processo = itens(self._gravadas())
+
+        estatisticas = self._lote(tamanho_particao=4, processos=3).executar()
+
+        self.assertEqual(estatisticas.processos, 3)
+        self.assertEqual(itens(self._gravadas()), em_um_processo)
+
+    def test_parametros_invalidos(self):
+        for kwargs in ({"top_n": 0}, {"tamanho_particao": 0}, {"processos": 0}):
+            with self.assertRaises(ValueError):
+                self._lote(**kwargs)
+
+    def test_buscar_le_do_repositorio(self):
+        self.mock_repo_recomendacao.buscar_por_candidato.return_value = None
+        self.assertIsNone(self._lote().buscar(3))
+        self.mock_repo_recomendacao.buscar_por_candidato.assert_called_once_with(3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,29 @@ class TestServiceRequisitoVaga(unittest.TestCase):
         req = self.service.cadastrar(1, 3, "iniciante", TipoVagaRequisito.CLT, False)
         self.assertEqual(req.id, 10)
 
+    def test_cadastrar_lote(self):
+        ja_cadastrado = Mock()
+        ja_cadastrado.id_competencia = 2
+        self.mock_repo.listar_por_vaga.side_effect = lambda id_vaga: [ja_cadastrado] if id_vaga == 1 else []
+        self.mock_repo.listar_todos.return_value = []
+        dados = [
+            {"id_vaga": 1, "id_competencia": 2, "nivel_minimo": "avancado", "tipo_vaga": TipoVagaRequisito.CLT},
+            {"id_vaga": 1, "id_competencia": 3, "nivel_minimo": "iniciante", "tipo_vaga": TipoVagaRequisito.CLT},
+            {"id_vaga": 1, "id_competencia": 3, "nivel_minimo": "avancado", "tipo_vaga": TipoVagaRequisito.CLT},
+            {"id_vaga": 2, "id_competencia": 3, "nivel_minimo": "nenhum", "tipo_vaga": TipoVagaRequisito.CLT},
+            {"id_vaga": 2, "id_competencia": 4, "nivel_minimo": "intermediario", "tipo_vaga": "ESTAGIO", "obrigatorio": False},
+        ]
+
+        resultado = self.service.cadastrar_lote(dados)
+
+        self.assertEqual([(r.id, r.id_competencia) for r in resultado], [(1, 3), (3, 4)])
+        self.assertEqual([e.posicao for e in resultado.erros], [0, 2, 3])
+        self.assertIn("já possui", resultado.erros[0].mensagem)
+        self.assertEqual(resultado.cadastrados[1].tipo_vaga, TipoVagaRequisito.ESTAGIO)
+        self.assertEqual(self.mock_repo.listar_por_vaga.call_count, 2)
+        self.mock_repo.salvar_muitos.assert_called_once_with(resultado.cadastrados)
+        self.mock_repo.salvar.assert_not_called()
+
     def test_buscar_por_id_sucesso(self):
         obj = Mock()
         self.mock_repo.buscar_por_id.return_value = obj
@@ -0,0 +1,167 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from src.dominio.vaga import Modalidade, TipoVaga, VagaCLT, VagaEstagio
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.repositorios import loader, repositorio_vaga_clt
+from src.repositorios.repositorio_vaga_clt import RepositorioVagaCLTJSON
+from src.services import service_tabela_vagas
+from src.services.service_recomendacao import RecomendacaoService
+from src.services.service_tabela_vagas import TabelaVagas
+
+
+def _vaga_clt(id, area="TI", modalidade=Modalidade.PRESENCIAL, localidade="São Paulo",
+              salario=5000.0, ativa=True):
+    return VagaCLT(
+        id=id, id_empresa=1, titulo="Vaga", descricao="Descrição", area=area,
+        modalidade=modalidade, tipo=TipoVaga.EMPREGO, ativa=ativa,
+        salario_base=salario, localidade=localidade,
+    )
+
+
+def _vaga_estagio(id, area="TI", bolsa=1500.0, ativa=True):
+    return VagaEstagio(
+        id=id, id_empresa=1, titulo="Estágio", descricao="Descrição", area=area,
+        modalidade=Modalidade.REMOTO, tipo=TipoVaga.ESTAGIO, ativa=ativa,
+        bolsa_auxilio=bolsa, id_instituicao_conveniada=1,
+    )
+
+
+class TestTabelaVagas(unittest.TestCase):
+    """Testes da tabela colunar de vagas."""
+
+    def setUp(self):
+        self.mock_repo = Mock(spec=IVagaRepositorio)
+        self.vagas = [
+            _vaga_clt(1, area="TI", localidade="São Paulo", salario=5000.0),
+            _vaga_clt(2, area="Saúde", localidade="Recife", salario=3000.0),
+            _vaga_clt(3, area="ti", modalidade=Modalidade.REMOTO, localidade="", salario=8000.0),
+            _vaga_clt(4, area="TI", localidade="Recife", salario=0.0, ativa=False),
+            _vaga_estagio(5, area="TI", bolsa=1500.0),
+        ]
+        self.mock_repo.listar_todas.return_value = self.vagas
+        self.tabela = TabelaVagas(self.mock_repo)
+
+    @staticmethod
+    def _ids(vagas):
+        return [v.id for v in vagas]
+
+    def test_filtros_combinados(self):
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["TI"])), [1, 3, 5])
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["TI"], apenas_ativas=False)), [1, 3, 4, 5])
+        self.assertEqual(self._ids(self.tabela.filtrar(modalidades=[Modalidade.REMOTO])), [3, 5])
+        self.assertEqual(self._ids(self.tabela.filtrar(tipos=[TipoVaga.ESTAGIO])), [5])
+        self.assertEqual(self._ids(self.tabela.filtrar(localidades=[" recife "], apenas_ativas=False)), [2, 4])
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["Marketing"])), [])
+
+    def test_faixa_de_salario_e_bolsa(self):
+        self.assertEqual(self._ids(self.tabela.filtrar(salario_min=1000, salario_max=5000)), [1, 2, 5])
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["TI"], salario_min=6000)), [3])
+        self.mock_repo.listar_todas.assert_called_once()
+
+    def test_compativeis_com_candidato(self):
+        self.assertEqual(self._ids(self.tabela.compativeis(["ti"], "são paulo")), [1, 3, 5])
+        self.assertEqual(self._ids(self.tabela.compativeis(["ti", "saúde"], "")), [3, 5])
+
+    def test_mantida_pelos_avisos(self):
+        self.tabela.filtrar()
+        self.tabela.vaga_salva(_vaga_clt(2, area="TI", localidade="Recife", salario=3000.0))
+        self.tabela.vaga_salva(_vaga_clt(6, area="TI", salario=9000.0))
+        self.tabela.vaga_removida(1)
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["TI"])), [2, 3, 5, 6])
+        self.assertEqual(self._ids(self.tabela.filtrar(salario_min=4000)), [3, 6])
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["Saúde"])), [])
+
+        self.tabela.invalidar()
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["TI"])), [1, 3, 5])
+        self.assertEqual(self.mock_repo.listar_todas.call_count, 2)
+
+    def test_compacta_depois_de_muitas_remocoes(self):
+        self.tabela.filtrar()
+        with patch.object(service_tabela_vagas, "_MINIMO_PARA_COMPACTAR", 2):
+            for id_vaga in (1, 2, 4):
+                self.tabela.vaga_removida(id_vaga)
+        self.assertEqual(len(self.tabela._vagas), 2)
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["TI"], salario_min=1000)), [3, 5])
+
+    def test_recomendacao_igual_a_sem_tabela(self):
+        gerador = random.Random(7)
+        vagas = [
+            _vaga_clt(
+                i,
+                area=gerador.choice(["TI", "Saúde", "Dados"]),
+                modalidade=gerador.choice(list(Modalidade)),
+                localidade=gerador.choice(["", "São Paulo", "Recife"]),
+                ativa=gerador.random() > 0.2,
+            )
+            for i in range(1, 200)
+        ]
+        self.mock_repo.listar_todas.return_value = vagas
+        self.mock_repo.listar_ativas.return_value = [v for v in vagas if v.ativa]
+        sem_tabela = RecomendacaoService(self.mock_repo, Mock())
+        com_tabela = RecomendacaoService(
+            self.mock_repo, Mock(), tabela_vagas=TabelaVagas(self.mock_repo)
+        )
+        for areas, localidade in [(["TI"], "São Paulo"), (["Dados", "Saúde"], ""), (["ti"], " recife")]:
+            candidato = Mock(areas_interesse=areas, localidade=localidade)
+            esperado = [(r.item.id, r.pontuacao) for r in sem_tabela.recomendar_vagas(candidato)]
+            obtido = [(r.item.id, r.pontuacao) for r in com_tabela.recomendar_vagas(candidato)]
+            self.assertEqual(obtido, esperado)
+
+    def test_codigos_passam_de_h_para_i(self):
+        coluna = service_tabela_vagas._ColunaCodificada()
+        for linha in range(70000):
+            coluna.definir(linha, linha, com_bits=False)
+        self.assertEqual(coluna.codigos.typecode, "I")
+        self.assertEqual(coluna.codigos[69999], 69999)
+
+    def test_remontada_quando_a_versao_muda_sem_aviso(self):
+        self.mock_repo.versao.return_value = 1
+        self.assertEqual(self._ids(self.tabela.filtrar(areas=["TI"])), [1, 3, 5])
+
+        self.mock_repo.listar_todas.return_value = [_vaga_clt(1, ativa=False), _vaga_clt(6)]
+        self.mock_repo.versao.return_value = 2
+        self.assertEqual(self._ids(self.tabela.compativeis(["TI"], "São Paulo")), [6])
+        self.assertEqual(self.mock_repo.listar_todas.call_count, 2)
+
+    def test_aviso_nao_remonta(self):
+        self.mock_repo.versao.return_value = 1
+        self.tabela.filtrar()
+        self.mock_repo.versao.return_value = 2
+        self.tabela.vaga_salva(_vaga_clt(6))
+        self.mock_repo.versao.return_value = 3
+        self.tabela.vaga_removida(2)
+
+        self.assertEqual(self._ids(self.tabela.filtrar()), [1, 3, 5, 6])
+        self.mock_repo.listar_todas.assert_called_once()
+
+
+class TestTabelaVagasRepositorioJSON(unittest.TestCase):
+    """A tabela sobre o repositório JSON vê escritas de outra instância do repositório."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        loader.limpar_cache()
+        self.addCleanup(loader.limpar_cache)
+        caminho = patch.object(repositorio_vaga_clt, "CAMINHO_ARQUIVO", os.path.join(tmp.name, "vaga_clt.json"))
+        caminho.start()
+        self.addCleanup(caminho.stop)
+
+    def test_escrita_de_outra_instancia(self):
+        repo = RepositorioVagaCLTJSON()
+        repo.salvar(_vaga_clt(1))
+        tabela = TabelaVagas(repo)
+        self.assertEqual([v.id for v in tabela.compativeis(["TI"], "São Paulo")], [1])
+
+        outro = RepositorioVagaCLTJSON()
+        outro.salvar_muitos([_vaga_clt(1, ativa=False), _vaga_clt(2)])
+
+        self.assertEqual([v.id for v in tabela.compativeis(["TI"], "São Paulo")], [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ from datetime import date
 from unittest.mock import Mock
 from src.services.service_vaga_clt import VagaCLTService
 from src.interfaces.interface_vaga import IVagaRepositorio
+from src.interfaces.interface_observador_vaga import IObservadorVaga
 from src.dominio.vaga import Modalidade, TipoVaga
 
 
@@ -110,6 +111,20 @@ class TestServiceVagaCLT(unittest.TestCase):
         vaga.pausar.assert_called_once()
         self.mock_repo.atualizar.assert_called_once_with(vaga)
 
+    # -- OBSERVADORES --
+
+    def test_observador_avisado_nas_escritas(self):
+        observador = Mock(spec=IObservadorVaga)
+        self.service.adicionar_observador(observador)
+        vaga = Mock()
+        self.mock_repo.buscar_por_id.return_value = vaga
+
+        self.service.pausar(1)
+        observador.vaga_salva.assert_called_once_with(vaga)
+
+        self.service.excluir(1)
+        observador.vaga_removida.assert_called_once_with(1)
+
 
 if __name__ == "__main__":
     unittest.main()
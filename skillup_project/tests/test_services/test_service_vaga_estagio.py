@@ -3,6 +3,7 @@ from datetime import date
 from unittest.mock import Mock
 from src.services.service_vaga_estagio import VagaEstagioService
 from src.interfaces.interface_vaga import IVagaRepositorio
+from src.interfaces.interface_sequencia_ids import ISequenciaIds
 from src.dominio.vaga import Modalidade, TipoVaga
 
 
@@ -46,6 +47,18 @@ class TestServiceVagaEstagio(unittest.TestCase):
         )
         self.assertEqual(vaga.id, 4)
 
+    def test_cadastrar_id_da_sequencia(self):
+        sequencia = Mock(spec=ISequenciaIds)
+        sequencia.proximo.return_value = 9
+        service = VagaEstagioService(self.mock_repo, sequencia=sequencia)
+        vaga = service.cadastrar(
+            1, "Estágio Eng", "Desc", "Engenharia", Modalidade.PRESENCIAL,
+            TipoVaga.ESTAGIO, 1200.0, 2, "São Paulo", date(2027, 6, 1),
+        )
+        self.assertEqual(vaga.id, 9)
+        sequencia.proximo.assert_called_once_with("vaga_estagio", service._maior_id)
+        self.mock_repo.listar_todas.assert_not_called()
+
     def test_buscar_por_id_sucesso(self):
         obj = Mock()
         self.mock_repo.buscar_por_id.return_value = obj
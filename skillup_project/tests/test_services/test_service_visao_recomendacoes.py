@@ -0,0 +1,313 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.dominio.competencia_candidato import CompetenciaCandidato
+from src.dominio.curso_ead import CursoEAD
+from src.dominio.curso_presencial import CursoPresencial
+from src.dominio.recomendacao_salva import RecomendacaoSalva, VagaRecomendada
+from src.dominio.requisitos_vaga import RequisitoVaga, TipoVagaRequisito
+from src.dominio.vaga import Modalidade, TipoVaga, VagaCLT
+from src.interfaces.interface_candidato import ICandidatoRepositorio
+from src.interfaces.interface_competencia_candidato import ICompetenciaCandidatoRepositorio
+from src.interfaces.interface_curso import ICursoRepositorio
+from src.interfaces.interface_recomendacao_salva import IRecomendacaoSalvaRepositorio
+from src.interfaces.interface_requisito_vaga import IRequisitoVagaRepositorio
+from src.interfaces.interface_vaga import IVagaRepositorio
+from src.repositorios import loader
+from src.repositorios.repositorio_recomendacao_salva import RepositorioRecomendacaoSalvaJSON
+from src.services.service_compatibilidade import MotorCompatibilidade
+from src.services.service_recomendacao import RecomendacaoService
+from src.services.service_recomendacao_lote import RecomendacaoLoteService
+from src.services.service_visao_recomendacoes import VisaoRecomendacoes
+
+AREAS = ["TI", "Saúde", "Dados"]
+LOCALIDADES = ["", "São Paulo", "Recife"]
+TOP_N = 4
+
+
+def _vaga(id, area, modalidade=Modalidade.PRESENCIAL, localidade="Recife"):
+    return VagaCLT(
+        id=id, id_empresa=1, titulo=f"Vaga {id}", descricao="Descrição",
+        area=area, modalidade=modalidade, tipo=TipoVaga.EMPREGO, ativa=True,
+        salario_base=3000.0, localidade=localidade,
+    )
+
+
+def _curso(id, gerador):
+    if gerador.random() < 0.5:
+        return CursoEAD(
+            id=id, id_instituicao=1, nome=f"Curso {id}", area=gerador.choice(AREAS),
+            carga_horaria=40, modalidade=Modalidade.REMOTO, capacidade=10,
+            plataforma_url="https://cursos.exemplo.com",
+        )
+    return CursoPresencial(
+        id=id, id_instituicao=1, nome=f"Curso {id}", area=gerador.choice(AREAS),
+        carga_horaria=40, modalidade=Modalidade.PRESENCIAL, capacidade=10,
+        localidade=gerador.choice(LOCALIDADES[1:]),
+    )
+
+
+class TestVisaoRecomendacoes(unittest.TestCase):
+    """Testes da visão de recomendações mantida pelos avisos."""
+
+    def setUp(self):
+        gerador = random.Random(5)
+        self.vagas = [
+            _vaga(i, gerador.choice(AREAS), gerador.choice(list(Modalidade)), gerador.choice(LOCALIDADES))
+            for i in range(1, 60)
+        ]
+        self.cursos = [_curso(i, gerador) for i in range(1, 20)]
+        self.candidatos = {
+            i: Mock(
+                id=i,
+                areas_interesse=gerador.sample(AREAS, gerador.randint(1, 2)),
+                localidade=gerador.choice(LOCALIDADES),
+            )
+            for i in range(1, 30)
+        }
+        self.requisitos = [
+            RequisitoVaga(i, v.id, TipoVagaRequisito.CLT, 100 + i % 3, "INTERMEDIARIO", i % 2 == 0)
+            for i, v in enumerate(self.vagas[::3], start=1)
+        ]
+        self.competencias = [
+            CompetenciaCandidato(i, id_c, 100 + i % 3, "avancado")
+            for i, id_c in enumerate(list(self.candidatos)[::2], start=1)
+        ]
+
+        self.mock_repo_vaga = Mock(spec=IVagaRepositorio)
+        self.mock_repo_vaga.listar_ativas.side_effect = lambda: [v for v in self.vagas if v.ativa]
+        self.mock_repo_curso = Mock(spec=ICursoRepositorio)
+        self.mock_repo_curso.listar_todos.return_value = self.cursos
+        self.mock_repo_candidato = Mock(spec=ICandidatoRepositorio)
+        self.mock_repo_candidato.iterar.side_effect = lambda: iter(list(self.candidatos.values()))
+
+        # Repositório de recomendações em memória
+        self.salvas = {}
+        self.mock_repo_recomendacao = Mock(spec=IRecomendacaoSalvaRepositorio)
+        self.mock_repo_recomendacao.iterar.side_effect = lambda: iter(list(self.salvas.values()))
+        self.mock_repo_recomendacao.buscar_por_candidato.side_effect = self.salvas.get
+        self.mock_repo_recomendacao.salvar_muitos.side_effect = (
+            lambda linhas: self.salvas.update({r.id_candidato: r for r in linhas})
+        )
+        self.mock_repo_recomendacao.remover_por_candidato.side_effect = (
+            lambda id_c: self.salvas.pop(id_c, None) is not None
+        )
+
+        def substituir_todas(linhas):
+            self.salvas.clear()
+            self.salvas.update({r.id_candidato: r for r in linhas})
+
+        self.mock_repo_recomendacao.substituir_todas.side_effect = substituir_todas
+
+        repo_requisito = Mock(spec=IRequisitoVagaRepositorio)
+        repo_requisito.iterar.side_effect = lambda: iter(self.requisitos)
+        repo_requisito.listar_por_vaga.side_effect = lambda id_v: [
+            r for r in self.requisitos if r.id_vaga == id_v
+        ]
+        repo_comp = Mock(spec=ICompetenciaCandidatoRepositorio)
+        repo_comp.iterar.side_effect = lambda: iter(self.competencias)
+        repo_comp.listar_por_candidato.side_effect = lambda id_c: [
+            c for c in self.competencias if c.id_candidato == id_c
+        ]
+        self.motor = MotorCompatibilidade(repo_requisito, repo_comp)
+
+    def _repos(self):
+        return (self.mock_repo_vaga, self.mock_repo_curso, self.mock_repo_candidato, self.mock_repo_recomendacao)
+
+    def _visao_sobre_o_lote(self, motor):
+        RecomendacaoLoteService(*self._repos(), motor, top_n=TOP_N, processos=1).executar()
+        self.mock_repo_vaga.listar_ativas.reset_mock()
+        self.mock_repo_recomendacao.salvar_muitos.reset_mock()
+        return VisaoRecomendacoes(*self._repos(), motor, top_n=TOP_N)
+
+    def _recalculados(self):
+        ids = set()
+        for (linhas,), _ in self.mock_repo_recomendacao.salvar_muitos.call_args_list:
+            ids.update(r.id_candidato for r in linhas)
+        self.mock_repo_recomendacao.salvar_muitos.reset_mock()
+        return ids
+
+    def _assert_igual_ao_sob_demanda(self, motor):
+        # Repositório à parte, para não contar as leituras do cálculo de referência
+        repo_vaga = Mock(spec=IVagaRepositorio)
+        repo_vaga.listar_ativas.side_effect = lambda: [v for v in self.vagas if v.ativa]
+        sob_demanda = RecomendacaoService(repo_vaga, self.mock_repo_curso, motor)
+        self.assertEqual(set(self.salvas), set(self.candidatos))
+        for candidato in self.candidatos.values():
+            esperado = sob_demanda.recomendar(candidato)
+            salva = self.salvas[candidato.id]
+            self.assertEqual(
+                [(v.id, v.pontuacao, v.percentual) for v in salva.vagas],
+                [
+                    (r.item.id, r.pontuacao, r.compatibilidade and r.compatibilidade.percentual)
+                    for r in esperado.vagas[:TOP_N]
+                ],
+            )
+            self.assertEqual(
+                [(c.id, c.pontuacao) for c in salva.cursos],
+                [(r.item.id, r.pontuacao) for r in esperado.cursos[:TOP_N]],
+            )
+
+    def test_avisos_mantem_as_linhas_iguais_ao_calculo_sob_demanda(self):
+        for com_competencias in (True, False):
+            with self.subTest(com_competencias=com_competencias):
+                self.setUp()
+                motor = self.motor if com_competencias else None
+                visao = self._visao_sobre_o_lote(motor)
+
+                pausada = self.salvas[1].vagas[0].id
+                self.vagas[pausada - 1].pausar()
+                visao.vaga_salva(self.vagas[pausada - 1])
+                self._assert_igual_ao_sob_demanda(motor)
+
+                self.vagas.append(_vaga(60, "TI", Modalidade.REMOTO, ""))
+                visao.vaga_salva(self.vagas[-1])
+                self._assert_igual_ao_sob_demanda(motor)
+
+                self.vagas[pausada - 1].publicar()
+                visao.vaga_salva(self.vagas[pausada - 1])
+                self.vagas[9] = _vaga(10, "Dados", Modalidade.HIBRIDO, "São Paulo")
+                visao.vaga_salva(self.vagas[9])
+                self._assert_igual_ao_sob_demanda(motor)
+
+                removida = self.vagas.pop(4)
+                visao.vaga_removida(removida.id)
+                self._assert_igual_ao_sob_demanda(motor)
+
+                self.candidatos[2].areas_interesse = ["Saúde"]
+                self.candidatos[3].localidade = "Recife"
+                visao.candidatos_salvos([self.candidatos[2], self.candidatos[3]])
+                self.competencias.append(CompetenciaCandidato(99, 5, 101, "avancado"))
+                visao.competencias_alteradas([5])
+                self._assert_igual_ao_sob_demanda(motor)
+
+                self.mock_repo_vaga.listar_ativas.assert_called_once()
+                self.mock_repo_recomendacao.substituir_todas.assert_called_once()
+
+    def test_vagas_salvas_em_lote_recalculam_cada_candidato_uma_vez(self):
+        visao = self._visao_sobre_o_lote(self.motor)
+
+        novas = [_vaga(60 + i, "TI", Modalidade.REMOTO, "") for i in range(3)]
+        self.vagas.extend(novas)
+        visao.vagas_salvas(novas)
+
+        self.mock_repo_recomendacao.salvar_muitos.assert_called_once()
+        self._assert_igual_ao_sob_demanda(self.motor)
+
+    def test_so_os_candidatos_afetados_sao_recalculados(self):
+        visao = self._visao_sobre_o_lote(self.motor)
+
+        pausada = self.salvas[1].vagas[0].id
+        com_a_vaga = {id_c for id_c, r in self.salvas.items() if pausada in [v.id for v in r.vagas]}
+        self.vagas[pausada - 1].pausar()
+        visao.vaga_salva(self.vagas[pausada - 1])
+        self.assertEqual(self._recalculados(), com_a_vaga)
+
+        # Vaga presencial em Recife: só candidatos de Saúde em Recife podem recebê-la
+        self.vagas.append(_vaga(60, "Saúde", Modalidade.PRESENCIAL, "Recife"))
+        visao.vaga_salva(self.vagas[-1])
+        publico = {
+            c.id for c in self.candidatos.values()
+            if "Saúde" in c.areas_interesse and c.localidade == "Recife"
+        }
+        self.assertTrue(self._recalculados() <= publico)
+
+        self.candidatos[7].localidade = "São Paulo" if self.candidatos[7].localidade != "São Paulo" else ""
+        visao.candidatos_salvos([self.candidatos[7], self.candidatos[8]])
+        self.assertEqual(self._recalculados(), {7})
+
+        self.mock_repo_vaga.listar_ativas.assert_called_once()
+
+    def test_buscar_calcula_e_salva_linha_que_falta(self):
+        visao = VisaoRecomendacoes(*self._repos(), self.motor, top_n=TOP_N)
+
+        salva = visao.buscar(3)
+
+        self.assertEqual(self.salvas, {3: salva})
+        self.assertIs(visao.buscar(3), salva)
+        self.assertIsNone(visao.buscar(999))
+
+    def test_candidato_removido_perde_a_linha(self):
+        visao = self._visao_sobre_o_lote(self.motor)
+
+        del self.candidatos[4]
+        visao.candidato_removido(4)
+
+        self.assertNotIn(4, self.salvas)
+        self.assertIsNone(visao.buscar(4))
+
+    def test_invalidar_rele_os_repositorios(self):
+        visao = self._visao_sobre_o_lote(None)
+        visao.buscar(1)
+        visao.invalidar()
+        visao.buscar(1)
+        self.assertEqual(self.mock_repo_vaga.listar_ativas.call_count, 2)
+
+    def test_escrita_de_vaga_sem_aviso_remonta_e_recalcula_na_leitura(self):
+        self.mock_repo_vaga.versao.return_value = 1
+        visao = self._visao_sobre_o_lote(None)
+        visao.buscar(1)
+
+        pausada = self.salvas[1].vagas[0].id
+        self.vagas[pausada - 1].pausar()
+        self.mock_repo_vaga.versao.return_value = 2
+        salva = visao.buscar(1)
+
+        self.assertNotIn(pausada, [v.id for v in salva.vagas])
+        self.assertEqual(self._recalculados(), {1})
+        self.assertEqual(self.mock_repo_vaga.listar_ativas.call_count, 2)
+        # Já recalculada: a próxima leitura usa a linha salva
+        self.assertIs(visao.buscar(1), salva)
+        self.assertEqual(self._recalculados(), set())
+
+    def test_escrita_avisada_nao_remonta(self):
+        self.mock_repo_vaga.versao.return_value = 1
+        visao = self._visao_sobre_o_lote(self.motor)
+        visao.buscar(1)
+
+        self.vagas.append(_vaga(60, "TI", Modalidade.REMOTO, ""))
+        self.mock_repo_vaga.versao.return_value = 2
+        visao.vaga_salva(self.vagas[-1])
+        visao.buscar(1)
+
+        self.mock_repo_vaga.listar_ativas.assert_called_once()
+        self._assert_igual_ao_sob_demanda(self.motor)
+
+    def test_linha_gravada_por_outra_instancia_do_repositorio_e_indexada(self):
+        loader.limpar_cache()
+        self.addCleanup(loader.limpar_cache)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        caminho = os.path.join(tmp.name, "recomendacao_salva.json")
+        repo = RepositorioRecomendacaoSalvaJSON(caminho)
+        visao = VisaoRecomendacoes(
+            self.mock_repo_vaga, self.mock_repo_curso, self.mock_repo_candidato, repo, top_n=TOP_N
+        )
+        propria = visao.buscar(1)
+
+        # Outro processo (o lote, por exemplo) grava a linha do candidato com uma vaga
+        # que a linha desta visão não tem
+        vaga = next(v for v in self.vagas if v.id not in [r.id for r in propria.vagas])
+        externa = RecomendacaoSalva(
+            1, (VagaRecomendada(vaga.id, vaga.titulo, vaga.area, vaga.modalidade.value, 1),), (), "externa"
+        )
+        RepositorioRecomendacaoSalvaJSON(caminho).salvar_muitos([externa])
+        self.assertEqual(visao.buscar(1), externa)
+
+        # A visão indexou a linha externa: remover a vaga recalcula o candidato
+        self.vagas.remove(vaga)
+        visao.vaga_removida(vaga.id)
+        salva = visao.buscar(1)
+        self.assertNotEqual(salva.gerada_em, "externa")
+        self.assertNotIn(vaga.id, [v.id for v in salva.vagas])
+
+    def test_top_n_invalido(self):
+        with self.assertRaises(ValueError):
+            VisaoRecomendacoes(*self._repos(), top_n=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
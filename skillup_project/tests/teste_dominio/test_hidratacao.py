@@ -0,0 +1,63 @@
+import unittest
+from datetime import date
+
+from src.dominio.candidato import CandidatoMapper
+from src.dominio.candidatura import CandidaturaMapper
+from src.dominio.hidratacao import hidratar
+from src.dominio.vaga import Modalidade, TipoVaga, VagaCLT, VagaCLTMapper
+
+
+class TestHidratacaoConfiavel(unittest.TestCase):
+    """Testes do from_dict(..., validar=False) usado nas leituras dos repositórios."""
+
+    def _dados_vaga(self, **kwargs):
+        dados = VagaCLT(
+            id=1, id_empresa=2, titulo="Dev", descricao="Backend", area="TI",
+            modalidade=Modalidade.REMOTO, tipo=TipoVaga.EMPREGO,
+            salario_base=4000.0, prazo_inscricao=date(2099, 1, 1),
+        ).to_dict()
+        dados.update(kwargs)
+        return dados
+
+    def test_resultado_igual_ao_caminho_validado(self):
+        dados = self._dados_vaga()
+        confiavel = VagaCLTMapper.from_dict(dados, validar=False)
+        self.assertIs(type(confiavel), VagaCLT)
+        self.assertEqual(confiavel.to_dict(), VagaCLTMapper.from_dict(dados).to_dict())
+        self.assertEqual(confiavel.calcular_custo_contratacao(), 4000.0 * 1.8)
+
+    def test_nao_revalida(self):
+        dados = self._dados_vaga(prazo_inscricao="2000-01-01")
+        with self.assertRaises(ValueError):
+            VagaCLTMapper.from_dict(dados)
+        vaga = VagaCLTMapper.from_dict(dados, validar=False)
+        self.assertEqual(vaga.prazo_inscricao, date(2000, 1, 1))
+
+    def test_regras_de_negocio_continuam_validando(self):
+        vaga = VagaCLTMapper.from_dict(self._dados_vaga(), validar=False)
+        with self.assertRaises(ValueError):
+            vaga.editar(titulo="   ")
+        vaga.pausar()
+        self.assertFalse(vaga.ativa)
+
+    def test_lista_nao_compartilhada_com_o_registro(self):
+        dados = {
+            "id": 1, "nome": "Ana", "cpf": "12345678901", "email": "ana@x.com",
+            "areas_interesse": ["TI"], "nivel_formacao": "Superior",
+        }
+        candidato = CandidatoMapper.from_dict(dados, validar=False)
+        candidato.adicionar_area("Dados")
+        self.assertEqual(dados["areas_interesse"], ["TI"])
+
+    def test_candidatura_sem_data_usa_construtor(self):
+        dados = {"id_candidatura": 1, "id_vaga": 2, "tipo_vaga": "CLT", "id_candidato": 3}
+        candidatura = CandidaturaMapper.from_dict(dados, validar=False)
+        self.assertEqual(candidatura.data_candidatura, date.today().isoformat())
+
+    def test_campo_obrigatorio_ausente(self):
+        with self.assertRaises(TypeError):
+            hidratar(VagaCLT, id=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,13 @@ class TestVagaCLT(unittest.TestCase):
         self.assertEqual(v.localidade, "São Paulo")
         self.assertTrue(v.ativa)
 
+    def test_validadores_compartilhados_e_sem_dict(self):
+        v1, v2 = self._criar_vaga_clt(), self._criar_vaga_clt(id=2)
+        self.assertIs(v1.texto_validador, v2.texto_validador)
+        self.assertFalse(hasattr(v1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            v1.campo_inexistente = 1
+
     def test_custo_contratacao(self):
         v = self._criar_vaga_clt(salario_base=5000.0)
         self.assertAlmostEqual(v.calcular_custo_contratacao(), 9000.0)